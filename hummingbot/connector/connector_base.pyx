@@ -184,6 +184,13 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Indicates whether the connector can already be used to trade the trading pair. Connectors that initialize
+        their markets one by one can return True for some trading pairs before the whole connector is ready.
+        """
+        return self.ready
+
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrderBase]:
         raise NotImplementedError
@@ -34,6 +34,7 @@ SERVER_TIME_PATH_URL = "v1/time"
 
 # Private API v1 Endpoints
 ORDER_URL = "v1/order"
+BATCH_ORDERS_URL = "v1/batchOrders"
 CANCEL_ALL_OPEN_ORDERS_URL = "v1/allOpenOrders"
 ACCOUNT_TRADE_LIST_URL = "v1/userTrades"
 SET_LEVERAGE_URL = "v1/leverage"
@@ -41,6 +42,8 @@ GET_INCOME_HISTORY_URL = "v1/income"
 CHANGE_POSITION_MODE_URL = "v1/positionSide/dual"
 
 POST_POSITION_MODE_LIMIT_ID = f"POST{CHANGE_POSITION_MODE_URL}"
+POST_BATCH_ORDERS_LIMIT_ID = f"POST{BATCH_ORDERS_URL}"
+DELETE_BATCH_ORDERS_LIMIT_ID = f"DELETE{BATCH_ORDERS_URL}"
 GET_POSITION_MODE_LIMIT_ID = f"GET{CHANGE_POSITION_MODE_URL}"
 
 # Private API v2 Endpoints
@@ -108,6 +111,12 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1),
                              LinkedLimitWeightPair(ORDERS_1MIN, weight=1),
                              LinkedLimitWeightPair(ORDERS_1SEC, weight=1)]),
+    RateLimit(limit_id=POST_BATCH_ORDERS_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5),
+                             LinkedLimitWeightPair(ORDERS_1MIN, weight=5),
+                             LinkedLimitWeightPair(ORDERS_1SEC, weight=5)]),
+    RateLimit(limit_id=DELETE_BATCH_ORDERS_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=CANCEL_ALL_OPEN_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=ACCOUNT_TRADE_LIST_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
@@ -128,6 +137,9 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
 ]
 
+MAX_BATCH_ORDER_CREATE_SIZE = 5
+MAX_BATCH_ORDER_CANCEL_SIZE = 10
+
 ORDER_NOT_EXIST_ERROR_CODE = -2013
 ORDER_NOT_EXIST_MESSAGE = "Order does not exist"
 UNKNOWN_ORDER_ERROR_CODE = -2011
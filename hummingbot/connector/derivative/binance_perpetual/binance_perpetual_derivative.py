@@ -1,8 +1,9 @@
 import asyncio
+import json
 import time
 from collections import defaultdict
 from decimal import Decimal
-from typing import Any, AsyncIterable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -40,6 +41,8 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
     LONG_POLL_INTERVAL = 120.0
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CREATE_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CANCEL_SIZE
 
     def __init__(
             self,
@@ -239,17 +242,111 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             **kwargs,
     ) -> Tuple[str, float]:
 
-        amount_str = f"{amount:f}"
-        price_str = f"{price:f}"
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        api_params = self._order_request_params(
+            order_id=order_id,
+            symbol=symbol,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            position_action=position_action,
+        )
+        try:
+            order_result = await self._api_post(
+                path_url=CONSTANTS.ORDER_URL,
+                data=api_params,
+                is_auth_required=True)
+            o_id = str(order_result["orderId"])
+            transact_time = order_result["updateTime"] * 1e-3
+        except IOError as e:
+            if self._is_server_overloaded_error(e):
+                o_id = "UNKNOWN"
+                transact_time = time.time()
+            else:
+                raise
+        return o_id, transact_time
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        batch_orders = [
+            self._order_request_params(
+                order_id=order.client_order_id,
+                symbol=symbol,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                position_action=order.position,
+            )
+            for order in orders
+        ]
+        try:
+            results = await self._api_post(
+                path_url=CONSTANTS.BATCH_ORDERS_URL,
+                data={"batchOrders": json.dumps(batch_orders)},
+                is_auth_required=True,
+                limit_id=CONSTANTS.POST_BATCH_ORDERS_LIMIT_ID)
+        except IOError as e:
+            if self._is_server_overloaded_error(e):
+                # As for a single order, the orders might have been created. They are kept tracked until their
+                # status is known
+                transact_time = time.time()
+                return [("UNKNOWN", transact_time) for _ in orders]
+            raise
+        return [
+            (str(result["orderId"]), result["updateTime"] * 1e-3)
+            if "orderId" in result
+            else IOError(f"{result.get('code')} - {result.get('msg')}")
+            for result in results
+        ]
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        results = await self._api_delete(
+            path_url=CONSTANTS.BATCH_ORDERS_URL,
+            params={
+                "symbol": symbol,
+                "origClientOrderIdList": json.dumps([order.client_order_id for order in orders]),
+            },
+            is_auth_required=True,
+            limit_id=CONSTANTS.DELETE_BATCH_ORDERS_LIMIT_ID)
+        cancel_results = []
+        for order, result in zip(orders, results):
+            if "code" not in result:
+                cancel_results.append(result.get("status") == "CANCELED")
+                continue
+            if result.get("code") == -2011 and "Unknown order sent." == result.get("msg", ""):
+                self.logger().debug(f"The order {order.client_order_id} does not exist on Binance Perpetuals. "
+                                    f"No cancelation needed.")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            cancel_results.append(IOError(f"{result.get('code')} - {result.get('msg')}"))
+        return cancel_results
+
+    @staticmethod
+    def _is_server_overloaded_error(error: Exception) -> bool:
+        error_description = str(error)
+        return ("status is 503" in error_description
+                and "Unknown error, please check your request or try again later." in error_description)
+
+    def _order_request_params(
+            self,
+            order_id: str,
+            symbol: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+            position_action: PositionAction,
+    ) -> Dict[str, Any]:
         api_params = {"symbol": symbol,
                       "side": "BUY" if trade_type is TradeType.BUY else "SELL",
-                      "quantity": amount_str,
+                      "quantity": f"{amount:f}",
                       "type": "MARKET" if order_type is OrderType.MARKET else "LIMIT",
                       "newClientOrderId": order_id
                       }
         if order_type.is_limit_type():
-            api_params["price"] = price_str
+            api_params["price"] = f"{price:f}"
         if order_type == OrderType.LIMIT:
             api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
         if order_type == OrderType.LIMIT_MAKER:
@@ -259,23 +356,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                 api_params["positionSide"] = "LONG" if trade_type is TradeType.BUY else "SHORT"
             else:
                 api_params["positionSide"] = "SHORT" if trade_type is TradeType.BUY else "LONG"
-        try:
-            order_result = await self._api_post(
-                path_url=CONSTANTS.ORDER_URL,
-                data=api_params,
-                is_auth_required=True)
-            o_id = str(order_result["orderId"])
-            transact_time = order_result["updateTime"] * 1e-3
-        except IOError as e:
-            error_description = str(e)
-            is_server_overloaded = ("status is 503" in error_description
-                                    and "Unknown error, please check your request or try again later." in error_description)
-            if is_server_overloaded:
-                o_id = "UNKNOWN"
-                transact_time = time.time()
-            else:
-                raise
-        return o_id, transact_time
+        return api_params
 
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         trade_updates = []
@@ -26,6 +26,7 @@ SERVER_TIME_PATH_URL = "/time"
 ACCOUNTS_PATH_URL = "/account"
 MY_TRADES_PATH_URL = "/myTrades"
 ORDER_PATH_URL = "/order"
+OPEN_ORDERS_PATH_URL = "/openOrders"
 BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
 WS_HEARTBEAT_TIME_INTERVAL = 30
@@ -51,6 +52,9 @@ ONE_SECOND = 1
 ONE_DAY = 86400
 
 MAX_REQUEST = 5000
+# Maximum number of fills returned by a trades request, and maximum time range the request can cover
+MAX_TRADES_PER_REQUEST = 1000
+MAX_TRADES_REQUEST_TIME_RANGE = ONE_DAY
 
 # Order States
 ORDER_STATE = {
@@ -110,7 +114,10 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 4),
                              LinkedLimitWeightPair(ORDERS, 1),
                              LinkedLimitWeightPair(ORDERS_24HR, 1),
-                             LinkedLimitWeightPair(RAW_REQUESTS, 1)])
+                             LinkedLimitWeightPair(RAW_REQUESTS, 1)]),
+    RateLimit(limit_id=OPEN_ORDERS_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 6),
+                             LinkedLimitWeightPair(RAW_REQUESTS, 1)]),
 ]
 
 ORDER_NOT_EXIST_ERROR_CODE = -2013
@@ -29,6 +29,10 @@ from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFa
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS = 10
+    DETECT_ORDER_BOOK_SEQUENCE_GAPS = True
+    BULK_ORDER_STATUS_UPDATES = True
+    MAX_CONCURRENT_ORDER_STATUS_REQUESTS = 10
 
     web_utils = web_utils
 
@@ -508,6 +512,77 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _all_trade_updates_for_trading_pair(self,
+                                                  trading_pair: str,
+                                                  orders: List[InFlightOrder],
+                                                  start_timestamp: float) -> List[TradeUpdate]:
+        orders_by_exchange_order_id = {order.exchange_order_id: order for order in orders}
+        # The trades request can't go back more than one day from now
+        min_start_timestamp = self._time_synchronizer.time() - CONSTANTS.MAX_TRADES_REQUEST_TIME_RANGE + 60
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        params = {
+            "symbol": symbol,
+            "startTime": int(max(start_timestamp, min_start_timestamp) * 1e3),
+            "limit": CONSTANTS.MAX_TRADES_PER_REQUEST,
+        }
+        trades = []
+        while True:
+            page = await self._api_get(
+                path_url=CONSTANTS.MY_TRADES_PATH_URL,
+                params=params,
+                is_auth_required=True)
+            trades.extend(page)
+            if len(page) < CONSTANTS.MAX_TRADES_PER_REQUEST:
+                break
+            # The oldest trades since the start time are returned first. The next page starts after the last trade
+            # (fromId can't be combined with startTime)
+            params = {
+                "symbol": symbol,
+                "fromId": int(page[-1]["id"]) + 1,
+                "limit": CONSTANTS.MAX_TRADES_PER_REQUEST,
+            }
+
+        trade_updates = []
+        for trade in trades:
+            order = orders_by_exchange_order_id.get(str(trade["orderId"]))
+            if order is None:
+                continue
+            fee = TradeFeeBase.new_spot_fee(
+                fee_schema=self.trade_fee_schema(),
+                trade_type=order.trade_type,
+                percent_token=trade["commissionAsset"],
+                flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
+            )
+            trade_updates.append(TradeUpdate(
+                trade_id=str(trade["id"]),
+                client_order_id=order.client_order_id,
+                exchange_order_id=str(trade["orderId"]),
+                trading_pair=trading_pair,
+                fee=fee,
+                fill_base_amount=Decimal(trade["qty"]),
+                fill_quote_amount=Decimal(trade["quoteQty"]),
+                fill_price=Decimal(trade["price"]),
+                fill_timestamp=trade["time"] * 1e-3,
+            ))
+        return trade_updates
+
+    async def _all_open_order_updates_for_trading_pair(self, trading_pair: str) -> List[OrderUpdate]:
+        open_orders = await self._api_get(
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            params={"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)},
+            is_auth_required=True)
+
+        return [
+            OrderUpdate(
+                client_order_id=order_data["clientOrderId"],
+                exchange_order_id=str(order_data["orderId"]),
+                trading_pair=trading_pair,
+                update_timestamp=order_data["updateTime"] * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+            )
+            for order_data in open_orders
+        ]
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
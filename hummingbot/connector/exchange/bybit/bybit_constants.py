@@ -66,10 +66,21 @@ ACCOUNT_INFO_PATH_URL = "/v5/account/info"
 BALANCE_PATH_URL = "/v5/account/wallet-balance"
 ORDER_PLACE_PATH_URL = "/v5/order/create"
 ORDER_CANCEL_PATH_URL = "/v5/order/cancel"
+BATCH_ORDER_PLACE_PATH_URL = "/v5/order/create-batch"
+BATCH_ORDER_CANCEL_PATH_URL = "/v5/order/cancel-batch"
 GET_ORDERS_PATH_URL = "/v5/order/realtime"
 TRADE_HISTORY_PATH_URL = "/v5/execution/list"
 EXCHANGE_FEE_RATE_PATH_URL = "/v5/account/fee-rate"
 
+# Maximum number of items of a page of the open orders and the trade history requests
+OPEN_ORDERS_PAGE_LIMIT = 50
+TRADE_HISTORY_PAGE_LIMIT = 100
+# Maximum time range of the trade history request
+TRADE_HISTORY_MAX_TIME_RANGE = 7 * 24 * 60 * 60
+# Maximum number of spot orders of a batch order creation and a batch order cancelation request
+MAX_BATCH_ORDER_CREATE_SIZE = 10
+MAX_BATCH_ORDER_CANCEL_SIZE = 10
+
 
 # Order States
 # https://bybit-exchange.github.io/docs/v5/enum#orderstatus
@@ -184,6 +195,22 @@ RATE_LIMITS = {
             LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
         ]
     ),
+    RateLimit(
+        limit_id=BATCH_ORDER_PLACE_PATH_URL,
+        limit=MAX_REQUEST_LIMIT_DEFAULT,
+        time_interval=ONE_SECOND,
+        linked_limits=[
+            LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
+        ]
+    ),
+    RateLimit(
+        limit_id=BATCH_ORDER_CANCEL_PATH_URL,
+        limit=MAX_REQUEST_LIMIT_DEFAULT,
+        time_interval=ONE_SECOND,
+        linked_limits=[
+            LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
+        ]
+    ),
     RateLimit(
         limit_id=GET_ORDERS_PATH_URL,
         limit=MAX_REQUEST_LIMIT_DEFAULT,
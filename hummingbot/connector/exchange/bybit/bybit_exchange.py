@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from bidict import bidict
@@ -27,6 +27,12 @@ s_decimal_NaN = Decimal("nan")
 
 
 class BybitExchange(ExchangePyBase):
+    BULK_ORDER_STATUS_UPDATES = True
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS = 10
+    MAX_CONCURRENT_ORDER_STATUS_REQUESTS = 10
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CREATE_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CANCEL_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -218,23 +224,18 @@ class BybitExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
-        type_str = self.bybit_order_type(order_type)
-
-        side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-
         api_params = {
             "category": self._category,
-            "symbol": symbol,
-            "side": side_str,
-            "orderType": type_str,
-            "qty": f"{amount:f}",
-            "marketUnit": "baseCoin",
-            "price": f"{price:f}",
-            "orderLinkId": order_id
+            **self._order_request_params(
+                order_id=order_id,
+                symbol=symbol,
+                amount=amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=price,
+            ),
         }
-        if order_type == OrderType.LIMIT:
-            api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
 
         response = await self._api_post(
             path_url=CONSTANTS.ORDER_PLACE_PATH_URL,
@@ -249,6 +250,57 @@ class BybitExchange(ExchangePyBase):
         transact_time = int(response["time"]) * 1e-3
         return (o_id, transact_time)
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        api_params = {
+            "category": self._category,
+            "request": [
+                self._order_request_params(
+                    order_id=order.client_order_id,
+                    symbol=symbol,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                )
+                for order in orders
+            ],
+        }
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_PLACE_PATH_URL,
+            data=api_params,
+            is_auth_required=True,
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        transact_time = int(response["time"]) * 1e-3
+        return [
+            (str(order_result["orderId"]), transact_time)
+            if order_error["code"] == 0
+            else ValueError(f"{order_error['msg']}")
+            for order_result, order_error in zip(response["result"]["list"], response["retExtInfo"]["list"])
+        ]
+
+    def _order_request_params(self,
+                              order_id: str,
+                              symbol: str,
+                              amount: Decimal,
+                              trade_type: TradeType,
+                              order_type: OrderType,
+                              price: Decimal) -> Dict[str, Any]:
+        api_params = {
+            "symbol": symbol,
+            "side": CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL,
+            "orderType": self.bybit_order_type(order_type),
+            "qty": f"{amount:f}",
+            "marketUnit": "baseCoin",
+            "price": f"{price:f}",
+            "orderLinkId": order_id
+        }
+        if order_type == OrderType.LIMIT:
+            api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        return api_params
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         exchange_order_id = tracked_order.exchange_order_id
         client_order_id = tracked_order.client_order_id
@@ -274,6 +326,29 @@ class BybitExchange(ExchangePyBase):
             return True
         return False
 
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        requests = []
+        for order in orders:
+            order_params = {"symbol": symbol}
+            if order.exchange_order_id:
+                order_params["orderId"] = order.exchange_order_id
+            else:
+                order_params["orderLinkId"] = order.client_order_id
+            requests.append(order_params)
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            data={"category": self._category, "request": requests},
+            is_auth_required=True,
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        return [
+            True if order_error["code"] == 0 else ValueError(f"{order_error['msg']}")
+            for order_error in response["retExtInfo"]["list"]
+        ]
+
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         trading_pair_rules = exchange_info_dict.get("result", []).get("list", [])
         retval = []
@@ -515,6 +590,67 @@ class BybitExchange(ExchangePyBase):
         )
         return order_update
 
+    async def _all_trade_updates_for_trading_pair(self,
+                                                  trading_pair: str,
+                                                  orders: List[InFlightOrder],
+                                                  start_timestamp: float) -> List[TradeUpdate]:
+        orders_by_exchange_order_id = {order.exchange_order_id: order for order in orders}
+        orders_by_client_order_id = {order.client_order_id: order for order in orders}
+        # The trade history request can't go back more than seven days from now
+        min_start_timestamp = self._time_synchronizer.time() - CONSTANTS.TRADE_HISTORY_MAX_TIME_RANGE + 60
+        api_params = {
+            "category": self._category,
+            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "execType": "Trade",
+            "startTime": int(max(start_timestamp, min_start_timestamp) * 1e3),
+            "limit": CONSTANTS.TRADE_HISTORY_PAGE_LIMIT,
+        }
+
+        trade_updates = []
+        for fill_data in await self._request_all_pages(CONSTANTS.TRADE_HISTORY_PATH_URL, api_params):
+            order = (orders_by_exchange_order_id.get(str(fill_data["orderId"]))
+                     or orders_by_client_order_id.get(fill_data.get("orderLinkId")))
+            if order is not None:
+                trade_updates.append(self._parse_trade_update(trade_msg=fill_data, tracked_order=order))
+        return trade_updates
+
+    async def _all_open_order_updates_for_trading_pair(self, trading_pair: str) -> List[OrderUpdate]:
+        api_params = {
+            "category": self._category,
+            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "openOnly": 0,
+            "limit": CONSTANTS.OPEN_ORDERS_PAGE_LIMIT,
+        }
+        return [
+            OrderUpdate(
+                client_order_id=order_data["orderLinkId"],
+                exchange_order_id=str(order_data["orderId"]),
+                trading_pair=trading_pair,
+                update_timestamp=int(order_data["updatedTime"]) * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[order_data["orderStatus"]],
+            )
+            for order_data in await self._request_all_pages(CONSTANTS.GET_ORDERS_PATH_URL, api_params)
+        ]
+
+    async def _request_all_pages(self, path_url: str, api_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Requests all the pages of a paginated private endpoint, following the cursor of each page
+        """
+        items = []
+        params = dict(api_params)
+        while True:
+            response = await self._api_get(
+                path_url=path_url,
+                params=params,
+                is_auth_required=True,
+                limit_id=path_url)
+            result = response["result"]
+            items.extend(result["list"] or [])
+            cursor = result.get("nextPageCursor")
+            if not cursor or not result["list"]:
+                return items
+            params["cursor"] = cursor
+
     async def _update_balances(self):
         # Update the first time it is called
         if self._account_type is None:
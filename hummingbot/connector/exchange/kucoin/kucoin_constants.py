@@ -23,6 +23,8 @@ SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v2/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
 ORDERS_PATH_URL_HFT = "/api/v1/hf/orders"
+BATCH_ORDERS_PATH_URL = "/api/v1/orders/multi"
+BATCH_ORDERS_PATH_URL_HFT = "/api/v1/hf/orders/multi"
 FEE_PATH_URL = "/api/v1/trade-fees"
 ALL_TICKERS_PATH_URL = "/api/v1/market/allTickers"
 FILLS_PATH_URL = "/api/v1/fills"
@@ -36,9 +38,13 @@ WS_CONNECTION_TIME_INTERVAL = 60
 WS_REQUEST_LIMIT_ID = "WSRequest"
 GET_ORDER_LIMIT_ID = "GetOrders"
 POST_ORDER_LIMIT_ID = "PostOrder"
+POST_BATCH_ORDERS_LIMIT_ID = "PostBatchOrders"
 DELETE_ORDER_LIMIT_ID = "DeleteOrder"
 WS_PING_HEARTBEAT = 10
 
+# Maximum number of limit orders of a batch order creation request
+MAX_BATCH_ORDER_CREATE_SIZE = 5
+
 DIFF_EVENT_TYPE = "trade.l2update"
 TRADE_EVENT_TYPE = "trade.l3match"
 ORDER_CHANGE_EVENT_TYPE = "orderChange"
@@ -62,6 +68,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=LIMIT_FILLS_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=ORDER_CLIENT_ORDER_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=POST_ORDER_LIMIT_ID, limit=45, time_interval=3),
+    RateLimit(limit_id=POST_BATCH_ORDERS_LIMIT_ID, limit=3, time_interval=1),
     RateLimit(limit_id=DELETE_ORDER_LIMIT_ID, limit=60, time_interval=3),
     RateLimit(limit_id=ORDERS_PATH_URL, limit=45, time_interval=3),
     RateLimit(limit_id=ORDERS_PATH_URL_HFT, limit=45, time_interval=3),
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -27,6 +27,11 @@ from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFa
 
 
 class KucoinExchange(ExchangePyBase):
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS = 10
+    DETECT_ORDER_BOOK_SEQUENCE_GAPS = True
+    # Kucoin has no endpoint to cancel a list of orders, only to create them
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CREATE_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -91,6 +96,10 @@ class KucoinExchange(ExchangePyBase):
     def orders_path_url(self):
         return CONSTANTS.ORDERS_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.ORDERS_PATH_URL
 
+    @property
+    def batch_orders_path_url(self):
+        return CONSTANTS.BATCH_ORDERS_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.BATCH_ORDERS_PATH_URL
+
     @property
     def fills_path_url(self):
         return CONSTANTS.FILLS_PATH_URL_HFT if self.domain == "hft" else CONSTANTS.FILLS_PATH_URL
@@ -193,20 +202,14 @@ class KucoinExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
-        side = trade_type.name.lower()
-        order_type_str = "market" if order_type == OrderType.MARKET else "limit"
-        data = {
-            "size": str(amount),
-            "clientOid": order_id,
-            "side": side,
-            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-            "type": order_type_str,
-        }
-        if order_type is OrderType.LIMIT:
-            data["price"] = str(price)
-        elif order_type is OrderType.LIMIT_MAKER:
-            data["price"] = str(price)
-            data["postOnly"] = True
+        data = self._order_request_data(
+            order_id=order_id,
+            symbol=await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
         exchange_order_id = await self._api_post(
             path_url=self.orders_path_url,
             data=data,
@@ -217,6 +220,67 @@ class KucoinExchange(ExchangePyBase):
             raise IOError(f"Error placing order on Kucoin: {exchange_order_id}")
         return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
 
+    def _is_batch_order_create_supported(self, order: InFlightOrder) -> bool:
+        # The batch order creation endpoints only accept limit orders
+        return order.order_type.is_limit_type()
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        order_list = [
+            self._order_request_data(
+                order_id=order.client_order_id,
+                symbol=symbol,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        data = {"orderList": order_list} if self.domain == "hft" else {"symbol": symbol, "orderList": order_list}
+        response = await self._api_post(
+            path_url=self.batch_orders_path_url,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_BATCH_ORDERS_LIMIT_ID,
+        )
+        if response.get("data") is None:
+            raise IOError(f"Error placing orders on Kucoin: {response}")
+        if self.domain == "hft":
+            return [
+                (str(result["orderId"]), self.current_timestamp)
+                if result.get("success")
+                else IOError(f"Error placing order on Kucoin: {result.get('failMsg')}")
+                for result in response["data"]
+            ]
+        return [
+            (str(result["id"]), self.current_timestamp)
+            if result.get("status") == "success"
+            else IOError(f"Error placing order on Kucoin: {result.get('failMsg')}")
+            for result in response["data"]["data"]
+        ]
+
+    def _order_request_data(self,
+                            order_id: str,
+                            symbol: str,
+                            amount: Decimal,
+                            trade_type: TradeType,
+                            order_type: OrderType,
+                            price: Decimal) -> Dict[str, Any]:
+        data = {
+            "size": str(amount),
+            "clientOid": order_id,
+            "side": trade_type.name.lower(),
+            "symbol": symbol,
+            "type": "market" if order_type == OrderType.MARKET else "limit",
+        }
+        if order_type is OrderType.LIMIT:
+            data["price"] = str(price)
+        elif order_type is OrderType.LIMIT_MAKER:
+            data["price"] = str(price)
+            data["postOnly"] = True
+        return data
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation specific function is called by _cancel, and returns True if successful
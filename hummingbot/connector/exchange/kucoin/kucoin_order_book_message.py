@@ -1,6 +1,9 @@
 import time
+from functools import cached_property
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -42,6 +45,14 @@ class KucoinOrderBookMessage(OrderBookMessage):
             for price, amount, *trash in self.content.get("bids", [])
         ]
 
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        return self._levels_to_array(self.content.get("asks", []))
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        return self._levels_to_array(self.content.get("bids", []))
+
     @property
     def has_update_id(self) -> bool:
         return True
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
 from collections import namedtuple
+from functools import cached_property
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -71,6 +74,14 @@ class NdaxOrderBookMessage(OrderBookMessage):
         bids.sort(key=lambda row: (row.price, row.update_id))
         return bids
 
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        return self._levels_to_array([(row.price, row.amount) for row in self.asks])
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        return self._levels_to_array([(row.price, row.amount) for row in self.bids])
+
     def _order_book_row_for_entry(self, entry: NdaxOrderBookEntry) -> OrderBookRow:
         price = float(entry.price)
         amount = float(entry.quantity) if entry.actionType != self._DELETE_ACTION_TYPE else 0.0
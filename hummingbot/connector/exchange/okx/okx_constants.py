@@ -51,11 +51,20 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_ORDER_PLACE_PATH = "/api/v5/trade/batch-orders"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
+OKX_PENDING_ORDERS_PATH = "/api/v5/trade/orders-pending"
+
+# Maximum number of items of a page of the pending orders and the fills requests
+OKX_PAGE_LIMIT = 100
+# Maximum time range the fills request can go back
+OKX_TRADE_FILLS_MAX_TIME_RANGE = 3 * 24 * 60 * 60
+# Maximum number of orders of a batch order placement and a batch order cancelation request
+OKX_MAX_BATCH_ORDER_SIZE = 20
 
 # WebSocket channels
 OKX_WS_ACCOUNT_CHANNEL = "account"
@@ -73,6 +82,13 @@ WS_CONNECTION_LIMIT_ID = "WSConnection"
 WS_REQUEST_LIMIT_ID = "WSRequest"
 WS_SUBSCRIPTION_LIMIT_ID = "WSSubscription"
 WS_LOGIN_LIMIT_ID = "WSLogin"
+WS_ORDER_LIMIT_ID = "WSOrder"
+WS_CANCEL_ORDER_LIMIT_ID = "WSCancelOrder"
+
+# Operations of the websocket trading API
+WS_ORDER_OPERATION = "order"
+WS_CANCEL_ORDER_OPERATION = "cancel-order"
+WS_ORDER_ENTRY_REQUEST_TIMEOUT = 10
 
 ORDER_STATE = {
     "live": OrderState.OPEN,
@@ -94,15 +110,19 @@ RATE_LIMITS = [
     RateLimit(WS_REQUEST_LIMIT_ID, limit=100, time_interval=10),
     RateLimit(WS_SUBSCRIPTION_LIMIT_ID, limit=240, time_interval=60 * 60),
     RateLimit(WS_LOGIN_LIMIT_ID, limit=1, time_interval=15),
+    RateLimit(WS_ORDER_LIMIT_ID, limit=60, time_interval=2),
+    RateLimit(WS_CANCEL_ORDER_LIMIT_ID, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_SERVER_TIME_PATH, limit=10, time_interval=2),
     RateLimit(limit_id=OKX_INSTRUMENTS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_TICKER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_TICKERS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_BOOK_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=20, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_ORDER_PLACE_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_BALANCE_PATH, limit=10, time_interval=2),
     RateLimit(limit_id=OKX_TRADE_FILLS_PATH, limit=60, time_interval=2),
+    RateLimit(limit_id=OKX_PENDING_ORDERS_PATH, limit=60, time_interval=2),
 ]
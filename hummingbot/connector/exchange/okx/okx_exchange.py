@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -8,6 +8,7 @@ from hummingbot.connector.exchange.okx import okx_constants as CONSTANTS, okx_ut
 from hummingbot.connector.exchange.okx.okx_api_order_book_data_source import OkxAPIOrderBookDataSource
 from hummingbot.connector.exchange.okx.okx_api_user_stream_data_source import OkxAPIUserStreamDataSource
 from hummingbot.connector.exchange.okx.okx_auth import OkxAuth
+from hummingbot.connector.exchange.okx.okx_ws_order_entry_data_source import OkxWSOrderEntryDataSource
 from hummingbot.connector.exchange_base import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
@@ -17,12 +18,18 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.data_type.ws_order_entry_data_source import WSOrderEntryDataSource
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
 class OkxExchange(ExchangePyBase):
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS = 10
+    BULK_ORDER_STATUS_UPDATES = True
+    MAX_CONCURRENT_ORDER_STATUS_REQUESTS = 10
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.OKX_MAX_BATCH_ORDER_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.OKX_MAX_BATCH_ORDER_SIZE
 
     web_utils = web_utils
 
@@ -141,6 +148,12 @@ class OkxExchange(ExchangePyBase):
             connector=self,
             api_factory=self._web_assistants_factory)
 
+    def _create_ws_order_entry_data_source(self) -> Optional[WSOrderEntryDataSource]:
+        return OkxWSOrderEntryDataSource(
+            auth=self._auth,
+            connector=self,
+            api_factory=self._web_assistants_factory)
+
     def _get_fee(self,
                  base_currency: str,
                  quote_currency: str,
@@ -190,19 +203,14 @@ class OkxExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
 
-        data = {
-            "clOrdId": order_id,
-            "tdMode": "cash",
-            "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
-            "side": trade_type.name.lower(),
-            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-            "sz": str(amount),
-        }
-        if order_type.is_limit_type():
-            data["px"] = f"{price:f}"
-        else:
-            # Specify that the order quantity for market orders is denominated in base currency
-            data["tgtCcy"] = "base_ccy"
+        data = self._order_request_data(
+            order_id=order_id,
+            symbol=await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
 
         exchange_order_id = await self._api_request(
             path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
@@ -216,6 +224,80 @@ class OkxExchange(ExchangePyBase):
             raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
         return str(data["ordId"]), self.current_timestamp
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        data = [
+            self._order_request_data(
+                order_id=order.client_order_id,
+                symbol=symbol,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_PLACE_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDER_PLACE_PATH,
+        )
+        # The response includes a result for each order, also when some (or all) of them failed
+        if len(response.get("data", [])) == 0:
+            raise IOError(f"Error submitting orders {[order.client_order_id for order in orders]}: {response}")
+        results = {order_data["clOrdId"]: order_data for order_data in response["data"]}
+        return [
+            (str(results[order.client_order_id]["ordId"]), self.current_timestamp)
+            if results.get(order.client_order_id, {}).get("sCode") == "0"
+            else IOError(f"Error submitting order {order.client_order_id}: "
+                         f"{results.get(order.client_order_id, {}).get('sMsg')}")
+            for order in orders
+        ]
+
+    async def _place_order_ws(self, order: InFlightOrder, **kwargs) -> Tuple[str, float]:
+        data = self._order_request_data(
+            order_id=order.client_order_id,
+            symbol=await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+            amount=order.amount,
+            trade_type=order.trade_type,
+            order_type=order.order_type,
+            price=order.price,
+        )
+        async with self._throttler.execute_task(limit_id=CONSTANTS.WS_ORDER_LIMIT_ID):
+            response = await self._ws_order_entry_data_source.execute_request(
+                operation=CONSTANTS.WS_ORDER_OPERATION,
+                params=[data])
+        if len(response.get("data", [])) == 0:
+            raise IOError(f"Error submitting order {order.client_order_id}: {response}")
+        data = response["data"][0]
+        if data["sCode"] != "0":
+            raise IOError(f"Error submitting order {order.client_order_id}: {data['sMsg']}")
+        return str(data["ordId"]), self.current_timestamp
+
+    def _order_request_data(self,
+                            order_id: str,
+                            symbol: str,
+                            amount: Decimal,
+                            trade_type: TradeType,
+                            order_type: OrderType,
+                            price: Decimal) -> Dict[str, Any]:
+        data = {
+            "clOrdId": order_id,
+            "tdMode": "cash",
+            "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
+            "side": trade_type.name.lower(),
+            "instId": symbol,
+            "sz": str(amount),
+        }
+        if order_type.is_limit_type():
+            data["px"] = f"{price:f}"
+        else:
+            # Specify that the order quantity for market orders is denominated in base currency
+            data["tgtCcy"] = "base_ccy"
+        return data
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation specific function is called by _cancel, and returns True if successful
@@ -242,6 +324,38 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_cancel_ws(self, order: InFlightOrder) -> bool:
+        params = {
+            "clOrdId": order.client_order_id,
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+        }
+        async with self._throttler.execute_task(limit_id=CONSTANTS.WS_CANCEL_ORDER_LIMIT_ID):
+            cancel_result = await self._ws_order_entry_data_source.execute_request(
+                operation=CONSTANTS.WS_CANCEL_ORDER_OPERATION,
+                params=[params])
+        # Orders that do not exist (51400) or are already canceled (51401) are considered canceled, as with REST
+        if len(cancel_result.get("data", [])) == 0 or cancel_result["data"][0]["sCode"] not in ("0", "51400", "51401"):
+            raise IOError(f"Error cancelling order {order.client_order_id}: {cancel_result}")
+        return True
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        cancel_result = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=[{"clOrdId": order.client_order_id, "instId": symbol} for order in orders],
+            is_auth_required=True,
+        )
+        if len(cancel_result.get("data", [])) == 0:
+            raise IOError(f"Error cancelling orders {[order.client_order_id for order in orders]}: {cancel_result}")
+        results = {order_data["clOrdId"]: order_data for order_data in cancel_result["data"]}
+        # Orders that do not exist (51400) or are already canceled (51401) are considered canceled, as for one order
+        return [
+            True
+            if results.get(order.client_order_id, {}).get("sCode") in ("0", "51400", "51401")
+            else IOError(f"Error cancelling order {order.client_order_id}: {results.get(order.client_order_id)}")
+            for order in orders
+        ]
+
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
         params = {"instType": "SPOT"}
 
@@ -359,27 +473,89 @@ class OkxExchange(ExchangePyBase):
             fills_data = all_fills_response["data"]
 
             for fill_data in fills_data:
-                fee = TradeFeeBase.new_spot_fee(
-                    fee_schema=self.trade_fee_schema(),
-                    trade_type=order.trade_type,
-                    percent_token=fill_data["feeCcy"],
-                    flat_fees=[TokenAmount(amount=-Decimal(fill_data["fee"]), token=fill_data["feeCcy"])]
-                )
-                trade_update = TradeUpdate(
-                    trade_id=str(fill_data["tradeId"]),
-                    client_order_id=order.client_order_id,
-                    exchange_order_id=str(fill_data["ordId"]),
-                    trading_pair=order.trading_pair,
-                    fee=fee,
-                    fill_base_amount=Decimal(fill_data["fillSz"]),
-                    fill_quote_amount=Decimal(fill_data["fillSz"]) * Decimal(fill_data["fillPx"]),
-                    fill_price=Decimal(fill_data["fillPx"]),
-                    fill_timestamp=int(fill_data["ts"]) * 1e-3,
-                )
-                trade_updates.append(trade_update)
+                trade_updates.append(self._create_trade_update(fill_data=fill_data, order=order))
 
         return trade_updates
 
+    async def _all_trade_updates_for_trading_pair(self,
+                                                  trading_pair: str,
+                                                  orders: List[InFlightOrder],
+                                                  start_timestamp: float) -> List[TradeUpdate]:
+        orders_by_exchange_order_id = {order.exchange_order_id: order for order in orders}
+        # The fills request can't go back more than three days from now
+        min_start_timestamp = self._time_synchronizer.time() - CONSTANTS.OKX_TRADE_FILLS_MAX_TIME_RANGE + 60
+        fills_data = await self._request_all_pages(
+            path_url=CONSTANTS.OKX_TRADE_FILLS_PATH,
+            params={
+                "instType": "SPOT",
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair),
+                "begin": str(int(max(start_timestamp, min_start_timestamp) * 1e3))},
+            cursor_key="billId")
+
+        trade_updates = []
+        for fill_data in fills_data:
+            order = orders_by_exchange_order_id.get(str(fill_data["ordId"]))
+            if order is not None:
+                trade_updates.append(self._create_trade_update(fill_data=fill_data, order=order))
+        return trade_updates
+
+    async def _all_open_order_updates_for_trading_pair(self, trading_pair: str) -> List[OrderUpdate]:
+        orders_data = await self._request_all_pages(
+            path_url=CONSTANTS.OKX_PENDING_ORDERS_PATH,
+            params={
+                "instType": "SPOT",
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair)},
+            cursor_key="ordId")
+
+        return [
+            OrderUpdate(
+                client_order_id=order_data["clOrdId"],
+                exchange_order_id=str(order_data["ordId"]),
+                trading_pair=trading_pair,
+                update_timestamp=int(order_data["uTime"]) * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[order_data["state"]],
+            )
+            for order_data in orders_data
+        ]
+
+    async def _request_all_pages(self, path_url: str, params: Dict[str, Any], cursor_key: str) -> List[Dict[str, Any]]:
+        """
+        Requests all the pages of a private endpoint returning the newest records first. Each following page is
+        requested with the id of the last record received as `after` parameter.
+        """
+        records = []
+        params = dict(params, limit=str(CONSTANTS.OKX_PAGE_LIMIT))
+        while True:
+            response = await self._api_request(
+                method=RESTMethod.GET,
+                path_url=path_url,
+                params=params,
+                is_auth_required=True)
+            page = response["data"]
+            records.extend(page)
+            if len(page) < CONSTANTS.OKX_PAGE_LIMIT:
+                return records
+            params["after"] = page[-1][cursor_key]
+
+    def _create_trade_update(self, fill_data: Dict[str, Any], order: InFlightOrder) -> TradeUpdate:
+        fee = TradeFeeBase.new_spot_fee(
+            fee_schema=self.trade_fee_schema(),
+            trade_type=order.trade_type,
+            percent_token=fill_data["feeCcy"],
+            flat_fees=[TokenAmount(amount=-Decimal(fill_data["fee"]), token=fill_data["feeCcy"])]
+        )
+        return TradeUpdate(
+            trade_id=str(fill_data["tradeId"]),
+            client_order_id=order.client_order_id,
+            exchange_order_id=str(fill_data["ordId"]),
+            trading_pair=order.trading_pair,
+            fee=fee,
+            fill_base_amount=Decimal(fill_data["fillSz"]),
+            fill_quote_amount=Decimal(fill_data["fillSz"]) * Decimal(fill_data["fillPx"]),
+            fill_price=Decimal(fill_data["fillPx"]),
+            fill_timestamp=int(fill_data["ts"]) * 1e-3,
+        )
+
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         updated_order_data = await self._request_order_update(order=tracked_order)
 
@@ -0,0 +1,69 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional
+
+from hummingbot.connector.exchange.okx import okx_constants as CONSTANTS
+from hummingbot.connector.exchange.okx.okx_auth import OkxAuth
+from hummingbot.core.data_type.ws_order_entry_data_source import WSOrderEntryDataSource
+from hummingbot.core.web_assistant.connections.data_types import (
+    WSJSONRequest,
+    WSPlainTextRequest,
+    WSRequest,
+    WSResponse,
+)
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
+
+
+class OkxWSOrderEntryDataSource(WSOrderEntryDataSource):
+
+    def __init__(
+            self,
+            auth: OkxAuth,
+            connector: 'OkxExchange',
+            api_factory: WebAssistantsFactory):
+        super().__init__(request_timeout=CONSTANTS.WS_ORDER_ENTRY_REQUEST_TIMEOUT)
+        self._auth: OkxAuth = auth
+        self._connector = connector
+        self._api_factory = api_factory
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        async with self._api_factory.throttler.execute_task(limit_id=CONSTANTS.WS_CONNECTION_LIMIT_ID):
+            await ws.connect(
+                ws_url=CONSTANTS.get_okx_ws_uri_private(self._connector.okx_registration_sub_domain),
+                message_timeout=CONSTANTS.SECONDS_TO_WAIT_TO_RECEIVE_MESSAGE)
+
+        payload = {
+            "op": "login",
+            "args": [self._auth.websocket_login_parameters()]
+        }
+        login_request: WSJSONRequest = WSJSONRequest(payload=payload)
+
+        async with self._api_factory.throttler.execute_task(limit_id=CONSTANTS.WS_LOGIN_LIMIT_ID):
+            await ws.send(login_request)
+
+        response: WSResponse = await ws.receive()
+        message = response.data
+        if message.get("event") != "login" or message.get("code") != "0":
+            await ws.disconnect()
+            raise IOError(f"Order entry websocket connection authentication failed ({message})")
+
+        return ws
+
+    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        while True:
+            try:
+                await super()._process_websocket_messages(websocket_assistant=websocket_assistant)
+                break
+            except asyncio.TimeoutError:
+                ping_request = WSPlainTextRequest(payload="ping")
+                await websocket_assistant.send(request=ping_request)
+
+    def _build_request(self, request_id: str, operation: str, params: Any) -> WSRequest:
+        return WSJSONRequest(payload={"id": request_id, "op": operation, "args": params})
+
+    def _request_id_from_message(self, message: Any) -> Optional[str]:
+        return message.get("id") if isinstance(message, dict) else None
@@ -35,6 +35,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         dict _trading_pairs
         object _queued_orders
         dict _quantization_params
+        dict _on_hold_balances
         object _order_book_trade_listener
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
@@ -53,6 +54,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                           object amount,
                           object price,
                           object is_maker=*)
+    cdef c_update_on_hold_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, bint is_release)
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
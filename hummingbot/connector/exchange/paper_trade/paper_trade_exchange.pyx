@@ -170,6 +170,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._trading_pairs = {}
         self._queued_orders = deque()
         self._quantization_params = {}
+        # Amount of each asset locked by the resting limit orders, updated when the orders are placed and removed
+        self._on_hold_balances = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
@@ -277,19 +279,14 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        return defaultdict(Decimal, self._on_hold_balances)
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
         _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
+        for asset, on_hold_balance in self._on_hold_balances.items():
+            if asset in _available_balances:
+                _available_balances[asset] -= on_hold_balance
         return _available_balances
 
     # </editor-fold>
@@ -341,6 +338,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrdersIterator map_it
             SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
             pair[LimitOrders.iterator, cppbool] insert_result
+            pair[SingleTradingPairLimitOrders.iterator, cppbool] insert_order_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -358,7 +356,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            insert_order_result = limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 True,
@@ -371,6 +369,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if insert_order_result.second:
+                self.c_update_on_hold_balance(address(deref(insert_order_result.first)), False)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -402,6 +402,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrdersIterator map_it
             SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
             pair[LimitOrders.iterator, cppbool] insert_result
+            pair[SingleTradingPairLimitOrders.iterator, cppbool] insert_order_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -418,7 +419,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            insert_order_result = limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 False,
@@ -431,6 +432,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if insert_order_result.second:
+                self.c_update_on_hold_balance(address(deref(insert_order_result.first)), False)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -623,6 +626,31 @@ cdef class PaperTradeExchange(ExchangeBase):
             else:
                 return
 
+    cdef c_update_on_hold_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, bint is_release):
+        """
+        Adds the balance locked by a limit order to the on hold balances, or releases it when the order is removed.
+
+        :param cpp_limit_order_ptr: pointer to the limit order
+        :param is_release: True if the order is being removed from the resting limit orders
+        """
+        cdef:
+            object quantity = <object> cpp_limit_order_ptr.getQuantity()
+            str asset
+            object on_hold_balance
+
+        if cpp_limit_order_ptr.getIsBuy():
+            asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+            quantity = quantity * <object> cpp_limit_order_ptr.getPrice()
+        else:
+            asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+
+        on_hold_balance = self._on_hold_balances.get(asset, s_decimal_0)
+        on_hold_balance = on_hold_balance - quantity if is_release else on_hold_balance + quantity
+        if is_release and on_hold_balance <= s_decimal_0:
+            self._on_hold_balances.pop(asset, None)
+        else:
+            self._on_hold_balances[asset] = on_hold_balance
+
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
@@ -630,6 +658,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self.c_update_on_hold_balance(address(deref(orders_it)), True)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -941,7 +970,11 @@ cdef class PaperTradeExchange(ExchangeBase):
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        cdef:
+            str asset = currency.upper()
+        if asset not in self._account_balances:
+            return s_decimal_0
+        return self._account_balances[asset] - self._on_hold_balances.get(asset, s_decimal_0)
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         cdef:
@@ -2,9 +2,12 @@ import asyncio
 import copy
 import logging
 import math
+import statistics
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from decimal import Decimal
-from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -26,6 +29,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.data_type.ws_order_entry_data_source import WSOrderEntryDataSource, WSOrderEntryUnavailableError
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
@@ -42,6 +46,32 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Number of order book snapshots requested in parallel during startup. 1 keeps the sequential initialization.
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS = 1
+    # Merge the order book diffs pending for a trading pair and apply them as a single diff
+    COALESCE_ORDER_BOOK_DIFFS = False
+    # Check the update ids of the order book diffs and request a new snapshot when a gap is found. Only for exchanges
+    # whose diff messages include consecutive first and last update ids
+    DETECT_ORDER_BOOK_SEQUENCE_GAPS = False
+    # Reconcile the tracked orders with one open orders request and one recent fills request per trading pair, instead
+    # of requesting the status and the fills of every order. Only for connectors implementing
+    # _all_open_order_updates_for_trading_pair and _all_trade_updates_for_trading_pair
+    BULK_ORDER_STATUS_UPDATES = False
+    # Minimum number of tracked orders in a trading pair to reconcile them in bulk. Below it the per-order requests
+    # are cheaper
+    MIN_ORDERS_FOR_BULK_ORDER_STATUS_UPDATES = 2
+    # Seconds the recent fills request goes back from the previous bulk update, to include the fills the exchange
+    # registers with some delay. Repeated fills are discarded by the order tracker
+    BULK_TRADE_UPDATES_OVERLAP = 60.0
+    # Number of per-order status and fills requests sent in parallel. 1 keeps the sequential requests
+    MAX_CONCURRENT_ORDER_STATUS_REQUESTS = 1
+    # Maximum number of orders the exchange accepts in a single batch order creation and batch order cancelation
+    # request. The orders created (or canceled) during the same event loop iteration are sent together in batches of
+    # up to that size. Only for connectors implementing _place_orders_batch (or _place_cancels_batch). 1 disables it
+    BATCH_ORDER_CREATE_MAX_SIZE = 1
+    BATCH_ORDER_CANCEL_MAX_SIZE = 1
+    # Number of order placement and cancelation latencies kept for each order entry path (websocket and REST)
+    ORDER_ENTRY_LATENCY_SAMPLES = 500
 
     def __init__(self,
                  balance_asset_limit: Optional[Dict[str, Dict[str, Decimal]]] = None,
@@ -59,6 +89,12 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._last_bulk_trade_updates_timestamps: Dict[str, float] = {}
+        self._orders_queued_to_create_in_batch: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]] = []
+        self._orders_queued_to_cancel_in_batch: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]] = []
+        self._ws_order_entry_task: Optional[asyncio.Task] = None
+        self._order_entry_latencies: Dict[str, Deque[float]] = {
+            path: deque(maxlen=self.ORDER_ENTRY_LATENCY_SAMPLES) for path in ("websocket", "rest")}
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -75,11 +111,17 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            max_concurrent_initializations=self.MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS,
+            coalesce_diffs=self.COALESCE_ORDER_BOOK_DIFFS,
+            detect_sequence_gaps=self.DETECT_ORDER_BOOK_SEQUENCE_GAPS))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
 
+        # init the order entry websocket, for exchanges that accept orders through a websocket connection
+        self._ws_order_entry_data_source: Optional[WSOrderEntryDataSource] = self._create_ws_order_entry_data_source()
+
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
     @classmethod
@@ -174,6 +216,23 @@ class ExchangePyBase(ExchangeBase, ABC):
             "user_stream_initialized": self._is_user_stream_initialized(),
         }
 
+    @property
+    def order_entry_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the statistics of the latest order placement and cancelation request latencies (in seconds), for the
+        order entry websocket and for the REST API, to compare both paths
+        """
+        stats = {}
+        for path, latencies in self._order_entry_latencies.items():
+            if len(latencies) > 0:
+                stats[path] = {
+                    "count": len(latencies),
+                    "mean": statistics.mean(latencies),
+                    "median": statistics.median(latencies),
+                    "max": max(latencies),
+                }
+        return stats
+
     @property
     def ready(self) -> bool:
         """
@@ -243,6 +302,26 @@ class ExchangePyBase(ExchangeBase, ABC):
             raise ValueError(f"No order book exists for '{trading_pair}'.")
         return self.order_book_tracker.order_books[trading_pair]
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Returns True if the order book for the trading pair has already been initialized, even if the order books for
+        other trading pairs are still being initialized
+
+        :param trading_pair: the pair of tokens for which the order book status should be checked
+        """
+        return self.order_book_tracker.is_order_book_ready(trading_pair)
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Returns True if the connector can trade the trading pair: every component of the connector is ready and the
+        order book of the trading pair is initialized, even if the order books for other trading pairs are not
+
+        :param trading_pair: the pair of tokens for which the status should be checked
+        """
+        components_ready = all(ready for component, ready in self.status_dict.items()
+                               if component != "order_books_initialized")
+        return components_ready and self.is_order_book_ready(trading_pair)
+
     def tick(self, timestamp: float):
         """
         Includes the logic that has to be processed every time a new tick happens in the bot. Particularly it enables
@@ -467,15 +546,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        exchange_order_id, update_timestamp = await self._send_order_placement(order=order, **kwargs)
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -545,7 +616,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         return None
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        cancelled = await self._send_order_cancelation(order=order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -561,6 +632,175 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._order_tracker.process_order_update(order_update)
         return cancelled
 
+    async def _send_order_placement(self, order: InFlightOrder, **kwargs) -> Tuple[str, float]:
+        """
+        Sends the order placement request. When batch creation is enabled the order is queued, and the orders queued
+        during the same event loop iteration are sent together in a batch request. Otherwise (or if it is the only
+        order queued) it is sent by itself, through the order entry websocket if it is connected
+        """
+        if self.BATCH_ORDER_CREATE_MAX_SIZE > 1 and self._is_batch_order_create_supported(order=order):
+            return await self._queue_batch_request(
+                queue=self._orders_queued_to_create_in_batch,
+                execute_queued_requests=self._execute_queued_order_creations,
+                order=order,
+                **kwargs,
+            )
+        return await self._send_single_order_placement(order=order, **kwargs)
+
+    async def _send_order_cancelation(self, order: InFlightOrder) -> bool:
+        """
+        Sends the order cancelation request. When batch cancelation is enabled the order is queued, and the orders
+        queued during the same event loop iteration are canceled together in a batch request. Otherwise (or if it is
+        the only order queued) it is sent by itself, through the order entry websocket if it is connected
+        """
+        if self.BATCH_ORDER_CANCEL_MAX_SIZE > 1:
+            return await self._queue_batch_request(
+                queue=self._orders_queued_to_cancel_in_batch,
+                execute_queued_requests=self._execute_queued_order_cancelations,
+                order=order,
+            )
+        return await self._send_single_order_cancelation(order=order)
+
+    async def _send_single_order_placement(self, order: InFlightOrder, **kwargs) -> Tuple[str, float]:
+        """
+        Places a single order through the order entry websocket when it is connected, and using the REST API
+        otherwise, or if the websocket request could not be sent
+        """
+        if self._ws_order_entry_data_source is not None and self._ws_order_entry_data_source.is_connected:
+            start_time = time.perf_counter()
+            try:
+                result = await self._place_order_ws(order=order, **kwargs)
+                self._register_order_entry_latency(path="websocket", start_time=start_time)
+                return result
+            except WSOrderEntryUnavailableError as ws_exception:
+                self.logger().warning(f"The order {order.client_order_id} could not be sent through the order entry "
+                                      f"websocket ({ws_exception}). Sending it using the REST API.")
+
+        start_time = time.perf_counter()
+        result = await self._place_order(
+            order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            amount=order.amount,
+            trade_type=order.trade_type,
+            order_type=order.order_type,
+            price=order.price,
+            **kwargs,
+        )
+        self._register_order_entry_latency(path="rest", start_time=start_time)
+        return result
+
+    async def _send_single_order_cancelation(self, order: InFlightOrder) -> bool:
+        """
+        Cancels a single order through the order entry websocket when it is connected, and using the REST API
+        otherwise, or if the websocket request could not be sent
+        """
+        if self._ws_order_entry_data_source is not None and self._ws_order_entry_data_source.is_connected:
+            start_time = time.perf_counter()
+            try:
+                cancelled = await self._place_cancel_ws(order=order)
+                self._register_order_entry_latency(path="websocket", start_time=start_time)
+                return cancelled
+            except WSOrderEntryUnavailableError as ws_exception:
+                self.logger().warning(f"The cancelation of {order.client_order_id} could not be sent through the "
+                                      f"order entry websocket ({ws_exception}). Sending it using the REST API.")
+
+        start_time = time.perf_counter()
+        cancelled = await self._place_cancel(order.client_order_id, order)
+        self._register_order_entry_latency(path="rest", start_time=start_time)
+        return cancelled
+
+    def _register_order_entry_latency(self, path: str, start_time: float):
+        self._order_entry_latencies[path].append(time.perf_counter() - start_time)
+
+    async def _queue_batch_request(self,
+                                   queue: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]],
+                                   execute_queued_requests: Callable,
+                                   order: InFlightOrder,
+                                   **kwargs) -> Any:
+        """
+        Queues an order to be sent in a batch request with the rest of orders queued during the same event loop
+        iteration. The first order queued schedules the execution of the batches.
+
+        :return: the result of the request for the order. Raises the error of the request if it failed for the order
+        """
+        future = asyncio.get_event_loop().create_future()
+        queue.append((order, kwargs, future))
+        if len(queue) == 1:
+            safe_ensure_future(execute_queued_requests())
+        return await future
+
+    def _split_in_batches(self,
+                          queue: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]],
+                          max_size: int) -> List[List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]]]:
+        """
+        Groups the queued orders by trading pair, in chunks of up to the maximum batch size
+        """
+        requests_by_pair: Dict[str, List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]]] = {}
+        for request in queue:
+            requests_by_pair.setdefault(request[0].trading_pair, []).append(request)
+        return [requests[index:index + max_size]
+                for requests in requests_by_pair.values()
+                for index in range(0, len(requests), max_size)]
+
+    async def _execute_queued_order_creations(self):
+        queue = self._orders_queued_to_create_in_batch
+        self._orders_queued_to_create_in_batch = []
+        await safe_gather(*[
+            self._execute_batch_request(batch=batch,
+                                        place_single_request=self._place_queued_order,
+                                        place_batch_request=self._place_orders_batch)
+            for batch in self._split_in_batches(queue=queue, max_size=self.BATCH_ORDER_CREATE_MAX_SIZE)])
+
+    async def _execute_queued_order_cancelations(self):
+        queue = self._orders_queued_to_cancel_in_batch
+        self._orders_queued_to_cancel_in_batch = []
+        await safe_gather(*[
+            self._execute_batch_request(batch=batch,
+                                        place_single_request=self._place_queued_cancel,
+                                        place_batch_request=self._place_cancels_batch)
+            for batch in self._split_in_batches(queue=queue, max_size=self.BATCH_ORDER_CANCEL_MAX_SIZE)])
+
+    async def _execute_batch_request(self,
+                                     batch: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]],
+                                     place_single_request: Callable,
+                                     place_batch_request: Callable):
+        """
+        Sends the request for a batch of queued orders, and sets the result of each order in its future.
+        A batch with a single order uses the single order request. If the whole request fails, the error is set for
+        all the orders of the batch.
+        """
+        try:
+            if len(batch) == 1:
+                order, kwargs, _ = batch[0]
+                results = [await place_single_request(order, **kwargs)]
+            else:
+                start_time = time.perf_counter()
+                results = await place_batch_request(orders=[order for order, _, _ in batch])
+                if len(results) != len(batch):
+                    raise IOError(f"The batch request returned {len(results)} results for {len(batch)} orders.")
+                for _ in batch:
+                    self._register_order_entry_latency(path="rest", start_time=start_time)
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as request_error:
+            results = [request_error] * len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _place_queued_order(self, order: InFlightOrder, **kwargs) -> Tuple[str, float]:
+        return await self._send_single_order_placement(order=order, **kwargs)
+
+    async def _place_queued_cancel(self, order: InFlightOrder) -> bool:
+        return await self._send_single_order_cancelation(order=order)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -648,6 +888,35 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates several orders of the same trading pair with a single request. Required when
+        BATCH_ORDER_CREATE_MAX_SIZE is bigger than 1.
+
+        :param orders: the orders to create, already tracked
+        :return: for each order, in the same order, the exchange order id and the creation timestamp, or the error
+            the exchange returned for that order
+        """
+        raise NotImplementedError
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels several orders of the same trading pair with a single request. Required when
+        BATCH_ORDER_CANCEL_MAX_SIZE is bigger than 1.
+
+        :param orders: the orders to cancel
+        :return: for each order, in the same order, True if the order was canceled, or the error the exchange returned
+            for that order
+        """
+        raise NotImplementedError
+
+    def _is_batch_order_create_supported(self, order: InFlightOrder) -> bool:
+        """
+        Indicates if an order can be created in a batch request, for exchanges whose batch requests don't accept
+        some order types
+        """
+        return True
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -682,6 +951,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            if self._ws_order_entry_data_source is not None:
+                self._ws_order_entry_task = safe_ensure_future(self._ws_order_entry_data_source.listen_for_responses())
 
     async def check_network(self) -> NetworkStatus:
         """
@@ -724,6 +995,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._ws_order_entry_task is not None:
+            self._ws_order_entry_task.cancel()
+            self._ws_order_entry_task = None
 
     # === loops and sync related methods ===
     #
@@ -955,7 +1229,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
+        async def update_order_fills(order: InFlightOrder):
             try:
                 trade_updates = await self._all_trade_updates_for_order(order=order)
                 for trade_update in trade_updates:
@@ -968,6 +1242,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                     exc_info=request_error,
                 )
 
+        await self._run_order_requests(orders=orders, request=update_order_fills)
+
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
             raise error
@@ -995,7 +1271,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        async def update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -1004,6 +1280,28 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._run_order_requests(orders=orders, request=update_order)
+
+    async def _run_order_requests(self, orders: List[InFlightOrder], request: Callable):
+        """
+        Runs a per-order request for each order, with at most MAX_CONCURRENT_ORDER_STATUS_REQUESTS requests in flight.
+        The throttler keeps the concurrent requests within the exchange rate limits.
+
+        :param orders: the orders to request
+        :param request: coroutine function receiving an order, that handles its own errors
+        """
+        if self.MAX_CONCURRENT_ORDER_STATUS_REQUESTS > 1 and len(orders) > 1:
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_STATUS_REQUESTS)
+
+            async def bounded_request(order: InFlightOrder):
+                async with semaphore:
+                    await request(order)
+
+            await safe_gather(*[bounded_request(order) for order in orders])
+        else:
+            for order in orders:
+                await request(order)
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1017,8 +1315,84 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
-        await self._update_orders()
+        if self.BULK_ORDER_STATUS_UPDATES:
+            await self._update_orders_in_bulk()
+        else:
+            await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
+            await self._update_orders()
+
+    async def _update_orders_in_bulk(self):
+        """
+        Reconciles the tracked orders with the exchange using, for each trading pair with enough tracked orders, one
+        request for the recent fills and one request for the open orders.
+        The active orders no longer open in the exchange (completed, canceled or not created yet) are updated with
+        their own fills and status requests, as well as all the orders of the other trading pairs and of the trading
+        pairs whose bulk requests fail.
+        """
+        fillable_orders_by_pair: Dict[str, List[InFlightOrder]] = {}
+        for order in self._order_tracker.all_fillable_orders.values():
+            fillable_orders_by_pair.setdefault(order.trading_pair, []).append(order)
+        active_orders = list(self.in_flight_orders.values())
+        bulk_pairs = [trading_pair for trading_pair, orders in fillable_orders_by_pair.items()
+                      if len(orders) >= self.MIN_ORDERS_FOR_BULK_ORDER_STATUS_UPDATES]
+
+        results = await safe_gather(
+            *[self._update_trading_pair_orders_in_bulk(trading_pair=trading_pair,
+                                                       orders=fillable_orders_by_pair[trading_pair])
+              for trading_pair in bulk_pairs],
+            return_exceptions=True)
+
+        updated_pairs = set()
+        open_client_order_ids = set()
+        for trading_pair, result in zip(bulk_pairs, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                self.logger().warning(
+                    f"Failed to fetch the bulk order updates for {trading_pair}. Updating each order instead. "
+                    f"Error: {result}",
+                    exc_info=result,
+                )
+            else:
+                updated_pairs.add(trading_pair)
+                open_client_order_ids.update(result)
+
+        orders_to_update = [order for order in active_orders if order.client_order_id not in open_client_order_ids]
+        orders_to_update_ids = {order.client_order_id for order in orders_to_update}
+        await self._update_orders_fills(orders=[
+            order for trading_pair, orders in fillable_orders_by_pair.items() for order in orders
+            if trading_pair not in updated_pairs or order.client_order_id in orders_to_update_ids
+        ])
+        await self._update_orders_with_error_handler(
+            orders=orders_to_update, error_handler=self._handle_update_error_for_active_order
+        )
+
+    async def _update_trading_pair_orders_in_bulk(self, trading_pair: str, orders: List[InFlightOrder]) -> List[str]:
+        """
+        Processes the recent fills and the open orders of a trading pair.
+
+        :param trading_pair: the trading pair of the orders
+        :param orders: the fillable orders of the trading pair
+        :return: the client order ids of the tracked orders open in the exchange
+        """
+        request_timestamp = self._time_synchronizer.time()
+        start_timestamp = self._last_bulk_trade_updates_timestamps.get(
+            trading_pair, min(order.creation_timestamp for order in orders))
+        trade_updates = await self._all_trade_updates_for_trading_pair(
+            trading_pair=trading_pair,
+            orders=orders,
+            start_timestamp=start_timestamp - self.BULK_TRADE_UPDATES_OVERLAP)
+        for trade_update in trade_updates:
+            self._order_tracker.process_trade_update(trade_update)
+        self._last_bulk_trade_updates_timestamps[trading_pair] = request_timestamp
+
+        tracked_client_order_ids = {order.client_order_id for order in orders}
+        open_client_order_ids = []
+        for order_update in await self._all_open_order_updates_for_trading_pair(trading_pair=trading_pair):
+            if order_update.client_order_id in tracked_client_order_ids:
+                self._order_tracker.process_order_update(order_update)
+                open_client_order_ids.append(order_update.client_order_id)
+        return open_client_order_ids
 
     async def _update_lost_orders_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
@@ -1054,6 +1428,31 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _all_trade_updates_for_trading_pair(self,
+                                                  trading_pair: str,
+                                                  orders: List[InFlightOrder],
+                                                  start_timestamp: float) -> List[TradeUpdate]:
+        """
+        Requests the fills of the account in a trading pair since a time, with a single request when possible.
+        Required by the bulk order status updates.
+
+        :param trading_pair: the trading pair of the fills
+        :param orders: the tracked orders of the trading pair. Fills of other orders are discarded
+        :param start_timestamp: time (in seconds) of the oldest fill to include
+        :return: the trade updates of the fills of the tracked orders
+        """
+        raise NotImplementedError
+
+    async def _all_open_order_updates_for_trading_pair(self, trading_pair: str) -> List[OrderUpdate]:
+        """
+        Requests the orders of the account open in the exchange for a trading pair, with a single request when
+        possible. Required by the bulk order status updates.
+
+        :param trading_pair: the trading pair of the orders
+        :return: an order update with the client order id and the current state of each open order
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1070,6 +1469,33 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
         raise NotImplementedError
 
+    def _create_ws_order_entry_data_source(self) -> Optional[WSOrderEntryDataSource]:
+        """
+        Creates the data source to place and cancel orders through a websocket connection. Exchanges supporting it
+        return an instance, and implement _place_order_ws and _place_cancel_ws. The REST API is used when it is None
+        """
+        return None
+
+    async def _place_order_ws(self, order: InFlightOrder, **kwargs) -> Tuple[str, float]:
+        """
+        Places an order through the order entry websocket. Required when _create_ws_order_entry_data_source returns
+        a data source
+
+        :param order: the order to place, already tracked
+        :return: the exchange order id and the creation timestamp
+        """
+        raise NotImplementedError
+
+    async def _place_cancel_ws(self, order: InFlightOrder) -> bool:
+        """
+        Cancels an order through the order entry websocket. Required when _create_ws_order_entry_data_source returns
+        a data source
+
+        :param order: the order to cancel
+        :return: True if the order was canceled
+        """
+        raise NotImplementedError
+
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
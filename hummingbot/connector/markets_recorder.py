@@ -5,8 +5,7 @@ import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -46,7 +45,9 @@ from hummingbot.model.position import Position
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_exporter import TradeFillExporter
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
@@ -87,6 +88,9 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        # Database writes are done by a worker thread once the recorder is started, to keep them out of the event loop
+        self._write_queue: SQLWriteBehindQueue = SQLWriteBehindQueue(sql)
+        self._trade_exporters: Dict[str, TradeFillExporter] = {}
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -131,28 +135,28 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    market_data_records: List[MarketData] = []
+                    for market in self._markets:
+                        exchange = market.display_name
+                        for trading_pair in market.trading_pairs:
+                            mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                            best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                            best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                            order_book = market.get_order_book(trading_pair)
+                            depth = self._market_data_collection_config.market_data_collection_depth + 1
+                            market_data = MarketData(
+                                timestamp=self.db_timestamp,
+                                exchange=exchange,
+                                trading_pair=trading_pair,
+                                mid_price=mid_price,
+                                best_bid=best_bid,
+                                best_ask=best_ask,
+                                order_book={
+                                    "bid": list(order_book.bid_entries())[:depth],
+                                    "ask": list(order_book.ask_entries())[:depth]}
+                            )
+                            market_data_records.append(market_data)
+                    self._write_queue.put(lambda session: session.add_all(market_data_records))
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -176,7 +180,15 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_queue(self) -> SQLWriteBehindQueue:
+        """
+        The queue persisting the recorder writes. Exposes the queue depth and commit latency metrics.
+        """
+        return self._write_queue
+
     def start(self):
+        self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -219,12 +231,24 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        self._write_queue.stop()
+        for exporter in self._trade_exporters.values():
+            exporter.close()
+        self._trade_exporters.clear()
+
+    def flush(self):
+        """
+        Blocks until all the pending writes have been committed to the database
+        """
+        self._write_queue.flush()
 
     def store_or_update_executor(self, executor):
-        with self._sql_manager.get_new_session() as session:
-            existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
-            serialized_config = executor.executor_info.model_dump_json()
-            executor_dict = json.loads(serialized_config)
+        executor_id = executor.config.id
+        serialized_config = executor.executor_info.model_dump_json()
+        executor_dict = json.loads(serialized_config)
+
+        def write(session: Session):
+            existing_executor = session.query(Executors).filter(Executors.id == executor_id).one_or_none()
             if existing_executor:
                 # Update existing executor
                 for attr, value in executor_dict.items():
@@ -233,15 +257,14 @@ class MarketsRecorder:
                 # Insert new executor
                 new_executor = Executors(**executor_dict)
                 session.add(new_executor)
-            session.commit()
+
+        self._write_queue.put(write)
 
     def store_position(self, position: Position):
-        with self._sql_manager.get_new_session() as session:
-            session.add(position)
-            session.commit()
+        self._write_queue.put(lambda session: session.add(position))
 
     def update_or_store_position(self, position: Position):
-        with self._sql_manager.get_new_session() as session:
+        def write(session: Session):
             # Check if a position already exists for this controller, connector, trading pair, and side
             existing_position = session.query(Position).filter(
                 Position.controller_id == position.controller_id,
@@ -262,45 +285,49 @@ class MarketsRecorder:
                 # Insert new position
                 session.add(position)
 
-            session.commit()
+        self._write_queue.put(write)
 
     def store_controller_config(self, controller_config: ControllerConfigBase):
-        with self._sql_manager.get_new_session() as session:
-            config = json.loads(controller_config.json())
-            base_columns = ["id", "timestamp", "type"]
-            controller = Controllers(id=config["id"],
-                                     timestamp=time.time(),
-                                     type=config["controller_type"],
-                                     config={k: v for k, v in config.items() if k not in base_columns})
-            session.add(controller)
-            session.commit()
+        config = json.loads(controller_config.json())
+        base_columns = ["id", "timestamp", "type"]
+        controller = Controllers(id=config["id"],
+                                 timestamp=time.time(),
+                                 type=config["controller_type"],
+                                 config={k: v for k, v in config.items() if k not in base_columns})
+        self._write_queue.put(lambda session: session.add(controller))
 
     def get_executors_by_ids(self, executor_ids: List[str]):
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.id.in_(executor_ids)).all()
             return executors
 
     def get_executors_by_controller(self, controller_id: str = None) -> List[ExecutorInfo]:
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
             return [executor.to_executor_info() for executor in executors]
 
     def get_all_executors(self) -> List[ExecutorInfo]:
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).all()
             return [executor.to_executor_info() for executor in executors]
 
     def get_positions_by_ids(self, position_ids: List[str]) -> List[Position]:
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).filter(Position.id.in_(position_ids)).all()
             return positions
 
     def get_positions_by_controller(self, controller_id: str = None) -> List[Position]:
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).filter(Position.controller_id == controller_id).all()
             return positions
 
     def get_all_positions(self) -> List[Position]:
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).all()
             return positions
@@ -308,6 +335,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -323,6 +351,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -334,20 +363,50 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states(config_file_path=config_file_path,
+                                 market_name=market.display_name,
+                                 tracking_states=market.tracking_states,
+                                 timestamp=self.db_timestamp,
+                                 session=session)
+
+    @staticmethod
+    def _save_market_states(config_file_path: str,
+                            market_name: str,
+                            tracking_states: Dict[str, Any],
+                            timestamp: int,
+                            session: Session):
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == config_file_path,
+                                MarketState.market == market_name))
+        market_states: Optional[MarketState] = query.one_or_none()
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
+    def _market_states_writer(self, market: ConnectorBase) -> Callable[[Session], None]:
+        """
+        Captures the current tracking states of the market, to be saved later by the write queue worker thread
+        """
+        config_file_path = self._config_file_path
+        market_name = market.display_name
+        tracking_states = market.tracking_states
+        timestamp = self.db_timestamp
+        return lambda session: self._save_market_states(config_file_path=config_file_path,
+                                                        market_name=market_name,
+                                                        tracking_states=tracking_states,
+                                                        timestamp=timestamp,
+                                                        session=session)
+
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
@@ -377,31 +436,34 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        save_market_states = self._market_states_writer(market)
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+            save_market_states(session)
+
+        self._write_queue.put(write)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -416,56 +478,57 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+        save_market_states = self._market_states_writer(market)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            save_market_states(session)
+
+        self._write_queue.put(write)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -476,25 +539,21 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._write_queue.put(write)
 
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
@@ -510,14 +569,12 @@ class MarketsRecorder:
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        exporter = self._trade_exporters.get(csv_path)
+        if exporter is None:
+            # The file header is validated once, when the exporter opens the file
+            exporter = TradeFillExporter(file_path=csv_path, field_names=field_names)
+            self._trade_exporters[csv_path] = exporter
+        exporter.append(field_data)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -535,18 +592,21 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        save_market_states = self._market_states_writer(market)
+
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                save_market_states(session)
+
+        self._write_queue.put(write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -582,15 +642,18 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        save_market_states = self._market_states_writer(connector)
+
+        def write(session: Session):
+            session.add(rp_update)
+            save_market_states(session)
+
+        self._write_queue.put(write)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -600,17 +663,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        save_market_states = self._market_states_writer(connector)
+
+        def write(session: Session):
+            session.add(rp_fees)
+            save_market_states(session)
+
+        self._write_queue.put(write)
 
     @staticmethod
     async def _sleep(delay):
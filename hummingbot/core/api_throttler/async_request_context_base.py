@@ -2,14 +2,15 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog, TaskLogWindow
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
+# Minimum time between capacity checks, to avoid spinning on timestamps rounding when a log is about to expire
+MIN_RETRY_INTERVAL = 0.001
 
 
 class AsyncRequestContextBase(ABC):
@@ -28,7 +29,7 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: Dict[str, TaskLogWindow],
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
@@ -37,55 +38,80 @@ class AsyncRequestContextBase(ABC):
                  ):
         """
         Asynchronous context associated with each API request.
-        :param task_logs: Shared task logs associated with this API request
+        :param task_logs: Shared task log windows, by limit id, associated with this API request
         :param rate_limit: The RateLimit associated with this API Request
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time to wait before checking the capacity again when the required capacity can not be
+            freed by the limit windows (i.e. a task heavier than the limit itself)
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: Dict[str, TaskLogWindow] = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
 
+    def _limits_with_weights(self) -> List[Tuple[RateLimit, int]]:
+        if self._rate_limit is None:
+            return []
+        return [(self._rate_limit, self._rate_limit.weight)] + self._related_limits
+
+    def _window_length(self, rate_limit: RateLimit) -> float:
+        return rate_limit.time_interval * (1 + self._safety_margin_pct)
+
     def flush(self):
         """
-        Remove task logs that have passed rate limit periods
+        Remove the task logs that have passed the rate limit periods of the limits affected by this request
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        self._task_logs[:] = [
-            task for task in self._task_logs
-            if now - Decimal(str(task.timestamp)) <= Decimal(str(task.rate_limit.time_interval * (1 + self._safety_margin_pct)))
-        ]
+        now: float = self._time()
+        for rate_limit, _ in self._limits_with_weights():
+            if rate_limit.limit_id in self._task_logs:
+                self._task_logs[rate_limit.limit_id].expire(now - self._window_length(rate_limit))
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def time_until_capacity(self) -> float:
+        """
+        Calculates the time to wait until all the limits associated with the request have capacity for it
+        :return: the number of seconds to wait
+        """
+        now: float = self._time()
+        waiting_time = 0.0
+        for rate_limit, weight in self._limits_with_weights():
+            if weight > rate_limit.limit:
+                return self._retry_interval
+            window = self._task_logs.get(rate_limit.limit_id)
+            if window is not None:
+                waiting_time = max(
+                    waiting_time,
+                    window.time_until_capacity(
+                        weight=weight,
+                        limit=rate_limit.limit,
+                        window_length=self._window_length(rate_limit),
+                        now=now))
+        return waiting_time
+
     async def acquire(self):
         while True:
             async with self._lock:
-                self.flush()
-
                 if self.within_capacity():
+                    now = self._time()
+                    # Each related limit is represented as it own individual TaskLog
+                    # Log the acquired rate limit and its related limits into the tasks log
+                    for rate_limit, weight in self._limits_with_weights():
+                        self._task_logs[rate_limit.limit_id].append(
+                            TaskLog(timestamp=now, rate_limit=rate_limit, weight=weight))
                     break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-
-            # Log the acquired rate limit into the tasks log
-            new_logs = [
-                TaskLog(timestamp=now, rate_limit=self._rate_limit, weight=self._rate_limit.weight)
-            ] + [
-                # Log its related limits into the tasks log as individual tasks
-                TaskLog(timestamp=now, rate_limit=limit, weight=weight)
-                for limit, weight in self._related_limits
-            ]
-            self._task_logs.extend(new_logs)
+                # Wake up exactly when the oldest logs blocking the request leave their windows
+                waiting_time = self.time_until_capacity()
+            await asyncio.sleep(max(waiting_time, MIN_RETRY_INTERVAL))
+
+    def _time(self) -> float:
+        return time.time()
 
     async def __aenter__(self):
         await self.acquire()
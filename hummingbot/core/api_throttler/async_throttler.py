@@ -1,20 +1,19 @@
-import collections
-import time
-from decimal import Decimal
-from typing import List, Tuple
+from typing import Optional
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import TaskLogWindow
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
     """
     An async context class ('async with' syntax) that checks for rate limit and wait for the capacity if needed.
     It uses async lock to prevent other instances of this class from running acquire fn before it finishes with it.
+    The used capacity of each limit is read from the running weight of its task log window, so the check does not
+    depend on the number of tasks logged.
     """
 
     def within_capacity(self) -> bool:
@@ -23,33 +22,26 @@ class AsyncRequestContext(AsyncRequestContextBase):
         Note: A task can be associated to one or more RateLimit.
         :return: True if it is within capacity to add a new task
         """
-        if self._rate_limit is not None:
-            list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
-                                                            self._rate_limit.weight)] + self._related_limits
-            limit_id_to_task_log_map = collections.defaultdict(list)
-            for task in self._task_logs:
-                limit_id_to_task_log_map[task.rate_limit.limit_id].append(task)
-            now: float = self._time()
-            for rate_limit, weight in list_of_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in limit_id_to_task_log_map[rate_limit.limit_id]
-                                          if
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
+        now: float = self._time()
+        for rate_limit, weight in self._limits_with_weights():
+            window: Optional[TaskLogWindow] = self._task_logs.get(rate_limit.limit_id)
+            if window is None:
+                capacity_used = 0
+            else:
+                window.expire(now - self._window_length(rate_limit))
+                capacity_used: int = window.weight
 
-                if capacity_used + weight > rate_limit.limit:
-                    if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
-                        msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
-                              f"{rate_limit.time_interval}s) has almost reached. Limits used " \
-                              f"is {capacity_used} in the last " \
-                              f"{rate_limit.time_interval} seconds"
-                        self.logger().notify(msg)
-                        AsyncRequestContextBase._last_max_cap_warning_ts = now
-                    return False
+            if capacity_used + weight > rate_limit.limit:
+                if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {capacity_used} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                return False
         return True
 
-    def _time(self):
-        return time.time()
-
 
 class AsyncThrottler(AsyncThrottlerBase):
     """
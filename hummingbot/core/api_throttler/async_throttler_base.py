@@ -3,11 +3,12 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLogWindow
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -34,7 +35,8 @@ class AsyncThrottlerBase(ABC):
                  ):
         """
         :param rate_limits: List of RateLimit(s).
-        :param retry_interval: Time between every capacity check.
+        :param retry_interval: Time between capacity checks for tasks that can never fit in their limits. Other tasks
+            wait exactly until the capacity they need is freed.
         :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity to ensure
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
@@ -46,8 +48,8 @@ class AsyncThrottlerBase(ABC):
 
         self.set_rate_limits(rate_limits)
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
+        # Windows of TaskLog, by limit id, used to determine the API requests within each limit time window.
+        self._task_logs: Dict[str, TaskLogWindow] = defaultdict(TaskLogWindow)
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
@@ -1,5 +1,7 @@
+from collections import deque
 from dataclasses import dataclass
 from typing import (
+    Deque,
     List,
     Optional,
 )
@@ -54,3 +56,58 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class TaskLogWindow:
+    """
+    Sliding window with the task logs registered for a single rate limit, kept in timestamp order together with the
+    running sum of their weights, so the used capacity can be checked without iterating over the logs.
+    """
+
+    def __init__(self):
+        self._task_logs: Deque[TaskLog] = deque()
+        self._weight: int = 0
+
+    def __len__(self) -> int:
+        return len(self._task_logs)
+
+    def __iter__(self):
+        return iter(self._task_logs)
+
+    @property
+    def weight(self) -> int:
+        """
+        Total weight of the task logs currently in the window
+        """
+        return self._weight
+
+    def append(self, task_log: TaskLog):
+        self._task_logs.append(task_log)
+        self._weight += task_log.weight
+
+    def expire(self, oldest_timestamp: float):
+        """
+        Removes the task logs registered before the oldest timestamp still inside the window
+        :param oldest_timestamp: timestamp of the beginning of the window
+        """
+        while self._task_logs and self._task_logs[0].timestamp < oldest_timestamp:
+            self._weight -= self._task_logs.popleft().weight
+
+    def time_until_capacity(self, weight: int, limit: int, window_length: float, now: float) -> float:
+        """
+        Calculates how long it will take until the window has enough capacity for a new task
+        :param weight: the weight of the new task
+        :param limit: the maximum total weight allowed in the window
+        :param window_length: the length of the window in seconds
+        :param now: the current timestamp
+        :return: the number of seconds until the new task fits in the window (0 if it already fits)
+        """
+        weight_to_release = self._weight + weight - limit
+        if weight_to_release <= 0:
+            return 0.0
+        for task_log in self._task_logs:
+            weight_to_release -= task_log.weight
+            if weight_to_release <= 0:
+                return max(0.0, task_log.timestamp + window_length - now)
+        # The task does not fit even in an empty window
+        return window_length
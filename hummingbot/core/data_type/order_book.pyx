@@ -34,10 +34,27 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+LEVELS_ARRAY_COLUMNS = ("price", "amount", "cumulative_amount", "cumulative_quote")
+cdef int64_t ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.OrderBookUpdateEvent.value
+
+
+cdef vector[OrderBookEntry] c_entries_from_levels(const double[:, :] levels,
+                                                  int64_t update_id,
+                                                  const int64_t[:] update_ids=None):
+    cdef:
+        vector[OrderBookEntry] entries
+        Py_ssize_t i
+        bint has_update_ids = update_ids is not None
+    entries.reserve(levels.shape[0])
+    for i in range(levels.shape[0]):
+        entries.push_back(OrderBookEntry(
+            levels[i, 0], levels[i, 1], update_ids[i] if has_update_ids else update_id))
+    return entries
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.OrderBookUpdateEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -55,6 +72,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._bid_levels_buffer = np.empty((0, len(LEVELS_ARRAY_COLUMNS)), dtype=np.float64)
+        self._ask_levels_buffer = np.empty((0, len(LEVELS_ARRAY_COLUMNS)), dtype=np.float64)
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -95,6 +114,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_trigger_event(ORDER_BOOK_UPDATE_EVENT_TAG, update_id)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -135,6 +155,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_trigger_event(ORDER_BOOK_UPDATE_EVENT_TAG, update_id)
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -197,6 +218,30 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_diffs_arrays(self,
+                           bids_array: np.ndarray,
+                           asks_array: np.ndarray,
+                           update_id: int,
+                           bids_update_ids: Optional[np.ndarray] = None,
+                           asks_update_ids: Optional[np.ndarray] = None):
+        """
+        Applies diffs given as float64 arrays with the columns [price, amount] (like the ones provided by
+        `OrderBookMessage.bids_array`), all of them with the same update id. If int64 arrays of update ids are given
+        for a side, each level gets its own update id instead. Levels with 0 amount are removed.
+        """
+        self.c_apply_diffs(c_entries_from_levels(bids_array, update_id, bids_update_ids),
+                           c_entries_from_levels(asks_array, update_id, asks_update_ids),
+                           update_id)
+
+    def apply_snapshot_arrays(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int):
+        """
+        Replaces the book content with the levels given as float64 arrays with the columns [price, amount], all of
+        them with the same update id.
+        """
+        self.c_apply_snapshot(c_entries_from_levels(bids_array, update_id),
+                              c_entries_from_levels(asks_array, update_id),
+                              update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -280,32 +325,100 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def levels_array(self, is_buy: bool, depth: int = 0) -> np.ndarray:
+        """
+        Returns the top levels of one side of the book as a contiguous float64 array with the columns
+        (price, amount, cumulative amount, cumulative quote), best price first.
+
+        The returned array is a view on a buffer owned by the order book and reused on every call, so it must be copied
+        if it has to be kept after the book changes or after the next call for the same side.
+
+        :param is_buy: True for the ask side (the side a buy order walks), False for the bid side
+        :param depth: maximum number of levels to return, 0 to return all the levels
+        :return: array view of shape (levels, 4)
+        """
+        return self.c_levels_array(is_buy, depth)
+
+    cdef object c_levels_array(self, bint is_buy, int depth):
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            size_t levels = self._ask_book.size() if is_buy else self._bid_book.size()
+            size_t row = 0
+            double cumulative_amount = 0
+            double cumulative_quote = 0
+            double[:, ::1] view
+
+        if 0 < depth < <int>levels:
+            levels = depth
+        buffer = self._ask_levels_buffer if is_buy else self._bid_levels_buffer
+        if buffer.shape[0] < levels:
+            # Grow geometrically, so the buffer is reallocated only a few times during the life of the book
+            buffer = np.empty((max(levels, 2 * buffer.shape[0]), len(LEVELS_ARRAY_COLUMNS)), dtype=np.float64)
+            if is_buy:
+                self._ask_levels_buffer = buffer
+            else:
+                self._bid_levels_buffer = buffer
+        view = buffer
+
+        if is_buy:
+            while row < levels:
+                entry = deref(ask_it)
+                cumulative_amount += entry.getAmount()
+                cumulative_quote += entry.getAmount() * entry.getPrice()
+                view[row, 0] = entry.getPrice()
+                view[row, 1] = entry.getAmount()
+                view[row, 2] = cumulative_amount
+                view[row, 3] = cumulative_quote
+                row += 1
+                inc(ask_it)
+        else:
+            while row < levels:
+                entry = deref(bid_it)
+                cumulative_amount += entry.getAmount()
+                cumulative_quote += entry.getAmount() * entry.getPrice()
+                view[row, 0] = entry.getPrice()
+                view[row, 1] = entry.getAmount()
+                view[row, 2] = cumulative_amount
+                view[row, 3] = cumulative_quote
+                row += 1
+                inc(bid_it)
+
+        return buffer[:levels]
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
+        cdef:
+            set[OrderBookEntry].iterator it = self._ask_book.begin()
+            OrderBookEntry entry
+            double amount_left = amount
         retval = []
-        for ask_entry in self.ask_entries():
-            ask_entry = ask_entry
-            if ask_entry.amount < amount_left:
-                retval.append(ask_entry)
-                amount_left -= ask_entry.amount
+        while it != self._ask_book.end():
+            entry = deref(it)
+            if entry.getAmount() < amount_left:
+                retval.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+                amount_left -= entry.getAmount()
             else:
-                retval.append(OrderBookRow(ask_entry.price, amount_left, ask_entry.update_id))
-                amount_left = 0.0
+                retval.append(OrderBookRow(entry.getPrice(), amount_left, entry.getUpdateId()))
                 break
+            inc(it)
         return retval
 
     def simulate_sell(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
+        cdef:
+            set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            double amount_left = amount
         retval = []
-        for bid_entry in self.bid_entries():
-            bid_entry = bid_entry
-            if bid_entry.amount < amount_left:
-                retval.append(bid_entry)
-                amount_left -= bid_entry.amount
+        while it != self._bid_book.rend():
+            entry = deref(it)
+            if entry.getAmount() < amount_left:
+                retval.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+                amount_left -= entry.getAmount()
             else:
-                retval.append(OrderBookRow(bid_entry.price, amount_left, bid_entry.update_id))
-                amount_left = 0.0
+                retval.append(OrderBookRow(entry.getPrice(), amount_left, entry.getUpdateId()))
                 break
+            inc(it)
         return retval
 
     cdef double c_get_price(self, bint is_buy) except? -1:
@@ -320,140 +433,177 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
             double cumulative_volume = 0
             double result_price = NaN
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                cumulative_volume += entry.getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = entry.getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                cumulative_volume += entry.getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = entry.getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if total_volume + entry.getAmount() >= volume:
+                    total_cost += (volume - total_volume) * entry.getPrice()
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += entry.getAmount() * entry.getPrice()
+                total_volume += entry.getAmount()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if total_volume + entry.getAmount() >= volume:
+                    total_cost += (volume - total_volume) * entry.getPrice()
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += entry.getAmount() * entry.getPrice()
+                total_volume += entry.getAmount()
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
             double cumulative_volume = 0
             double result_price = NaN
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                cumulative_volume += entry.getAmount() * entry.getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = entry.getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                cumulative_volume += entry.getAmount() * entry.getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = entry.getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                row_amount = entry.getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * entry.getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                row_amount = entry.getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * entry.getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
             double cumulative_volume = 0
             double result_price = NaN
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if entry.getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += entry.getAmount()
+                result_price = entry.getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if entry.getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += entry.getAmount()
+                result_price = entry.getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
             double cumulative_volume = 0
             double result_price = NaN
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if entry.getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += entry.getAmount() * entry.getPrice()
+                result_price = entry.getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if entry.getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += entry.getAmount() * entry.getPrice()
+                result_price = entry.getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -478,6 +628,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_arrays(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diffs_arrays(diff.bids_array, diff.asks_array, diff.update_id)
@@ -1,8 +1,10 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -52,18 +54,42 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
+    @cached_property
     def asks(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
         ]
 
-    @property
+    @cached_property
     def bids(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        """
+        Ask levels as a float64 array of shape (levels, 2) with the columns (price, amount). The levels are parsed only
+        once, the first time the array is requested.
+        """
+        return self._levels_to_array(self.content["asks"])
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        """
+        Bid levels as a float64 array of shape (levels, 2) with the columns (price, amount). The levels are parsed only
+        once, the first time the array is requested.
+        """
+        return self._levels_to_array(self.content["bids"])
+
+    @staticmethod
+    def _levels_to_array(levels) -> np.ndarray:
+        if isinstance(levels, np.ndarray) and levels.ndim == 2:
+            return np.asarray(levels[:, :2], dtype=np.float64)
+        if len(levels) == 0:
+            return np.empty((0, 2), dtype=np.float64)
+        return np.array([level[:2] for level in levels], dtype=np.float64)
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -0,0 +1,394 @@
+import os
+import time
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import msgpack
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+SEGMENT_FILE_EXTENSION = ".l2seg"
+INDEX_FILE_EXTENSION = ".l2idx"
+INDEX_FORMAT_VERSION = 1
+
+
+class RecordedMessagesIndex(NamedTuple):
+    """
+    Position of the messages of one trading pair inside a segment file, in the order they were recorded
+    """
+    offsets: np.ndarray  # int64, position of each record in the segment file
+    lengths: np.ndarray  # int64, size in bytes of each record
+    timestamps: np.ndarray  # float64, time when each message was recorded
+    types: np.ndarray  # uint8, OrderBookMessageType value of each message
+
+    def to_dict(self) -> Dict[str, bytes]:
+        return {field: getattr(self, field).tobytes() for field in self._fields}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, bytes]) -> "RecordedMessagesIndex":
+        return cls(
+            offsets=np.frombuffer(data["offsets"], dtype=np.int64),
+            lengths=np.frombuffer(data["lengths"], dtype=np.int64),
+            timestamps=np.frombuffer(data["timestamps"], dtype=np.float64),
+            types=np.frombuffer(data["types"], dtype=np.uint8),
+        )
+
+    @classmethod
+    def from_lists(cls, offsets: List[int], lengths: List[int], timestamps: List[float],
+                   types: List[int]) -> "RecordedMessagesIndex":
+        return cls(
+            offsets=np.array(offsets, dtype=np.int64),
+            lengths=np.array(lengths, dtype=np.int64),
+            timestamps=np.array(timestamps, dtype=np.float64),
+            types=np.array(types, dtype=np.uint8),
+        )
+
+
+def encode_order_book_message(message: OrderBookMessage, recorded_timestamp: float) -> List[Any]:
+    """
+    Converts an order book message into a record. The price levels are stored as the raw bytes of their float64
+    (price, amount) arrays, the rest of the content is kept as it is.
+    """
+    content = dict(message.content)
+    trading_pair = content.pop("trading_pair")
+    if message.type is OrderBookMessageType.TRADE:
+        bids = asks = b""
+    else:
+        bids = np.ascontiguousarray(message.bids_array[:, :2]).tobytes()
+        asks = np.ascontiguousarray(message.asks_array[:, :2]).tobytes()
+        content.pop("bids", None)
+        content.pop("asks", None)
+    return [message.type.value, trading_pair, recorded_timestamp, message.timestamp, bids, asks, content]
+
+
+def decode_order_book_message(record: List[Any]) -> Tuple[float, OrderBookMessage]:
+    """
+    Converts a record back into an order book message. The price levels of snapshots and diffs are float64 arrays of
+    shape (levels, 2).
+
+    :return: the time when the message was recorded and the message
+    """
+    type_value, trading_pair, recorded_timestamp, timestamp, bids, asks, content = record
+    message_type = OrderBookMessageType(type_value)
+    content["trading_pair"] = trading_pair
+    if message_type is not OrderBookMessageType.TRADE:
+        content["bids"] = np.frombuffer(bids, dtype=np.float64).reshape(-1, 2)
+        content["asks"] = np.frombuffer(asks, dtype=np.float64).reshape(-1, 2)
+    return recorded_timestamp, OrderBookMessage(message_type, content, timestamp)
+
+
+class OrderBookRecorder:
+    """
+    Stores the order book snapshots, diffs and trades received by an order book tracker in compact binary segments.
+
+    Each segment is a file of consecutive msgpack records, one per message, with the price levels stored as raw
+    float64 arrays. When a segment is closed (because it reached the maximum size or duration, or when the recorder is
+    closed) an index file is written next to it with, for every trading pair, the position, size, recording time and
+    type of each of its messages. This allows reading the messages of some trading pairs without decoding the others.
+
+    If a provider of the current order book snapshots is set, every segment after the first one starts with a snapshot
+    of each order book, so a recording can be replayed from the start of any segment. The first segment starts with
+    the messages recorded, usually the snapshots of the books when the recording started.
+    """
+    def __init__(self,
+                 path: str,
+                 max_segment_size: int = 64 * 1024 * 1024,
+                 max_segment_duration: float = 60 * 60,
+                 write_buffer_size: int = 1024 * 1024):
+        """
+        :param path: directory where the segments are stored
+        :param max_segment_size: size in bytes after which a new segment is started
+        :param max_segment_duration: time in seconds after which a new segment is started
+        :param write_buffer_size: size in bytes of the records kept in memory before writing them to the file
+        """
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._max_segment_size = max_segment_size
+        self._max_segment_duration = max_segment_duration
+        self._write_buffer_size = write_buffer_size
+        self._snapshots_provider: Optional[Callable[[], List[OrderBookMessage]]] = None
+        self._segment_file: Optional[BinaryIO] = None
+        self._segment_file_path: Optional[str] = None
+        self._segment_start_timestamp = 0.0
+        self._segment_end_timestamp = 0.0
+        self._segment_size = 0
+        self._segment_index: Dict[str, Tuple[List[int], List[int], List[float], List[int]]] = {}
+        self._write_buffer = bytearray()
+        self._packer = msgpack.Packer(default=str)
+        self._messages_count = 0
+        self._segments_count = 0
+        self._bytes_recorded = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def messages_count(self) -> int:
+        return self._messages_count
+
+    @property
+    def segments_count(self) -> int:
+        return self._segments_count
+
+    @property
+    def bytes_recorded(self) -> int:
+        """
+        Size of the segments closed plus the size of the current segment
+        """
+        return self._bytes_recorded + self._segment_size
+
+    def set_snapshots_provider(self, snapshots_provider: Optional[Callable[[], List[OrderBookMessage]]]):
+        """
+        Sets the function returning the snapshot messages of the current order books, recorded at the start of every
+        segment after the first one
+        """
+        self._snapshots_provider = snapshots_provider
+
+    def record(self, message: OrderBookMessage, timestamp: Optional[float] = None):
+        """
+        Stores an order book message.
+
+        :param message: the snapshot, diff or trade message
+        :param timestamp: the time when the message was received, now by default
+        """
+        timestamp = self._time() if timestamp is None else timestamp
+        if self._segment_file is None:
+            self._open_segment(timestamp)
+        elif (self._segment_size >= self._max_segment_size
+              or timestamp - self._segment_start_timestamp >= self._max_segment_duration):
+            self._close_segment()
+            self._open_segment(timestamp)
+            if self._snapshots_provider is not None:
+                for snapshot_message in self._snapshots_provider():
+                    self._append(snapshot_message, timestamp)
+        self._append(message, timestamp)
+
+    def flush(self):
+        """
+        Writes the records kept in memory to the current segment file
+        """
+        if self._segment_file is not None and len(self._write_buffer) > 0:
+            self._segment_file.write(self._write_buffer)
+            self._segment_file.flush()
+            self._write_buffer.clear()
+
+    def close(self):
+        """
+        Closes the current segment, writing its index
+        """
+        if self._segment_file is not None:
+            self._close_segment()
+
+    def _open_segment(self, timestamp: float):
+        segment_name = int(timestamp * 1e3)
+        while os.path.exists(os.path.join(self._path, f"{segment_name:013d}{SEGMENT_FILE_EXTENSION}")):
+            segment_name += 1
+        self._segment_file_path = os.path.join(self._path, f"{segment_name:013d}{SEGMENT_FILE_EXTENSION}")
+        self._segment_file = open(self._segment_file_path, "wb")
+        self._segment_start_timestamp = timestamp
+        self._segment_size = 0
+        self._segments_count += 1
+
+    def _append(self, message: OrderBookMessage, timestamp: float):
+        record = self._packer.pack(encode_order_book_message(message, timestamp))
+        offsets, lengths, timestamps, types = self._segment_index.setdefault(message.trading_pair, ([], [], [], []))
+        offsets.append(self._segment_size)
+        lengths.append(len(record))
+        timestamps.append(timestamp)
+        types.append(message.type.value)
+        self._write_buffer += record
+        self._segment_size += len(record)
+        self._segment_end_timestamp = timestamp
+        self._messages_count += 1
+        if len(self._write_buffer) >= self._write_buffer_size:
+            self.flush()
+
+    def _close_segment(self):
+        self.flush()
+        self._segment_file.close()
+        index = {
+            "version": INDEX_FORMAT_VERSION,
+            "start_timestamp": self._segment_start_timestamp,
+            "end_timestamp": self._segment_end_timestamp,
+            "trading_pairs": {
+                trading_pair: RecordedMessagesIndex.from_lists(*pair_index).to_dict()
+                for trading_pair, pair_index in self._segment_index.items()
+            },
+        }
+        index_file_path = self._segment_file_path[:-len(SEGMENT_FILE_EXTENSION)] + INDEX_FILE_EXTENSION
+        temporary_index_file_path = f"{index_file_path}.tmp"
+        with open(temporary_index_file_path, "wb") as index_file:
+            index_file.write(msgpack.packb(index))
+        os.replace(temporary_index_file_path, index_file_path)
+        self._bytes_recorded += self._segment_size
+        self._segment_file = None
+        self._segment_file_path = None
+        self._segment_size = 0
+        self._segment_index = {}
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+class OrderBookRecording:
+    """
+    Reads the segments stored by an OrderBookRecorder. The index of a segment without index file (for example the
+    segment being written, or the last one if the recorder was not closed) is rebuilt reading the whole segment.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._indexes: Dict[str, Dict[str, RecordedMessagesIndex]] = {}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def segments(self) -> List[str]:
+        """
+        Paths of the segment files, in recording order
+        """
+        if not os.path.isdir(self._path):
+            return []
+        return [os.path.join(self._path, file_name)
+                for file_name in sorted(os.listdir(self._path))
+                if file_name.endswith(SEGMENT_FILE_EXTENSION)]
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        trading_pairs = set()
+        for segment in self.segments:
+            trading_pairs.update(self.read_index(segment).keys())
+        return sorted(trading_pairs)
+
+    def read_index(self, segment: str) -> Dict[str, RecordedMessagesIndex]:
+        """
+        Returns the index of each trading pair recorded in the segment
+        """
+        index = self._indexes.get(segment)
+        if index is None:
+            index_file_path = segment[:-len(SEGMENT_FILE_EXTENSION)] + INDEX_FILE_EXTENSION
+            if os.path.exists(index_file_path):
+                with open(index_file_path, "rb") as index_file:
+                    index_data = msgpack.unpackb(index_file.read())
+                index = {trading_pair: RecordedMessagesIndex.from_dict(pair_index)
+                         for trading_pair, pair_index in index_data["trading_pairs"].items()}
+                self._indexes[segment] = index
+            else:
+                # Not cached, the segment might still be growing
+                index = self._rebuild_index(segment)
+        return index
+
+    def get_snapshot(self, trading_pair: str, timestamp: Optional[float] = None) -> Optional[OrderBookMessage]:
+        """
+        Returns the last snapshot of the trading pair recorded at or before the timestamp (or the first snapshot
+        recorded after it if there is none). The first snapshot of the recording if no timestamp is specified.
+        """
+        position = self._starting_snapshot_position(trading_pair, timestamp)
+        if position is None:
+            return None
+        segment_number, offset, length = position
+        with open(self.segments[segment_number], "rb") as segment_file:
+            segment_file.seek(offset)
+            return decode_order_book_message(msgpack.unpackb(segment_file.read(length)))[1]
+
+    def iter_messages(self,
+                      trading_pairs: List[str],
+                      start_timestamp: Optional[float] = None,
+                      end_timestamp: Optional[float] = None) -> Iterator[Tuple[float, OrderBookMessage]]:
+        """
+        Iterates over the messages of the trading pairs in recording order. The messages of each trading pair start
+        after the snapshot returned by get_snapshot for the start timestamp, so they can be applied on top of it. The
+        messages recorded between that snapshot and the start timestamp are included.
+
+        :return: iterator of the time when each message was recorded and the message
+        """
+        starting_positions = {}
+        for trading_pair in trading_pairs:
+            position = self._starting_snapshot_position(trading_pair, start_timestamp)
+            if position is not None:
+                starting_positions[trading_pair] = position
+        if len(starting_positions) == 0:
+            return
+        first_segment_number = min(position[0] for position in starting_positions.values())
+        end_timestamp = np.inf if end_timestamp is None else end_timestamp
+        segments = self.segments
+
+        for segment_number in range(first_segment_number, len(segments)):
+            index = self.read_index(segments[segment_number])
+            offsets = []
+            lengths = []
+            for trading_pair, (pair_segment_number, snapshot_offset, _) in starting_positions.items():
+                pair_index = index.get(trading_pair)
+                if pair_index is None or segment_number < pair_segment_number:
+                    continue
+                selected = pair_index.timestamps <= end_timestamp
+                if segment_number == pair_segment_number:
+                    selected &= pair_index.offsets > snapshot_offset
+                offsets.append(pair_index.offsets[selected])
+                lengths.append(pair_index.lengths[selected])
+            offsets = np.concatenate(offsets) if len(offsets) > 0 else np.empty(0, dtype=np.int64)
+            lengths = np.concatenate(lengths) if len(lengths) > 0 else np.empty(0, dtype=np.int64)
+            if len(offsets) == 0:
+                continue
+            recording_order = np.argsort(offsets, kind="stable")
+            with open(segments[segment_number], "rb") as segment_file:
+                segment_data = memoryview(segment_file.read())
+            for offset, length in zip(offsets[recording_order].tolist(), lengths[recording_order].tolist()):
+                yield decode_order_book_message(msgpack.unpackb(segment_data[offset:offset + length]))
+
+    def _starting_snapshot_position(self, trading_pair: str,
+                                    timestamp: Optional[float]) -> Optional[Tuple[int, int, int]]:
+        """
+        :return: the segment number, offset and length of the snapshot to start replaying the trading pair from
+        """
+        last_position_before = None
+        for segment_number, segment in enumerate(self.segments):
+            pair_index = self.read_index(segment).get(trading_pair)
+            if pair_index is None:
+                continue
+            snapshot_positions = np.flatnonzero(pair_index.types == OrderBookMessageType.SNAPSHOT.value)
+            if len(snapshot_positions) == 0:
+                continue
+            if timestamp is None:
+                return self._record_position(segment_number, pair_index, snapshot_positions[0])
+            snapshot_positions_before = snapshot_positions[pair_index.timestamps[snapshot_positions] <= timestamp]
+            if len(snapshot_positions_before) > 0:
+                last_position_before = self._record_position(
+                    segment_number, pair_index, snapshot_positions_before[-1])
+            elif last_position_before is None:
+                # Nothing recorded before the timestamp, the first snapshot after it is used
+                return self._record_position(segment_number, pair_index, snapshot_positions[0])
+            else:
+                # The segments are in recording order, the next ones are later
+                break
+        return last_position_before
+
+    @staticmethod
+    def _record_position(segment_number: int, pair_index: RecordedMessagesIndex,
+                         position: int) -> Tuple[int, int, int]:
+        return segment_number, int(pair_index.offsets[position]), int(pair_index.lengths[position])
+
+    @staticmethod
+    def _rebuild_index(segment: str) -> Dict[str, RecordedMessagesIndex]:
+        pair_indexes: Dict[str, Tuple[List[int], List[int], List[float], List[int]]] = {}
+        with open(segment, "rb") as segment_file:
+            unpacker = msgpack.Unpacker(segment_file)
+            offset = 0
+            try:
+                for record in unpacker:
+                    end_offset = unpacker.tell()
+                    offsets, lengths, timestamps, types = pair_indexes.setdefault(record[1], ([], [], [], []))
+                    offsets.append(offset)
+                    lengths.append(end_offset - offset)
+                    timestamps.append(record[2])
+                    types.append(record[0])
+                    offset = end_offset
+            except ValueError:
+                # The last record was not completely written
+                pass
+        return {trading_pair: RecordedMessagesIndex.from_lists(*pair_index)
+                for trading_pair, pair_index in pair_indexes.items()}
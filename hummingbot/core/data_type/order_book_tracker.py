@@ -3,16 +3,19 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.logger import HummingbotLogger
 
 
@@ -31,11 +34,41 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 max_concurrent_initializations: int = 1,
+                 coalesce_diffs: bool = False,
+                 detect_sequence_gaps: bool = False):
+        """
+        :param data_source: the data source providing the order book snapshots and the real time messages
+        :param trading_pairs: the trading pairs to track
+        :param domain: the domain of the exchange
+        :param max_concurrent_initializations: maximum number of initial snapshots requested at the same time. With
+            the default value of 1 the order books are initialized one after the other, waiting one second between
+            them. Values bigger than 1 request the snapshots concurrently, relying on the connector throttler to keep
+            the requests within the exchange rate limits.
+        :param coalesce_diffs: if True, all the diff messages pending for a book are merged by price level (the
+            level from the diff with the highest update id wins) and applied to the book as a single diff
+        :param detect_sequence_gaps: if True, the diff messages including a `first_update_id` must continue from the
+            last update applied to the book. Diffs already contained in the book are dropped, and when a gap is found
+            the book is quarantined (flagged as not ready) until a new snapshot is requested and the buffered diffs
+            are replayed on top of it. Only valid for exchanges with consecutive update ids between diff messages
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._max_concurrent_initializations: int = max(1, max_concurrent_initializations)
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._diff_messages_coalesced: Dict[str, int] = defaultdict(int)
+        self._detect_sequence_gaps: bool = detect_sequence_gaps
+        self._last_update_ids: Dict[str, int] = {}
+        self._sequence_gaps: Dict[str, int] = defaultdict(int)
+        self._resync_latencies: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._quarantined_trading_pairs: Set[str] = set()
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +78,9 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        # Diffs after a sequence gap, replayed on top of the new snapshot. Not bounded, so none is lost
+        self._resync_message_buffers: Dict[str, Deque[OrderBookMessage]] = defaultdict(deque)
+        self._recorder: Optional[OrderBookRecorder] = None
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +104,48 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Returns the trading pairs whose order book is already initialized, even if other books are still pending
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    @property
+    def diff_messages_coalesced(self) -> Dict[str, int]:
+        """
+        Returns, for each trading pair, the number of diff messages that have been merged into other diffs instead of
+        being applied individually (only when diff coalescing is enabled)
+        """
+        return dict(self._diff_messages_coalesced)
+
+    @property
+    def sequence_gaps(self) -> Dict[str, int]:
+        """
+        Returns, for each trading pair, the number of gaps detected in the update ids of the diff messages (only when
+        sequence gap detection is enabled)
+        """
+        return dict(self._sequence_gaps)
+
+    @property
+    def resync_latencies(self) -> Dict[str, LatencyHistogram]:
+        """
+        Returns, for each trading pair, the distribution of the time between the detection of a sequence gap and the
+        order book being restored from a new snapshot
+        """
+        return dict(self._resync_latencies)
+
+    @property
+    def quarantined_trading_pairs(self) -> List[str]:
+        """
+        Returns the trading pairs whose order book is waiting for a new snapshot after a sequence gap
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if trading_pair in self._quarantined_trading_pairs]
+
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,10 +216,67 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        self._quarantined_trading_pairs.clear()
+        self._resync_message_buffers.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
+
+    def start_recording(self, recorder: OrderBookRecorder):
+        """
+        Stores with the recorder every snapshot, diff and trade message received from now on. Each segment of the
+        recording starts with a snapshot of the order books already initialized, and the books initialized later are
+        recorded as a snapshot too, so the recording can be replayed with a ReplayOrderBookDataSource.
+        """
+        self.stop_recording()
+        recorder.set_snapshots_provider(self._order_book_snapshot_messages)
+        self._recorder = recorder
+        for snapshot_message in self._order_book_snapshot_messages():
+            self._record_message(snapshot_message)
+
+    def stop_recording(self):
+        """
+        Stops recording the order book messages and closes the recorder
+        """
+        if self._recorder is not None:
+            recorder = self._recorder
+            self._recorder = None
+            recorder.set_snapshots_provider(None)
+            recorder.close()
+
+    def _record_message(self, message: OrderBookMessage):
+        if self._recorder is not None:
+            try:
+                self._recorder.record(message)
+            except Exception:
+                self.logger().error("Unexpected error recording the order book messages. Recording stopped.",
+                                    exc_info=True)
+                self._recorder = None
+
+    def _order_book_snapshot_messages(self) -> List[OrderBookMessage]:
+        return [self._order_book_snapshot_message(trading_pair, order_book)
+                for trading_pair, order_book in self._order_books.items()]
+
+    @staticmethod
+    def _order_book_snapshot_message(trading_pair: str, order_book: OrderBook) -> OrderBookMessage:
+        """
+        Builds a snapshot message with the current levels of the order book
+        """
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": max(order_book.snapshot_uid, order_book.last_diff_uid),
+            "bids": order_book.levels_array(False)[:, :2].copy(),
+            "asks": order_book.levels_array(True)[:, :2].copy(),
+        }, timestamp=time.time())
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_book_ready_events and self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -176,15 +311,56 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if self._max_concurrent_initializations > 1:
+            await self._init_order_books_concurrently()
+        else:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                await self._init_order_book(trading_pair)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    async def _init_order_books_concurrently(self):
+        """
+        Requests the initial snapshots of all order books in parallel, with at most `max_concurrent_initializations`
+        requests in flight. Each order book starts being tracked (and is flagged as ready) as soon as its own snapshot
+        arrives. Failed initializations are retried until they succeed.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_initializations)
+        initialized_count = 0
+
+        async def init_with_retries(trading_pair: str):
+            nonlocal initialized_count
+            while True:
+                try:
+                    async with semaphore:
+                        await self._init_order_book(trading_pair)
+                    initialized_count += 1
+                    self.logger().info(f"Initialized order book for {trading_pair}. "
+                                       f"{initialized_count}/{len(self._trading_pairs)} completed.")
+                    return
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error initializing order book for {trading_pair}.",
+                        exc_info=True,
+                        app_warning_msg=f"Error initializing order book for {trading_pair}. Retrying after 5 seconds."
+                    )
+                    await self._sleep(delay=5)
+
+        await asyncio.gather(*[init_with_retries(trading_pair) for trading_pair in self._trading_pairs])
+
+    async def _init_order_book(self, trading_pair: str):
+        self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        self._last_update_ids[trading_pair] = self._order_books[trading_pair].snapshot_uid
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+        if self._recorder is not None:
+            self._record_message(self._order_book_snapshot_message(trading_pair, self._order_books[trading_pair]))
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -197,6 +373,7 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                self._record_message(ob_message)
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
@@ -242,6 +419,7 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
+                self._record_message(ob_message)
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
                     continue
@@ -263,18 +441,40 @@ class OrderBookTracker:
 
         while True:
             try:
+                resync_messages: Deque[OrderBookMessage] = self._resync_message_buffers[trading_pair]
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                # Process the messages buffered during a resync and the saved messages first if there are any
+                if len(resync_messages) > 0:
+                    message = resync_messages.popleft()
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if self._coalesce_diffs:
+                        diff_messages = self._pending_diff_messages(
+                            message, [resync_messages, saved_messages], message_queue)
+                    else:
+                        diff_messages = [message]
+                    out_of_sequence_messages = []
+                    if self._detect_sequence_gaps:
+                        diff_messages, out_of_sequence_messages = self._split_at_sequence_gap(
+                            trading_pair, order_book, diff_messages)
+                    if len(diff_messages) > 1:
+                        self._apply_coalesced_diffs(order_book, diff_messages)
+                        self._diff_messages_coalesced[trading_pair] += len(diff_messages) - 1
+                    elif len(diff_messages) == 1:
+                        order_book.apply_diffs_arrays(
+                            diff_messages[0].bids_array, diff_messages[0].asks_array, diff_messages[0].update_id)
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
+
+                    if len(out_of_sequence_messages) > 0:
+                        # The messages after the gap are buffered and replayed on top of the new snapshot
+                        resync_messages.extendleft(reversed(out_of_sequence_messages))
+                        await self._resync_order_book(trading_pair, order_book)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -285,6 +485,8 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._last_update_ids[trading_pair] = max(
+                        message.update_id, self._last_update_ids.get(trading_pair, message.update_id))
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +497,126 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _split_at_sequence_gap(
+            self,
+            trading_pair: str,
+            order_book: OrderBook,
+            diff_messages: List[OrderBookMessage]) -> Tuple[List[OrderBookMessage], List[OrderBookMessage]]:
+        """
+        Checks that the diff messages continue the sequence of update ids of the order book. Diffs already contained
+        in the book are dropped.
+
+        :return: the diffs that can be applied to the book, and the diffs starting at the first sequence gap
+        """
+        last_update_id = self._last_update_ids.get(trading_pair, order_book.snapshot_uid)
+        in_sequence_messages = []
+        out_of_sequence_messages = []
+        for position, diff_message in enumerate(diff_messages):
+            if "first_update_id" in diff_message.content:
+                if diff_message.update_id <= last_update_id:
+                    continue
+                if diff_message.first_update_id > last_update_id + 1:
+                    out_of_sequence_messages = diff_messages[position:]
+                    break
+            in_sequence_messages.append(diff_message)
+            last_update_id = max(last_update_id, diff_message.update_id)
+        self._last_update_ids[trading_pair] = last_update_id
+        return in_sequence_messages, out_of_sequence_messages
+
+    async def _resync_order_book(self, trading_pair: str, order_book: OrderBook):
+        """
+        Quarantines the order book after a sequence gap and restores it from a new snapshot, requested right away
+        instead of waiting for the periodic snapshots. The diffs received meanwhile are kept in the tracking queue.
+        """
+        gap_detection_time = time.perf_counter()
+        self._sequence_gaps[trading_pair] += 1
+        self._quarantined_trading_pairs.add(trading_pair)
+        self._order_book_ready_events[trading_pair].clear()
+        self.logger().warning(f"Sequence gap detected in the order book diffs for {trading_pair} "
+                              f"(last update id {self._last_update_ids.get(trading_pair)}). "
+                              f"Requesting a new snapshot.")
+        while True:
+            try:
+                snapshot_message: OrderBookMessage = await self._data_source.get_order_book_snapshot_message(
+                    trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error requesting the order book snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Error requesting the order book snapshot for {trading_pair}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await self._sleep(delay=5)
+
+        self._record_message(snapshot_message)
+        order_book.apply_snapshot_arrays(
+            snapshot_message.bids_array, snapshot_message.asks_array, snapshot_message.update_id)
+        self._last_update_ids[trading_pair] = snapshot_message.update_id
+        self._quarantined_trading_pairs.discard(trading_pair)
+        self._order_book_ready_events[trading_pair].set()
+        self._resync_latencies[trading_pair].record(time.perf_counter() - gap_detection_time)
+
+    @staticmethod
+    def _pending_diff_messages(
+            first_message: OrderBookMessage,
+            buffered_messages: List[Deque[OrderBookMessage]],
+            message_queue: asyncio.Queue) -> List[OrderBookMessage]:
+        """
+        Collects, without waiting, the diff messages already pending for the book after the first one, from the
+        buffers in order and then from the queue. Stops at the first message that is not a diff, and puts it back to
+        be processed next, so snapshots keep their order.
+        """
+        diff_messages = [first_message]
+        while True:
+            source = next((messages for messages in buffered_messages if len(messages) > 0), None)
+            if source is not None:
+                next_message = source.popleft()
+            elif not message_queue.empty():
+                source = buffered_messages[-1]
+                next_message = message_queue.get_nowait()
+            else:
+                break
+            if next_message.type is not OrderBookMessageType.DIFF:
+                source.appendleft(next_message)
+                break
+            diff_messages.append(next_message)
+        return diff_messages
+
+    @staticmethod
+    def _apply_coalesced_diffs(order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        """
+        Merges the diffs by price level, keeping for each level the amount from the diff with the highest update id,
+        and applies the result to the order book in a single operation.
+        """
+        diff_messages = sorted(diff_messages, key=lambda diff_message: diff_message.update_id)
+        coalesced_bids, bids_update_ids = OrderBookTracker._coalesce_levels(
+            [(diff_message.bids_array, diff_message.update_id) for diff_message in diff_messages])
+        coalesced_asks, asks_update_ids = OrderBookTracker._coalesce_levels(
+            [(diff_message.asks_array, diff_message.update_id) for diff_message in diff_messages])
+        order_book.apply_diffs_arrays(
+            coalesced_bids, coalesced_asks, diff_messages[-1].update_id, bids_update_ids, asks_update_ids)
+
+    @staticmethod
+    def _coalesce_levels(levels_with_update_ids: List[Tuple[np.ndarray, int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merges (price, amount) level arrays ordered by update id into a single (price, amount) array with one row per
+        price, taken from the last array that contains the price. The update ids of the rows are returned in a
+        separate int64 array, since a float64 column can not hold every update id exactly.
+        """
+        levels = np.concatenate([levels_array for levels_array, _ in levels_with_update_ids])
+        update_ids = np.concatenate([
+            np.full(len(levels_array), update_id, dtype=np.int64)
+            for levels_array, update_id in levels_with_update_ids
+        ])
+        # np.unique returns the first occurrence of each price, so the levels are reversed to keep the last one
+        reversed_levels = levels[::-1]
+        _, last_occurrences = np.unique(reversed_levels[:, 0], return_index=True)
+        return (np.ascontiguousarray(reversed_levels[last_occurrences]),
+                np.ascontiguousarray(update_ids[::-1][last_occurrences]))
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -303,6 +625,7 @@ class OrderBookTracker:
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
+                self._record_message(trade_message)
                 trading_pair: str = trade_message.trading_pair
 
                 if trading_pair not in self._order_books:
@@ -64,9 +64,19 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_snapshot_arrays(snapshot_msg.bids_array, snapshot_msg.asks_array, snapshot_msg.update_id)
         return order_book
 
+    async def get_order_book_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Requests the current order book snapshot for a particular trading pair to the exchange
+
+        :param trading_pair: the trading pair for which the snapshot has to be retrieved
+
+        :return: the snapshot message
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
@@ -0,0 +1,128 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Union
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecording
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class ReplayOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source feeding the messages stored by an OrderBookRecorder instead of connecting to an exchange.
+
+    The order books are initialized with the last snapshot recorded before the start timestamp, and the messages
+    recorded after that snapshot are delivered to the order book tracker keeping the time between them (divided by the
+    replay speed). The messages recorded before the start timestamp are delivered right away. With a speed of 0 the
+    messages are delivered as fast as the tracker consumes them.
+    """
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 recording: Union[OrderBookRecording, str],
+                 speed: float = 1.0,
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None):
+        """
+        :param trading_pairs: the trading pairs to replay
+        :param recording: the recording, or the directory where the recorder stored it
+        :param speed: replay speed relative to the recording time (1 is wall clock speed, 10 ten times faster), or 0 to
+            replay without waiting between messages
+        :param start_timestamp: time of the recording to start replaying from, the start of the recording by default
+        :param end_timestamp: time of the recording to stop replaying at, the end of the recording by default
+        """
+        super().__init__(trading_pairs)
+        self._recording = recording if isinstance(recording, OrderBookRecording) else OrderBookRecording(recording)
+        self._speed = speed
+        self._start_timestamp = start_timestamp
+        self._end_timestamp = end_timestamp
+        self._last_snapshot_messages: Dict[str, OrderBookMessage] = {}
+        self._last_traded_prices: Dict[str, float] = {}
+        self._messages_replayed = 0
+        self._replay_finished = asyncio.Event()
+
+    @property
+    def messages_replayed(self) -> int:
+        return self._messages_replayed
+
+    @property
+    def replay_finished(self) -> asyncio.Event:
+        """
+        Event set when all the messages of the recording have been delivered
+        """
+        return self._replay_finished
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        """
+        Returns the price of the last trade replayed for each trading pair, or the mid price of its last snapshot if no
+        trade was replayed yet
+        """
+        return {trading_pair: self._last_traded_price(trading_pair) for trading_pair in trading_pairs}
+
+    async def listen_for_subscriptions(self):
+        """
+        Replays the recorded messages, adding each one to the queue of its type
+        """
+        replay_start_time = None
+        first_timestamp = None
+        for recorded_timestamp, message in self._recording.iter_messages(
+                self._trading_pairs, self._start_timestamp, self._end_timestamp):
+            if self._speed > 0 and (self._start_timestamp is None or recorded_timestamp >= self._start_timestamp):
+                if replay_start_time is None:
+                    replay_start_time = self._time()
+                    first_timestamp = recorded_timestamp
+                delay = (recorded_timestamp - first_timestamp) / self._speed - (self._time() - replay_start_time)
+                await self._sleep(max(delay, 0))
+            else:
+                # Let the tracker process the messages already queued
+                await self._sleep(0)
+            self._replay_message(message)
+        self._replay_finished.set()
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        snapshot_message = self._last_snapshot_messages.get(trading_pair)
+        if snapshot_message is None:
+            snapshot_message = self._recording.get_snapshot(trading_pair, self._start_timestamp)
+            if snapshot_message is None:
+                raise ValueError(f"No order book snapshot recorded for {trading_pair}.")
+            self._last_snapshot_messages[trading_pair] = snapshot_message
+        return snapshot_message
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        snapshot_message = await self._order_book_snapshot(trading_pair=trading_pair)
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot_arrays(snapshot_message.bids_array, snapshot_message.asks_array,
+                                         snapshot_message.update_id)
+        return order_book
+
+    def _replay_message(self, message: OrderBookMessage):
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            self._last_snapshot_messages[message.trading_pair] = message
+            queue_key = self._snapshot_messages_queue_key
+        elif message.type is OrderBookMessageType.DIFF:
+            queue_key = self._diff_messages_queue_key
+        else:
+            self._last_traded_prices[message.trading_pair] = float(message.content["price"])
+            queue_key = self._trade_messages_queue_key
+        self._message_queue[queue_key].put_nowait(message)
+        self._messages_replayed += 1
+
+    def _last_traded_price(self, trading_pair: str) -> float:
+        last_traded_price = self._last_traded_prices.get(trading_pair)
+        if last_traded_price is None:
+            last_traded_price = float("nan")
+            snapshot_message = self._last_snapshot_messages.get(trading_pair)
+            if (snapshot_message is not None
+                    and len(snapshot_message.bids_array) > 0 and len(snapshot_message.asks_array) > 0):
+                last_traded_price = float(
+                    (snapshot_message.bids_array[:, 0].max() + snapshot_message.asks_array[:, 0].min()) / 2)
+        return last_traded_price
+
+    async def _parse_trade_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
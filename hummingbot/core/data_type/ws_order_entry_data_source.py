@@ -0,0 +1,144 @@
+import asyncio
+import itertools
+import logging
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, Optional
+
+from hummingbot.core.web_assistant.connections.data_types import WSRequest
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class WSOrderEntryUnavailableError(ConnectionError):
+    """
+    Raised when a request could not be sent through the order entry websocket. The request never reached the exchange,
+    so it is safe to send it again using the REST API.
+    """
+
+
+class WSOrderEntryDataSource(metaclass=ABCMeta):
+    """
+    Keeps a persistent authenticated websocket connection to the exchange trading API, to place and cancel orders
+    without paying a full HTTP request for each action. Each request carries an id, and the exchange responses are
+    matched to the pending requests using that id.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(self, request_timeout: float = 10.0):
+        self._ws_assistant: Optional[WSAssistant] = None
+        self._request_timeout = request_timeout
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def is_connected(self) -> bool:
+        return self._ws_assistant is not None
+
+    async def listen_for_responses(self):
+        """
+        Connects and authenticates the order entry websocket, and processes the responses received from the exchange.
+        Reconnects when the connection is lost. The requests waiting for a response when the connection is lost fail.
+        """
+        while True:
+            ws_assistant = None
+            try:
+                ws_assistant = await self._connected_websocket_assistant()
+                self._ws_assistant = ws_assistant
+                await self._process_websocket_messages(websocket_assistant=ws_assistant)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The order entry websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception("Unexpected error in the order entry websocket. Retrying after 1 second...")
+                await self._sleep(1.0)
+            finally:
+                self._ws_assistant = None
+                self._fail_pending_requests(ConnectionError("The order entry websocket connection was closed"))
+                ws_assistant and await ws_assistant.disconnect()
+
+    async def execute_request(self, operation: str, params: Any) -> Any:
+        """
+        Sends a request through the order entry websocket and waits for the exchange response
+
+        :param operation: the exchange operation to execute (e.g. order placement or cancelation)
+        :param params: the operation parameters, in the format expected by the exchange
+        :return: the response message for the request
+
+        Raises WSOrderEntryUnavailableError if the request could not be sent, and asyncio.TimeoutError if the
+        response was not received in time
+        """
+        ws_assistant = self._ws_assistant
+        if ws_assistant is None:
+            raise WSOrderEntryUnavailableError("The order entry websocket is not connected")
+
+        request_id = str(next(self._request_ids))
+        response_future = asyncio.get_event_loop().create_future()
+        self._pending_requests[request_id] = response_future
+        try:
+            try:
+                await ws_assistant.send(self._build_request(request_id=request_id, operation=operation, params=params))
+            except asyncio.CancelledError:
+                raise
+            except Exception as send_exception:
+                raise WSOrderEntryUnavailableError(f"Error sending the order entry request ({send_exception})")
+            return await asyncio.wait_for(response_future, timeout=self._request_timeout)
+        finally:
+            self._pending_requests.pop(request_id, None)
+
+    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        async for ws_response in websocket_assistant.iter_messages():
+            await self._process_message(websocket_assistant=websocket_assistant, message=ws_response.data)
+
+    async def _process_message(self, websocket_assistant: WSAssistant, message: Any):
+        request_id = self._request_id_from_message(message)
+        response_future = self._pending_requests.get(request_id) if request_id is not None else None
+        if response_future is not None and not response_future.done():
+            response_future.set_result(message)
+
+    def _fail_pending_requests(self, exception: Exception):
+        for response_future in self._pending_requests.values():
+            if not response_future.done():
+                response_future.set_exception(exception)
+
+    @abstractmethod
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        """
+        Creates an instance of WSAssistant connected to the exchange trading API, and authenticates the connection
+
+        :return: an instance of WSAssistant ready to send order entry requests
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _build_request(self, request_id: str, operation: str, params: Any) -> WSRequest:
+        """
+        Creates the websocket request for an operation, including the request id
+
+        :param request_id: the id the exchange includes in the response for the request
+        :param operation: the exchange operation to execute
+        :param params: the operation parameters
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _request_id_from_message(self, message: Any) -> Optional[str]:
+        """
+        Returns the id of the request a message responds to, or None if the message is not a response
+        """
+        raise NotImplementedError
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+
+        :param delay: number of seconds to sleep
+        """
+        await asyncio.sleep(delay)
@@ -0,0 +1,184 @@
+from collections.abc import MutableMapping
+from decimal import Decimal
+from itertools import chain
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.gateway.utils import unwrap_token_symbol
+
+# A conversion step: the trading pair whose price is used and whether the price has to be inverted
+RateEdge = Tuple[str, bool]
+
+
+class RateIndex(MutableMapping):
+    """
+    Dictionary of trading pair prices that keeps a graph of the tokens to find conversion rates.
+
+    Each price `BASE-QUOTE` is an edge from BASE to QUOTE (multiplying by the price) and from QUOTE to BASE (dividing
+    by the price). The graph is updated incrementally when prices are added or removed, and a conversion rate is found
+    with a breadth first search limited to `max_hops` conversions, so the shortest route is always used.
+
+    The route found for each pair is memoized until the set of trading pairs changes, and the rate for each pair is
+    memoized until a price changes. After a price refresh a rate is recomputed from its memoized route only.
+
+    Every rate `find_rate` finds is found through the same route: routes starting with a pair with the base token as
+    base are tried first, in the order the prices were added. The index also finds rates `find_rate` does not, since
+    any pair can be used in either direction at any hop (e.g. HBOT-GBP from USDT-HBOT and USDT-GBP).
+    """
+    DEFAULT_MAX_HOPS = 2
+
+    def __init__(self, prices: Optional[Mapping[str, Decimal]] = None, max_hops: int = DEFAULT_MAX_HOPS):
+        """
+        :param prices: initial prices, keyed by trading pair
+        :param max_hops: maximum number of conversions used to find a rate
+        """
+        self._max_hops = max_hops
+        self._prices: Dict[str, Decimal] = {}
+        # token -> {quote token: pair} for the pairs with the token as base
+        self._quotes: Dict[str, Dict[str, str]] = {}
+        # token -> {base token: pair} for the pairs with the token as quote
+        self._bases: Dict[str, Dict[str, str]] = {}
+        self._routes: Dict[Tuple[str, str], Optional[Tuple[RateEdge, ...]]] = {}
+        self._rates: Dict[str, Optional[Decimal]] = {}
+        if prices is not None:
+            self.update(prices)
+
+    def __getitem__(self, pair: str) -> Decimal:
+        return self._prices[pair]
+
+    def __setitem__(self, pair: str, price: Decimal):
+        if pair not in self._prices:
+            self._add_edges(pair)
+        self._prices[pair] = price
+        if self._rates:
+            self._rates.clear()
+
+    def __delitem__(self, pair: str):
+        del self._prices[pair]
+        self._remove_edges(pair)
+        self._rates.clear()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._prices)
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._prices!r})"
+
+    @property
+    def max_hops(self) -> int:
+        return self._max_hops
+
+    def copy(self) -> Dict[str, Decimal]:
+        return self._prices.copy()
+
+    def clear(self):
+        self._prices.clear()
+        self._quotes.clear()
+        self._bases.clear()
+        self._routes.clear()
+        self._rates.clear()
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the conversion rate for a trading pair, directly or through other tokens.
+
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return the conversion rate, or None if there is no route within the maximum number of hops
+        """
+        if pair in self._prices:
+            return self._prices[pair]
+        if pair in self._rates:
+            return self._rates[pair]
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            rate = Decimal("1")
+        else:
+            key = (base, quote)
+            if key not in self._routes:
+                self._routes[key] = self._find_route(base, quote)
+            rate = self._route_rate(self._routes[key])
+        self._rates[pair] = rate
+        return rate
+
+    def _add_edges(self, pair: str):
+        tokens = self._tokens(pair)
+        if tokens is None:
+            return
+        base, quote = tokens
+        self._quotes.setdefault(base, {})[quote] = pair
+        self._bases.setdefault(quote, {})[base] = pair
+        self._routes.clear()
+
+    def _remove_edges(self, pair: str):
+        tokens = self._tokens(pair)
+        if tokens is None:
+            return
+        base, quote = tokens
+        del self._quotes[base][quote]
+        del self._bases[quote][base]
+        self._routes.clear()
+
+    def _find_route(self, base: str, quote: str) -> Optional[Tuple[RateEdge, ...]]:
+        previous_step: Dict[str, Optional[Tuple[str, RateEdge]]] = {base: None}
+        frontier = [base]
+        for hops in range(1, self._max_hops + 1):
+            # Tokens with a direct pair with the quote are checked before expanding the search to their neighbors
+            for token in frontier:
+                edge = self._edge(token, quote)
+                if edge is not None:
+                    previous_step[quote] = (token, edge)
+                    return self._route_to(quote, previous_step)
+            if hops == self._max_hops:
+                break
+            next_frontier = []
+            for token in frontier:
+                for neighbor, edge in self._neighbors(token):
+                    if neighbor not in previous_step:
+                        previous_step[neighbor] = (token, edge)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return None
+
+    def _edge(self, token: str, other_token: str) -> Optional[RateEdge]:
+        pair = self._quotes.get(token, {}).get(other_token)
+        if pair is not None:
+            return pair, False
+        pair = self._bases.get(token, {}).get(other_token)
+        if pair is not None:
+            return pair, True
+        return None
+
+    def _neighbors(self, token: str) -> Iterator[Tuple[str, RateEdge]]:
+        forward = ((quote, (pair, False)) for quote, pair in self._quotes.get(token, {}).items())
+        inverse = ((base, (pair, True)) for base, pair in self._bases.get(token, {}).items())
+        return chain(forward, inverse)
+
+    def _route_rate(self, route: Optional[Tuple[RateEdge, ...]]) -> Optional[Decimal]:
+        if route is None:
+            return None
+        rate = None
+        for pair, inverted in route:
+            price = self._prices[pair]
+            if rate is None:
+                rate = Decimal("1") / price if inverted else price
+            else:
+                rate = rate / price if inverted else rate * price
+        return rate
+
+    @staticmethod
+    def _route_to(token: str, previous_step: Dict[str, Optional[Tuple[str, RateEdge]]]) -> Tuple[RateEdge, ...]:
+        route = []
+        while previous_step[token] is not None:
+            token, edge = previous_step[token]
+            route.append(edge)
+        return tuple(reversed(route))
+
+    @staticmethod
+    def _tokens(pair: str) -> Optional[Tuple[str, str]]:
+        tokens = pair.split("-")
+        return (tokens[0], tokens[1]) if len(tokens) == 2 else None
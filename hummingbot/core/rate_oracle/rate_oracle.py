@@ -1,12 +1,13 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.rate_oracle.rate_index import RateIndex
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 from hummingbot.core.rate_oracle.sources.coin_cap_rate_source import CoinCapRateSource
@@ -44,7 +45,10 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are kept in a
+    RateIndex, which memoizes the conversion routes between tokens to find rates without scanning all the prices. The
+    stored rates can also use routes find_rate does not try, like pairs quoted in the base token or more conversions
+    when max_conversion_hops is increased.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -61,10 +65,14 @@ class RateOracle(NetworkBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
+    def __init__(self,
+                 source: Optional[RateSourceBase] = None,
+                 quote_token: Optional[str] = None,
+                 max_conversion_hops: int = RateIndex.DEFAULT_MAX_HOPS):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
-        self._prices: Dict[str, Decimal] = {}
+        self._max_conversion_hops = max_conversion_hops
+        self._rate_index = RateIndex(max_hops=max_conversion_hops)
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -89,6 +97,14 @@ class RateOracle(NetworkBase):
     def name(self) -> str:
         return "rate_oracle"
 
+    @property
+    def _prices(self) -> RateIndex:
+        return self._rate_index
+
+    @_prices.setter
+    def _prices(self, prices: Mapping[str, Decimal]):
+        self._rate_index = RateIndex(prices, max_hops=self._max_conversion_hops)
+
     @property
     def source(self) -> RateSourceBase:
         return self._source
@@ -105,7 +121,7 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
-            self._prices = {}
+            self._prices.clear()
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -165,7 +181,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._prices.find_rate(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.rate_index import RateIndex
 
 
 class FixedRateSource:
@@ -8,7 +8,7 @@ class FixedRateSource:
     def __init__(self):
         super().__init__()
 
-        self._known_rates: dict = {}
+        self._known_rates = RateIndex()
 
     def __str__(self):
         return "fixed rates"
@@ -28,4 +28,4 @@ class FixedRateSource:
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._known_rates, pair)
+        return self._known_rates.find_rate(pair)
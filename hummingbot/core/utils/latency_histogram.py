@@ -0,0 +1,86 @@
+import bisect
+import math
+from typing import List, Sequence, Tuple
+
+
+class LatencyHistogram:
+    """
+    Distribution of latencies (in seconds) counted in fixed buckets.
+
+    Recording a latency is O(log(buckets)) and takes constant memory, so it can be used on hot paths. Percentiles are
+    estimated as the upper bound of the bucket that contains them (the maximum recorded latency for the last bucket).
+    """
+    DEFAULT_BUCKET_BOUNDS = (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+    )
+
+    def __init__(self, bucket_bounds: Sequence[float] = DEFAULT_BUCKET_BOUNDS):
+        """
+        :param bucket_bounds: ascending upper bounds of the buckets, a last bucket collects the larger latencies
+        """
+        self._bucket_bounds: Tuple[float, ...] = tuple(bucket_bounds)
+        self._bucket_counts: List[int] = [0] * (len(self._bucket_bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = 0.0
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(count={self._count}, mean={self.mean:.6f}, p50={self.percentile(50):.6f}, "
+                f"p99={self.percentile(99):.6f}, max={self._max:.6f})")
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else math.nan
+
+    @property
+    def min(self) -> float:
+        return self._min if self._count > 0 else math.nan
+
+    @property
+    def max(self) -> float:
+        return self._max if self._count > 0 else math.nan
+
+    @property
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        (upper bound, count) for each bucket, the upper bound of the last bucket is infinity
+        """
+        return list(zip(self._bucket_bounds + (math.inf,), self._bucket_counts))
+
+    def record(self, latency: float):
+        self._bucket_counts[bisect.bisect_left(self._bucket_bounds, latency)] += 1
+        self._count += 1
+        self._total += latency
+        self._min = min(self._min, latency)
+        self._max = max(self._max, latency)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :param percentile: percentile to estimate, between 0 and 100
+        :return: the upper bound of the bucket containing the percentile, capped to the maximum recorded latency
+        """
+        if self._count == 0:
+            return math.nan
+        rank = max(1, math.ceil(self._count * percentile / 100))
+        accumulated = 0
+        for bound, count in zip(self._bucket_bounds, self._bucket_counts):
+            accumulated += count
+            if accumulated >= rank:
+                return min(bound, self._max)
+        return self._max
+
+    def reset(self):
+        self._bucket_counts = [0] * (len(self._bucket_bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = 0.0
@@ -1,7 +1,6 @@
 import asyncio
 import os
 import time
-from collections import deque
 from typing import List, Optional
 
 import numpy as np
@@ -15,13 +14,15 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a preallocated NumPy ring buffer to store
+    candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -45,13 +46,17 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    # Maximum number of REST requests sent at the same time when fetching historical candles
+    HISTORICAL_CANDLES_MAX_CONCURRENT_REQUESTS = 5
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesRingBuffer(maxlen=max_records, n_columns=len(self.columns))
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_version: Optional[int] = None
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -91,7 +96,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +146,26 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is built only when the candles change since the previous access, and a shallow copy of it is
+        returned so the columns added by the caller do not modify the cached one.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_cache is None or self._candles_df_version != self._candles.version:
+            self._candles_df_cache = self._build_candles_df(self.candles_array)
+            self._candles_df_version = self._candles.version
+        return self._candles_df_cache.copy(deep=False)
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns the candles stored in the _candles buffer, oldest first, as a read-only NumPy array with
+        the same columns as candles_df. The array is a view of the buffer (no copy is made), so it reflects the later
+        candle updates and must be copied if it has to be kept.
+        """
+        return self._candles.array
+
+    def _build_candles_df(self, candles: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(candles, columns=self.columns, dtype=float, copy=True)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -161,30 +183,26 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
-    async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
+    async def get_historical_candles(self, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        """
+        This method fetches the candles between the start and end time of the config from the REST API.
+        The range is split in pages of the maximum number of candles per request, and the pages are fetched
+        concurrently (the throttler keeps the requests within the exchange rate limits).
+        :param config: the historical candles configuration
+        :return: DataFrame with the candles sorted by timestamp
+        """
         try:
             await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                    candles_df = pd.concat([fetched_candles_df, candles_df])
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
-            candles_df = candles_df[(candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
-            return candles_df
+            end_time = self._round_timestamp_to_interval_multiple(config.end_time)
+            start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+            candles = await self._fetch_candles_pages(start_time=start_time, end_time=end_time)
+            if len(candles) > 0:
+                candles = candles[np.argsort(candles[:, 0], kind="stable")]
+                _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+                candles = candles[unique_indexes]
+                self.check_candles_sorted_and_equidistant(candles)
+                candles = candles[(candles[:, 0] <= config.end_time) & (candles[:, 0] >= config.start_time)]
+            return pd.DataFrame(candles, columns=self.columns, dtype=float)
         except ValueError as e:
             self.logger().error(f"Error fetching historical candles: {str(e)}")
             raise e
@@ -192,6 +210,34 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    async def _fetch_candles_pages(self, start_time: int, end_time: int) -> np.ndarray:
+        """
+        Fetches the candles between start_time and end_time (both rounded to the interval) with one request per page
+        :return: array with the candles of all the pages, not sorted and possibly with duplicates
+        """
+        page_span = self.candles_max_result_per_rest_request * self.interval_in_seconds
+        semaphore = asyncio.Semaphore(self.HISTORICAL_CANDLES_MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_page(page_end_time: int) -> np.ndarray:
+            async with semaphore:
+                return await self.fetch_candles(
+                    start_time=max(start_time, page_end_time - page_span),
+                    end_time=page_end_time,
+                    limit=min(self.candles_max_result_per_rest_request,
+                              int((page_end_time - start_time) / self.interval_in_seconds)))
+
+        # The oldest pages are requested first, so exchanges that refuse requests too far in the past fail fast
+        page_end_times = list(range(end_time, start_time - 1, -page_span))[::-1]
+        page_tasks = [asyncio.ensure_future(fetch_page(page_end_time)) for page_end_time in page_end_times]
+        try:
+            pages = await asyncio.gather(*page_tasks)
+        except BaseException:
+            for page_task in page_tasks:
+                page_task.cancel()
+            raise
+        pages = [page.reshape(-1, len(self.columns)) for page in pages if len(page) > 0]
+        return np.concatenate(pages) if len(pages) > 0 else np.empty((0, len(self.columns)))
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -321,7 +367,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -341,7 +387,7 @@ class CandlesBase(NetworkBase):
                     "Unexpected error occurred when getting historical klines. Retrying in 1 seconds...",
                 )
                 await self._sleep(1.0)
-        self.check_candles_sorted_and_equidistant(np.array(self._candles))
+        self.check_candles_sorted_and_equidistant(self.candles_array)
 
     async def listen_for_subscriptions(self):
         """
@@ -0,0 +1,100 @@
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+
+class CandlesRingBuffer:
+    """
+    Fixed size store of candles backed by a preallocated 2-D float64 NumPy array.
+
+    It keeps the deque interface used by the candles feeds (append, appendleft, extend, extendleft, indexing and
+    maxlen), discarding the candles in the opposite end when it is full. Each row is written twice, at its position
+    in the ring and at the same position plus maxlen, so the stored candles are always available in chronological
+    order as a contiguous view of the buffer without copying them.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        self._maxlen = maxlen
+        self._buffer = np.zeros((2 * maxlen, n_columns), dtype=np.float64)
+        self._start = 0
+        self._length = 0
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented every time the stored candles change, to detect when cached views have to be rebuilt
+        """
+        return self._version
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Returns the stored candles, oldest first, as a read-only view of the buffer. The view reflects later changes
+        of the buffer and must be copied if it has to be kept.
+        """
+        view = self._buffer[self._start:self._start + self._length]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(self._length):
+            yield self[index]
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        if isinstance(index, slice):
+            return self.array[index].copy()
+        return self._buffer[self._start + self._position(index)].copy()
+
+    def __setitem__(self, index: int, candle: Iterable[float]):
+        self._write(position=(self._start + self._position(index)) % self._maxlen, candle=candle)
+        self._version += 1
+
+    def append(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        self._write(position=(self._start + self._length) % self._maxlen, candle=candle)
+        if self._length == self._maxlen:
+            self._start = (self._start + 1) % self._maxlen
+        else:
+            self._length += 1
+        self._version += 1
+
+    def appendleft(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        self._start = (self._start - 1) % self._maxlen
+        self._write(position=self._start, candle=candle)
+        self._length = min(self._length + 1, self._maxlen)
+        self._version += 1
+
+    def extend(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self.append(candle)
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self.appendleft(candle)
+
+    def clear(self):
+        self._start = 0
+        self._length = 0
+        self._version += 1
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("candles index out of range")
+        return index
+
+    def _write(self, position: int, candle: Iterable[float]):
+        self._buffer[position] = candle
+        self._buffer[position + self._maxlen] = candle
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.logger import HummingbotLogger
+
+CANDLES_FILE_EXTENSION = ".candles.npy"
+RANGES_FILE_EXTENSION = ".ranges.npy"
+
+
+class HistoricalCandlesCache:
+    """
+    Stores on disk the historical candles fetched from the exchanges, so they are downloaded only once.
+
+    The candles of each connector, trading pair and interval are kept in a NumPy file in columnar (Fortran) order,
+    sorted by timestamp, and read as a memory map. A second file keeps the time ranges already fetched from the
+    exchange, so the ranges where the exchange has no candles are not requested again. Only the missing ranges of a
+    request are fetched. The candles that are not closed yet are returned but never stored.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        :param cache_dir: directory where the candles are stored (by default the candles directory in the data path)
+        """
+        self._cache_dir = cache_dir
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def cache_dir(self) -> str:
+        if self._cache_dir is None:
+            self._cache_dir = os.path.join(data_path(), "candles")
+        return self._cache_dir
+
+    async def get_historical_candles(self, candles_feed: CandlesBase, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        """
+        Returns the candles between the start and end time of the config, fetching from the exchange only the ranges
+        that are not in the cache.
+
+        :param candles_feed: the candles feed used to fetch the missing candles
+        :param config: the historical candles configuration
+        :return: DataFrame with the candles sorted by timestamp
+        """
+        key = self._cache_key(config)
+        interval = candles_feed.interval_in_seconds
+        start_time = int(config.start_time - config.start_time % interval)
+        end_time = int(config.end_time - config.end_time % interval)
+        async with self._locks[key]:
+            candles, ranges = self._load(key=key, n_columns=len(candles_feed.columns))
+            missing_ranges = self.missing_ranges(ranges=ranges, start_time=start_time, end_time=end_time,
+                                                 interval=interval)
+            if len(missing_ranges) > 0:
+                fetched_candles = []
+                fetched_ranges = []
+                current_time = self._time()
+                last_closed_candle_time = int(current_time - current_time % interval) - interval
+                for missing_start, missing_end in missing_ranges:
+                    fetched_df = await candles_feed.get_historical_candles(config=HistoricalCandlesConfig(
+                        connector_name=config.connector_name,
+                        trading_pair=config.trading_pair,
+                        interval=config.interval,
+                        start_time=missing_start,
+                        end_time=missing_end,
+                    ))
+                    fetched_candles.append(fetched_df[candles_feed.columns].to_numpy(dtype=np.float64))
+                    if missing_start <= last_closed_candle_time:
+                        fetched_ranges.append((missing_start, min(missing_end, last_closed_candle_time)))
+                new_candles = self._merge_candles([np.asarray(candles)] + fetched_candles)
+                closed_candles = new_candles[new_candles[:, 0] <= last_closed_candle_time]
+                if len(fetched_ranges) > 0:
+                    self._store(key=key,
+                                candles=closed_candles,
+                                ranges=self.merge_ranges(ranges + fetched_ranges, interval=interval))
+                candles = new_candles
+            timestamps = candles[:, 0]
+            first_index = np.searchsorted(timestamps, config.start_time, side="left")
+            last_index = np.searchsorted(timestamps, config.end_time, side="right")
+            return pd.DataFrame(np.array(candles[first_index:last_index]), columns=candles_feed.columns, dtype=float)
+
+    @staticmethod
+    def missing_ranges(ranges: List[Tuple[int, int]], start_time: int, end_time: int,
+                       interval: int) -> List[Tuple[int, int]]:
+        """
+        Returns the parts of the range between start_time and end_time (both included) not covered by the ranges
+
+        :param ranges: the covered ranges, sorted and not overlapping
+        """
+        missing = []
+        current_start = start_time
+        for range_start, range_end in ranges:
+            if range_end < current_start:
+                continue
+            if range_start > end_time:
+                break
+            if range_start > current_start:
+                missing.append((current_start, range_start - interval))
+            current_start = max(current_start, range_end + interval)
+        if current_start <= end_time:
+            missing.append((current_start, end_time))
+        return missing
+
+    @staticmethod
+    def merge_ranges(ranges: List[Tuple[int, int]], interval: int) -> List[Tuple[int, int]]:
+        """
+        Merges the overlapping and contiguous ranges
+        """
+        merged = []
+        for range_start, range_end in sorted(ranges):
+            if len(merged) > 0 and range_start <= merged[-1][1] + interval:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+            else:
+                merged.append((range_start, range_end))
+        return merged
+
+    @staticmethod
+    def _merge_candles(candles_list: List[np.ndarray]) -> np.ndarray:
+        candles = np.concatenate([candles for candles in candles_list if len(candles) > 0] or candles_list)
+        # Sorting the reversed array keeps the most recently fetched candle when a timestamp is duplicated
+        candles = candles[::-1]
+        _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+        return candles[unique_indexes]
+
+    def _cache_key(self, config: HistoricalCandlesConfig) -> str:
+        return f"{config.connector_name}_{config.trading_pair}_{config.interval}"
+
+    def _file_path(self, key: str, extension: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{extension}")
+
+    def _load(self, key: str, n_columns: int) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+        candles_path = self._file_path(key, CANDLES_FILE_EXTENSION)
+        ranges_path = self._file_path(key, RANGES_FILE_EXTENSION)
+        try:
+            candles = np.load(candles_path, mmap_mode="r")
+            ranges = [(int(range_start), int(range_end)) for range_start, range_end in np.load(ranges_path)]
+            if candles.ndim == 2 and candles.shape[1] == n_columns:
+                return candles, ranges
+            self.logger().warning(f"Discarding the cached candles of {key} (unexpected format {candles.shape}).")
+        except FileNotFoundError:
+            pass
+        except Exception:
+            self.logger().exception(f"Error reading the cached candles of {key}. The candles will be fetched again.")
+        return np.empty((0, n_columns)), []
+
+    def _store(self, key: str, candles: np.ndarray, ranges: List[Tuple[int, int]]):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # The ranges are written last, so a failure in between can only leave candles that are fetched again
+        self._write_array(self._file_path(key, CANDLES_FILE_EXTENSION), np.asfortranarray(candles, dtype=np.float64))
+        self._write_array(self._file_path(key, RANGES_FILE_EXTENSION), np.array(ranges, dtype=np.int64).reshape(-1, 2))
+
+    @staticmethod
+    def _write_array(file_path: str, array: np.ndarray):
+        temporary_path = f"{file_path}.tmp"
+        with open(temporary_path, "wb") as file:
+            np.save(file, array)
+        os.replace(temporary_path, file_path)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
@@ -2,6 +2,7 @@ import logging
 import time
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.network_iterator import NetworkStatus
@@ -68,9 +69,8 @@ class KucoinSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
-    @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+    def _build_candles_df(self, candles: np.ndarray) -> pd.DataFrame:
+        df = super()._build_candles_df(candles)
         return df.sort_values(by="timestamp", ascending=True)
 
     @property
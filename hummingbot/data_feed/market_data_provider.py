@@ -4,6 +4,7 @@ import time
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.config_helpers import (
@@ -18,8 +19,10 @@ from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResu
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
-from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.historical_candles_cache import HistoricalCandlesCache
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 
@@ -40,7 +43,8 @@ class MarketDataProvider:
 
     def __init__(self,
                  connectors: Dict[str, ConnectorBase],
-                 rates_update_interval: int = 60):
+                 rates_update_interval: int = 60,
+                 historical_candles_cache: Optional[HistoricalCandlesCache] = None):
         self.candles_feeds = {}  # Stores instances of candle feeds
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
@@ -49,6 +53,7 @@ class MarketDataProvider:
         self._non_trading_connectors = LazyDict[str, ConnectorBase](self._create_non_trading_connector)
         self._rates_required = GroupedSetDict[str, ConnectorPair]()
         self.conn_settings = AllConnectorSettings.get_connector_settings()
+        self._historical_candles_cache = historical_candles_cache
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
@@ -388,10 +393,6 @@ class MarketDataProvider:
         :param max_cache_records: Maximum records to keep in cache for efficiency
         :return: Candles dataframe for the requested range
         """
-        import time
-
-        from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
-
         # Set default end_time to current time if not provided
         if end_time is None:
             end_time = int(time.time())
@@ -467,7 +468,7 @@ class MarketDataProvider:
                 end_time=fetch_end
             )
 
-            new_df = await candles_feed.get_historical_candles(historical_config)
+            new_df = await self._fetch_historical_candles(candles_feed, historical_config)
 
             if len(new_df) > 0:
                 # Merge with existing data if any
@@ -506,6 +507,17 @@ class MarketDataProvider:
         # Fallback to existing method if historical fetch fails
         return self.get_candles_df(connector_name, trading_pair, interval, max_records or 500)
 
+    async def _fetch_historical_candles(self, candles_feed: CandlesBase, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        """
+        Fetches historical candles through the on-disk cache when the provider has one, and from the exchange otherwise.
+        :param candles_feed: CandlesBase
+        :param config: HistoricalCandlesConfig
+        :return: Candles dataframe.
+        """
+        if self._historical_candles_cache is not None:
+            return await self._historical_candles_cache.get_historical_candles(candles_feed=candles_feed, config=config)
+        return await candles_feed.get_historical_candles(config)
+
     def get_trading_pairs(self, connector_name: str):
         """
         Retrieves the trading pairs from the specified connector.
@@ -543,8 +555,7 @@ class MarketDataProvider:
         :param is_buy: True if buying, False if selling.
         :return: OrderBookQueryResult containing the result of the query.
         """
-        connector = self.get_connector_with_fallback(connector_name)
-        order_book = connector.get_order_book(trading_pair)
+        order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_price_for_volume(is_buy, volume)
 
     def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -555,10 +566,25 @@ class MarketDataProvider:
         :param trading_pair: str
         :return: Tuple of bid and ask in DataFrame format.
         """
-        connector = self.get_connector_with_fallback(connector_name)
-        order_book = connector.get_order_book(trading_pair)
+        order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.snapshot
 
+    def get_order_book_levels(self, connector_name: str, trading_pair: str, is_buy: bool,
+                              depth: int = 0) -> np.ndarray:
+        """
+        Retrieves the top levels of one side of the order book as a float64 array with the columns
+        (price, amount, cumulative amount, cumulative quote), best price first. The array is a view on a buffer reused
+        by the order book, so it has to be copied if it needs to outlive the current tick.
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair for which to retrieve the data.
+        :param is_buy: True for the ask side, False for the bid side.
+        :param depth: Maximum number of levels to return, 0 to return all the levels.
+        :return: Array of shape (levels, 4).
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        return order_book.levels_array(is_buy, depth)
+
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float,
                                    is_buy: bool) -> OrderBookQueryResult:
         """
@@ -570,8 +596,7 @@ class MarketDataProvider:
         :param is_buy: True if buying, False if selling.
         :return: OrderBookQueryResult containing the result of the query.
         """
-        connector = self.get_connector_with_fallback(connector_name)
-        order_book = connector.get_order_book(trading_pair)
+        order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_price_for_quote_volume(is_buy, quote_volume)
 
     def get_volume_for_price(self, connector_name: str, trading_pair: str, price: float,
@@ -585,8 +610,7 @@ class MarketDataProvider:
         :param is_buy: True if buying, False if selling.
         :return: OrderBookQueryResult containing the result of the query.
         """
-        connector = self.get_connector_with_fallback(connector_name)
-        order_book = connector.get_order_book(trading_pair)
+        order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_volume_for_price(is_buy, price)
 
     def get_quote_volume_for_price(self, connector_name: str, trading_pair: str, price: float,
@@ -600,8 +624,7 @@ class MarketDataProvider:
         :param is_buy: True if buying, False if selling.
         :return: OrderBookQueryResult containing the result of the query.
         """
-        connector = self.get_connector_with_fallback(connector_name)
-        order_book = connector.get_order_book(trading_pair)
+        order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_quote_volume_for_price(is_buy, price)
 
     def get_vwap_for_volume(self, connector_name: str, trading_pair: str, volume: float,
@@ -615,8 +638,7 @@ class MarketDataProvider:
         :param is_buy: True if buying, False if selling.
         :return: OrderBookQueryResult containing the result of the query.
         """
-        connector = self.get_connector_with_fallback(connector_name)
-        order_book = connector.get_order_book(trading_pair)
+        order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_vwap_for_volume(is_buy, volume)
 
     def get_rate(self, pair: str) -> Decimal:
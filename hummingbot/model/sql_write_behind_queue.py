@@ -0,0 +1,186 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+WriteOperation = Callable[[Session], None]
+
+# Markers sent through the queue to the worker thread
+_FLUSH = object()
+_STOP = object()
+
+
+class SQLWriteBehindQueue:
+    """
+    Executes database write operations on a dedicated worker thread, batching the operations queued together into a
+    single transaction.
+
+    A write operation is a callable receiving the session it has to use. Operations are executed in the same order
+    they were queued. If a batch transaction fails, its operations are executed again one by one (each in its own
+    transaction, keeping their order), so a single failing operation does not discard the rest of the batch.
+
+    While the worker thread is not running (before `start` or after `stop`) the operations are executed synchronously
+    when queued.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql_manager: SQLConnectionManager,
+                 max_queue_size: int = 10000,
+                 max_batch_size: int = 500,
+                 batch_interval: float = 0.1):
+        """
+        :param sql_manager: the connection manager used to create the sessions
+        :param max_queue_size: maximum number of operations waiting to be written. Queueing an operation when the
+            queue is full blocks until the worker thread makes room for it
+        :param max_batch_size: maximum number of operations written in a single transaction
+        :param batch_interval: time (in seconds) the worker thread waits for more operations before committing a batch
+        """
+        self._sql_manager = sql_manager
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._max_batch_size = max_batch_size
+        self._batch_interval = batch_interval
+        self._worker_thread: Optional[threading.Thread] = None
+
+        self._committed_writes: int = 0
+        self._failed_writes: int = 0
+        self._committed_batches: int = 0
+        self._total_commit_latency: float = 0
+        self._last_commit_latency: float = 0
+        self._max_commit_latency: float = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker_thread is not None and self._worker_thread.is_alive()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of operations waiting to be written
+        """
+        return self._queue.qsize()
+
+    @property
+    def committed_writes(self) -> int:
+        return self._committed_writes
+
+    @property
+    def failed_writes(self) -> int:
+        return self._failed_writes
+
+    @property
+    def committed_batches(self) -> int:
+        return self._committed_batches
+
+    @property
+    def last_commit_latency(self) -> float:
+        return self._last_commit_latency
+
+    @property
+    def max_commit_latency(self) -> float:
+        return self._max_commit_latency
+
+    @property
+    def average_commit_latency(self) -> float:
+        return self._total_commit_latency / self._committed_batches if self._committed_batches > 0 else 0
+
+    def start(self):
+        if not self.is_running:
+            self._worker_thread = threading.Thread(target=self._write_loop, name="SQLWriteBehindQueue", daemon=True)
+            self._worker_thread.start()
+
+    def stop(self):
+        """
+        Writes all the pending operations and stops the worker thread
+        """
+        if self.is_running:
+            self._queue.put(_STOP)
+            self._worker_thread.join()
+        self._worker_thread = None
+
+    def put(self, operation: WriteOperation):
+        if not self.is_running:
+            self._write_batch([operation])
+            return
+        try:
+            self._queue.put_nowait(operation)
+        except queue.Full:
+            self.logger().warning(
+                f"The database write queue is full ({self._queue.maxsize} operations). Waiting for pending writes.")
+            self._queue.put(operation)
+
+    def flush(self):
+        """
+        Blocks until all the operations queued before calling this method have been written
+        """
+        if self.is_running:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def _write_loop(self):
+        while True:
+            batch: List[WriteOperation] = []
+            markers: List[object] = []
+            item = self._queue.get()
+            deadline = time.perf_counter() + self._batch_interval
+            while True:
+                if item is _FLUSH or item is _STOP:
+                    markers.append(item)
+                    break
+                batch.append(item)
+                remaining = deadline - time.perf_counter()
+                if len(batch) >= self._max_batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if len(batch) > 0:
+                self._write_batch(batch)
+            for _ in range(len(batch) + len(markers)):
+                self._queue.task_done()
+            if _STOP in markers:
+                break
+
+    def _write_batch(self, batch: List[WriteOperation]):
+        start = time.perf_counter()
+        try:
+            self._execute(batch)
+        except Exception:
+            if len(batch) == 1:
+                self._failed_writes += 1
+                self.logger().error("Unexpected error writing to the database.", exc_info=True)
+                return
+            self.logger().warning(
+                f"Error writing a batch of {len(batch)} operations to the database. Retrying them one by one.",
+                exc_info=True)
+            for operation in batch:
+                self._write_batch([operation])
+            return
+        self._register_commit(len(batch), time.perf_counter() - start)
+
+    def _execute(self, batch: List[WriteOperation]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for operation in batch:
+                    operation(session)
+
+    def _register_commit(self, writes: int, latency: float):
+        self._committed_writes += writes
+        self._committed_batches += 1
+        self._total_commit_latency += latency
+        self._last_commit_latency = latency
+        self._max_commit_latency = max(self._max_commit_latency, latency)
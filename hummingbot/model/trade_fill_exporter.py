@@ -0,0 +1,187 @@
+import csv
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from shutil import move
+from typing import IO, Any, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # pyarrow is only required to export trades in Parquet format
+    pq = None
+
+from hummingbot.logger import HummingbotLogger
+
+
+class TradeExportFormat(Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+class TradeFillExporter:
+    """
+    Appends trade rows to an export file that is kept open between trades.
+
+    Rows are buffered and written in batches. The header of an existing CSV file is validated once, when the file is
+    opened (a file with a different header is moved aside, as the recorder has always done). Files can be rotated when
+    they reach a maximum size and/or when the UTC day changes; rotated files keep the base name with the date and time
+    of the rotation as suffix.
+
+    The Parquet format requires pyarrow. Parquet files can not be appended once closed, so each time the exporter opens
+    a Parquet file it creates a new one (named with the opening date and time), and every batch of rows is written as a
+    row group.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 file_path: str,
+                 field_names: Sequence[str],
+                 export_format: TradeExportFormat = TradeExportFormat.CSV,
+                 buffer_size: int = 1,
+                 max_file_size: Optional[int] = None,
+                 rotate_daily: bool = False):
+        """
+        :param file_path: path of the export file (without the extension for Parquet exports, it is added)
+        :param field_names: names of the columns, in the order of the row values
+        :param export_format: CSV or Parquet
+        :param buffer_size: number of rows kept in memory before writing them to the file
+        :param max_file_size: size in bytes after which the file is rotated (no size rotation if None)
+        :param rotate_daily: if True the file is rotated when the UTC day changes
+        """
+        if export_format is TradeExportFormat.PARQUET and pa is None:
+            raise ImportError("pyarrow is required to export trades in Parquet format.")
+        self._base_path = os.path.splitext(file_path)[0] if export_format is TradeExportFormat.PARQUET else file_path
+        self._field_names = tuple(field_names)
+        self._export_format = export_format
+        self._buffer_size = max(1, buffer_size)
+        self._max_file_size = max_file_size
+        self._rotate_daily = rotate_daily
+
+        self._buffered_rows: List[Sequence[Any]] = []
+        self._file: Optional[IO] = None
+        self._csv_writer = None
+        self._parquet_writer = None
+        self._current_path: Optional[str] = None
+        self._opened_date = None
+
+    @property
+    def field_names(self) -> Sequence[str]:
+        return self._field_names
+
+    @property
+    def current_path(self) -> Optional[str]:
+        """
+        Path of the file currently open (None if no row has been written yet)
+        """
+        return self._current_path
+
+    def append(self, row: Sequence[Any]):
+        self._buffered_rows.append(row)
+        if len(self._buffered_rows) >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered rows to the export file
+        """
+        if len(self._buffered_rows) == 0:
+            return
+        if self._file is not None and self._rotate_daily and self._current_date() != self._opened_date:
+            self._rotate()
+        if self._file is None:
+            self._open()
+        if self._export_format is TradeExportFormat.CSV:
+            self._csv_writer.writerows(self._buffered_rows)
+            self._file.flush()
+        else:
+            self._write_parquet_row_group(self._buffered_rows)
+        self._buffered_rows = []
+        if self._max_file_size is not None and self._file.tell() >= self._max_file_size:
+            self._rotate()
+
+    def close(self):
+        self.flush()
+        self._close_file()
+
+    def _open(self):
+        self._opened_date = self._current_date()
+        if self._export_format is TradeExportFormat.CSV:
+            self._current_path = self._base_path
+            if os.path.exists(self._current_path) and not self._csv_header_matches(self._current_path):
+                move(self._current_path, self._suffixed_path(self._current_path, "old"))
+            write_header = not os.path.exists(self._current_path) or os.path.getsize(self._current_path) == 0
+            self._file = open(self._current_path, mode="a", newline="")
+            self._csv_writer = csv.writer(self._file)
+            if write_header:
+                self._csv_writer.writerow(self._field_names)
+        else:
+            self._current_path = self._suffixed_path(self._base_path + ".parquet")
+            self._file = open(self._current_path, mode="wb")
+            schema = pa.schema([(field_name, pa.string()) for field_name in self._field_names])
+            self._parquet_writer = pq.ParquetWriter(self._file, schema)
+
+    def _close_file(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_writer = None
+
+    def _rotate(self):
+        self._close_file()
+        if self._export_format is TradeExportFormat.CSV:
+            move(self._current_path, self._suffixed_path(self._current_path))
+        self._current_path = None
+
+    def _csv_header_matches(self, file_path: str) -> bool:
+        with open(file_path, newline="") as file:
+            header = next(csv.reader(file), None)
+        return header is None or tuple(header) == self._field_names
+
+    def _write_parquet_row_group(self, rows: List[Sequence[Any]]):
+        # All the values are exported as text, the same way they are represented in the CSV files
+        columns = [
+            pa.array([self._parquet_value(row[index]) for row in rows], type=pa.string())
+            for index in range(len(self._field_names))
+        ]
+        self._parquet_writer.write_table(pa.Table.from_arrays(columns, names=list(self._field_names)))
+
+    @staticmethod
+    def _parquet_value(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        if isinstance(value, Decimal):
+            return format(value, "f")
+        return str(value)
+
+    @staticmethod
+    def _current_date():
+        return datetime.now(tz=timezone.utc).date()
+
+    @staticmethod
+    def _suffixed_path(file_path: str, label: Optional[str] = None) -> str:
+        root, extension = os.path.splitext(file_path)
+        suffix = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+        if label is not None:
+            suffix = f"{label}_{suffix}"
+        suffixed_path = f"{root}_{suffix}{extension}"
+        counter = 1
+        while os.path.exists(suffixed_path):
+            suffixed_path = f"{root}_{suffix}_{counter}{extension}"
+            counter += 1
+        return suffixed_path
@@ -8,13 +8,24 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        # Running statistics of the values in the buffer (Welford's algorithm)
+        double _mean
+        double _m2
+        int64_t _replacements
+        bint _statistics_valid
 
     cdef void c_add_value(self, float val)
     cdef void c_increment_delimiter(self)
     cdef double c_get_last_value(self)
+    cdef double c_get_value(self, int64_t index)
+    cdef int64_t c_size(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef double c_current_mean_value(self)
+    cdef void c_update_statistics(self, double value, double evicted_value, bint evicted)
+    cdef void c_refresh_statistics(self)
+    cdef void c_reset_statistics(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
@@ -1,6 +1,7 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt
 
 
 pmm_logger = None
@@ -18,13 +19,21 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
+        cdef:
+            double evicted_value = self._buffer[self._delimiter]
+            bint evicted = self._is_full
         self._buffer[self._delimiter] = val
+        self.c_update_statistics(self._buffer[self._delimiter], evicted_value, evicted)
         self.c_increment_delimiter()
+        if self._is_full and not evicted:
+            # Start the sliding window statistics from exact values once the buffer fills up
+            self.c_refresh_statistics()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
@@ -39,27 +48,89 @@ cdef class RingBuffer:
             return np.nan
         return self._buffer[self._delimiter-1]
 
+    cdef double c_get_value(self, int64_t index):
+        # Index 0 is the oldest value in the buffer
+        if index < 0 or index >= self.c_size():
+            raise IndexError(f"RingBuffer index {index} out of range.")
+        if self._is_full:
+            index = (self._delimiter + index) % self._length
+        return self._buffer[index]
+
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef bint c_is_full(self):
         return self._is_full
 
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_current_mean_value()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            if not self._statistics_valid:
+                self.c_refresh_statistics()
+            result = max(self._m2, 0.0) / self._length
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_variance())
         return result
 
+    cdef double c_current_mean_value(self):
+        if self.c_is_empty():
+            return np.nan
+        if not self._statistics_valid:
+            self.c_refresh_statistics()
+        return self._mean
+
+    cdef void c_update_statistics(self, double value, double evicted_value, bint evicted):
+        cdef:
+            double delta
+            double previous_mean
+        if not self._statistics_valid:
+            return
+        if not isfinite(value) or (evicted and not isfinite(evicted_value)):
+            # Non finite values are not tracked incrementally, the statistics are recomputed when read
+            self._statistics_valid = False
+            return
+        if evicted:
+            previous_mean = self._mean
+            delta = value - evicted_value
+            self._mean += delta / self._length
+            self._m2 += delta * (value - self._mean + evicted_value - previous_mean)
+            self._replacements += 1
+            if self._replacements >= self._length:
+                # Recompute from the buffer once per window to stop rounding errors from accumulating
+                self._statistics_valid = False
+        else:
+            delta = value - self._mean
+            self._mean += delta / (self._delimiter + 1)
+            self._m2 += delta * (value - self._mean)
+
+    cdef void c_refresh_statistics(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+        self._replacements = 0
+        if values.size == 0:
+            self._mean = 0
+            self._m2 = 0
+            self._statistics_valid = True
+            return
+        self._mean = np.mean(values)
+        self._m2 = np.sum(np.square(values - self._mean))
+        self._statistics_valid = isfinite(self._mean) and isfinite(self._m2)
+
+    cdef void c_reset_statistics(self):
+        self._mean = 0
+        self._m2 = 0
+        self._replacements = 0
+        self._statistics_valid = True
+
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
         cdef np.ndarray[np.int16_t, ndim=1] indexes
 
@@ -75,6 +146,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -85,6 +157,16 @@ cdef class RingBuffer:
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_value(self, index: int) -> float:
+        """
+        Returns the value at the given position, 0 being the oldest value in the buffer
+        """
+        return self.c_get_value(index)
+
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def is_full(self):
         return self.c_is_full()
@@ -93,6 +175,13 @@ cdef class RingBuffer:
     def mean_value(self):
         return self.c_mean_value()
 
+    @property
+    def current_mean_value(self):
+        """
+        Mean of the values in the buffer, available before the buffer is full (nan if it is empty)
+        """
+        return self.c_current_mean_value()
+
     @property
     def std_dev(self):
         return self.c_std_dev()
@@ -113,6 +202,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
         for val in data[-value:]:
             self.add_value(val)
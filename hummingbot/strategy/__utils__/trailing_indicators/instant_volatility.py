@@ -5,15 +5,48 @@ import numpy as np
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Sum of the squared differences between consecutive samples in the sampling buffer, updated on each sample
+        self._squared_diffs_sum = 0.0
+        self._samples_since_refresh = 0
+
+    def add_sample(self, value: float):
+        buffer = self._sampling_buffer
+        previous_size = buffer.size
+        previous_value = buffer.get_last_value()
+        if buffer.is_full and buffer.length > 1:
+            # The difference between the two oldest samples leaves the buffer
+            self._squared_diffs_sum -= (buffer.get_value(1) - buffer.get_value(0)) ** 2
+        buffer.add_value(value)
+        if previous_size > 0 and buffer.length > 1:
+            self._squared_diffs_sum += (buffer.get_last_value() - previous_value) ** 2
+
+        self._samples_since_refresh += 1
+        if self._samples_since_refresh >= buffer.length or not np.isfinite(self._squared_diffs_sum):
+            # Recompute from the buffer once per buffer length to stop rounding errors from accumulating
+            self._refresh_squared_diffs_sum()
+
+        self._processing_buffer.add_value(self._indicator_calculation())
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        vol = np.sqrt(max(self._squared_diffs_sum, 0.0) / self._sampling_buffer.size)
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    def _refresh_squared_diffs_sum(self):
+        self._squared_diffs_sum = float(np.sum(np.square(np.diff(self._sampling_buffer.get_as_numpy_array()))))
+        self._samples_since_refresh = 0
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._refresh_squared_diffs_sum()
@@ -20,9 +20,16 @@ cdef class TradingIntensityIndicator:
         list _last_quotes
         int _sampling_length
         int _samples_length
+        dict _trades_consolidated
+        dict _price_level_trades
+        bint _trades_consolidated_changed
+        int _refit_interval
+        int _changes_since_fit
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_sample(self, object timestamp, dict trade)
+    cdef c_remove_trade_samples(self, object timestamp)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -27,7 +27,17 @@ cdef class TradesForwarder(EventListener):
 
 cdef class TradingIntensityIndicator:
 
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 refit_interval: int = 1):
+        """
+        :param order_book: order book whose trades are sampled
+        :param price_delegate: provides the mid price the trade price levels are measured from
+        :param sampling_length: number of ticks with trades used to estimate the intensity
+        :param refit_interval: number of ticks with new or expired trades between two fits of the intensity curve
+        """
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
@@ -39,6 +49,12 @@ cdef class TradingIntensityIndicator:
         self._sampling_length = sampling_length
         self._samples_length = 0
         self._last_quotes = []
+        # Traded amount and number of trades per price level in the sampled ticks, updated as ticks enter and leave
+        self._trades_consolidated = {}
+        self._price_level_trades = {}
+        self._trades_consolidated_changed = False
+        self._refit_interval = max(1, refit_interval)
+        self._changes_since_fit = 0
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -91,10 +107,7 @@ cdef class TradingIntensityIndicator:
                         latest_processed_quote_idx = i
                     trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
 
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    self.c_add_trade_sample(quote["timestamp"] + 1, trade)
                     break
 
         # THere are no trades left to process
@@ -103,17 +116,16 @@ cdef class TradingIntensityIndicator:
         if latest_processed_quote_idx is not None:
             self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        # Keep only the latest sampling_length ticks
+        while len(self._trade_samples) > self._sampling_length:
+            self.c_remove_trade_samples(min(self._trade_samples))
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        if self._trades_consolidated_changed:
+            self._changes_since_fit += 1
+            self._trades_consolidated_changed = False
 
-        if self.is_sampling_buffer_full:
+        # The curve is only fitted again when the sampled trades changed
+        if self.is_sampling_buffer_full and self._changes_since_fit >= self._refit_interval:
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,30 +135,39 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_sample(self, object timestamp, dict trade):
+        price_level = trade["price_level"]
+        if timestamp not in self._trade_samples:
+            self._trade_samples[timestamp] = []
+        self._trade_samples[timestamp].append(trade)
+        if price_level not in self._trades_consolidated:
+            self._trades_consolidated[price_level] = 0
+            self._price_level_trades[price_level] = 0
+        self._trades_consolidated[price_level] += trade["amount"]
+        self._price_level_trades[price_level] += 1
+        self._trades_consolidated_changed = True
+
+    cdef c_remove_trade_samples(self, object timestamp):
+        for trade in self._trade_samples.pop(timestamp):
+            price_level = trade["price_level"]
+            self._price_level_trades[price_level] -= 1
+            if self._price_level_trades[price_level] == 0:
+                del self._price_level_trades[price_level]
+                del self._trades_consolidated[price_level]
+            else:
+                self._trades_consolidated[price_level] -= trade["amount"]
+        self._trades_consolidated_changed = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
             list lambdas
             list price_levels
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
+        self._changes_since_fit = 0
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        # Trading intensities, by descending price level
+        price_levels = sorted(self._trades_consolidated.keys(), reverse=True)
+        lambdas = [self._trades_consolidated[price_level] for price_level in price_levels]
 
         # Adjust to be able to calculate log
         lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
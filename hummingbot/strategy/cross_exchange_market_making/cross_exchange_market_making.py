@@ -1,10 +1,12 @@
+import asyncio
 import logging
+import time
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 from bidict import bidict
@@ -15,10 +17,13 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TokenAmount
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     MarketOrderFailureEvent,
+    OrderBookEvent,
     OrderCancelledEvent,
     OrderExpiredEvent,
     OrderFilledEvent,
@@ -26,6 +31,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -82,7 +88,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     market_pairs: List[MakerTakerMarketPair],
                     status_report_interval: float = 900,
                     logging_options: int = OPTION_LOG_ALL,
-                    hb_app_notification: bool = False
+                    hb_app_notification: bool = False,
+                    max_concurrent_market_pairs: int = 0,
                     ):
         """
         Initializes a cross exchange market making strategy object.
@@ -91,6 +98,9 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         :param market_pairs: list of cross exchange market pairs
         :param logging_options: bit field for what types of logging to enable in this strategy object
         :param hb_app_notification:
+        :param max_concurrent_market_pairs: if greater than 0, each market pair is processed by its own task, on every
+            clock tick and every update of its taker order book, with at most this number of market pairs processed at
+            the same time. If 0, the market pairs are processed one after the other on each clock tick.
         """
         self._config_map = config_map
         self._market_pairs = {
@@ -123,6 +133,20 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         self._gateway_quotes_task = None
         self._hedge_maker_order_tasks = []
 
+        # Concurrent processing of the market pairs
+        self._max_concurrent_market_pairs = max_concurrent_market_pairs
+        self._market_pair_semaphore: Optional[asyncio.Semaphore] = None
+        self._market_pair_tasks: Dict[MakerTakerMarketPair, asyncio.Task] = {}
+        self._market_pair_update_events: Dict[MakerTakerMarketPair, asyncio.Event] = {}
+        self._taker_order_book_market_pairs: Dict[OrderBook, List[MakerTakerMarketPair]] = {}
+        self._taker_order_book_update_forwarder = SourceInfoEventForwarder(self._did_update_taker_order_book)
+        # Time (perf_counter) of the first taker order book update not yet followed by a requote, for each pair
+        self._pending_taker_book_updates: Dict[MakerTakerMarketPair, float] = {}
+        self._requote_latencies: Dict[MakerTakerMarketPair, LatencyHistogram] = {
+            market_pair: LatencyHistogram() for market_pair in market_pairs
+        }
+        self._last_price_sample_timestamps: Dict[MakerTakerMarketPair, float] = {}
+
         self._last_conv_rates_logged = 0
         self._hb_app_notification = hb_app_notification
 
@@ -232,6 +256,18 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def logging_options(self, logging_options: Tuple):
         self._logging_options = logging_options
 
+    @property
+    def concurrent_market_pairs_enabled(self) -> bool:
+        return self._max_concurrent_market_pairs > 0
+
+    @property
+    def requote_latencies(self) -> Dict[MakerTakerMarketPair, LatencyHistogram]:
+        """
+        For each market pair, the time from an update of the taker order book to the end of the requote it triggered
+        (only measured when the market pairs are processed concurrently)
+        """
+        return self._requote_latencies
+
     @property
     def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
         return self._sb_order_tracker.market_pair_to_active_orders
@@ -254,7 +290,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             gas_rate_source, gas_rate
 
     def log_conversion_rates(self):
-        for market_pair in self._market_pairs.values():
+        for market_pair in self.ready_market_pairs():
             quote_pair, quote_rate_source, quote_rate, base_pair, base_rate_source, base_rate, gas_pair, \
                 gas_rate_source, gas_rate = self.get_conversion_rates(market_pair)
             if quote_pair.split("-")[0] != quote_pair.split("-")[1]:
@@ -347,6 +383,14 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             else:
                 lines.extend(["", "  No active maker market orders."])
 
+            requote_latency = self._requote_latencies.get(market_pair)
+            if requote_latency is not None and requote_latency.count > 0:
+                lines.extend(["", "  Requote latency after taker order book updates:",
+                              f"    p50: {requote_latency.percentile(50) * 1e3:.1f} ms, "
+                              f"p90: {requote_latency.percentile(90) * 1e3:.1f} ms, "
+                              f"p99: {requote_latency.percentile(99) * 1e3:.1f} ms, "
+                              f"max: {requote_latency.max * 1e3:.1f} ms ({requote_latency.count} requotes)"])
+
             warning_lines.extend(self.balance_warning([market_pair.maker, market_pair.taker]))
 
         if len(warning_lines) > 0:
@@ -358,6 +402,10 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
 
+    def stop(self, clock: Clock):
+        self.stop_market_pair_tasks()
+        super().stop(clock)
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point.
@@ -378,27 +426,27 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         if not self._all_markets_ready:
             self._all_markets_ready = all([market.ready for market in self.active_markets])
-            if not self._all_markets_ready:
+            if self._all_markets_ready:
+                # Markets are ready, ok to proceed.
+                if LogOption.STATUS_REPORT:
+                    self.logger().info("Markets are ready.")
+            elif len(self.ready_market_pairs()) == 0:
                 # Markets not ready yet. Don't do anything.
                 if should_report_warnings:
                     self.logger().warning("Markets are not ready. No market making trades are permitted.")
                 return
-            else:
-                # Markets are ready, ok to proceed.
-                if LogOption.STATUS_REPORT:
-                    self.logger().info("Markets are ready.")
 
         if not self._conversions_ready:
-            for market_pair in self._market_pairs.values():
+            for market_pair in self.ready_market_pairs():
                 _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
                 if not quote_rate or not base_rate:
                     if should_report_warnings:
                         self.logger().warning("Conversion rates are not ready. No market making trades are permitted.")
                     return
 
-            # Conversion rates are ready, ok to proceed.
-            self._conversions_ready = True
-            if LogOption.STATUS_REPORT:
+            # Conversion rates are ready, ok to proceed. Checked again while some market pairs are not ready.
+            self._conversions_ready = self._all_markets_ready
+            if self._conversions_ready and LogOption.STATUS_REPORT:
                 self.logger().info("Conversion rates are ready. Trading started.")
 
         if should_report_warnings:
@@ -411,28 +459,52 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self._gateway_quotes_task = safe_ensure_future(self.get_gateway_quotes())
 
         if self.ready_for_new_trades():
-            if self._main_task is None or self._main_task.done():
+            if self.concurrent_market_pairs_enabled:
+                self.request_market_pairs_update(timestamp)
+            elif self._main_task is None or self._main_task.done():
                 self._main_task = safe_ensure_future(self.main(timestamp))
 
+    def is_market_pair_ready(self, market_pair: MakerTakerMarketPair) -> bool:
+        """
+        Returns True if both the maker and the taker markets can trade the trading pairs of the market pair
+        """
+        return (market_pair.maker.market.is_trading_pair_ready(market_pair.maker.trading_pair)
+                and market_pair.taker.market.is_trading_pair_ready(market_pair.taker.trading_pair))
+
+    def ready_market_pairs(self) -> List[MakerTakerMarketPair]:
+        """
+        Returns the market pairs that can be traded. Before all the markets are ready, the market pairs whose trading
+        pairs are already ready in their markets (e.g. their order books are initialized) are traded.
+        """
+        if self._all_markets_ready:
+            return list(self._market_pairs.values())
+        return [market_pair for market_pair in self._market_pairs.values() if self.is_market_pair_ready(market_pair)]
+
+    def get_market_pair_to_active_orders(self) -> Dict[MakerTakerMarketPair, List[LimitOrder]]:
+        """
+        Calculate a mapping from market pair to list of active limit orders on the market.
+        """
+        market_pair_to_active_orders = defaultdict(list)
+
+        for maker_market, limit_order, order_id in self.active_maker_limit_orders:
+            market_pair = self._market_pairs.get((maker_market, limit_order.trading_pair))
+            if market_pair is None:
+                self.log_with_clock(logging.WARNING,
+                                    f"The in-flight maker order in for the trading pair '{limit_order.trading_pair}' "
+                                    f"does not correspond to any whitelisted trading pairs. Skipping.")
+                continue
+
+            if not self._sb_order_tracker.has_in_flight_cancel(limit_order.client_order_id) and \
+                    limit_order.client_order_id in self._maker_to_taker_order_ids.keys():
+                market_pair_to_active_orders[market_pair].append(limit_order)
+        return market_pair_to_active_orders
+
     async def main(self, timestamp: float):
         try:
-            # Calculate a mapping from market pair to list of active limit orders on the market.
-            market_pair_to_active_orders = defaultdict(list)
-
-            for maker_market, limit_order, order_id in self.active_maker_limit_orders:
-                market_pair = self._market_pairs.get((maker_market, limit_order.trading_pair))
-                if market_pair is None:
-                    self.log_with_clock(logging.WARNING,
-                                        f"The in-flight maker order in for the trading pair '{limit_order.trading_pair}' "
-                                        f"does not correspond to any whitelisted trading pairs. Skipping.")
-                    continue
-
-                if not self._sb_order_tracker.has_in_flight_cancel(limit_order.client_order_id) and \
-                        limit_order.client_order_id in self._maker_to_taker_order_ids.keys():
-                    market_pair_to_active_orders[market_pair].append(limit_order)
+            market_pair_to_active_orders = self.get_market_pair_to_active_orders()
 
             # Process each market pair independently.
-            for market_pair in self._market_pairs.values():
+            for market_pair in self.ready_market_pairs():
                 await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
 
             # log conversion rates every 5 minutes
@@ -442,8 +514,84 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         finally:
             self._last_timestamp = timestamp
 
+    def request_market_pairs_update(self, timestamp: float):
+        """
+        Clock tick processing when the market pairs are processed concurrently: starts the market pair tasks if needed
+        and wakes all of them up.
+        """
+        if len(self._market_pair_tasks) < len(self._market_pairs):
+            self.start_market_pair_tasks()
+        for update_event in self._market_pair_update_events.values():
+            update_event.set()
+
+        # log conversion rates every 5 minutes
+        if self._last_conv_rates_logged + (60. * 5) < timestamp:
+            self.log_conversion_rates()
+            self._last_conv_rates_logged = timestamp
+        self._last_timestamp = timestamp
+
+    def start_market_pair_tasks(self):
+        """
+        Starts the tasks of the ready market pairs that are not running yet
+        """
+        if self._market_pair_semaphore is None:
+            self._market_pair_semaphore = asyncio.Semaphore(self._max_concurrent_market_pairs)
+        for market_pair in self.ready_market_pairs():
+            if market_pair in self._market_pair_tasks:
+                continue
+            self._market_pair_update_events[market_pair] = asyncio.Event()
+            if not self.is_gateway_market(market_pair.taker):
+                order_book = market_pair.taker.order_book
+                if order_book not in self._taker_order_book_market_pairs:
+                    self._taker_order_book_market_pairs[order_book] = []
+                    order_book.add_listener(OrderBookEvent.OrderBookUpdateEvent,
+                                            self._taker_order_book_update_forwarder)
+                self._taker_order_book_market_pairs[order_book].append(market_pair)
+            self._market_pair_tasks[market_pair] = safe_ensure_future(self.market_pair_loop(market_pair))
+
+    def stop_market_pair_tasks(self):
+        for order_book in self._taker_order_book_market_pairs.keys():
+            order_book.remove_listener(OrderBookEvent.OrderBookUpdateEvent, self._taker_order_book_update_forwarder)
+        self._taker_order_book_market_pairs.clear()
+        for task in self._market_pair_tasks.values():
+            task.cancel()
+        self._market_pair_tasks.clear()
+        self._market_pair_update_events.clear()
+        self._pending_taker_book_updates.clear()
+
+    async def market_pair_loop(self, market_pair: MakerTakerMarketPair):
+        """
+        Processes a market pair every time it is woken up by a clock tick or an update of its taker order book. Updates
+        received while the market pair is being processed are handled together in the next run.
+        """
+        update_event = self._market_pair_update_events[market_pair]
+        while True:
+            await update_event.wait()
+            update_event.clear()
+            if not self.ready_for_new_trades():
+                continue
+            async with self._market_pair_semaphore:
+                taker_book_update_time = self._pending_taker_book_updates.pop(market_pair, None)
+                try:
+                    await self.process_market_pair(self.current_timestamp,
+                                                   market_pair,
+                                                   self.get_market_pair_to_active_orders()[market_pair])
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error(f"Unexpected error processing the market pair {market_pair.maker.trading_pair}"
+                                        f" ({market_pair.taker.trading_pair} on the taker market).", exc_info=True)
+                if taker_book_update_time is not None:
+                    self._requote_latencies[market_pair].record(time.perf_counter() - taker_book_update_time)
+
+    def _did_update_taker_order_book(self, event_tag: int, order_book: OrderBook, update_id: int):
+        for market_pair in self._taker_order_book_market_pairs.get(order_book, []):
+            if market_pair not in self._pending_taker_book_updates:
+                self._pending_taker_book_updates[market_pair] = time.perf_counter()
+            self._market_pair_update_events[market_pair].set()
+
     async def get_gateway_quotes(self):
-        for market_pair in self._market_pairs.values():
+        for market_pair in self.ready_market_pairs():
             if self.is_gateway_market(market_pair.taker):
                 _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
                 order_amount = self._config_map.order_amount * base_rate
@@ -1359,7 +1507,9 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         :param market_pair: cross exchange market pair
         """
-        if ((self._last_timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL) <
+        last_sample_timestamp = self._last_price_sample_timestamps.get(market_pair, self._last_timestamp)
+        self._last_price_sample_timestamps[market_pair] = timestamp
+        if ((last_sample_timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL) <
                 (timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL)):
             if market_pair not in self._suggested_price_samples:
                 self._suggested_price_samples[market_pair] = (deque(), deque())
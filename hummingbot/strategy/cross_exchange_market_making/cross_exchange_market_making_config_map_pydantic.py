@@ -289,6 +289,17 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
             "prompt_on_new": True
         }
     )
+    max_concurrent_market_pairs: int = Field(
+        default=0,
+        description="If greater than 0, each market pair is processed by its own task, on every clock tick and every "
+                    "update of its taker order book, with at most this number of market pairs processed at the same "
+                    "time. If 0, the market pairs are processed one after the other on each clock tick.",
+        ge=0,
+        json_schema_extra={
+            "prompt": "How many market pairs do you want to process at the same time? (Enter 0 to process them one "
+                      "after the other on each tick)"
+        }
+    )
     taker_market: str = Field(
         default=...,
         description="The name of the taker exchange connector.",
@@ -74,4 +74,5 @@ async def start(self):
         status_report_interval=status_report_interval,
         logging_options=strategy_logging_options,
         hb_app_notification=True,
+        max_concurrent_market_pairs=c_map.max_concurrent_market_pairs,
     )
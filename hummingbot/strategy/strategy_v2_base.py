@@ -17,6 +17,7 @@ from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.common import MarketDict, PositionMode
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.historical_candles_cache import HistoricalCandlesCache
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.exceptions import InvalidController
 from hummingbot.remote_iface.mqtt import ETopicPublisher
@@ -192,7 +193,7 @@ class StrategyV2Base(ScriptStrategyBase):
         self.controller_reports: Dict[str, Dict] = {}
 
         # Initialize the market data provider and executor orchestrator
-        self.market_data_provider = MarketDataProvider(connectors)
+        self.market_data_provider = MarketDataProvider(connectors, historical_candles_cache=HistoricalCandlesCache())
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
 
         # Initialize the controllers
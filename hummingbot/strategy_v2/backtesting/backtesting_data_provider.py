@@ -14,6 +14,7 @@ from hummingbot.data_feed.candles_feed.data_types import (
     CandlesConfig,
     HistoricalCandlesConfig,
 )
+from hummingbot.data_feed.candles_feed.historical_candles_cache import HistoricalCandlesCache
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 
 # Set up logging
@@ -42,8 +43,10 @@ class BacktestingDataProvider(MarketDataProvider):
         "injective_v2",
     ]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
-        super().__init__(connectors)
+    def __init__(self, connectors: Dict[str, ConnectorBase],
+                 historical_candles_cache: Optional[HistoricalCandlesCache] = None):
+        super().__init__(connectors,
+                         historical_candles_cache=historical_candles_cache or HistoricalCandlesCache())
         self.start_time = None
         self.end_time = None
         self.prices = {}
@@ -124,7 +127,8 @@ class BacktestingDataProvider(MarketDataProvider):
         candles_buffer = (
             config.max_records * CandlesBase.interval_to_seconds[config.interval]
         )
-        candles_df = await candle_feed.get_historical_candles(
+        candles_df = await self._fetch_historical_candles(
+            candles_feed=candle_feed,
             config=HistoricalCandlesConfig(
                 connector_name=config.connector,
                 trading_pair=config.trading_pair,
@@ -83,18 +83,19 @@ class BacktestingEngineBase:
                               controller_config: ControllerConfigBase,
                               start: int, end: int,
                               backtesting_resolution: str = "1m",
-                              trade_cost=0.0006):
-        controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name, controller_config.get_controller_class)
-        # controller_class = controller_config.get_controller_class()
+                              trade_cost=0.0006,
+                              vectorized: bool = False):
         # Load historical candles
         self.backtesting_data_provider.update_backtesting_time(start, end)
         await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
-        self.controller = controller_class(config=controller_config, market_data_provider=self.backtesting_data_provider,
-                                           actions_queue=None)
+        self.initialize_controller(controller_config)
         self.backtesting_resolution = backtesting_resolution
         await self.initialize_backtesting_data_provider()
         await self.controller.update_processed_data()
-        executors_info = await self.simulate_execution(trade_cost=trade_cost)
+        if vectorized:
+            executors_info = await self.simulate_execution_vectorized(trade_cost=trade_cost)
+        else:
+            executors_info = await self.simulate_execution(trade_cost=trade_cost)
         results = self.summarize_results(executors_info, controller_config.total_amount_quote)
         return {
             "executors": executors_info,
@@ -102,6 +103,11 @@ class BacktestingEngineBase:
             "processed_data": self.controller.processed_data,
         }
 
+    def initialize_controller(self, controller_config: ControllerConfigBase):
+        controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name, controller_config.get_controller_class)
+        self.controller = controller_class(config=controller_config, market_data_provider=self.backtesting_data_provider,
+                                           actions_queue=None)
+
     async def initialize_backtesting_data_provider(self):
         backtesting_config = CandlesConfig(
             connector=self.controller.config.connector_name,
@@ -137,6 +143,49 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
+    async def simulate_execution_vectorized(self, trade_cost: float) -> list:
+        """
+        Simulates the strategy over historical data like `simulate_execution`, but converting the market data to NumPy
+        arrays once and iterating them by position, instead of building a pandas Series for every row.
+
+        The controller receives the same processed data, prices and timestamps for every row, so the executor actions
+        it determines (and the simulation results) are the same as with `simulate_execution`.
+
+        Args:
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        processed_features = self.prepare_market_data()
+        self.active_executor_simulations: List[ExecutorSimulation] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+
+        columns = processed_features.columns.tolist()
+        rows = processed_features.to_numpy(dtype=object)
+        timestamp_column = columns.index("timestamp")
+        close_prices = [Decimal(close) for close in processed_features["close_bt"].tolist()]
+        key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        market_data_provider = self.controller.market_data_provider
+
+        for i in range(len(rows)):
+            row_values = rows[i]
+            timestamp = row_values[timestamp_column]
+            market_data_provider.prices = {key: close_prices[i]}
+            market_data_provider._time = timestamp
+            self.controller.processed_data.update(zip(columns, row_values))
+            self.update_executors_info(timestamp)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    executor_simulation = self.simulate_executor(
+                        action.executor_config, processed_features.iloc[i:], trade_cost)
+                    if executor_simulation is not None and executor_simulation.close_type != CloseType.FAILED:
+                        self.manage_active_executors(executor_simulation)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action(action, timestamp)
+
+        return self.controller.executors_info
+
     async def update_state(self, row):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
@@ -264,7 +313,7 @@ class BacktestingEngineBase:
             correct_short = ((executors_with_position["side"] == TradeType.SELL) & (executors_with_position["net_pnl_quote"] > 0)).sum()
             accuracy_long = correct_long / total_long if total_long > 0 else 0
             accuracy_short = correct_short / total_short if total_short > 0 else 0
-            executors_df["close_type_name"] = executors_df["close_type"].apply(lambda x: x.name)
+            executors_df["close_type_name"] = executors_df["close_type"].apply(lambda x: x.name if x is not None else None)
             close_types = executors_df.groupby("close_type_name")["timestamp"].count().to_dict()
             executors_with_position = executors_df[executors_df["net_pnl_quote"] != 0].copy()
             # Additional metrics
@@ -0,0 +1,242 @@
+import asyncio
+import itertools
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+
+# Candles shared with the worker processes: (shared memory block name, array shape, column names) for numeric feeds,
+# or the DataFrame itself for feeds that can not be stored as a float64 array
+SharedCandlesSpec = Union[Tuple[str, Tuple[int, int], List[str]], pd.DataFrame]
+
+# Backtesting engine of each worker process, created once by the pool initializer
+_worker_engine: Optional[BacktestingEngineBase] = None
+_worker_shared_blocks: List[shared_memory.SharedMemory] = []
+
+
+class BacktestingSweep:
+    """
+    Backtests many variants of a controller configuration in parallel.
+
+    The candles and trading rules required by all the variants are loaded once in the main process. Numeric candles are
+    copied once to shared memory blocks that the worker processes map without copying, and every worker process
+    creates a single backtesting engine that is reused for all the configurations it simulates.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 backtesting_engine_class: Type[BacktestingEngineBase] = BacktestingEngineBase):
+        """
+        :param max_workers: number of worker processes (defaults to the number of CPUs)
+        :param backtesting_engine_class: engine used to run each backtest
+        """
+        self._max_workers = max_workers or os.cpu_count()
+        self._backtesting_engine_class = backtesting_engine_class
+        self.backtesting_data_provider = BacktestingDataProvider(connectors={})
+
+    @staticmethod
+    def grid_configs(base_config: ControllerConfigBase,
+                     parameter_grid: Dict[str, Sequence[Any]]) -> List[ControllerConfigBase]:
+        """
+        Creates one configuration for every combination of the parameter values.
+
+        :param base_config: configuration providing the values of the parameters not included in the grid
+        :param parameter_grid: values to test for each parameter
+        """
+        parameter_names = list(parameter_grid.keys())
+        return [
+            BacktestingSweep._config_variant(base_config, dict(zip(parameter_names, values)), index)
+            for index, values in enumerate(itertools.product(*parameter_grid.values()))
+        ]
+
+    @staticmethod
+    def random_configs(base_config: ControllerConfigBase,
+                       parameter_space: Dict[str, Union[Sequence[Any], Tuple[Any, Any]]],
+                       samples: int,
+                       seed: Optional[int] = None) -> List[ControllerConfigBase]:
+        """
+        Creates configurations with parameter values sampled at random.
+
+        :param base_config: configuration providing the values of the parameters not included in the space
+        :param parameter_space: for each parameter, a list of values to choose from, or a (low, high) tuple to sample
+            uniformly from (integers if both bounds are integers, Decimals if any bound is a Decimal)
+        :param samples: number of configurations to create
+        :param seed: seed for the random generator, to get reproducible samples
+        """
+        generator = random.Random(seed)
+        configs = []
+        for index in range(samples):
+            parameters = {
+                name: BacktestingSweep._sample_value(generator, values) for name, values in parameter_space.items()
+            }
+            configs.append(BacktestingSweep._config_variant(base_config, parameters, index))
+        return configs
+
+    async def run_sweep(self,
+                        configs: List[ControllerConfigBase],
+                        start: int,
+                        end: int,
+                        backtesting_resolution: str = "1m",
+                        trade_cost: float = 0.0006,
+                        vectorized: bool = True) -> pd.DataFrame:
+        """
+        Backtests all the configurations and returns one row per configuration, with the parameters that change
+        between configurations and the metrics from `BacktestingEngineBase.summarize_results`. Configurations that
+        fail are reported in the `error` column.
+        """
+        await self.initialize_market_data(configs, start, end, backtesting_resolution)
+        shared_blocks, candles_specs = self._share_candles(self.backtesting_data_provider.candles_feeds)
+        try:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=self._max_workers,
+                                     initializer=_initialize_worker,
+                                     initargs=(self._backtesting_engine_class,
+                                               candles_specs,
+                                               self.backtesting_data_provider.trading_rules)) as pool:
+                results = await asyncio.gather(*[
+                    loop.run_in_executor(pool, _run_backtesting, config, start, end, backtesting_resolution,
+                                         trade_cost, vectorized)
+                    for config in configs
+                ], return_exceptions=True)
+        finally:
+            for block in shared_blocks:
+                block.close()
+                block.unlink()
+        return self._results_df(configs, results)
+
+    async def initialize_market_data(self,
+                                     configs: List[ControllerConfigBase],
+                                     start: int,
+                                     end: int,
+                                     backtesting_resolution: str):
+        """
+        Loads the trading rules and candles required by all the configurations. Data already loaded in the data
+        provider is reused.
+        """
+        self.backtesting_data_provider.update_backtesting_time(start, end)
+        candles_configs: Dict[str, CandlesConfig] = {}
+        for config in configs:
+            await self.backtesting_data_provider.initialize_trading_rules(config.connector_name)
+            required_candles = [CandlesConfig(connector=config.connector_name,
+                                              trading_pair=config.trading_pair,
+                                              interval=backtesting_resolution)]
+            required_candles.extend(config.candles_config)
+            for candles_config in required_candles:
+                key = self.backtesting_data_provider._generate_candle_feed_key(candles_config)
+                if key not in candles_configs or candles_config.max_records > candles_configs[key].max_records:
+                    candles_configs[key] = candles_config
+        for candles_config in candles_configs.values():
+            await self.backtesting_data_provider.initialize_candles_feed(candles_config)
+
+    @staticmethod
+    def _config_variant(base_config: ControllerConfigBase,
+                        parameters: Dict[str, Any],
+                        index: int) -> ControllerConfigBase:
+        config_data = base_config.model_dump()
+        config_data.update(parameters)
+        if "id" not in parameters:
+            config_data["id"] = f"{base_config.id}_{index}"
+        return type(base_config)(**config_data)
+
+    @staticmethod
+    def _sample_value(generator: random.Random, values: Union[Sequence[Any], Tuple[Any, Any]]) -> Any:
+        if isinstance(values, tuple) and len(values) == 2:
+            low, high = values
+            if isinstance(low, int) and isinstance(high, int):
+                return generator.randint(low, high)
+            value = generator.uniform(float(low), float(high))
+            return Decimal(str(value)) if isinstance(low, Decimal) or isinstance(high, Decimal) else value
+        return generator.choice(list(values))
+
+    @staticmethod
+    def _share_candles(
+            candles_feeds: Dict[str, pd.DataFrame]
+    ) -> Tuple[List[shared_memory.SharedMemory], Dict[str, SharedCandlesSpec]]:
+        shared_blocks = []
+        candles_specs = {}
+        for key, candles_df in candles_feeds.items():
+            if len(candles_df) == 0 or not all(pd.api.types.is_numeric_dtype(dtype) for dtype in candles_df.dtypes):
+                candles_specs[key] = candles_df
+                continue
+            values = candles_df.to_numpy(dtype=np.float64)
+            block = shared_memory.SharedMemory(create=True, size=values.nbytes)
+            np.ndarray(values.shape, dtype=np.float64, buffer=block.buf)[:] = values
+            shared_blocks.append(block)
+            candles_specs[key] = (block.name, values.shape, candles_df.columns.tolist())
+        return shared_blocks, candles_specs
+
+    @staticmethod
+    def _results_df(configs: List[ControllerConfigBase], results: List[Any]) -> pd.DataFrame:
+        configs_data = [config.model_dump() for config in configs]
+        varying_parameters = [
+            name for name in configs_data[0].keys()
+            if name != "id" and any(config_data[name] != configs_data[0][name] for config_data in configs_data[1:])
+        ] if len(configs_data) > 0 else []
+        rows = []
+        for config, config_data, result in zip(configs, configs_data, results):
+            row = {"id": config.id}
+            row.update({name: config_data[name] for name in varying_parameters})
+            if isinstance(result, BaseException):
+                BacktestingSweep.logger().error(f"Error backtesting the configuration {config.id}: {result}")
+                row["error"] = str(result)
+            else:
+                row.update(result)
+                row["error"] = None
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+
+def _initialize_worker(engine_class: Type[BacktestingEngineBase],
+                       candles_specs: Dict[str, SharedCandlesSpec],
+                       trading_rules: Dict[str, Any]):
+    global _worker_engine
+    _worker_engine = engine_class()
+    data_provider = _worker_engine.backtesting_data_provider
+    for key, spec in candles_specs.items():
+        if isinstance(spec, pd.DataFrame):
+            data_provider.candles_feeds[key] = spec
+            continue
+        name, shape, columns = spec
+        block = shared_memory.SharedMemory(name=name)
+        # The main process owns (and unlinks) the block, the worker only maps it
+        resource_tracker.unregister(block._name, "shared_memory")
+        _worker_shared_blocks.append(block)
+        values = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        values.flags.writeable = False
+        data_provider.candles_feeds[key] = pd.DataFrame(values, columns=columns, copy=False)
+    data_provider.trading_rules = trading_rules
+
+
+def _run_backtesting(config: ControllerConfigBase,
+                     start: int,
+                     end: int,
+                     backtesting_resolution: str,
+                     trade_cost: float,
+                     vectorized: bool) -> Dict[str, Any]:
+    backtesting_result = asyncio.run(_worker_engine.run_backtesting(
+        controller_config=config,
+        start=start,
+        end=end,
+        backtesting_resolution=backtesting_resolution,
+        trade_cost=trade_cost,
+        vectorized=vectorized))
+    return backtesting_result["results"]
@@ -0,0 +1,282 @@
+import math
+from decimal import Decimal
+from typing import List, Optional, Set, Tuple, Union
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy_v2.backtesting.order_book_exchange_simulator import OrderBookExchangeSimulator
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TrailingStop
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+AMOUNT_EPSILON = 1e-12
+
+
+class OrderBookExecutorSimulation:
+    """
+    Event driven simulation of a position or DCA executor trading in an OrderBookExchangeSimulator.
+
+    The entry orders are placed when the executor starts, and filled by the exchange simulator as the recorded
+    order book messages are replayed. The barriers are evaluated every time the backtesting engine runs the control
+    step of the executors, like the executors do on every tick:
+    - The position is closed with a market order on stop loss, trailing stop, time limit and early stop.
+    - A limit take profit is placed as a limit order once the entry orders are filled, and a market take profit closes
+      the position when the PnL reaches it.
+
+    The PnL of the open position is marked at the best price it could be closed at.
+    """
+
+    def __init__(self,
+                 config: Union[PositionExecutorConfig, DCAExecutorConfig],
+                 exchange: OrderBookExchangeSimulator,
+                 market_data_provider: MarketDataProvider,
+                 entries: List[Tuple[Optional[Decimal], Decimal]],
+                 take_profit: Optional[Decimal] = None,
+                 stop_loss: Optional[Decimal] = None,
+                 trailing_stop: Optional[TrailingStop] = None,
+                 time_limit: Optional[int] = None,
+                 take_profit_order_type: OrderType = OrderType.MARKET):
+        """
+        :param config: the executor configuration
+        :param exchange: the exchange simulator where the orders are placed
+        :param market_data_provider: the data provider used to quantize the orders
+        :param entries: (price, amount) of the entry orders, with None as price for market orders
+        :param take_profit: take profit as a fraction of the position value
+        :param stop_loss: stop loss as a fraction of the position value
+        :param trailing_stop: trailing stop activation and delta, as fractions of the position value
+        :param time_limit: seconds after the executor creation to close the position
+        :param take_profit_order_type: type of the order closing the position on take profit
+        """
+        self.config = config
+        self._exchange = exchange
+        self._market_data_provider = market_data_provider
+        self._entries = entries
+        self._take_profit = float(take_profit) if take_profit is not None else None
+        self._stop_loss = float(stop_loss) if stop_loss is not None else None
+        self._trailing_stop_activation = float(trailing_stop.activation_price) if trailing_stop is not None else None
+        self._trailing_stop_delta = float(trailing_stop.trailing_delta) if trailing_stop is not None else None
+        self._time_limit_timestamp = config.timestamp + time_limit if time_limit else None
+        self._take_profit_order_type = take_profit_order_type
+        self._is_buy = config.side == TradeType.BUY
+        self._status = RunnableStatus.NOT_STARTED
+        self._close_type: Optional[CloseType] = None
+        self._close_timestamp: Optional[float] = None
+        self._closing_type: Optional[CloseType] = None
+        self._entry_order_ids: Set[int] = set()
+        self._take_profit_order_id: Optional[int] = None
+        self._trailing_stop_trigger_pct: Optional[float] = None
+        self._open_filled_amount = 0.0
+        self._open_filled_quote = 0.0
+        self._close_filled_amount = 0.0
+        self._close_filled_quote = 0.0
+        self._cum_fees_quote = 0.0
+        self._close_price = math.nan
+        self._terminated_executor_info: Optional[ExecutorInfo] = None
+
+    @classmethod
+    def from_executor_config(cls,
+                             config,
+                             exchange: OrderBookExchangeSimulator,
+                             market_data_provider: MarketDataProvider) -> Optional["OrderBookExecutorSimulation"]:
+        """
+        Creates the simulation of an executor, or returns None if its type can't be simulated with order books
+        """
+        def quantize_price(price: Decimal) -> Decimal:
+            return market_data_provider.quantize_order_price(config.connector_name, config.trading_pair, price)
+
+        def quantize_amount(amount: Decimal) -> Decimal:
+            return market_data_provider.quantize_order_amount(config.connector_name, config.trading_pair, amount)
+
+        if isinstance(config, PositionExecutorConfig):
+            barriers = config.triple_barrier_config
+            entry_price = (quantize_price(config.entry_price)
+                           if barriers.open_order_type.is_limit_type() and config.entry_price is not None
+                           else None)
+            return cls(config=config,
+                       exchange=exchange,
+                       market_data_provider=market_data_provider,
+                       entries=[(entry_price, quantize_amount(config.amount))],
+                       take_profit=barriers.take_profit,
+                       stop_loss=barriers.stop_loss,
+                       trailing_stop=barriers.trailing_stop,
+                       time_limit=barriers.time_limit,
+                       take_profit_order_type=barriers.take_profit_order_type)
+        if isinstance(config, DCAExecutorConfig) and config.mode == DCAMode.MAKER:
+            return cls(config=config,
+                       exchange=exchange,
+                       market_data_provider=market_data_provider,
+                       entries=[(quantize_price(price), quantize_amount(amount_quote / price))
+                                for price, amount_quote in zip(config.prices, config.amounts_quote)],
+                       take_profit=config.take_profit,
+                       stop_loss=config.stop_loss,
+                       trailing_stop=config.trailing_stop,
+                       time_limit=config.time_limit)
+        return None
+
+    @property
+    def trading_pair(self) -> str:
+        return self.config.trading_pair
+
+    @property
+    def is_active(self) -> bool:
+        return self._status != RunnableStatus.TERMINATED
+
+    @property
+    def close_type(self) -> Optional[CloseType]:
+        return self._close_type
+
+    @property
+    def position_amount(self) -> float:
+        return self._open_filled_amount - self._close_filled_amount
+
+    @property
+    def average_entry_price(self) -> float:
+        return self._open_filled_quote / self._open_filled_amount if self._open_filled_amount > 0 else math.nan
+
+    @property
+    def net_pnl_quote(self) -> float:
+        position_value = self.position_amount * self._close_price if self.position_amount > AMOUNT_EPSILON else 0
+        side_multiplier = 1 if self._is_buy else -1
+        trade_pnl = side_multiplier * (self._close_filled_quote + position_value - self._open_filled_quote)
+        return trade_pnl - self._cum_fees_quote
+
+    @property
+    def net_pnl_pct(self) -> float:
+        return self.net_pnl_quote / self._open_filled_quote if self._open_filled_quote > 0 else 0.0
+
+    def start(self, timestamp: float):
+        """
+        Places the entry orders
+        """
+        self._status = RunnableStatus.RUNNING
+        self._update_close_price()
+        for price, amount in self._entries:
+            if amount <= 0:
+                continue
+            if price is None:
+                self._exchange.place_market_order(self, self.trading_pair, self._is_buy, float(amount))
+            else:
+                order_id = self._exchange.place_limit_order(
+                    self, self.trading_pair, self._is_buy, float(price), float(amount))
+                if self._exchange.is_order_active(order_id):
+                    self._entry_order_ids.add(order_id)
+        if self._open_filled_amount == 0 and len(self._entry_order_ids) == 0:
+            self._terminate(timestamp, CloseType.FAILED)
+
+    def control(self, timestamp: float):
+        """
+        Evaluates the barriers of the executor at the current state of the order book
+        """
+        if not self.is_active:
+            return
+        self._update_close_price()
+        if self._time_limit_timestamp is not None and timestamp >= self._time_limit_timestamp:
+            self.stop(timestamp, CloseType.TIME_LIMIT)
+        elif self.position_amount > AMOUNT_EPSILON:
+            net_pnl_pct = self.net_pnl_pct
+            if self._stop_loss is not None and net_pnl_pct <= -self._stop_loss:
+                self.stop(timestamp, CloseType.STOP_LOSS)
+            elif self._is_trailing_stop_triggered(net_pnl_pct):
+                self.stop(timestamp, CloseType.TRAILING_STOP)
+            elif self._take_profit is not None:
+                if not self._take_profit_order_type.is_limit_type():
+                    if net_pnl_pct >= self._take_profit:
+                        self.stop(timestamp, CloseType.TAKE_PROFIT)
+                elif self._take_profit_order_id is None and len(self._entry_order_ids) == 0:
+                    self._place_take_profit_order()
+
+    def stop(self, timestamp: float, close_type: CloseType = CloseType.EARLY_STOP):
+        """
+        Cancels the active orders and closes the position with a market order
+        """
+        if not self.is_active:
+            return
+        for order_id in self._entry_order_ids:
+            self._exchange.cancel_order(self.trading_pair, order_id)
+        self._entry_order_ids.clear()
+        if self._take_profit_order_id is not None:
+            self._exchange.cancel_order(self.trading_pair, self._take_profit_order_id)
+        self._closing_type = close_type
+        if self.position_amount > AMOUNT_EPSILON:
+            self._exchange.place_market_order(self, self.trading_pair, not self._is_buy, self.position_amount)
+        if self.is_active:
+            self._terminate(timestamp, close_type)
+
+    def process_fill(self, order_id: int, is_buy: bool, price: float, amount: float, fee_quote: float):
+        """
+        Updates the position with a fill of one of the orders of the executor
+        """
+        self._cum_fees_quote += fee_quote
+        if is_buy == self._is_buy:
+            self._open_filled_amount += amount
+            self._open_filled_quote += price * amount
+            if not self._exchange.is_order_active(order_id):
+                self._entry_order_ids.discard(order_id)
+        else:
+            self._close_filled_amount += amount
+            self._close_filled_quote += price * amount
+            if len(self._entry_order_ids) == 0 and self.position_amount <= AMOUNT_EPSILON:
+                self._terminate(self._exchange.current_timestamp, self._closing_type or CloseType.TAKE_PROFIT)
+
+    def get_executor_info(self) -> ExecutorInfo:
+        if self._terminated_executor_info is not None:
+            return self._terminated_executor_info
+        self._update_close_price()
+        executor_info = ExecutorInfo(
+            id=self.config.id,
+            timestamp=self.config.timestamp,
+            type=self.config.type,
+            close_timestamp=self._close_timestamp,
+            close_type=self._close_type,
+            status=self._status,
+            config=self.config,
+            net_pnl_pct=Decimal(self.net_pnl_pct),
+            net_pnl_quote=Decimal(self.net_pnl_quote),
+            cum_fees_quote=Decimal(self._cum_fees_quote),
+            filled_amount_quote=Decimal(self._open_filled_quote + self._close_filled_quote),
+            is_active=self.is_active,
+            is_trading=self.is_active and self._open_filled_amount > 0,
+            custom_info={
+                "close_price": self._close_price,
+                "level_id": self.config.level_id,
+                "side": self.config.side,
+                "current_position_average_price": self.average_entry_price,
+            },
+            controller_id=self.config.controller_id,
+        )
+        if not self.is_active:
+            self._terminated_executor_info = executor_info
+        return executor_info
+
+    def _place_take_profit_order(self):
+        side_multiplier = 1 if self._is_buy else -1
+        take_profit_price = self._market_data_provider.quantize_order_price(
+            self.config.connector_name, self.trading_pair,
+            Decimal(self.average_entry_price * (1 + side_multiplier * self._take_profit)))
+        self._take_profit_order_id = self._exchange.place_limit_order(
+            self, self.trading_pair, not self._is_buy, float(take_profit_price), self.position_amount)
+
+    def _is_trailing_stop_triggered(self, net_pnl_pct: float) -> bool:
+        if self._trailing_stop_activation is None:
+            return False
+        if self._trailing_stop_trigger_pct is None:
+            if net_pnl_pct > self._trailing_stop_activation:
+                self._trailing_stop_trigger_pct = net_pnl_pct - self._trailing_stop_delta
+            return False
+        if net_pnl_pct < self._trailing_stop_trigger_pct:
+            return True
+        self._trailing_stop_trigger_pct = max(self._trailing_stop_trigger_pct, net_pnl_pct - self._trailing_stop_delta)
+        return False
+
+    def _update_close_price(self):
+        if self.is_active:
+            close_price = self._exchange.get_price(self.trading_pair, not self._is_buy)
+            if not math.isnan(close_price):
+                self._close_price = close_price
+
+    def _terminate(self, timestamp: float, close_type: CloseType):
+        self._status = RunnableStatus.TERMINATED
+        self._close_type = close_type
+        self._close_timestamp = timestamp
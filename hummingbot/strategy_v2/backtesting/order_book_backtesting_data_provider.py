@@ -0,0 +1,61 @@
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.data_feed.candles_feed.historical_candles_cache import HistoricalCandlesCache
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.executors.data_types import ConnectorPair
+
+
+class OrderBookBacktestingDataProvider(BacktestingDataProvider):
+    """
+    Backtesting data provider serving the order books rebuilt from recorded order book messages, so the controllers
+    get the prices and the order book queries of the MarketDataProvider interface from the book at the backtesting time.
+    """
+
+    def __init__(self, connectors: Dict[str, ConnectorBase],
+                 historical_candles_cache: Optional[HistoricalCandlesCache] = None):
+        super().__init__(connectors, historical_candles_cache=historical_candles_cache)
+        self.order_books: Dict[str, OrderBook] = {}
+
+    def set_order_book(self, connector_name: str, trading_pair: str, order_book: OrderBook):
+        self.order_books[f"{connector_name}_{trading_pair}"] = order_book
+
+    def initialize_rate_sources(self, connector_pairs: List[ConnectorPair]):
+        """
+        The prices of the backtest come from the order books at the backtesting time, so no live rates are fetched
+        """
+        pass
+
+    def get_order_book(self, connector_name: str, trading_pair: str) -> OrderBook:
+        """
+        Retrieves the order book rebuilt for a trading pair of the specified connector.
+        :param connector_name: str
+        :param trading_pair: str
+        :return: Order book instance.
+        """
+        return self.order_books[f"{connector_name}_{trading_pair}"]
+
+    def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
+        """
+        Retrieves the price for a trading pair from its rebuilt order book, falling back to the prices set by the
+        backtesting engine for the trading pairs without order book.
+        :param connector_name: str
+        :param trading_pair: str
+        :param price_type: PriceType
+        :return: Price.
+        """
+        order_book = self.order_books.get(f"{connector_name}_{trading_pair}")
+        if order_book is None:
+            return super().get_price_by_type(connector_name, trading_pair, price_type)
+        if price_type == PriceType.BestBid:
+            price = order_book.get_price(False)
+        elif price_type == PriceType.BestAsk:
+            price = order_book.get_price(True)
+        elif price_type == PriceType.LastTrade:
+            price = order_book.last_trade_price
+        else:
+            price = (order_book.get_price(False) + order_book.get_price(True)) / 2
+        return Decimal(price)
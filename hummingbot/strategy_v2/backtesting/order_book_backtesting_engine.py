@@ -0,0 +1,160 @@
+from typing import Dict, List, Optional, Union
+
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecording
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executors_simulator.order_book_executor_simulation import (
+    OrderBookExecutorSimulation,
+)
+from hummingbot.strategy_v2.backtesting.order_book_backtesting_data_provider import OrderBookBacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.order_book_exchange_simulator import OrderBookExchangeSimulator
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class OrderBookBacktestingEngine(BacktestingEngineBase):
+    """
+    Backtesting engine replaying the order book messages stored by an OrderBookRecorder, instead of simulating the
+    executors on candles.
+
+    The order book of the controller trading pair is rebuilt from the recorded snapshots and diffs, and served to the
+    controller through the MarketDataProvider interface. Every update interval of the recording time the engine runs
+    the control step of the executors, updates the controller processed data and executes the actions the controller
+    determines, like the strategy does on every tick. The orders of the executors are simulated by an
+    OrderBookExchangeSimulator, that keeps the queue position of the limit orders and fills them with the recorded
+    trades, so maker controllers (e.g. pmm_simple or dman_maker_v2) get partial fills and queue priority into account.
+
+    Position executors and maker DCA executors are simulated, the actions for other executor types are ignored.
+    """
+
+    def __init__(self, recording: Union[OrderBookRecording, str]):
+        """
+        :param recording: the recording, or the directory where the recorder stored it
+        """
+        super().__init__()
+        self.recording = recording if isinstance(recording, OrderBookRecording) else OrderBookRecording(recording)
+        self.backtesting_data_provider = OrderBookBacktestingDataProvider(connectors={})
+        self.exchange_simulator: Optional[OrderBookExchangeSimulator] = None
+        self.active_executor_simulations: List[OrderBookExecutorSimulation] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+
+    async def run_backtesting(self,
+                              controller_config: ControllerConfigBase,
+                              start: int, end: int,
+                              update_interval: float = 1.0,
+                              trade_cost: float = 0.0006,
+                              maker_trade_cost: Optional[float] = None) -> Dict:
+        """
+        Runs the controller over the recorded order book messages between start and end.
+
+        Args:
+            controller_config (ControllerConfigBase): The configuration of the controller to backtest.
+            start (int): Recording time to start the backtest at.
+            end (int): Recording time to end the backtest at.
+            update_interval (float): Seconds between the updates of the controller and the executors.
+            trade_cost (float): The cost per trade of the taker fills.
+            maker_trade_cost (float): The cost per trade of the maker fills, the taker cost by default.
+
+        Returns:
+            Dict: The executors info, the results summary and the processed data of the controller.
+        """
+        self.backtesting_data_provider.update_backtesting_time(start, end)
+        await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
+        self.initialize_controller(controller_config)
+        for config in self.controller.config.candles_config:
+            await self.controller.market_data_provider.initialize_candles_feed(config)
+        self.exchange_simulator = OrderBookExchangeSimulator(
+            maker_fee=trade_cost if maker_trade_cost is None else maker_trade_cost,
+            taker_fee=trade_cost)
+        self.initialize_order_books(start)
+        await self.replay_order_book_messages(start, end, update_interval)
+        executors_info = self.controller.executors_info
+        results = self.summarize_results(executors_info, controller_config.total_amount_quote)
+        return {
+            "executors": executors_info,
+            "results": results,
+            "processed_data": self.controller.processed_data,
+        }
+
+    def initialize_order_books(self, start: float):
+        """
+        Rebuilds the order book of the controller trading pair from the last snapshot recorded before the start
+        """
+        trading_pair = self.controller.config.trading_pair
+        snapshot_message = self.recording.get_snapshot(trading_pair, start)
+        if snapshot_message is None:
+            raise ValueError(f"No order book snapshot recorded for {trading_pair}.")
+        order_book = self.exchange_simulator.add_order_book(snapshot_message)
+        self.backtesting_data_provider.set_order_book(self.controller.config.connector_name, trading_pair, order_book)
+
+    async def replay_order_book_messages(self, start: float, end: float, update_interval: float):
+        """
+        Applies the recorded order book messages to the exchange simulator, updating the controller and the executors
+        every update interval of the recording time.
+
+        Args:
+            start (float): Recording time of the first update.
+            end (float): Recording time of the last update.
+            update_interval (float): Seconds between the updates.
+        """
+        self.active_executor_simulations = []
+        self.stopped_executors_info = []
+        next_update_timestamp = start
+        for recorded_timestamp, message in self.recording.iter_messages(
+                [self.controller.config.trading_pair], start, end):
+            while next_update_timestamp <= recorded_timestamp:
+                await self.update_state(next_update_timestamp)
+                next_update_timestamp += update_interval
+            self.exchange_simulator.current_timestamp = recorded_timestamp
+            self.exchange_simulator.apply_message(message)
+        while next_update_timestamp <= end:
+            await self.update_state(next_update_timestamp)
+            next_update_timestamp += update_interval
+
+    async def update_state(self, timestamp: float):
+        """
+        Runs the control step of the executors and the controller at the backtesting time.
+
+        Args:
+            timestamp (float): The current backtesting time.
+        """
+        self.backtesting_data_provider._time = timestamp
+        self.exchange_simulator.current_timestamp = timestamp
+        self.update_executors_info(timestamp)
+        await self.controller.update_processed_data()
+        for action in self.controller.determine_executor_actions():
+            if isinstance(action, CreateExecutorAction):
+                executor_simulation = OrderBookExecutorSimulation.from_executor_config(
+                    action.executor_config, self.exchange_simulator, self.backtesting_data_provider)
+                if executor_simulation is not None:
+                    executor_simulation.start(timestamp)
+                    if executor_simulation.close_type != CloseType.FAILED:
+                        self.active_executor_simulations.append(executor_simulation)
+            elif isinstance(action, StopExecutorAction):
+                self.handle_stop_action(action, timestamp)
+
+    def update_executors_info(self, timestamp: float):
+        active_executors_info = []
+        for executor_simulation in self.active_executor_simulations:
+            executor_simulation.control(timestamp)
+            executor_info = executor_simulation.get_executor_info()
+            if executor_simulation.is_active:
+                active_executors_info.append(executor_info)
+            else:
+                self.stopped_executors_info.append(executor_info)
+        self.active_executor_simulations = [executor_simulation for executor_simulation
+                                            in self.active_executor_simulations if executor_simulation.is_active]
+        self.controller.executors_info = active_executors_info + self.stopped_executors_info
+
+    def handle_stop_action(self, action: StopExecutorAction, timestamp: float):
+        """
+        Stops the executor of the action, closing its position at the current order book.
+
+        Args:
+            action (StopExecutorAction): The action indicating which executor to stop.
+            timestamp (float): The current timestamp.
+        """
+        for executor_simulation in self.active_executor_simulations:
+            if executor_simulation.config.id == action.executor_id:
+                executor_simulation.stop(timestamp)
@@ -0,0 +1,213 @@
+import math
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.strategy_v2.backtesting.order_queue_simulator import OrderQueueSimulator
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.backtesting.executors_simulator.order_book_executor_simulation import (
+        OrderBookExecutorSimulation,
+    )
+
+TAKER_BUY_TRADE_TYPE = float(TradeType.BUY.value)
+
+
+class OrderBookExchangeSimulator:
+    """
+    Exchange rebuilding the order books of a connector from recorded order book messages, and executing the orders
+    of the simulated executors against them:
+    - Market orders, and the part of limit orders crossing the book when placed, are filled as taker at the average
+      price of the levels they take.
+    - The rest of the limit orders rest in an OrderQueueSimulator, that fills them as maker when the recorded trades
+      consume the amount of the book ahead of them, or when the book crosses their price.
+
+    The orders placed by the simulator don't modify the rebuilt order books.
+    """
+
+    def __init__(self, maker_fee: float, taker_fee: float):
+        """
+        :param maker_fee: fee rate of the fills of resting limit orders
+        :param taker_fee: fee rate of the fills of market orders and crossing limit orders
+        """
+        self._maker_fee = maker_fee
+        self._taker_fee = taker_fee
+        self._order_books: Dict[str, OrderBook] = {}
+        self._order_queues: Dict[str, OrderQueueSimulator] = {}
+        # Owner, trading pair and side of the resting limit orders
+        self._active_orders: Dict[int, Tuple["OrderBookExecutorSimulation", str, bool]] = {}
+        self._last_order_id = 0
+        self._current_timestamp = 0.0
+        self._messages_count = 0
+        self._fills_count = 0
+
+    @property
+    def current_timestamp(self) -> float:
+        return self._current_timestamp
+
+    @current_timestamp.setter
+    def current_timestamp(self, timestamp: float):
+        self._current_timestamp = timestamp
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return self._order_books
+
+    @property
+    def messages_count(self) -> int:
+        return self._messages_count
+
+    @property
+    def fills_count(self) -> int:
+        return self._fills_count
+
+    @property
+    def active_orders_count(self) -> int:
+        return len(self._active_orders)
+
+    def add_order_book(self, snapshot_message: OrderBookMessage) -> OrderBook:
+        """
+        Starts simulating the trading pair of an order book snapshot
+        """
+        order_book = OrderBook()
+        order_book.apply_snapshot_arrays(snapshot_message.bids_array, snapshot_message.asks_array,
+                                         snapshot_message.update_id)
+        self._order_books[snapshot_message.trading_pair] = order_book
+        self._order_queues[snapshot_message.trading_pair] = OrderQueueSimulator()
+        return order_book
+
+    def get_price(self, trading_pair: str, is_buy: bool) -> float:
+        """
+        :return: the best ask price of the order book if is_buy is True, otherwise the best bid price, or NaN if that
+            side of the book is empty
+        """
+        try:
+            return self._order_books[trading_pair].get_price(is_buy)
+        except EnvironmentError:
+            return math.nan
+
+    def apply_message(self, message: OrderBookMessage):
+        """
+        Applies a recorded order book message to the order book of its trading pair, and fills the limit orders
+        matched by it
+        """
+        trading_pair = message.trading_pair
+        order_book = self._order_books.get(trading_pair)
+        if order_book is None:
+            return
+        order_queue = self._order_queues[trading_pair]
+        self._messages_count += 1
+        if message.type is OrderBookMessageType.TRADE:
+            price = float(message.content["price"])
+            order_book.last_trade_price = price
+            if order_queue.orders_count > 0:
+                self._process_fills(order_queue.match_trade(
+                    message.content["trade_type"] == TAKER_BUY_TRADE_TYPE, price, float(message.content["amount"])))
+            return
+        bids = message.bids_array
+        asks = message.asks_array
+        is_diff = message.type is OrderBookMessageType.DIFF
+        if is_diff:
+            order_book.apply_diffs_arrays(bids, asks, message.update_id)
+        else:
+            order_book.apply_snapshot_arrays(bids, asks, message.update_id)
+        if order_queue.orders_count > 0:
+            if is_diff:
+                order_queue.apply_levels(True, bids)
+                order_queue.apply_levels(False, asks)
+            else:
+                order_queue.apply_snapshot_levels(True, bids)
+                order_queue.apply_snapshot_levels(False, asks)
+            self._process_fills(order_queue.match_crossed(
+                self.get_price(trading_pair, False), self.get_price(trading_pair, True)))
+
+    def place_limit_order(self,
+                          owner: "OrderBookExecutorSimulation",
+                          trading_pair: str,
+                          is_buy: bool,
+                          price: float,
+                          amount: float) -> int:
+        """
+        Places a limit order. The part of the order crossing the book is filled right away as taker, and the rest
+        is queued behind the amount of the book at the order price.
+
+        :return: the id of the order
+        """
+        order_id = self._next_order_id()
+        order_book = self._order_books[trading_pair]
+        taker_amount = 0.0
+        best_opposite_price = self.get_price(trading_pair, is_buy)
+        if not math.isnan(best_opposite_price) and (
+                (is_buy and price >= best_opposite_price) or (not is_buy and price <= best_opposite_price)):
+            taker_amount = min(amount, order_book.get_volume_for_price(is_buy, price).result_volume)
+        if amount - taker_amount > 0:
+            self._active_orders[order_id] = (owner, trading_pair, is_buy)
+            self._order_queues[trading_pair].add_order(
+                order_id, is_buy, price, amount - taker_amount, self._level_amount(order_book, not is_buy, price))
+        if taker_amount > 0:
+            self._fill_taker_order(owner, order_id, order_book, is_buy, taker_amount)
+        return order_id
+
+    def place_market_order(self,
+                           owner: "OrderBookExecutorSimulation",
+                           trading_pair: str,
+                           is_buy: bool,
+                           amount: float) -> int:
+        """
+        Places a market order, filled right away at the average price of the levels of the book it takes
+
+        :return: the id of the order
+        """
+        order_id = self._next_order_id()
+        self._fill_taker_order(owner, order_id, self._order_books[trading_pair], is_buy, amount)
+        return order_id
+
+    def cancel_order(self, trading_pair: str, order_id: int) -> bool:
+        """
+        :return: True if the order was active, False otherwise
+        """
+        self._active_orders.pop(order_id, None)
+        return self._order_queues[trading_pair].cancel_order(order_id)
+
+    def is_order_active(self, order_id: int) -> bool:
+        return order_id in self._active_orders
+
+    def get_queue_ahead(self, trading_pair: str, order_id: int) -> Optional[float]:
+        """
+        :return: the amount of the book ahead of an active limit order, or None if the order is not active
+        """
+        order_queue = self._order_queues[trading_pair]
+        return order_queue.get_queue_ahead(order_id) if order_queue.has_order(order_id) else None
+
+    def _next_order_id(self) -> int:
+        self._last_order_id += 1
+        return self._last_order_id
+
+    def _fill_taker_order(self,
+                          owner: "OrderBookExecutorSimulation",
+                          order_id: int,
+                          order_book: OrderBook,
+                          is_buy: bool,
+                          amount: float):
+        price = order_book.get_vwap_for_volume(is_buy, amount).result_price
+        if math.isnan(price):
+            price = order_book.last_trade_price
+        self._fills_count += 1
+        owner.process_fill(order_id, is_buy, price, amount, price * amount * self._taker_fee)
+
+    def _process_fills(self, fills: List[Tuple[int, float, float]]):
+        for order_id, price, amount in fills:
+            owner, trading_pair, is_buy = self._active_orders[order_id]
+            if not self._order_queues[trading_pair].has_order(order_id):
+                del self._active_orders[order_id]
+            self._fills_count += 1
+            owner.process_fill(order_id, is_buy, price, amount, price * amount * self._maker_fee)
+
+    @staticmethod
+    def _level_amount(order_book: OrderBook, is_ask: bool, price: float) -> float:
+        levels = order_book.levels_array(is_ask)
+        level_index = np.flatnonzero(levels[:, 0] == price)
+        return float(levels[level_index[0], 1]) if len(level_index) > 0 else 0.0
@@ -0,0 +1,32 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool as cppbool
+from libcpp.map cimport map as cpp_map
+from libcpp.unordered_map cimport unordered_map
+from libcpp.vector cimport vector
+
+
+cdef struct SimulatedOrder:
+    int64_t order_id
+    cppbool is_buy
+    double price
+    double amount
+    double filled_amount
+    double queue_ahead
+
+
+ctypedef cpp_map[double, vector[int64_t]] OrderLevels
+
+
+cdef class OrderQueueSimulator:
+    cdef:
+        unordered_map[int64_t, SimulatedOrder] _orders
+        OrderLevels _bid_levels
+        OrderLevels _ask_levels
+
+    cdef c_remove_from_level(self, SimulatedOrder *order_ptr)
+    cdef c_fill_order(self, SimulatedOrder *order_ptr, double amount, list fills)
+    cdef c_apply_levels(self, OrderLevels *levels_ptr, const double[:, :] levels)
+    cdef c_apply_snapshot_levels(self, OrderLevels *levels_ptr, const double[:, :] levels)
+    cdef c_match_level(self, vector[int64_t] *order_ids_ptr, double trade_amount, list fills)
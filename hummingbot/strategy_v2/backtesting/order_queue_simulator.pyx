@@ -0,0 +1,272 @@
+# distutils: language=c++
+
+from typing import List, Tuple
+
+from cython.operator cimport dereference as deref, postincrement as inc, preincrement as preinc
+from libc.math cimport isnan
+from libc.stdint cimport int64_t
+from libcpp.unordered_map cimport unordered_map
+from libcpp.vector cimport vector
+
+cdef double AMOUNT_EPSILON = 1e-12
+
+
+cdef class OrderQueueSimulator:
+    """
+    Simulates the position in the order book queue of limit orders placed during a backtest, and their fills.
+
+    The orders are not added to the order book rebuilt from the recorded data. Each order keeps the amount of the
+    book resting ahead of it at its price level:
+    - It starts as the amount of the level when the order is placed.
+    - A trade at the order price consumes the amount ahead of the order before filling it.
+    - A decrease of the level amount (cancellations) moves the order forward in the queue, never leaving more
+      amount ahead of it than the amount of the level.
+
+    Like in the PaperTradeExchange, an order is completely filled at its price when a trade happens at a better
+    price, or when the opposite side of the order book crosses it.
+
+    Fills are returned as lists of (order id, price, amount) tuples.
+    """
+
+    def add_order(self, int64_t order_id, bint is_buy, double price, double amount, double queue_ahead):
+        """
+        :param order_id: unique id of the order
+        :param is_buy: True for buy orders, resting in the bid side of the book
+        :param price: limit price
+        :param amount: order amount
+        :param queue_ahead: amount of the book resting at the order price before the order
+        """
+        cdef SimulatedOrder order
+        if self._orders.count(order_id) > 0:
+            raise ValueError(f"The order {order_id} is already in the simulator.")
+        order.order_id = order_id
+        order.is_buy = is_buy
+        order.price = price
+        order.amount = amount
+        order.filled_amount = 0
+        order.queue_ahead = max(queue_ahead, 0)
+        self._orders[order_id] = order
+        if is_buy:
+            self._bid_levels[price].push_back(order_id)
+        else:
+            self._ask_levels[price].push_back(order_id)
+
+    def cancel_order(self, int64_t order_id) -> bool:
+        """
+        Removes an order from the simulator
+
+        :return: True if the order was active, False otherwise
+        """
+        cdef unordered_map[int64_t, SimulatedOrder].iterator it = self._orders.find(order_id)
+        if it == self._orders.end():
+            return False
+        self.c_remove_from_level(&deref(it).second)
+        self._orders.erase(it)
+        return True
+
+    def has_order(self, int64_t order_id) -> bool:
+        return self._orders.count(order_id) > 0
+
+    def get_queue_ahead(self, int64_t order_id) -> float:
+        cdef unordered_map[int64_t, SimulatedOrder].iterator it = self._orders.find(order_id)
+        if it == self._orders.end():
+            raise KeyError(order_id)
+        return deref(it).second.queue_ahead
+
+    def get_filled_amount(self, int64_t order_id) -> float:
+        cdef unordered_map[int64_t, SimulatedOrder].iterator it = self._orders.find(order_id)
+        if it == self._orders.end():
+            raise KeyError(order_id)
+        return deref(it).second.filled_amount
+
+    @property
+    def orders_count(self) -> int:
+        return self._orders.size()
+
+    def apply_levels(self, bint is_bid, const double[:, :] levels):
+        """
+        Updates the queue of the orders resting at the levels of an order book diff or snapshot
+
+        :param is_bid: True if the levels are bids
+        :param levels: (price, amount) rows with the new amount of each level, 0 for removed levels
+        """
+        if levels.shape[0] == 0 or self._orders.empty():
+            return
+        self.c_apply_levels(&self._bid_levels if is_bid else &self._ask_levels, levels)
+
+    def apply_snapshot_levels(self, bint is_bid, const double[:, :] levels):
+        """
+        Updates the queue of the orders resting on one side of the book with the levels of an order book snapshot.
+        Unlike a diff, a snapshot contains every level, so the orders at levels missing from it have nothing ahead
+
+        :param is_bid: True if the levels are bids
+        :param levels: (price, amount) rows with the amount of each level of the snapshot
+        """
+        if self._orders.empty():
+            return
+        self.c_apply_snapshot_levels(&self._bid_levels if is_bid else &self._ask_levels, levels)
+
+    def match_trade(self, bint is_taker_buy, double price, double amount) -> List[Tuple[int, float, float]]:
+        """
+        Fills the orders on the opposite side of a trade
+
+        :param is_taker_buy: True if the taker of the trade was buying, so it matched the asks
+        :param price: trade price
+        :param amount: trade amount
+        :return: the fills of the orders matched by the trade
+        """
+        cdef:
+            list fills = []
+            vector[int64_t] crossed_order_ids
+            OrderLevels.iterator levels_it
+            OrderLevels.reverse_iterator levels_rit
+            int64_t order_id
+            SimulatedOrder *order_ptr
+
+        if self._orders.empty():
+            return fills
+        if is_taker_buy:
+            levels_it = self._ask_levels.begin()
+            while levels_it != self._ask_levels.end() and deref(levels_it).first < price:
+                crossed_order_ids.insert(crossed_order_ids.end(),
+                                         deref(levels_it).second.begin(), deref(levels_it).second.end())
+                inc(levels_it)
+            if levels_it != self._ask_levels.end() and deref(levels_it).first == price:
+                self.c_match_level(&deref(levels_it).second, amount, fills)
+        else:
+            levels_rit = self._bid_levels.rbegin()
+            while levels_rit != self._bid_levels.rend() and deref(levels_rit).first > price:
+                crossed_order_ids.insert(crossed_order_ids.end(),
+                                         deref(levels_rit).second.begin(), deref(levels_rit).second.end())
+                preinc(levels_rit)
+            if levels_rit != self._bid_levels.rend() and deref(levels_rit).first == price:
+                self.c_match_level(&deref(levels_rit).second, amount, fills)
+
+        for order_id in crossed_order_ids:
+            order_ptr = &self._orders[order_id]
+            self.c_fill_order(order_ptr, order_ptr.amount - order_ptr.filled_amount, fills)
+        return fills
+
+    def match_crossed(self, double best_bid, double best_ask) -> List[Tuple[int, float, float]]:
+        """
+        Fills the orders crossed by the opposite side of the order book
+
+        :param best_bid: best bid price of the order book, NaN if the bid side is empty
+        :param best_ask: best ask price of the order book, NaN if the ask side is empty
+        :return: the fills of the crossed orders
+        """
+        cdef:
+            list fills = []
+            vector[int64_t] crossed_order_ids
+            OrderLevels.iterator levels_it
+            OrderLevels.reverse_iterator levels_rit
+            int64_t order_id
+            SimulatedOrder *order_ptr
+
+        if self._orders.empty():
+            return fills
+        if not isnan(best_ask):
+            levels_rit = self._bid_levels.rbegin()
+            while levels_rit != self._bid_levels.rend() and deref(levels_rit).first >= best_ask:
+                crossed_order_ids.insert(crossed_order_ids.end(),
+                                         deref(levels_rit).second.begin(), deref(levels_rit).second.end())
+                preinc(levels_rit)
+        if not isnan(best_bid):
+            levels_it = self._ask_levels.begin()
+            while levels_it != self._ask_levels.end() and deref(levels_it).first <= best_bid:
+                crossed_order_ids.insert(crossed_order_ids.end(),
+                                         deref(levels_it).second.begin(), deref(levels_it).second.end())
+                inc(levels_it)
+
+        for order_id in crossed_order_ids:
+            order_ptr = &self._orders[order_id]
+            self.c_fill_order(order_ptr, order_ptr.amount - order_ptr.filled_amount, fills)
+        return fills
+
+    cdef c_apply_levels(self, OrderLevels *levels_ptr, const double[:, :] levels):
+        cdef:
+            Py_ssize_t i
+            double level_amount
+            int64_t order_id
+            SimulatedOrder *order_ptr
+            OrderLevels.iterator levels_it
+
+        if levels_ptr.empty():
+            return
+        for i in range(levels.shape[0]):
+            levels_it = levels_ptr.find(levels[i, 0])
+            if levels_it == levels_ptr.end():
+                continue
+            level_amount = levels[i, 1]
+            for order_id in deref(levels_it).second:
+                order_ptr = &self._orders[order_id]
+                if order_ptr.queue_ahead > level_amount:
+                    order_ptr.queue_ahead = level_amount
+
+    cdef c_apply_snapshot_levels(self, OrderLevels *levels_ptr, const double[:, :] levels):
+        cdef:
+            Py_ssize_t i
+            unordered_map[double, double] snapshot_amounts
+            unordered_map[double, double].iterator amounts_it
+            double level_amount
+            int64_t order_id
+            SimulatedOrder *order_ptr
+            OrderLevels.iterator levels_it
+
+        if levels_ptr.empty():
+            return
+        for i in range(levels.shape[0]):
+            snapshot_amounts[levels[i, 0]] = levels[i, 1]
+        levels_it = levels_ptr.begin()
+        while levels_it != levels_ptr.end():
+            amounts_it = snapshot_amounts.find(deref(levels_it).first)
+            level_amount = deref(amounts_it).second if amounts_it != snapshot_amounts.end() else 0
+            for order_id in deref(levels_it).second:
+                order_ptr = &self._orders[order_id]
+                if order_ptr.queue_ahead > level_amount:
+                    order_ptr.queue_ahead = level_amount
+            inc(levels_it)
+
+    cdef c_match_level(self, vector[int64_t] *order_ids_ptr, double trade_amount, list fills):
+        cdef:
+            vector[int64_t] order_ids = deref(order_ids_ptr)
+            double matched_amount = 0
+            double fill_amount
+            int64_t order_id
+            SimulatedOrder *order_ptr
+
+        # The amount ahead of each order is consumed first, and the orders of the simulator are filled in the order
+        # they were placed
+        for order_id in order_ids:
+            order_ptr = &self._orders[order_id]
+            fill_amount = min(order_ptr.amount - order_ptr.filled_amount,
+                              trade_amount - order_ptr.queue_ahead - matched_amount)
+            order_ptr.queue_ahead = max(order_ptr.queue_ahead - trade_amount, 0)
+            if fill_amount > AMOUNT_EPSILON:
+                matched_amount += fill_amount
+                self.c_fill_order(order_ptr, fill_amount, fills)
+
+    cdef c_fill_order(self, SimulatedOrder *order_ptr, double amount, list fills):
+        cdef int64_t order_id = order_ptr.order_id
+        order_ptr.filled_amount += amount
+        fills.append((order_id, order_ptr.price, amount))
+        if order_ptr.amount - order_ptr.filled_amount <= AMOUNT_EPSILON:
+            self.c_remove_from_level(order_ptr)
+            self._orders.erase(order_id)
+
+    cdef c_remove_from_level(self, SimulatedOrder *order_ptr):
+        cdef:
+            OrderLevels *levels_ptr = &self._bid_levels if order_ptr.is_buy else &self._ask_levels
+            OrderLevels.iterator levels_it = levels_ptr.find(order_ptr.price)
+            vector[int64_t].iterator order_ids_it
+
+        if levels_it == levels_ptr.end():
+            return
+        order_ids_it = deref(levels_it).second.begin()
+        while order_ids_it != deref(levels_it).second.end():
+            if deref(order_ids_it) == order_ptr.order_id:
+                deref(levels_it).second.erase(order_ids_it)
+                break
+            inc(order_ids_it)
+        if deref(levels_it).second.empty():
+            levels_ptr.erase(levels_it)
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -25,6 +25,9 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_event_dispatcher import ExecutorEventDispatcher
+
 
 class ExecutorBase(RunnableBase):
     """
@@ -45,17 +48,34 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp: Optional[float] = None
         self._strategy: ScriptStrategyBase = strategy
         self._held_position_orders = []  # Keep track of orders that become held positions
+        self._order_ids: Set[str] = set()  # Ids of the orders placed by the executor
+        self._state_version = 0  # Bumped every time the state of the executor may have changed
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
+        # When set before starting, the order events are delivered by the shared dispatcher instead of listening to
+        # the connectors
+        self.event_dispatcher: Optional["ExecutorEventDispatcher"] = None
+
+        # Handlers of the different order events
+        self._event_handlers: Dict[int, Callable] = {
+            MarketEvent.OrderCancelled.value: self._waking_up_on_own_orders(self.process_order_canceled_event),
+            MarketEvent.BuyOrderCreated.value: self._waking_up_on_own_orders(self.process_order_created_event),
+            MarketEvent.SellOrderCreated.value: self._waking_up_on_own_orders(self.process_order_created_event),
+            MarketEvent.OrderFilled.value: self._waking_up_on_own_orders(self.process_order_filled_event),
+            MarketEvent.BuyOrderCompleted.value: self._waking_up_on_own_orders(self.process_order_completed_event),
+            MarketEvent.SellOrderCompleted.value: self._waking_up_on_own_orders(self.process_order_completed_event),
+            MarketEvent.OrderFailure.value: self._waking_up_on_own_orders(self.process_order_failed_event),
+        }
+
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_market_event)
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_market_event)
+        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_market_event)
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_market_event)
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_market_event)
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_market_event)
+        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_market_event)
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -75,6 +95,22 @@ class ExecutorBase(RunnableBase):
         """
         return self._status
 
+    @property
+    def state_version(self) -> int:
+        """
+        Returns a counter that changes every time the state of the executor may have changed: when it starts or stops,
+        after every control step and after processing the events of its orders. An executor info built with the same
+        state version is still up to date (the PnL of open positions is refreshed with the price on every step).
+        """
+        return self._state_version
+
+    def mark_state_changed(self):
+        """
+        Bumps the state version. Subclasses changing their state outside of the control steps and the order events
+        should call it.
+        """
+        self._state_version += 1
+
     @property
     def is_trading(self):
         """
@@ -155,12 +191,29 @@ class ExecutorBase(RunnableBase):
             AllConnectorSettings.get_gateway_amm_connector_names()
         )
 
+    @property
+    def price_update_markets(self) -> List[Tuple[str, str]]:
+        """
+        Returns the (connector name, trading pair) of the markets whose order book updates wake up the executor when
+        it is run by a shared scheduler with price update wake ups. By default the market of the config, if any.
+        """
+        connector_name = getattr(self.config, "connector_name", None)
+        trading_pair = getattr(self.config, "trading_pair", None)
+        if connector_name is None or trading_pair is None:
+            return []
+        return [(connector_name, trading_pair)]
+
     def start(self):
         """
         Starts the executor and registers the events.
         """
         super().start()
+        self.mark_state_changed()
         self.register_events()
+        if self.scheduler is not None and self.scheduler.wake_up_on_price_updates:
+            for connector_name, trading_pair in self.price_update_markets:
+                if connector_name in self.connectors and not self.is_amm_connector(connector_name):
+                    self.scheduler.watch_order_book(self, self.connectors[connector_name].get_order_book(trading_pair))
 
     def stop(self):
         """
@@ -168,6 +221,7 @@ class ExecutorBase(RunnableBase):
         """
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
+        self.mark_state_changed()
         self.unregister_events()
 
     async def on_start(self):
@@ -182,6 +236,15 @@ class ExecutorBase(RunnableBase):
         """
         pass
 
+    async def run_control_task(self):
+        """
+        Runs one step of the control task, bumping the state version after it.
+        """
+        try:
+            await super().run_control_task()
+        finally:
+            self.mark_state_changed()
+
     def early_stop(self, keep_position: bool = False):
         """
         This method allows strategy to stop the executor early.
@@ -243,18 +306,48 @@ class ExecutorBase(RunnableBase):
         """
         return self.connectors[connector_name]._order_tracker.fetch_order(client_order_id=order_id)
 
+    def _waking_up_on_own_orders(self, process_event: Callable) -> Callable:
+        """
+        Wraps an order event handler to bump the state version and wake up the executor after processing the events of
+        its own orders.
+        """
+        def process_event_and_wake_up(event_tag: int, market: ConnectorBase, event):
+            process_event(event_tag, market, event)
+            if getattr(event, "order_id", None) in self._order_ids:
+                self.mark_state_changed()
+                self.wake_up()
+        return process_event_and_wake_up
+
+    def process_market_event(self, event_tag: int, market: ConnectorBase, event):
+        """
+        Processes an order event of the connectors with the handler of its event tag.
+
+        :param event_tag: The event tag.
+        :param market: The market where the event occurred.
+        :param event: The event.
+        """
+        event_handler = self._event_handlers.get(event_tag)
+        if event_handler is not None:
+            event_handler(event_tag, market, event)
+
     def register_events(self):
         """
-        Registers the events with the connectors.
+        Registers the events with the connectors, or with the shared event dispatcher if set.
         """
+        if self.event_dispatcher is not None:
+            self.event_dispatcher.register_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.add_listener(event_pair[0], event_pair[1])
 
     def unregister_events(self):
         """
-        Unregisters the events from the connectors.
+        Unregisters the events from the connectors, or from the shared event dispatcher if set.
         """
+        if self.event_dispatcher is not None:
+            self.event_dispatcher.unregister_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
@@ -287,9 +380,13 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        self._order_ids.add(order_id)
+        if self.event_dispatcher is not None:
+            self.event_dispatcher.register_order(self, order_id)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
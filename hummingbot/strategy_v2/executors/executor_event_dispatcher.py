@@ -0,0 +1,133 @@
+import logging
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class ExecutorEventDispatcher:
+    """
+    Delivers the order events of the connectors to the executors, instead of each executor listening to every event
+    of its connectors and filtering the ones of its orders.
+
+    The dispatcher listens once to each connector used by the registered executors and keeps an index of the client
+    order ids placed by each executor, so an event is only processed by the executor that owns the order. The events of
+    unknown orders (for example the ones triggered before the order id is returned to the executor, or the orders of
+    an executor that is no longer registered) are broadcast to all the executors using the connector.
+    """
+    _logger = None
+
+    DISPATCHED_EVENTS: List[MarketEvent] = [
+        MarketEvent.OrderCancelled,
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+        MarketEvent.OrderFailure,
+    ]
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._connector_executors: Dict[ConnectorBase, Set["ExecutorBase"]] = {}
+        self._order_executors: Dict[str, "ExecutorBase"] = {}
+        self._executor_order_ids: Dict["ExecutorBase", Set[str]] = {}
+        # The connectors keep weak references to their listeners
+        self._event_forwarder = SourceInfoEventForwarder(self._dispatch_event)
+        self._routed_events_count = 0
+        self._broadcast_events_count = 0
+
+    @property
+    def routed_events_count(self) -> int:
+        """
+        Number of events delivered only to the executor owning the order
+        """
+        return self._routed_events_count
+
+    @property
+    def broadcast_events_count(self) -> int:
+        """
+        Number of events of unknown orders delivered to all the executors using the connector
+        """
+        return self._broadcast_events_count
+
+    @property
+    def executors_count(self) -> int:
+        return len(self._executor_order_ids)
+
+    def register_executor(self, executor: "ExecutorBase"):
+        """
+        Starts delivering the order events of the connectors of the executor to it
+        """
+        if executor in self._executor_order_ids:
+            return
+        self._executor_order_ids[executor] = set()
+        for connector in executor.connectors.values():
+            executors = self._connector_executors.get(connector)
+            if executors is None:
+                executors = self._connector_executors[connector] = set()
+                for event in self.DISPATCHED_EVENTS:
+                    connector.add_listener(event, self._event_forwarder)
+            executors.add(executor)
+
+    def unregister_executor(self, executor: "ExecutorBase"):
+        """
+        Stops delivering events to the executor and forgets its orders
+        """
+        order_ids = self._executor_order_ids.pop(executor, None)
+        if order_ids is None:
+            return
+        for order_id in order_ids:
+            self._order_executors.pop(order_id, None)
+        for connector in executor.connectors.values():
+            executors = self._connector_executors.get(connector)
+            if executors is None:
+                continue
+            executors.discard(executor)
+            if len(executors) == 0:
+                for event in self.DISPATCHED_EVENTS:
+                    connector.remove_listener(event, self._event_forwarder)
+                del self._connector_executors[connector]
+
+    def register_order(self, executor: "ExecutorBase", order_id: str):
+        """
+        Routes the events of the order only to the executor that placed it
+        """
+        order_ids = self._executor_order_ids.get(executor)
+        if order_ids is None:
+            self.logger().warning(f"Order {order_id} was placed by an executor not registered in the dispatcher.")
+            return
+        order_ids.add(order_id)
+        self._order_executors[order_id] = executor
+
+    def stop(self):
+        """
+        Unregisters all the executors and stops listening to the connectors
+        """
+        for executor in list(self._executor_order_ids.keys()):
+            self.unregister_executor(executor)
+
+    def _dispatch_event(self, event_tag: int, connector: ConnectorBase, event):
+        executor = self._order_executors.get(getattr(event, "order_id", None))
+        if executor is not None:
+            self._routed_events_count += 1
+            executors = [executor]
+        else:
+            self._broadcast_events_count += 1
+            executors = list(self._connector_executors.get(connector, []))
+        for executor in executors:
+            try:
+                executor.process_market_event(event_tag, connector, event)
+            except Exception:
+                self.logger().error(f"Error processing the event {event} in the executor {executor.config.id}.",
+                                    exc_info=True)
@@ -3,10 +3,11 @@ import logging
 import uuid
 from collections import deque
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import PositionAction, PositionMode, PriceType, TradeType
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.position import Position
 
@@ -16,6 +17,9 @@ if TYPE_CHECKING:
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.data_types import PositionSummary
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_event_dispatcher import ExecutorEventDispatcher
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.order_executor.order_executor import OrderExecutor
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -157,7 +161,23 @@ class ExecutorOrchestrator:
                  strategy: "StrategyV2Base",
                  executors_update_interval: float = 1.0,
                  executors_max_retries: int = 10,
-                 initial_positions_by_controller: Optional[dict] = None):
+                 initial_positions_by_controller: Optional[dict] = None,
+                 use_executors_scheduler: bool = True,
+                 wake_executors_on_price_updates: bool = False,
+                 use_executors_event_dispatcher: bool = True):
+        """
+        :param strategy: the strategy running the executors
+        :param executors_update_interval: time between the control steps of the executors, in seconds
+        :param executors_max_retries: maximum number of retries of the executors when placing orders
+        :param initial_positions_by_controller: initial positions to use for each controller instead of the stored ones
+        :param use_executors_scheduler: if True, the control steps of all the executors are run by a shared scheduler
+            instead of a control loop task per executor
+        :param wake_executors_on_price_updates: if True (and using the shared scheduler), the executors also run a
+            control step when the order book of their market is updated
+        :param use_executors_event_dispatcher: if True, the order events are delivered to the executors by a shared
+            dispatcher routing each event to the executor owning the order, instead of every executor listening to
+            all the events of its connectors
+        """
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.executors_max_retries = executors_max_retries
@@ -166,6 +186,18 @@ class ExecutorOrchestrator:
         self.executors_ids_position_held = deque(maxlen=50)
         self.cached_performance = {}
         self.initial_positions_by_controller = initial_positions_by_controller or {}
+        self.executors_scheduler: Optional[ExecutorScheduler] = (
+            ExecutorScheduler(wake_up_on_price_updates=wake_executors_on_price_updates)
+            if use_executors_scheduler
+            else None
+        )
+        self.executors_event_dispatcher: Optional[ExecutorEventDispatcher] = (
+            ExecutorEventDispatcher() if use_executors_event_dispatcher else None
+        )
+        # Info of the active executors of each controller with the state version it was built with, and the
+        # performance of the active executors of each controller, updated with the info that changed
+        self._executors_info_snapshots: Dict[str, Dict[ExecutorBase, Tuple[int, ExecutorInfo]]] = {}
+        self._active_executors_performance: Dict[str, PerformanceReport] = {}
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
@@ -305,6 +337,10 @@ class ExecutorOrchestrator:
         self.store_all_positions()
         # Clear executors and trigger garbage collection
         self.active_executors.clear()
+        if self.executors_scheduler is not None:
+            self.executors_scheduler.stop()
+        if self.executors_event_dispatcher is not None:
+            self.executors_event_dispatcher.stop()
 
     def store_all_positions(self):
         """
@@ -397,6 +433,8 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.scheduler = self.executors_scheduler
+        executor.event_dispatcher = self.executors_event_dispatcher
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -422,13 +460,13 @@ class ExecutorOrchestrator:
         Update positions from executors that are done but haven't been processed yet.
         This is called before generating reports to ensure position state is current.
         """
-        for controller_id, executors_list in self.active_executors.items():
+        for controller_id in self.active_executors.keys():
             # Filter executors that need position updates
             executors_to_process = [
-                executor for executor in executors_list
-                if (executor.executor_info.is_done and
-                    executor.executor_info.close_type == CloseType.POSITION_HOLD and
-                    executor.executor_info.config.id not in self.executors_ids_position_held)
+                executor_info for executor_info in self._get_executors_info(controller_id)
+                if (executor_info.is_done and
+                    executor_info.close_type == CloseType.POSITION_HOLD and
+                    executor_info.config.id not in self.executors_ids_position_held)
             ]
 
             # Skip if no executors to process
@@ -437,8 +475,7 @@ class ExecutorOrchestrator:
 
             positions = self.positions_held.get(controller_id, [])
 
-            for executor in executors_to_process:
-                executor_info = executor.executor_info
+            for executor_info in executors_to_process:
                 self.executors_ids_position_held.append(executor_info.config.id)
 
                 # Determine position side (handling perpetual markets)
@@ -525,15 +562,72 @@ class ExecutorOrchestrator:
         del executor
         # Trigger garbage collection after executor cleanup
 
+    def get_executors_step_times(self) -> Dict[str, LatencyHistogram]:
+        """
+        Get the distribution of the control step durations of each active executor run by the shared scheduler.
+        """
+        if self.executors_scheduler is None:
+            return {}
+        step_times = {}
+        for executors_list in self.active_executors.values():
+            for executor in executors_list:
+                executor_step_times = self.executors_scheduler.get_step_times(executor)
+                if executor_step_times is not None:
+                    step_times[executor.config.id] = executor_step_times
+        return step_times
+
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
         Generate a report of all executors.
         """
         report = {}
-        for controller_id, executors_list in self.active_executors.items():
-            report[controller_id] = [executor.executor_info for executor in executors_list if executor]
+        for controller_id in self.active_executors.keys():
+            report[controller_id] = self._get_executors_info(controller_id)
         return report
 
+    def _get_executors_info(self, controller_id: str) -> List[ExecutorInfo]:
+        """
+        Get the info of the active executors of a controller. The info of an executor is only built again when its
+        state version changed, updating the performance of the active executors of the controller with the difference.
+        """
+        snapshots = self._executors_info_snapshots.get(controller_id, {})
+        performance = self._active_executors_performance.setdefault(controller_id, PerformanceReport())
+        updated_snapshots = {}
+        for executor in self.active_executors.get(controller_id, []):
+            if not executor:
+                continue
+            state_version = executor.state_version
+            snapshot = snapshots.pop(executor, None)
+            if snapshot is None or snapshot[0] != state_version:
+                executor_info = executor.executor_info
+                if snapshot is not None:
+                    self._add_executor_performance(performance, snapshot[1], -1)
+                self._add_executor_performance(performance, executor_info, 1)
+                snapshot = (state_version, executor_info)
+            updated_snapshots[executor] = snapshot
+        # The executors left are no longer active
+        for _, executor_info in snapshots.values():
+            self._add_executor_performance(performance, executor_info, -1)
+        self._executors_info_snapshots[controller_id] = updated_snapshots
+        return [executor_info for _, executor_info in updated_snapshots.values()]
+
+    @staticmethod
+    def _add_executor_performance(report: PerformanceReport, executor_info: ExecutorInfo, sign: int):
+        """
+        Add (sign 1) or remove (sign -1) the contribution of an executor to the performance of the active executors.
+        """
+        if not executor_info.is_done:
+            report.unrealized_pnl_quote += sign * executor_info.net_pnl_quote
+        else:
+            report.realized_pnl_quote += sign * executor_info.net_pnl_quote
+            if executor_info.close_type:
+                close_type_count = report.close_type_counts.get(executor_info.close_type, 0) + sign
+                if close_type_count > 0:
+                    report.close_type_counts[executor_info.close_type] = close_type_count
+                else:
+                    report.close_type_counts.pop(executor_info.close_type, None)
+        report.volume_traded += sign * executor_info.filled_amount_quote
+
     def get_positions_report(self) -> Dict[str, List[PositionSummary]]:
         """
         Generate a report of all positions held.
@@ -586,20 +680,15 @@ class ExecutorOrchestrator:
         report.close_type_counts = cached_report.close_type_counts.copy() if cached_report.close_type_counts else {}
 
         # Add data from active executors
-        active_executors = self.active_executors.get(controller_id, [])
+        self._get_executors_info(controller_id)
+        active_executors_performance = self._active_executors_performance[controller_id]
+        report.unrealized_pnl_quote += active_executors_performance.unrealized_pnl_quote
+        report.realized_pnl_quote += active_executors_performance.realized_pnl_quote
+        report.volume_traded += active_executors_performance.volume_traded
+        for close_type, close_type_count in active_executors_performance.close_type_counts.items():
+            report.close_type_counts[close_type] = report.close_type_counts.get(close_type, 0) + close_type_count
         positions = self.positions_held.get(controller_id, [])
 
-        for executor in active_executors:
-            executor_info = executor.executor_info
-            if not executor_info.is_done:
-                report.unrealized_pnl_quote += executor_info.net_pnl_quote
-            else:
-                report.realized_pnl_quote += executor_info.net_pnl_quote
-                if executor_info.close_type:
-                    report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
-
-            report.volume_traded += executor_info.filled_amount_quote
-
         # Add data from positions held and collect position summaries
         positions_summary = []
         for position in positions:
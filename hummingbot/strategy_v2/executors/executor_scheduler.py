@@ -0,0 +1,241 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class ExecutorScheduler:
+    """
+    Runs the control steps of many runnables (usually executors) from a single loop, instead of one control loop task
+    per runnable sleeping its own update interval.
+
+    All the runnables due within the batch window are stepped in the same loop iteration, so the scheduler only wakes
+    up once per batch. A runnable is scheduled again `update_interval` seconds after its step finishes, like in the
+    control loop of RunnableBase, and can be woken up earlier (for example on the events of its orders or on updates
+    of the order books it watches). Each step runs in its own task, so a slow step does not delay the other runnables.
+    """
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 batch_window: float = 0.05,
+                 min_wake_up_interval: float = 0.1,
+                 wake_up_on_price_updates: bool = False):
+        """
+        :param batch_window: runnables due within this time (in seconds) are stepped in the same loop iteration
+        :param min_wake_up_interval: minimum time between the start of two steps of a runnable when it is woken up
+            before its update interval
+        :param wake_up_on_price_updates: if True, the executors are woken up when the order books of their markets
+            are updated
+        """
+        self._batch_window = batch_window
+        self._min_wake_up_interval = min_wake_up_interval
+        self._wake_up_on_price_updates = wake_up_on_price_updates
+        self._due_queue: List[Tuple[float, int, "RunnableBase"]] = []
+        self._due_times: Dict["RunnableBase", float] = {}
+        self._sequence = itertools.count()
+        self._registered: Set["RunnableBase"] = set()
+        self._started: Set["RunnableBase"] = set()
+        self._step_tasks: Dict["RunnableBase", asyncio.Task] = {}
+        self._wake_up_requested: Set["RunnableBase"] = set()
+        self._last_step_start_times: Dict["RunnableBase", float] = {}
+        self._step_times: Dict["RunnableBase", LatencyHistogram] = {}
+        self._order_book_runnables: Dict[OrderBook, Set["RunnableBase"]] = {}
+        self._order_book_update_forwarder = SourceInfoEventForwarder(self._did_update_order_book)
+        self._loop_event = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._loop_iterations = 0
+
+    @property
+    def wake_up_on_price_updates(self) -> bool:
+        return self._wake_up_on_price_updates
+
+    @property
+    def loop_iterations(self) -> int:
+        """
+        Number of loop iterations in which at least one control step was started
+        """
+        return self._loop_iterations
+
+    @property
+    def runnables_count(self) -> int:
+        return len(self._registered)
+
+    def get_step_times(self, runnable: "RunnableBase") -> Optional[LatencyHistogram]:
+        """
+        Returns the distribution of the duration of the control steps of the runnable, None if it is not scheduled
+        """
+        return self._step_times.get(runnable)
+
+    def register(self, runnable: "RunnableBase"):
+        """
+        Schedules the runnable. Its first step (running on_start before the first control task) starts right away.
+        """
+        if runnable in self._registered:
+            return
+        self._registered.add(runnable)
+        self._step_times[runnable] = LatencyHistogram()
+        self._schedule(runnable, self._time())
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = safe_ensure_future(self._scheduler_loop())
+
+    def unregister(self, runnable: "RunnableBase"):
+        self._registered.discard(runnable)
+        self._started.discard(runnable)
+        self._due_times.pop(runnable, None)
+        self._wake_up_requested.discard(runnable)
+        self._last_step_start_times.pop(runnable, None)
+        self._step_times.pop(runnable, None)
+        for order_book in [order_book for order_book, runnables in self._order_book_runnables.items()
+                           if runnable in runnables]:
+            self.unwatch_order_book(runnable, order_book)
+
+    def wake_up(self, runnable: "RunnableBase"):
+        """
+        Runs the next step of the runnable as soon as possible, respecting the minimum wake up interval. If the
+        runnable is being stepped, the next step starts right after the current one.
+        """
+        if runnable not in self._registered:
+            return
+        if runnable in self._step_tasks:
+            self._wake_up_requested.add(runnable)
+            return
+        now = self._time()
+        due_time = max(now, self._last_step_start_times.get(runnable, now) + self._min_wake_up_interval)
+        if due_time < self._due_times.get(runnable, math.inf):
+            self._schedule(runnable, due_time)
+
+    def watch_order_book(self, runnable: "RunnableBase", order_book: OrderBook):
+        """
+        Wakes up the runnable every time the order book is updated
+        """
+        runnables = self._order_book_runnables.get(order_book)
+        if runnables is None:
+            runnables = self._order_book_runnables[order_book] = set()
+            order_book.add_listener(OrderBookEvent.OrderBookUpdateEvent, self._order_book_update_forwarder)
+        runnables.add(runnable)
+
+    def unwatch_order_book(self, runnable: "RunnableBase", order_book: OrderBook):
+        runnables = self._order_book_runnables.get(order_book)
+        if runnables is None:
+            return
+        runnables.discard(runnable)
+        if len(runnables) == 0:
+            order_book.remove_listener(OrderBookEvent.OrderBookUpdateEvent, self._order_book_update_forwarder)
+            del self._order_book_runnables[order_book]
+
+    def stop(self):
+        """
+        Stops the scheduler loop and cancels the steps in progress
+        """
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            self._loop_task = None
+        for task in self._step_tasks.values():
+            task.cancel()
+        self._step_tasks.clear()
+        for order_book in list(self._order_book_runnables.keys()):
+            order_book.remove_listener(OrderBookEvent.OrderBookUpdateEvent, self._order_book_update_forwarder)
+        self._order_book_runnables.clear()
+        for runnable in list(self._registered):
+            self.unregister(runnable)
+        self._due_queue.clear()
+
+    def _schedule(self, runnable: "RunnableBase", due_time: float):
+        self._due_times[runnable] = due_time
+        heapq.heappush(self._due_queue, (due_time, next(self._sequence), runnable))
+        if self._due_queue[0][2] is runnable:
+            # The loop is sleeping until a later due time
+            self._loop_event.set()
+
+    def _is_scheduled_entry(self, entry: Tuple[float, int, "RunnableBase"]) -> bool:
+        # Entries are not removed from the queue when a runnable is rescheduled or unregistered
+        return self._due_times.get(entry[2]) == entry[0]
+
+    def _pop_due_runnables(self, now: float) -> List["RunnableBase"]:
+        due_runnables = []
+        batch_end = now + self._batch_window
+        while len(self._due_queue) > 0 and self._due_queue[0][0] <= batch_end:
+            entry = heapq.heappop(self._due_queue)
+            if self._is_scheduled_entry(entry):
+                del self._due_times[entry[2]]
+                due_runnables.append(entry[2])
+        while len(self._due_queue) > 0 and not self._is_scheduled_entry(self._due_queue[0]):
+            heapq.heappop(self._due_queue)
+        return due_runnables
+
+    async def _scheduler_loop(self):
+        while True:
+            self._loop_event.clear()
+            due_runnables = self._pop_due_runnables(self._time())
+            if len(due_runnables) > 0:
+                self._loop_iterations += 1
+            for runnable in due_runnables:
+                self._step_tasks[runnable] = safe_ensure_future(self._run_step(runnable))
+            timer_handle = None
+            if len(self._due_queue) > 0:
+                timer_handle = self._call_at(self._due_queue[0][0], self._loop_event.set)
+            await self._loop_event.wait()
+            if timer_handle is not None:
+                timer_handle.cancel()
+
+    async def _run_step(self, runnable: "RunnableBase"):
+        step_start_time = self._time()
+        self._last_step_start_times[runnable] = step_start_time
+        try:
+            if runnable not in self._started:
+                self._started.add(runnable)
+                await runnable.on_start()
+            if not runnable.terminated.is_set():
+                await runnable.run_control_task()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            runnable.logger().error(e, exc_info=True)
+        finally:
+            self._step_tasks.pop(runnable, None)
+
+        if runnable not in self._registered:
+            return
+        step_end_time = self._time()
+        self._step_times[runnable].record(step_end_time - step_start_time)
+        if runnable.terminated.is_set():
+            self.unregister(runnable)
+            try:
+                runnable.on_stop()
+            except Exception as e:
+                runnable.logger().error(e, exc_info=True)
+        elif runnable in self._wake_up_requested:
+            self._wake_up_requested.discard(runnable)
+            self._schedule(runnable, max(step_end_time, step_start_time + self._min_wake_up_interval))
+        else:
+            self._schedule(runnable, step_end_time + runnable.update_interval)
+
+    def _did_update_order_book(self, event_tag: int, order_book: OrderBook, update_id: int):
+        for runnable in list(self._order_book_runnables.get(order_book, [])):
+            self.wake_up(runnable)
+
+    @staticmethod
+    def _time() -> float:
+        return asyncio.get_event_loop().time()
+
+    @staticmethod
+    def _call_at(when: float, callback: Callable) -> asyncio.TimerHandle:
+        return asyncio.get_event_loop().call_at(when, callback)
@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -29,6 +33,8 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        # When set before starting, the control steps are run by the shared scheduler instead of the control loop
+        self.scheduler: Optional["ExecutorScheduler"] = None
 
     @property
     def status(self):
@@ -47,7 +53,10 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            if self.scheduler is not None:
+                self.scheduler.register(self)
+            else:
+                safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -58,6 +67,14 @@ class RunnableBase(ABC):
             self._status = RunnableStatus.TERMINATED
             self.terminated.set()
 
+    def wake_up(self):
+        """
+        Requests the next control step to run as soon as possible. Only has effect when the smart component is run by
+        a shared scheduler, the control loop always waits for the update interval.
+        """
+        if self.scheduler is not None:
+            self.scheduler.wake_up(self)
+
     async def control_loop(self):
         """
         The main control loop of the smart component.
@@ -66,7 +83,7 @@ class RunnableBase(ABC):
         await self.on_start()
         while not self.terminated.is_set():
             try:
-                await self.control_task()
+                await self.run_control_task()
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
@@ -87,6 +104,13 @@ class RunnableBase(ABC):
         """
         pass
 
+    async def run_control_task(self):
+        """
+        Runs one step of the control task. Used by the control loop and by the shared scheduler, subclasses can extend
+        it to do something around every step.
+        """
+        await self.control_task()
+
     async def control_task(self):
         """
         The main task to be executed in the control loop.
@@ -0,0 +1,37 @@
+import os
+from typing import Dict
+
+from hummingbot import data_path
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class RecordOrderBooks(ScriptStrategyBase):
+    """
+    This script records every order book snapshot, diff and trade received by the connector for the trading pairs, in
+    the /data/order_book_recordings/<exchange> directory. Unlike download_order_book_and_trades.py, that stores a
+    snapshot of the books on every tick, the recording is lossless, and it can be replayed with a
+    ReplayOrderBookDataSource to test strategies and connectors offline.
+    """
+    exchange = os.getenv("EXCHANGE", "binance_paper_trade")
+    trading_pairs = os.getenv("TRADING_PAIRS", "ETH-USDT,BTC-USDT").split(",")
+    markets = {exchange: set(trading_pairs)}
+
+    def __init__(self, connectors: Dict[str, ConnectorBase]):
+        super().__init__(connectors)
+        self.recorder = OrderBookRecorder(os.path.join(data_path(), "order_book_recordings", self.exchange))
+
+    def on_tick(self):
+        order_book_tracker = self.connectors[self.exchange].order_book_tracker
+        if order_book_tracker.recorder is None and order_book_tracker.ready:
+            order_book_tracker.start_recording(self.recorder)
+            self.logger().info(f"Recording the order books of {self.trading_pairs} in {self.recorder.path}")
+
+    async def on_stop(self):
+        self.connectors[self.exchange].order_book_tracker.stop_recording()
+
+    def format_status(self) -> str:
+        return (f"Recording the order books of {', '.join(self.trading_pairs)} in {self.recorder.path}\n"
+                f"Messages recorded: {self.recorder.messages_count} | "
+                f"Size: {self.recorder.bytes_recorded / 1e6:.2f} MB | Segments: {self.recorder.segments_count}")
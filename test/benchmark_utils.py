@@ -0,0 +1,16 @@
+import os
+import unittest
+
+RUN_BENCHMARKS_ENV_VAR = "HUMMINGBOT_RUN_BENCHMARKS"
+
+
+def benchmark(test_item):
+    """
+    Marks a test that measures or compares wall-clock timings. The results of those tests depend on the load of the
+    machine running them, so they are skipped unless the HUMMINGBOT_RUN_BENCHMARKS environment variable is set, e.g.:
+
+        HUMMINGBOT_RUN_BENCHMARKS=1 python -m pytest test/hummingbot/core/data_type/test_order_book_depth_benchmark.py
+    """
+    return unittest.skipUnless(
+        os.environ.get(RUN_BENCHMARKS_ENV_VAR),
+        f"benchmark, set {RUN_BENCHMARKS_ENV_VAR}=1 to run it")(test_item)
@@ -1822,6 +1822,113 @@ class BinancePerpetualDerivativeUnitTest(IsolatedAsyncioWrapperTestCase):
             f"{Decimal('9999')} {self.trading_pair} {Decimal('1010')}.",
         ))
 
+    @aioresponses()
+    async def test_orders_created_together_are_sent_in_batch(self, req_mock):
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_ORDERS_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        create_response = [
+            {"updateTime": int(self.start_timestamp * 1e3), "status": "NEW", "orderId": 8886774,
+             "clientOrderId": "OID1"},
+            {"code": -2019, "msg": "Margin is insufficient."},
+            {"updateTime": int(self.start_timestamp * 1e3), "status": "NEW", "orderId": 8886775,
+             "clientOrderId": "OID3"},
+        ]
+        req_mock.post(regex_url, body=json.dumps(create_response))
+        self._simulate_trading_rules_initialized()
+
+        await asyncio.gather(*[
+            self.exchange._create_order(
+                trade_type=TradeType.BUY,
+                order_id=order_id,
+                trading_pair=self.trading_pair,
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT_MAKER,
+                position_action=PositionAction.OPEN,
+                price=price)
+            for order_id, price in (("OID1", Decimal("10000")), ("OID2", Decimal("9999")), ("OID3", Decimal("9998")))
+        ])
+
+        batch_request = next(value for key, value in req_mock.requests.items() if key[1].path.endswith("batchOrders"))
+        self.assertEqual(1, len(batch_request))
+        batch_orders = json.loads(batch_request[0].kwargs["data"]["batchOrders"])
+        self.assertEqual(["OID1", "OID2", "OID3"], [order["newClientOrderId"] for order in batch_orders])
+        self.assertEqual(CONSTANTS.TIME_IN_FORCE_GTX, batch_orders[0]["timeInForce"])
+
+        self.assertEqual("8886774", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual("8886775", self.exchange.in_flight_orders["OID3"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertTrue(any("Order OID2 has failed" in record.getMessage()
+                            and "Margin is insufficient" in record.getMessage()
+                            for record in self.log_records))
+
+    @aioresponses()
+    async def test_orders_created_together_are_kept_tracked_when_server_overloaded(self, req_mock):
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_ORDERS_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_response = {"code": -1003, "msg": "Unknown error, please check your request or try again later."}
+        req_mock.post(regex_url, body=json.dumps(mock_response), status=503)
+        self._simulate_trading_rules_initialized()
+
+        await asyncio.gather(*[
+            self.exchange._create_order(
+                trade_type=TradeType.BUY,
+                order_id=order_id,
+                trading_pair=self.trading_pair,
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT_MAKER,
+                position_action=PositionAction.OPEN,
+                price=price)
+            for order_id, price in (("OID1", Decimal("10000")), ("OID2", Decimal("9999")))
+        ])
+
+        # The orders might have been created, so they are not marked as failed
+        for order_id in ("OID1", "OID2"):
+            self.assertIn(order_id, self.exchange.in_flight_orders)
+            self.assertEqual("UNKNOWN", self.exchange.in_flight_orders[order_id].exchange_order_id)
+        self.assertFalse(any("has failed" in record.getMessage() for record in self.log_records))
+
+    @aioresponses()
+    async def test_orders_canceled_together_are_canceled_in_batch(self, req_mock):
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_ORDERS_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        cancel_response = [
+            {"clientOrderId": "OID1", "orderId": 8886774, "status": "CANCELED", "symbol": "COINALPHAHBOT"},
+            {"code": -2011, "msg": "Unknown order sent."},
+        ]
+        req_mock.delete(regex_url, body=json.dumps(cancel_response))
+        self._simulate_trading_rules_initialized()
+
+        for order_id, exchange_order_id in (("OID1", "8886774"), ("OID2", "8886775")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+                leverage=1,
+                position_action=PositionAction.OPEN,
+            )
+            self.exchange._order_tracker.fetch_order(order_id).current_state = OrderState.OPEN
+
+        canceled_order_ids = await asyncio.gather(
+            self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID1"),
+            self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID2"),
+        )
+
+        batch_request = next(value for key, value in req_mock.requests.items() if key[1].path.endswith("batchOrders"))
+        self.assertEqual(1, len(batch_request))
+        self.assertEqual('["OID1", "OID2"]', batch_request[0].kwargs["params"]["origClientOrderIdList"])
+        self.assertEqual(["OID1", None], canceled_order_ids)
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertEqual("OID1", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertIn("OID2", self.exchange._order_tracker._order_not_found_records)
+        self.assertTrue(self._is_logged(
+            "DEBUG",
+            "The order OID2 does not exist on Binance Perpetuals. No cancelation needed."
+        ))
+
     async def test_create_order_min_order_size_failure(self):
         self._simulate_trading_rules_initialized()
         margin_asset = self.quote_asset
@@ -977,6 +977,125 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    @aioresponses()
+    def test_update_order_status_in_bulk_requests_only_the_orders_no_longer_open(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        open_order = self.exchange.in_flight_orders["OID1"]
+        filled_order = self.exchange.in_flight_orders["OID2"]
+
+        trades_url = web_utils.private_rest_url(path_url=CONSTANTS.MY_TRADES_PATH_URL)
+        trades_regex_url = re.compile(trades_url + r"\?.*")
+        mock_api.get(trades_regex_url, body=json.dumps(
+            self._order_fills_request_partial_fill_mock_response(order=open_order)
+            + self._order_fills_request_full_fill_mock_response(order=filled_order)))
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        mock_api.get(re.compile(f"^{open_orders_url}".replace(".", r"\.")), body=json.dumps(
+            [self._order_status_request_partially_filled_mock_response(order=open_order)]))
+        mock_api.get(trades_regex_url, body=json.dumps(
+            self._order_fills_request_full_fill_mock_response(order=filled_order)))
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        mock_api.get(re.compile(f"^{order_url}".replace(".", r"\.")), body=json.dumps(
+            self._order_status_request_completely_filled_mock_response(order=filled_order)))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(filled_order.wait_until_completely_filled())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        trades_requests = self._all_executed_requests(mock_api, trades_url)
+        self.assertEqual(2, len(trades_requests))
+        self.assertIn("startTime", trades_requests[0].kwargs["params"])
+        self.assertNotIn("orderId", trades_requests[0].kwargs["params"])
+        self.assertEqual(100235, trades_requests[1].kwargs["params"]["orderId"])
+        open_orders_request = self._all_executed_requests(mock_api, open_orders_url)[0]
+        self.validate_auth_credentials_present(open_orders_request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         open_orders_request.kwargs["params"]["symbol"])
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual("OID2", order_requests[0].kwargs["params"]["origClientOrderId"])
+
+        self.assertEqual(OrderState.PARTIALLY_FILLED, open_order.current_state)
+        self.assertEqual(self.expected_partial_fill_amount, open_order.executed_amount_base)
+        self.assertTrue(filled_order.is_filled)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(2, len(self.order_filled_logger.event_log))
+
+    @aioresponses()
+    def test_all_trade_updates_for_trading_pair_requests_all_pages(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="100234",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+        order = self.exchange.in_flight_orders["OID1"]
+        fill = self._order_fills_request_full_fill_mock_response(order=order)[0]
+        # 1500 trades since the start time, the first 1000 of other orders
+        trades = [dict(fill, id=trade_id, orderId=99) for trade_id in range(1, 1500)] + [dict(fill, id=1500)]
+
+        trades_url = web_utils.private_rest_url(path_url=CONSTANTS.MY_TRADES_PATH_URL)
+        trades_regex_url = re.compile(trades_url + r"\?.*")
+        mock_api.get(trades_regex_url, body=json.dumps(trades[:CONSTANTS.MAX_TRADES_PER_REQUEST]))
+        mock_api.get(trades_regex_url, body=json.dumps(trades[CONSTANTS.MAX_TRADES_PER_REQUEST:]))
+
+        trade_updates = self.async_run_with_timeout(self.exchange._all_trade_updates_for_trading_pair(
+            trading_pair=self.trading_pair, orders=[order], start_timestamp=1640780000))
+
+        trades_requests = self._all_executed_requests(mock_api, trades_url)
+        self.assertEqual(2, len(trades_requests))
+        self.assertIn("startTime", trades_requests[0].kwargs["params"])
+        self.assertNotIn("startTime", trades_requests[1].kwargs["params"])
+        self.assertEqual(1001, trades_requests[1].kwargs["params"]["fromId"])
+        self.assertEqual(1, len(trade_updates))
+        self.assertEqual("1500", trade_updates[0].trade_id)
+        self.assertEqual(order.client_order_id, trade_updates[0].client_order_id)
+
+    @aioresponses()
+    def test_update_order_status_requests_each_order_when_the_bulk_update_fails(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+
+        trades_url = web_utils.private_rest_url(path_url=CONSTANTS.MY_TRADES_PATH_URL)
+        mock_api.get(re.compile(trades_url + r"\?.*"), body=json.dumps([]), repeat=True)
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        mock_api.get(re.compile(f"^{open_orders_url}".replace(".", r"\.")), status=500)
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        for order in list(self.exchange.in_flight_orders.values()):
+            mock_api.get(re.compile(f"^{order_url}".replace(".", r"\.")), body=json.dumps(
+                self._order_status_request_open_mock_response(order=order)))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(3, len(self._all_executed_requests(mock_api, trades_url)))
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual({"OID1", "OID2"}, {request.kwargs["params"]["origClientOrderId"] for request in order_requests})
+        self.assertTrue(self.is_logged(
+            "WARNING", "Failed to fetch the bulk order updates for COINALPHA-HBOT. Updating each order instead. "
+                       f"Error: Error executing request GET {open_orders_url}. HTTP status is 500. Error: "))
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
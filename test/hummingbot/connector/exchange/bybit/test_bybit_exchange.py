@@ -462,7 +462,7 @@ class TestBybitExchange(unittest.TestCase):
                      body=json.dumps(get_orders_resp))
         self.async_run_with_timeout(self.exchange._update_order_status())
 
-        self.test_task = asyncio.get_event_loop().create_task(
+        self.async_run_with_timeout(
             self.exchange._create_order(trade_type=TradeType.BUY,
                                         order_id="OID1",
                                         trading_pair=self.trading_pair,
@@ -578,7 +578,7 @@ class TestBybitExchange(unittest.TestCase):
                      body=json.dumps(get_orders_resp))
         self.async_run_with_timeout(self.exchange._update_order_status())
 
-        self.test_task = asyncio.get_event_loop().create_task(
+        self.async_run_with_timeout(
             self.exchange._create_order(trade_type=TradeType.SELL,
                                         order_id="OID1",
                                         trading_pair=self.trading_pair,
@@ -677,6 +677,115 @@ class TestBybitExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_orders_created_together_are_sent_in_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_PLACE_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "1001", "orderLinkId": "OID1",
+                     "createAt": "1640780000000"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "", "orderLinkId": "OID2",
+                     "createAt": ""},
+                ]
+            },
+            "retExtInfo": {
+                "list": [
+                    {"code": 0, "msg": "OK"},
+                    {"code": 170131, "msg": "Insufficient balance."},
+                ]
+            },
+            "time": 1640780000000
+        }
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        self.async_run_with_timeout(asyncio.gather(
+            self.exchange._create_order(trade_type=TradeType.BUY,
+                                        order_id="OID1",
+                                        trading_pair=self.trading_pair,
+                                        amount=Decimal("100"),
+                                        order_type=OrderType.LIMIT,
+                                        price=Decimal("10000")),
+            self.exchange._create_order(trade_type=TradeType.BUY,
+                                        order_id="OID2",
+                                        trading_pair=self.trading_pair,
+                                        amount=Decimal("100"),
+                                        order_type=OrderType.LIMIT,
+                                        price=Decimal("9999")),
+        ))
+
+        batch_request = next(value for key, value in mock_api.requests.items() if key[1].human_repr().startswith(url))
+        self.assertEqual(1, len(batch_request))
+        request_data = json.loads(batch_request[0].kwargs["data"])
+        self.assertEqual("spot", request_data["category"])
+        self.assertEqual(["OID1", "OID2"], [order["orderLinkId"] for order in request_data["request"]])
+        self.assertEqual([CONSTANTS.TIME_IN_FORCE_GTC] * 2, [order["timeInForce"] for order in request_data["request"]])
+
+        self.assertEqual("1001", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_orders_canceled_together_are_canceled_in_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        for order_id, exchange_order_id in (("OID1", "1001"), ("OID2", "1002")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "1001", "orderLinkId": "OID1"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "1002", "orderLinkId": "OID2"},
+                ]
+            },
+            "retExtInfo": {
+                "list": [
+                    {"code": 0, "msg": "OK"},
+                    {"code": 170213, "msg": "Order does not exist."},
+                ]
+            },
+            "time": 1640780000000
+        }
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        canceled_order_ids = self.async_run_with_timeout(asyncio.gather(
+            self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID1"),
+            self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID2"),
+        ))
+
+        batch_request = next(value for key, value in mock_api.requests.items() if key[1].human_repr().startswith(url))
+        self.assertEqual(1, len(batch_request))
+        request_data = json.loads(batch_request[0].kwargs["data"])
+        self.assertEqual(["1001", "1002"], [order["orderId"] for order in request_data["request"]])
+
+        self.assertEqual(["OID1", None], canceled_order_ids)
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertEqual("OID1", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertIn("OID2", self.exchange.in_flight_orders)
+        self.assertTrue(self._is_logged("ERROR", "Failed to cancel order OID2"))
+
     @aioresponses()
     def test_cancel_order_successfully(self, mock_api):
         request_sent_event = asyncio.Event()
@@ -1305,6 +1414,100 @@ class TestBybitExchange(unittest.TestCase):
 
         self.assertEqual(1, self.exchange._order_tracker._order_not_found_records[order.client_order_id])
 
+    @aioresponses()
+    def test_update_order_status_in_bulk_follows_the_pages_of_open_orders(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._set_trading_pair_symbol_map(bidict({self.ex_trading_pair: self.trading_pair}))
+        for order_id, exchange_order_id in (("OID1", "EOID1"), ("OID2", "EOID2")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        first_order: InFlightOrder = self.exchange.in_flight_orders["OID1"]
+        second_order: InFlightOrder = self.exchange.in_flight_orders["OID2"]
+
+        trades_url = web_utils.rest_url(CONSTANTS.TRADE_HISTORY_PATH_URL)
+        fills = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "nextPageCursor": "",
+                "category": "spot",
+                "list": [
+                    {
+                        "symbol": self.ex_trading_pair,
+                        "orderId": "EOID1",
+                        "orderLinkId": "OID1",
+                        "side": "Buy",
+                        "execId": "T1",
+                        "execPrice": "10000",
+                        "execQty": "0.4",
+                        "execFee": "0.0004",
+                        "execTime": "1640780000000",
+                        "isMaker": True,
+                    },
+                    {
+                        "symbol": self.ex_trading_pair,
+                        "orderId": "UNTRACKED",
+                        "orderLinkId": "",
+                        "side": "Buy",
+                        "execId": "T2",
+                        "execPrice": "10000",
+                        "execQty": "1",
+                        "execFee": "0.001",
+                        "execTime": "1640780000000",
+                        "isMaker": True,
+                    },
+                ]
+            },
+        }
+        mock_api.get(re.compile(f"^{trades_url}".replace(".", r"\.")), body=json.dumps(fills))
+
+        orders_url = web_utils.rest_url(CONSTANTS.GET_ORDERS_PATH_URL)
+        orders_regex_url = re.compile(f"^{orders_url}".replace(".", r"\."))
+        for order, order_status, cursor in ((first_order, "PartiallyFilled", "next_page"), (second_order, "New", "")):
+            mock_api.get(orders_regex_url, body=json.dumps({
+                "retCode": 0,
+                "retMsg": "OK",
+                "result": {
+                    "nextPageCursor": cursor,
+                    "category": "spot",
+                    "list": [
+                        {
+                            "orderId": order.exchange_order_id,
+                            "orderLinkId": order.client_order_id,
+                            "symbol": self.ex_trading_pair,
+                            "orderStatus": order_status,
+                            "updatedTime": "1640780000000",
+                        }
+                    ]
+                },
+            }))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        trades_requests = [value[0] for key, value in mock_api.requests.items()
+                           if key[1].human_repr().startswith(trades_url)]
+        self.assertEqual(1, len(trades_requests))
+        self.assertEqual(self.ex_trading_pair, trades_requests[0].kwargs["params"]["symbol"])
+        self.assertIn("startTime", trades_requests[0].kwargs["params"])
+        orders_requests = [request for key, value in mock_api.requests.items()
+                           if key[1].human_repr().startswith(orders_url) for request in value]
+        self.assertEqual(2, len(orders_requests))
+        self.assertNotIn("cursor", orders_requests[0].kwargs["params"])
+        self.assertEqual("next_page", orders_requests[1].kwargs["params"]["cursor"])
+
+        self.assertEqual(OrderState.PARTIALLY_FILLED, first_order.current_state)
+        self.assertEqual(Decimal("0.4"), first_order.executed_amount_base)
+        self.assertEqual(OrderState.OPEN, second_order.current_state)
+        self.assertEqual(Decimal("0"), second_order.executed_amount_base)
+
     @aioresponses()
     def test_update_account_type(self, mock_api):
         url = web_utils.rest_url(CONSTANTS.ACCOUNT_INFO_PATH_URL)
@@ -737,6 +737,50 @@ class TestGateIoExchange(IsolatedAsyncioWrapperTestCase):
         self.assertNotIn(order_id, self.exchange.in_flight_orders)
         self.assertEqual(1, len(self.order_failure_logger.event_log))
 
+    @aioresponses()
+    async def test_orders_created_together_are_sent_in_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        created_order = self.get_order_create_response_mock(exchange_order_id="someExchId")
+        created_order.update({"text": "OID1", "succeeded": True})
+        resp = [
+            created_order,
+            {"text": "OID2", "succeeded": False, "label": "BALANCE_NOT_ENOUGH", "message": "Not enough balance"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp))
+
+        await asyncio.gather(
+            self.exchange._create_order(
+                trade_type=TradeType.BUY,
+                order_id="OID1",
+                trading_pair=self.trading_pair,
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT_MAKER,
+                price=Decimal("5.1")),
+            self.exchange._create_order(
+                trade_type=TradeType.BUY,
+                order_id="OID2",
+                trading_pair=self.trading_pair,
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+                price=Decimal("5")),
+        )
+
+        order_request = next(value for key, value in mock_api.requests.items() if key[1].human_repr() == url)
+        self.assertEqual(1, len(order_request))
+        request_data = json.loads(order_request[0].kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order["text"] for order in request_data])
+        self.assertEqual(["poc", "gtc"], [order["time_in_force"] for order in request_data])
+
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual("someExchId", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
     @aioresponses()
     def test_create_order_request_fails_and_raises_failure_event(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -836,6 +880,7 @@ class TestGateIoExchange(IsolatedAsyncioWrapperTestCase):
                         callback=lambda *args, **kwargs: request_sent_event.set())
 
         self.exchange.cancel(trading_pair=self.trading_pair, client_order_id="OID1")
+        await asyncio.wait_for(request_sent_event.wait(), timeout=1)
         await asyncio.sleep(0.0001)
 
         self.assertEqual(0, len(self.order_cancelled_logger.event_log))
@@ -925,20 +970,26 @@ class TestGateIoExchange(IsolatedAsyncioWrapperTestCase):
         self.assertIn("OID2", self.exchange.in_flight_orders)
         order2 = self.exchange.in_flight_orders["OID2"]
 
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order1.exchange_order_id)}"
+        # Both orders are canceled with a single batch cancelation request
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_DELETE_PATH_URL}"
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
 
-        response = self.get_order_create_response_mock(cancelled=True, exchange_order_id=order1.exchange_order_id)
-
-        mock_api.delete(regex_url, body=json.dumps(response))
-
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order2.exchange_order_id)}"
-        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = [
+            {"currency_pair": self.ex_trading_pair, "id": order1.exchange_order_id, "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": order2.exchange_order_id, "succeeded": False,
+             "label": "INVALID_PARAM_VALUE", "message": "Invalid parameter value"},
+        ]
 
-        mock_api.delete(regex_url, status=400)
+        mock_api.post(regex_url, body=json.dumps(response))
 
         cancellation_results = self.async_run_with_timeout(self.exchange.cancel_all(10))
 
+        cancel_request = next(value for key, value in mock_api.requests.items() if key[1].human_repr() == url)
+        self.assertEqual(1, len(cancel_request))
+        self.assertEqual(
+            [{"currency_pair": self.ex_trading_pair, "id": order1.exchange_order_id},
+             {"currency_pair": self.ex_trading_pair, "id": order2.exchange_order_id}],
+            json.loads(cancel_request[0].kwargs["data"]))
         self.assertEqual(2, len(cancellation_results))
         self.assertEqual(CancellationResult(order1.client_order_id, True), cancellation_results[0])
         self.assertEqual(CancellationResult(order2.client_order_id, False), cancellation_results[1])
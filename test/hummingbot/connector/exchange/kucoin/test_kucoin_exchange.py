@@ -567,6 +567,67 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_limit_orders_created_together_are_sent_in_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        batch_url = web_utils.private_rest_url(CONSTANTS.BATCH_ORDERS_PATH_URL)
+        url = web_utils.private_rest_url(CONSTANTS.ORDERS_PATH_URL)
+
+        batch_creation_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {"symbol": self.exchange_trading_pair, "type": "limit", "side": "buy", "price": "10000",
+                     "size": "100", "clientOid": "OID1", "id": "5bd6e9286d99522a52e458de", "status": "success",
+                     "failMsg": None},
+                    {"symbol": self.exchange_trading_pair, "type": "limit", "side": "buy", "price": "9999",
+                     "size": "100", "clientOid": "OID2", "id": None, "status": "fail",
+                     "failMsg": "Balance insufficient!"},
+                ]
+            }}
+        mock_api.post(batch_url, body=json.dumps(batch_creation_response))
+        creation_response = {"code": "200000", "data": {"orderId": "5bd6e9286d99522a52e458df"}}
+        mock_api.post(url, body=json.dumps(creation_response))
+
+        self.async_run_with_timeout(asyncio.gather(
+            self.exchange._create_order(trade_type=TradeType.BUY,
+                                        order_id="OID1",
+                                        trading_pair=self.trading_pair,
+                                        amount=Decimal("100"),
+                                        order_type=OrderType.LIMIT_MAKER,
+                                        price=Decimal("10000")),
+            self.exchange._create_order(trade_type=TradeType.BUY,
+                                        order_id="OID2",
+                                        trading_pair=self.trading_pair,
+                                        amount=Decimal("100"),
+                                        order_type=OrderType.LIMIT,
+                                        price=Decimal("9999")),
+            self.exchange._create_order(trade_type=TradeType.SELL,
+                                        order_id="OID3",
+                                        trading_pair=self.trading_pair,
+                                        amount=Decimal("100"),
+                                        order_type=OrderType.MARKET,
+                                        price=Decimal("10000")),
+        ))
+
+        batch_request = next(value for key, value in mock_api.requests.items() if key[1].human_repr() == batch_url)
+        self.assertEqual(1, len(batch_request))
+        self._validate_auth_credentials_present(batch_request[0])
+        request_data = json.loads(batch_request[0].kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual(["OID1", "OID2"], [order["clientOid"] for order in request_data["orderList"]])
+        self.assertTrue(request_data["orderList"][0]["postOnly"])
+        # Market orders are not accepted in batches
+        order_request = next(value for key, value in mock_api.requests.items() if key[1].human_repr() == url)
+        self.assertEqual("OID3", json.loads(order_request[0].kwargs["data"])["clientOid"])
+
+        self.assertEqual("5bd6e9286d99522a52e458de", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual("5bd6e9286d99522a52e458df", self.exchange.in_flight_orders["OID3"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
     @aioresponses()
     def test_create_limit_maker_order_successfully(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -79,3 +79,22 @@ class NdaxOrderBookMessageTests(TestCase):
         self.assertEqual(41508.19, asks[0].price)
         self.assertEqual(0.0, asks[0].amount)
         self.assertEqual(1, asks[0].update_id)
+
+    def test_levels_arrays_are_parsed_once(self):
+        entries = [NdaxOrderBookEntry(mdUpdateId=1,
+                                      accountId=1,
+                                      actionDateTime=1627935956059,
+                                      actionType=0,
+                                      lastTradePrice=42211.51,
+                                      orderId=1,
+                                      price=41508.19,
+                                      productPairCode=5,
+                                      quantity=1.5,
+                                      side=0)]
+        message = NdaxOrderBookMessage(message_type=OrderBookMessageType.DIFF,
+                                       content={"data": entries},
+                                       timestamp=time.time())
+
+        self.assertEqual([[41508.19, 1.5]], message.bids_array.tolist())
+        self.assertIs(message.bids_array, message.bids_array)
+        self.assertIs(message.asks_array, message.asks_array)
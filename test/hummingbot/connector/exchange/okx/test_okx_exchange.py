@@ -3,7 +3,7 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
@@ -13,8 +13,9 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
+from hummingbot.core.data_type.ws_order_entry_data_source import WSOrderEntryUnavailableError
 from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
 
 
@@ -592,12 +593,28 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both orders are canceled with a single batch cancelation request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": successful_order.client_order_id,
+                    "ordId": successful_order.exchange_order_id,
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": erroneous_order.client_order_id,
+                    "ordId": erroneous_order.exchange_order_id,
+                    "sCode": "1",
+                    "sMsg": "Error"
+                },
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1239,6 +1256,232 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             ]
         }
 
+    @aioresponses()
+    def test_update_order_status_in_bulk(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "EOID1"), ("OID2", "EOID2")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        first_order: InFlightOrder = self.exchange.in_flight_orders["OID1"]
+        second_order: InFlightOrder = self.exchange.in_flight_orders["OID2"]
+
+        fills_url = web_utils.private_rest_url(CONSTANTS.OKX_TRADE_FILLS_PATH)
+        mock_api.get(re.compile(f"^{fills_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps(self._order_fills_request_partial_fill_mock_response(order=first_order)))
+        pending_orders_url = web_utils.private_rest_url(CONSTANTS.OKX_PENDING_ORDERS_PATH)
+        pending_orders = self._order_status_request_partially_filled_mock_response(order=first_order)
+        pending_orders["data"] += self._order_status_request_open_mock_response(order=second_order)["data"]
+        mock_api.get(re.compile(f"^{pending_orders_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps(pending_orders))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        fills_request = self._all_executed_requests(mock_api, fills_url)[0]
+        self.validate_auth_credentials_present(fills_request)
+        self.assertEqual(self.exchange_trading_pair, fills_request.kwargs["params"]["instId"])
+        self.assertIn("begin", fills_request.kwargs["params"])
+        pending_orders_request = self._all_executed_requests(mock_api, pending_orders_url)[0]
+        self.validate_auth_credentials_present(pending_orders_request)
+        self.assertEqual(self.exchange_trading_pair, pending_orders_request.kwargs["params"]["instId"])
+        # No order status was requested for each order
+        self.assertFalse(any("clOrdId" in request.kwargs["params"] for request in self._all_executed_requests(
+            mock_api, web_utils.private_rest_url(CONSTANTS.OKX_ORDER_DETAILS_PATH))))
+
+        self.assertEqual(OrderState.PARTIALLY_FILLED, first_order.current_state)
+        self.assertEqual(self.expected_partial_fill_amount, first_order.executed_amount_base)
+        self.assertEqual(OrderState.OPEN, second_order.current_state)
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+
+    @aioresponses()
+    def test_orders_created_together_are_sent_in_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        url = web_utils.private_rest_url(CONSTANTS.OKX_BATCH_ORDER_PLACE_PATH)
+        first_order_id = self.place_buy_order(price=Decimal("10000"))
+        second_order_id = self.place_buy_order(price=Decimal("9999"))
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": first_order_id, "ordId": "EOID1", "tag": "", "sCode": "0", "sMsg": ""},
+                {"clOrdId": second_order_id, "ordId": "", "tag": "", "sCode": "51008",
+                 "sMsg": "Order failed. Insufficient balance"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        batch_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(batch_request)
+        request_data = json.loads(batch_request.kwargs["data"])
+        self.assertEqual([first_order_id, second_order_id], [order["clOrdId"] for order in request_data])
+        self.assertEqual([Decimal("10000"), Decimal("9999")], [Decimal(order["px"]) for order in request_data])
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[first_order_id].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertNotIn(second_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(second_order_id, self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_create_order_through_order_entry_websocket(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        ws_data_source = self.exchange._ws_order_entry_data_source
+        ws_data_source._ws_assistant = MagicMock()
+        ws_data_source.execute_request = AsyncMock(side_effect=lambda operation, params: {
+            "id": "1",
+            "op": operation,
+            "code": "0",
+            "msg": "",
+            "data": [{"clOrdId": params[0]["clOrdId"], "ordId": "EOID1", "tag": "", "sCode": "0", "sMsg": ""}],
+        })
+
+        order_id = self.place_buy_order(price=Decimal("10000"))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        ws_data_source.execute_request.assert_awaited_once()
+        self.assertEqual(CONSTANTS.WS_ORDER_OPERATION, ws_data_source.execute_request.call_args.kwargs["operation"])
+        order_params = ws_data_source.execute_request.call_args.kwargs["params"][0]
+        self.assertEqual(order_id, order_params["clOrdId"])
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset), order_params["instId"])
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[order_id].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(1, self.exchange.order_entry_latency_stats["websocket"]["count"])
+        self.assertNotIn("rest", self.exchange.order_entry_latency_stats)
+
+    @aioresponses()
+    def test_create_order_falls_back_to_rest_when_order_entry_websocket_request_not_sent(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        ws_data_source = self.exchange._ws_order_entry_data_source
+        ws_data_source._ws_assistant = MagicMock()
+        ws_data_source.execute_request = AsyncMock(side_effect=WSOrderEntryUnavailableError("Connection closed"))
+
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+
+        order_id = self.place_buy_order()
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+        self.assertIn(order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertTrue(
+            self.is_logged(
+                "WARNING",
+                f"The order {order_id} could not be sent through the order entry websocket (Connection closed). "
+                f"Sending it using the REST API."
+            )
+        )
+        self.assertEqual(1, self.exchange.order_entry_latency_stats["rest"]["count"])
+        self.assertNotIn("websocket", self.exchange.order_entry_latency_stats)
+
+    @aioresponses()
+    def test_orders_created_together_are_sent_in_batch_when_order_entry_websocket_connected(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        ws_data_source = self.exchange._ws_order_entry_data_source
+        ws_data_source._ws_assistant = MagicMock()
+        ws_data_source.execute_request = AsyncMock(side_effect=lambda operation, params: {
+            "id": "1",
+            "op": operation,
+            "code": "0",
+            "msg": "",
+            "data": [{"clOrdId": params[0]["clOrdId"], "ordId": "EOID3", "tag": "", "sCode": "0", "sMsg": ""}],
+        })
+
+        url = web_utils.private_rest_url(CONSTANTS.OKX_BATCH_ORDER_PLACE_PATH)
+        first_order_id = self.place_buy_order(price=Decimal("10000"))
+        second_order_id = self.place_buy_order(price=Decimal("9999"))
+        response = {
+            "code": "0",
+            "msg": "",
+            "data": [
+                {"clOrdId": first_order_id, "ordId": "EOID1", "tag": "", "sCode": "0", "sMsg": ""},
+                {"clOrdId": second_order_id, "ordId": "EOID2", "tag": "", "sCode": "0", "sMsg": ""},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        # The orders queued in the same event loop iteration are still sent together in one batch request
+        batch_request = self._all_executed_requests(mock_api, url)[0]
+        request_data = json.loads(batch_request.kwargs["data"])
+        self.assertEqual([first_order_id, second_order_id], [order["clOrdId"] for order in request_data])
+        ws_data_source.execute_request.assert_not_awaited()
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[first_order_id].exchange_order_id)
+        self.assertEqual("EOID2", self.exchange.in_flight_orders[second_order_id].exchange_order_id)
+
+        # An order queued by itself is sent through the websocket
+        third_order_id = self.place_buy_order(price=Decimal("9998"))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        ws_data_source.execute_request.assert_awaited_once()
+        self.assertEqual(CONSTANTS.WS_ORDER_OPERATION, ws_data_source.execute_request.call_args.kwargs["operation"])
+        self.assertEqual(third_order_id, ws_data_source.execute_request.call_args.kwargs["params"][0]["clOrdId"])
+        self.assertEqual("EOID3", self.exchange.in_flight_orders[third_order_id].exchange_order_id)
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, url)))
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+        self.assertEqual(3, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(2, self.exchange.order_entry_latency_stats["rest"]["count"])
+        self.assertEqual(1, self.exchange.order_entry_latency_stats["websocket"]["count"])
+
+    def test_cancel_order_through_order_entry_websocket(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="11",
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+
+        ws_data_source = self.exchange._ws_order_entry_data_source
+        ws_data_source._ws_assistant = MagicMock()
+        ws_data_source.execute_request = AsyncMock(return_value={
+            "id": "1",
+            "op": CONSTANTS.WS_CANCEL_ORDER_OPERATION,
+            "code": "0",
+            "msg": "",
+            "data": [{"clOrdId": "11", "ordId": "4", "sCode": "0", "sMsg": ""}],
+        })
+
+        self.async_run_with_timeout(self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="11"))
+
+        ws_data_source.execute_request.assert_awaited_once_with(
+            operation=CONSTANTS.WS_CANCEL_ORDER_OPERATION,
+            params=[{"clOrdId": "11", "instId": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)}],
+        )
+        self.assertTrue(self.exchange.in_flight_orders["11"].is_pending_cancel_confirmation)
+        self.assertEqual(1, self.exchange.order_entry_latency_stats["websocket"]["count"])
+
     @aioresponses()
     def test_get_last_trade_prices(self, mock_api):
         self._simulate_trading_rules_initialized()
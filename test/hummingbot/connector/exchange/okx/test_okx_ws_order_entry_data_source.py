@@ -0,0 +1,162 @@
+import asyncio
+import json
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.connector.exchange.okx import okx_constants as CONSTANTS
+from hummingbot.connector.exchange.okx.okx_auth import OkxAuth
+from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
+from hummingbot.connector.exchange.okx.okx_ws_order_entry_data_source import OkxWSOrderEntryDataSource
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.data_type.ws_order_entry_data_source import WSOrderEntryUnavailableError
+
+
+class OkxWSOrderEntryDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
+    # the level is required to receive logs from the data source logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.base_asset = "COINALPHA"
+        cls.quote_asset = "HBOT"
+        cls.trading_pair = f"{cls.base_asset}-{cls.quote_asset}"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.log_records = []
+        self.listening_task: Optional[asyncio.Task] = None
+        self.mocking_assistant = NetworkMockingAssistant(self.local_event_loop)
+
+        self.time_synchronizer = MagicMock()
+        self.time_synchronizer.time.return_value = 1640001112.223
+
+        self.auth = OkxAuth(
+            api_key="TEST_API_KEY",
+            secret_key="TEST_SECRET",
+            passphrase="TEST_PASSPHRASE",
+            time_provider=self.time_synchronizer)
+
+        self.connector = OkxExchange(
+            okx_api_key="",
+            okx_secret_key="",
+            okx_passphrase="",
+            trading_pairs=[self.trading_pair],
+            trading_required=False,
+        )
+        self.connector._web_assistants_factory._auth = self.auth
+
+        self.data_source = OkxWSOrderEntryDataSource(
+            auth=self.auth,
+            connector=self.connector,
+            api_factory=self.connector._web_assistants_factory
+        )
+
+        self.data_source.logger().setLevel(1)
+        self.data_source.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.listening_task and self.listening_task.cancel()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message
+                   for record in self.log_records)
+
+    def _add_successful_login_response(self, websocket_mock):
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=websocket_mock,
+            message=json.dumps({"event": "login", "code": "0", "msg": ""}))
+
+    async def _wait_until_connected(self):
+        while not self.data_source.is_connected:
+            await asyncio.sleep(0)
+
+    async def test_execute_request_fails_when_not_connected(self):
+        with self.assertRaises(WSOrderEntryUnavailableError):
+            await self.data_source.execute_request(operation=CONSTANTS.WS_ORDER_OPERATION, params=[{}])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_execute_request_returns_the_response_with_the_request_id(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self._add_successful_login_response(ws_connect_mock.return_value)
+
+        self.listening_task = self.local_event_loop.create_task(self.data_source.listen_for_responses())
+        await self._wait_until_connected()
+
+        order_params = [{"instId": self.trading_pair, "clOrdId": "OID1", "side": "buy"}]
+        request_task = self.local_event_loop.create_task(
+            self.data_source.execute_request(operation=CONSTANTS.WS_ORDER_OPERATION, params=order_params))
+        await asyncio.sleep(0)
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual(2, len(sent_messages))
+        self.assertEqual("login", sent_messages[0]["op"])
+        order_request = sent_messages[1]
+        self.assertEqual(CONSTANTS.WS_ORDER_OPERATION, order_request["op"])
+        self.assertEqual(order_params, order_request["args"])
+
+        unrelated_response = {"id": "unknown", "op": "order", "code": "0", "msg": "", "data": []}
+        order_response = {
+            "id": order_request["id"],
+            "op": "order",
+            "code": "0",
+            "msg": "",
+            "data": [{"clOrdId": "OID1", "ordId": "12345", "sCode": "0", "sMsg": ""}],
+        }
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(unrelated_response))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(order_response))
+
+        response = await request_task
+
+        self.assertEqual(order_response, response)
+        self.assertEqual(0, len(self.data_source._pending_requests))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_pending_requests_fail_when_the_connection_is_lost(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self._add_successful_login_response(ws_connect_mock.return_value)
+
+        self.listening_task = self.local_event_loop.create_task(self.data_source.listen_for_responses())
+        await self._wait_until_connected()
+
+        request_task = self.local_event_loop.create_task(
+            self.data_source.execute_request(operation=CONSTANTS.WS_CANCEL_ORDER_OPERATION, params=[{}]))
+        await asyncio.sleep(0)
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"event": "error", "code": "60018", "msg": "Invalid sign"}))
+        ws_connect_mock.return_value.receive.side_effect = ConnectionError("Connection lost")
+
+        with self.assertRaises(ConnectionError):
+            await request_task
+
+        self.assertFalse(self.data_source.is_connected)
+
+    @patch("hummingbot.core.data_type.ws_order_entry_data_source.WSOrderEntryDataSource._sleep")
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_listen_for_responses_logs_error_when_login_fails(self, ws_connect_mock, sleep_mock):
+        sleep_mock.side_effect = asyncio.CancelledError
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"event": "error", "code": "60009", "msg": "Login failed."}))
+
+        with self.assertRaises(asyncio.CancelledError):
+            await self.data_source.listen_for_responses()
+
+        self.assertFalse(self.data_source.is_connected)
+        self.assertTrue(
+            self._is_logged(
+                "ERROR",
+                "Unexpected error in the order entry websocket. Retrying after 1 second..."))
@@ -1,9 +1,19 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from decimal import Decimal
+from test.benchmark_utils import benchmark
+from typing import Dict
 from unittest import TestCase
 
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.events import OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -25,3 +35,117 @@ class PaperTradeExchangeTests(TestCase):
             exchange_name="kucoin",
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+
+class PaperTradeExchangeOnHoldBalancesTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockPaperExchange()
+        self.exchange.set_balanced_order_book(self.trading_pair, 10, 5, 15, 0.1, 1)
+        self.exchange.set_balance("COINALPHA", Decimal("10000"))
+        self.exchange.set_balance("HBOT", Decimal("100000"))
+
+    def tearDown(self) -> None:
+        # Let the order created events scheduled by the exchange complete
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        super().tearDown()
+
+    @staticmethod
+    def _on_hold_balances_from_limit_orders(exchange: MockPaperExchange) -> Dict[str, Decimal]:
+        on_hold_balances = defaultdict(Decimal)
+        for limit_order in exchange.limit_orders:
+            if limit_order.is_buy:
+                on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+            else:
+                on_hold_balances[limit_order.base_currency] += limit_order.quantity
+        return on_hold_balances
+
+    def test_limit_orders_hold_balances(self):
+        self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("9"))
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("8"))
+        self.exchange.sell(self.trading_pair, Decimal("3"), OrderType.LIMIT, Decimal("11"))
+        # Market orders do not hold balance
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.MARKET)
+
+        self.assertEqual({"HBOT": Decimal("26"), "COINALPHA": Decimal("3")}, self.exchange.on_hold_balances)
+        self.assertEqual(Decimal("99974"), self.exchange.available_balances["HBOT"])
+        self.assertEqual(Decimal("9997"), self.exchange.get_available_balance("COINALPHA"))
+        self.assertEqual(Decimal("0"), self.exchange.get_available_balance("WETH"))
+
+    def test_cancelled_orders_release_balances(self):
+        buy_order_id = self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("9"))
+        self.exchange.sell(self.trading_pair, Decimal("3"), OrderType.LIMIT, Decimal("11"))
+
+        self.exchange.cancel(self.trading_pair, buy_order_id)
+
+        self.assertEqual({"COINALPHA": Decimal("3")}, self.exchange.on_hold_balances)
+        self.assertEqual(Decimal("100000"), self.exchange.get_available_balance("HBOT"))
+
+        self.ev_loop.run_until_complete(self.exchange.cancel_all(timeout_seconds=1))
+
+        self.assertEqual({}, self.exchange.on_hold_balances)
+        self.assertEqual(Decimal("10000"), self.exchange.get_available_balance("COINALPHA"))
+
+    def test_filled_orders_release_balances(self):
+        self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("9"))
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("8"))
+
+        self.exchange.match_trade_to_limit_orders(OrderBookTradeEvent(
+            self.trading_pair, 1, TradeType.SELL, Decimal("8.5"), Decimal("2")))
+
+        self.assertEqual({"HBOT": Decimal("8")}, self.exchange.on_hold_balances)
+        self.assertEqual(self.exchange.get_balance("HBOT") - Decimal("8"),
+                         self.exchange.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("10002"), self.exchange.get_balance("COINALPHA"))
+
+    def _place_resting_orders(self, count: int):
+        for i in range(count):
+            self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("9") - Decimal(i) / 1000)
+            self.exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("11") + Decimal(i) / 1000)
+
+    def test_on_hold_ledger_matches_resting_orders(self):
+        self._place_resting_orders(500)
+        self.assertEqual(1000, len(self.exchange.limit_orders))
+        self.assertEqual(self._on_hold_balances_from_limit_orders(self.exchange), self.exchange.on_hold_balances)
+
+        for limit_order in list(self.exchange.limit_orders)[::3]:
+            self.exchange.cancel(self.trading_pair, limit_order.client_order_id)
+        self.exchange.match_trade_to_limit_orders(OrderBookTradeEvent(
+            self.trading_pair, 1, TradeType.SELL, Decimal("8.9"), Decimal("50")))
+
+        on_hold_balances = self._on_hold_balances_from_limit_orders(self.exchange)
+        self.assertEqual({asset: balance for asset, balance in on_hold_balances.items() if balance != 0},
+                         self.exchange.on_hold_balances)
+        for asset in ("HBOT", "COINALPHA"):
+            self.assertEqual(self.exchange.get_balance(asset) - on_hold_balances[asset],
+                             self.exchange.get_available_balance(asset))
+
+    @benchmark
+    def test_balance_queries_benchmark_with_resting_orders(self):
+        self._place_resting_orders(500)
+        queries = 200
+
+        start = time.perf_counter()
+        for _ in range(queries):
+            on_hold_balances = self._on_hold_balances_from_limit_orders(self.exchange)
+            expected_balance = self.exchange.get_balance("HBOT") - on_hold_balances["HBOT"]
+        rebuild_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(queries):
+            available_balance = self.exchange.get_available_balance("HBOT")
+        ledger_time = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(
+            f"{queries} balance queries with {len(self.exchange.limit_orders)} resting orders: rebuilding from the "
+            f"orders {rebuild_time * 1e3:.1f} ms, on hold ledger {ledger_time * 1e3:.3f} ms "
+            f"({queries / max(ledger_time, 1e-9):.0f} queries/s)")
+        self.assertEqual(expected_balance, available_balance)
+        self.assertLess(ledger_time * 10, rebuild_time)
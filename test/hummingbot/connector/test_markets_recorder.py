@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
@@ -28,6 +30,7 @@ from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_exporter import TradeFillExporter
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -110,6 +113,49 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(self.strategy_name, recorder.strategy_name)
         self.assertIsInstance(recorder.logger(), HummingbotLogger)
 
+    def test_append_to_csv_reads_existing_file_header_once(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        trades = [
+            TradeFill(config_file_path="test_config.yml", strategy=self.strategy_name, market=self.display_name,
+                      symbol=self.trading_pair, base_asset=self.base, quote_asset=self.quote, timestamp=1640001112223,
+                      order_id=f"//OID{i}", trade_type=TradeType.BUY.name, order_type=OrderType.LIMIT.name,
+                      price=Decimal(1000), amount=Decimal(1), leverage=1, trade_fee={}, trade_fee_in_quote=0,
+                      exchange_trade_id=f"EOID{i}", position=PositionAction.NIL.value)
+            for i in range(3)
+        ]
+
+        header = ",".join(TradeFill.attribute_names_for_file_export() + ["age"])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "trades_test_config.csv")
+            with open(csv_path, "w") as file:
+                file.write(header + "\n")
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir):
+                with patch.object(TradeFillExporter, "_csv_header_matches", autospec=True,
+                                  side_effect=TradeFillExporter._csv_header_matches) as header_check_mock:
+                    for trade in trades:
+                        recorder.append_to_csv(trade)
+                    recorder.stop()
+
+            with open(csv_path) as file:
+                lines = file.read().splitlines()
+
+        self.assertEqual(1, header_check_mock.call_count)
+        self.assertEqual(4, len(lines))
+        self.assertEqual(header, lines[0])
+        self.assertTrue(lines[1].startswith("EOID0,test_config.yml,"))
+        self.assertTrue(lines[3].endswith(",n/a"))
+
     def test_get_trade_for_config(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -191,6 +237,62 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(0, len(trade_fills))
 
+    def test_order_events_are_written_by_the_write_queue_once_started(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SQLConnectionManager(
+                ClientConfigAdapter(ClientConfigMap()),
+                SQLConnectionType.TRADE_FILLS,
+                db_path=os.path.join(temp_dir, "test_write_behind.sqlite"))
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                market_data_collection=MarketDataCollectionConfigMap(
+                    market_data_collection_enabled=False,
+                    market_data_collection_interval=60,
+                    market_data_collection_depth=20,
+                ),
+            )
+            recorder.start()
+            self.assertTrue(recorder.write_queue.is_running)
+
+            create_event = BuyOrderCreatedEvent(
+                timestamp=int(time.time()),
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id="OID1",
+                creation_timestamp=1640001112.223,
+                exchange_order_id="EOID1",
+            )
+            complete_event = BuyOrderCompletedEvent(
+                timestamp=int(time.time()),
+                order_id=create_event.order_id,
+                base_asset=self.base,
+                quote_asset=self.quote,
+                base_asset_amount=create_event.amount,
+                quote_asset_amount=create_event.amount * create_event.price,
+                order_type=create_event.type,
+                exchange_order_id=create_event.exchange_order_id,
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+            recorder.stop()
+
+            self.assertFalse(recorder.write_queue.is_running)
+            self.assertEqual(0, recorder.write_queue.queue_depth)
+            self.assertEqual(2, recorder.write_queue.committed_writes)
+            with manager.get_new_session() as session:
+                order = session.query(Order).one()
+                statuses = [order_status.status for order_status in order.status]
+                last_status = order.last_status
+            manager.engine.dispose()
+
+        self.assertEqual([MarketEvent.BuyOrderCreated.name, MarketEvent.BuyOrderCompleted.name], statuses)
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, last_status)
+
     def test_sell_order_created_event_creates_order_record(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -4,14 +4,16 @@ import math
 import sys
 import time
 import unittest
+from collections import defaultdict
 from decimal import Decimal
+from test.benchmark_utils import benchmark
 from typing import Dict, List
 from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog, TaskLogWindow
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -105,23 +107,24 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
-            TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        task_logs = self.throttler._task_logs[rate_limit.limit_id]
+        task_logs.append(TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight))
+        task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
-        self.assertEqual(2, len(self.throttler._task_logs))
+        self.assertEqual(2, len(task_logs))
+        self.assertEqual(2, task_logs.weight)
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=lock,
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         context.flush()
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, len(task_logs))
+        self.assertEqual(1, task_logs.weight)
 
     def test_within_capacity_singular_non_weighted_task_returns_false(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        self.throttler._task_logs.append(
+        self.throttler._task_logs[rate_limit.limit_id].append(
             TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -144,7 +147,8 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
         for linked_limit, weight in related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
 
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
@@ -168,10 +172,12 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         # Simulate Weighted Task 1 and Task 2 already in task logs, resulting in a used capacity of 6/10
         for linked_limit, weight in task_1_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
         task_2, task_2_related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_2_ID)
         for linked_limit, weight in task_2_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
 
         # Another Task 1(weight=5) will exceed the capacity(11/10)
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -210,10 +216,11 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         # We acquire()'d just one rate_limit, task log should have only one entry
         self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, len(self.throttler._task_logs[rate_limit.limit_id]))
 
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs.append(
+        self.throttler._task_logs[rate_limit.limit_id].append(
             TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
@@ -240,9 +247,11 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         ])
 
         # Scenario where one specific task was executed at 0 milliseconds
-        tasks_log = []
-        tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
-        tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
+        tasks_log = defaultdict(TaskLogWindow)
+        tasks_log[per_millisecond_limit.limit_id].append(
+            TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
+        tasks_log[per_second_limit.limit_id].append(
+            TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
 
         context = AsyncRequestContext(
             task_logs=tasks_log,
@@ -257,8 +266,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self.assertTrue(result)
 
         # Add one more occurrence of the same task but at millisecond 1
-        tasks_log.append(TaskLog(timestamp=1640000000.1000, rate_limit=per_millisecond_limit, weight=1))
-        tasks_log.append(TaskLog(timestamp=1640000000.1000, rate_limit=per_second_limit, weight=1))
+        tasks_log[per_millisecond_limit.limit_id].append(
+            TaskLog(timestamp=1640000000.1000, rate_limit=per_millisecond_limit, weight=1))
+        tasks_log[per_second_limit.limit_id].append(
+            TaskLog(timestamp=1640000000.1000, rate_limit=per_second_limit, weight=1))
 
         time_mock.return_value = 1640000000.1000
         result = context.within_capacity()
@@ -275,3 +286,92 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_task_log_window_keeps_running_weight(self):
+        rate_limit = self.rate_limits[2]
+        window = TaskLogWindow()
+        window.append(TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=5))
+        window.append(TaskLog(timestamp=2.0, rate_limit=rate_limit, weight=3))
+        window.append(TaskLog(timestamp=3.0, rate_limit=rate_limit, weight=1))
+        self.assertEqual(9, window.weight)
+
+        # A task of weight 4 in a limit of 10 needs the first log to leave the window
+        self.assertEqual(4.0, window.time_until_capacity(weight=4, limit=10, window_length=5.0, now=2.0))
+        # A task of weight 7 needs the first two logs to leave the window
+        self.assertEqual(5.0, window.time_until_capacity(weight=7, limit=10, window_length=5.0, now=2.0))
+        self.assertEqual(0.0, window.time_until_capacity(weight=1, limit=10, window_length=5.0, now=2.0))
+
+        window.expire(oldest_timestamp=2.0)
+        self.assertEqual(2, len(window))
+        self.assertEqual(4, window.weight)
+
+    @patch("hummingbot.core.api_throttler.async_throttler.AsyncRequestContext._time")
+    def test_time_until_capacity_uses_the_most_restrictive_linked_limit(self, time_mock):
+        time_mock.return_value = 100.0
+        task_1, task_1_related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        for timestamp in (96.0, 98.0):
+            for linked_limit, weight in [(task_1, task_1.weight)] + task_1_related_limits:
+                self.throttler._task_logs[linked_limit.limit_id].append(
+                    TaskLog(timestamp=timestamp, rate_limit=linked_limit, weight=weight))
+
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=task_1,
+                                      related_limits=task_1_related_limits,
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.assertFalse(context.within_capacity())
+        # The first weighted task leaves the pool window 5 seconds (plus the safety margin) after it was logged
+        self.assertAlmostEqual(96.0 + 5.0 * 1.05 - 100.0, context.time_until_capacity())
+
+    def test_acquire_waits_until_capacity_is_freed_without_polling(self):
+        rate_limit = RateLimit(limit_id="short_limit", limit=1, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+
+        async def acquire_twice():
+            with patch("hummingbot.core.api_throttler.async_request_context_base.asyncio.sleep",
+                       wraps=asyncio.sleep) as sleep_mock:
+                async with throttler.execute_task(limit_id="short_limit"):
+                    pass
+                async with throttler.execute_task(limit_id="short_limit"):
+                    pass
+                return sleep_mock.call_count
+
+        start = time.time()
+        sleep_calls = self.ev_loop.run_until_complete(acquire_twice())
+
+        self.assertGreaterEqual(time.time() - start, 0.2)
+        self.assertLessEqual(sleep_calls, 2)
+        # The first log left the window before the second request was logged
+        self.assertEqual(1, len(throttler._task_logs["short_limit"]))
+
+    @benchmark
+    def test_throughput_benchmark_for_linked_limits(self):
+        requests_per_minute = 10000
+        pool_limit = RateLimit(limit_id="REQUEST_WEIGHT", limit=requests_per_minute * 2, time_interval=60)
+        orders_limit = RateLimit(limit_id="ORDERS", limit=requests_per_minute, time_interval=60)
+        rate_limits = [
+            pool_limit,
+            orders_limit,
+            RateLimit(limit_id="/order", limit=requests_per_minute, time_interval=60, linked_limits=[
+                LinkedLimitWeightPair(pool_limit.limit_id, 1), LinkedLimitWeightPair(orders_limit.limit_id, 1)]),
+            RateLimit(limit_id="/cancel", limit=requests_per_minute, time_interval=60, linked_limits=[
+                LinkedLimitWeightPair(pool_limit.limit_id, 1)]),
+        ]
+        throttler = AsyncThrottler(rate_limits=rate_limits)
+
+        async def run_requests():
+            for i in range(requests_per_minute):
+                async with throttler.execute_task(limit_id="/order" if i % 2 == 0 else "/cancel"):
+                    pass
+
+        start = time.perf_counter()
+        self.ev_loop.run_until_complete(run_requests())
+        elapsed = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(
+            f"Throttled {requests_per_minute} requests across linked limits in {elapsed:.3f}s "
+            f"({requests_per_minute / elapsed:.0f} requests/s)")
+        self.assertEqual(requests_per_minute, throttler._task_logs[pool_limit.limit_id].weight)
+        self.assertEqual(requests_per_minute // 2, throttler._task_logs[orders_limit.limit_id].weight)
+        # All the requests fit in the limits, so the throttler overhead is the only cost
+        self.assertLess(elapsed, 10)
@@ -3,6 +3,10 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +54,82 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_levels_array(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2], [6, 3, 3], [7, 4, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids = order_book.levels_array(False)
+        np.testing.assert_array_equal(bids, [[3, 3, 3, 9], [2, 2, 5, 13], [1, 1, 6, 14]])
+        asks = order_book.levels_array(True, 2)
+        np.testing.assert_array_equal(asks, [[4, 1, 1, 4], [5, 2, 3, 14]])
+        self.assertTrue(asks.flags["C_CONTIGUOUS"])
+
+        # The buffer is reused between calls as long as it is big enough
+        all_asks = order_book.levels_array(True)
+        self.assertEqual(4, len(all_asks))
+        self.assertTrue(np.shares_memory(all_asks, order_book.levels_array(True, 1)))
+
+        order_book.apply_numpy_diffs(np.array([[3, 0, 5]], dtype=np.float64), np.empty((0, 3)))
+        np.testing.assert_array_equal(order_book.levels_array(False), [[2, 2, 2, 4], [1, 1, 3, 5]])
+
+    def test_apply_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot_arrays(np.array([[1.0, 1.0], [2.0, 2.0]]), np.array([[3.0, 1.0]]), 10)
+        self.assertEqual(10, order_book.snapshot_uid)
+        self.assertEqual(2.0, order_book.get_price(False))
+        self.assertEqual(3.0, order_book.get_price(True))
+
+        order_book.apply_diffs_arrays(np.array([[2.0, 0.0], [1.5, 4.0]]), np.empty((0, 2)), 11)
+        self.assertEqual(11, order_book.last_diff_uid)
+        self.assertEqual([(1.5, 4.0, 11), (1.0, 1.0, 10)], [tuple(row) for row in order_book.bid_entries()])
+
+        # Update ids arrays carry the update id of each level
+        order_book.apply_diffs_arrays(
+            np.empty((0, 2)), np.array([[3.0, 2.0], [4.0, 1.0]]), 13, asks_update_ids=np.array([12, 13]))
+        self.assertEqual(13, order_book.last_diff_uid)
+        self.assertEqual([(3.0, 2.0, 12), (4.0, 1.0, 13)], [tuple(row) for row in order_book.ask_entries()])
+
+        # Update ids above 2^53 are kept exactly
+        large_update_id = 2 ** 53 + 1
+        order_book.apply_diffs_arrays(
+            np.array([[1.25, 1.0]]), np.empty((0, 2)), large_update_id,
+            bids_update_ids=np.array([large_update_id], dtype=np.int64))
+        self.assertEqual(large_update_id, order_book.last_diff_uid)
+        self.assertIn((1.25, 1.0, large_update_id), [tuple(row) for row in order_book.bid_entries()])
+
+    def test_update_event_triggered_on_diffs_and_snapshots(self):
+        order_book = OrderBook()
+        update_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.OrderBookUpdateEvent, update_logger)
+
+        order_book.apply_snapshot([OrderBookRow(1.0, 1.0, 1)], [OrderBookRow(2.0, 1.0, 1)], 1)
+        order_book.apply_diffs([OrderBookRow(1.5, 1.0, 2)], [], 2)
+        order_book.apply_diffs_arrays(np.array([[1.5, 0.0]]), np.empty((0, 2)), 3)
+
+        self.assertEqual([1, 2, 3], update_logger.event_log)
+
+    def test_restore_from_snapshot_and_diffs(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT", "update_id": 2, "bids": [["1", "1"]], "asks": [["3", "1"]]}, 1)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": [[str(price), "1"]], "asks": []}, 1)
+            for update_id, price in ((3, 1.5), (4, 0.5))
+        ]
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+
+        self.assertEqual([1.5, 1.0, 0.5], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def test_levels_array_empty_book(self):
+        order_book = OrderBook()
+        self.assertEqual((0, 4), order_book.levels_array(True).shape)
+        self.assertEqual((0, 4), order_book.levels_array(False, 10).shape)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
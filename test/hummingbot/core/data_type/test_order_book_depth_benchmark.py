@@ -0,0 +1,101 @@
+import logging
+import math
+import time
+import unittest
+from test.benchmark_utils import benchmark
+from typing import Iterator
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+def generator_price_for_volume(entries: Iterator[OrderBookRow], volume: float) -> float:
+    """
+    Reference implementation of the depth walk as it was done through the Python row generators.
+    """
+    cumulative_volume = 0
+    for row in entries:
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return float("nan")
+
+
+def generator_vwap_for_volume(entries: Iterator[OrderBookRow], volume: float) -> float:
+    total_cost = 0
+    total_volume = 0
+    for row in entries:
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+        if total_volume >= volume:
+            total_cost -= row.amount * row.price
+            total_volume -= row.amount
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * row.price
+            total_volume += incremental_amount
+            return total_cost / total_volume
+    return float("nan")
+
+
+def generator_volume_for_price(entries: Iterator[OrderBookRow], price: float, is_buy: bool) -> float:
+    cumulative_volume = 0
+    for row in entries:
+        if (is_buy and row.price > price) or (not is_buy and row.price < price):
+            break
+        cumulative_volume += row.amount
+    return cumulative_volume
+
+
+class OrderBookDepthBenchmark(unittest.TestCase):
+    """
+    Compares the native C++ depth walk against the former Python generator based walk on a synthetic 5k levels book.
+    """
+    LEVELS = 5000
+    ITERATIONS = 50
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.order_book = OrderBook()
+        levels = np.arange(1, cls.LEVELS + 1, dtype=np.float64)
+        bids = np.column_stack([1000.0 - levels * 0.01, np.full(cls.LEVELS, 1.5), np.ones(cls.LEVELS)])
+        asks = np.column_stack([1000.0 + levels * 0.01, np.full(cls.LEVELS, 1.5), np.ones(cls.LEVELS)])
+        cls.order_book.apply_numpy_snapshot(bids, asks)
+        # Walk almost the full depth so both implementations touch every level
+        cls.deep_volume = cls.LEVELS * 1.5 - 1
+
+    def _time(self, function) -> float:
+        start = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            function()
+        return time.perf_counter() - start
+
+    def test_native_walk_matches_generator_walk(self):
+        for is_buy in (True, False):
+            entries = self.order_book.ask_entries if is_buy else self.order_book.bid_entries
+            for volume in (0.1, 1.5, 100.0, self.deep_volume, self.LEVELS * 2.0):
+                self.assertTrue(math.isclose(
+                    generator_price_for_volume(entries(), volume),
+                    self.order_book.get_price_for_volume(is_buy, volume).result_price) or (
+                    math.isnan(generator_price_for_volume(entries(), volume))
+                    and math.isnan(self.order_book.get_price_for_volume(is_buy, volume).result_price)))
+                expected_vwap = generator_vwap_for_volume(entries(), volume)
+                vwap = self.order_book.get_vwap_for_volume(is_buy, volume).result_price
+                self.assertTrue(math.isclose(expected_vwap, vwap) or (math.isnan(expected_vwap) and math.isnan(vwap)))
+            for price in (999.0, 1000.0, 1001.0, 1010.0):
+                self.assertAlmostEqual(
+                    generator_volume_for_price(entries(), price, is_buy),
+                    self.order_book.get_volume_for_price(is_buy, price).result_volume)
+
+    @benchmark
+    def test_native_walk_benchmark(self):
+        generator_time = self._time(
+            lambda: generator_vwap_for_volume(self.order_book.ask_entries(), self.deep_volume))
+        native_time = self._time(
+            lambda: self.order_book.get_vwap_for_volume(True, self.deep_volume))
+        logging.getLogger(__name__).info(
+            f"VWAP over {self.LEVELS} levels x {self.ITERATIONS}: generator {generator_time:.4f}s, "
+            f"native {native_time:.4f}s ({generator_time / max(native_time, 1e-9):.1f}x)")
+        self.assertLess(native_time, generator_time)
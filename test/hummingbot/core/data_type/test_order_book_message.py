@@ -1,6 +1,8 @@
 import time
 import unittest
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -119,6 +121,23 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_bids_and_asks_are_parsed_once(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 1,
+                "asks": [("1.5", "2", "ignored"), ("3", "4")],
+                "bids": [],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertIs(msg.asks, msg.asks)
+        self.assertIs(msg.asks_array, msg.asks_array)
+        np.testing.assert_array_equal(np.array([[1.5, 2.0], [3.0, 4.0]]), msg.asks_array)
+        self.assertEqual(np.float64, msg.asks_array.dtype)
+        self.assertEqual((0, 2), msg.bids_array.shape)
+
     def test_has_update_id(self):
         update_id = "someId"
 
@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import (
+    INDEX_FILE_EXTENSION,
+    SEGMENT_FILE_EXTENSION,
+    OrderBookRecorder,
+    OrderBookRecording,
+)
+
+
+class OrderBookRecorderTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+    @staticmethod
+    def _snapshot(trading_pair: str, update_id: int, price: float = 100.0) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": [[str(price - 1), "1.5"], [str(price - 2), "2"]],
+            "asks": [[str(price + 1), "0.5"]],
+        }, timestamp=update_id)
+
+    @staticmethod
+    def _diff(trading_pair: str, update_id: int, price: float = 100.0) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "first_update_id": update_id,
+            "update_id": update_id,
+            "bids": [[price - 1, update_id]],
+            "asks": [],
+        }, timestamp=update_id)
+
+    @staticmethod
+    def _trade(trading_pair: str, trade_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": trading_pair,
+            "trade_type": float(TradeType.SELL.value),
+            "trade_id": trade_id,
+            "update_id": trade_id,
+            "price": "100.5",
+            "amount": "0.25",
+        }, timestamp=trade_id)
+
+    def _record(self, recorder: OrderBookRecorder, messages: List[OrderBookMessage]):
+        for message in messages:
+            recorder.record(message, timestamp=message.timestamp)
+
+    def test_messages_are_replayed_with_their_content(self):
+        recorder = OrderBookRecorder(self.path)
+        messages = [self._snapshot("BTC-USDT", 1), self._diff("BTC-USDT", 2), self._trade("BTC-USDT", 3)]
+        self._record(recorder, messages)
+        recorder.close()
+
+        recording = OrderBookRecording(self.path)
+        snapshot = recording.get_snapshot("BTC-USDT")
+        replayed = list(recording.iter_messages(["BTC-USDT"]))
+
+        self.assertEqual(1, recorder.segments_count)
+        self.assertEqual(3, recorder.messages_count)
+        self.assertEqual(["BTC-USDT"], recording.trading_pairs)
+        self.assertEqual(1, snapshot.update_id)
+        np.testing.assert_array_equal(np.array([[99.0, 1.5], [98.0, 2.0]]), snapshot.bids_array)
+        np.testing.assert_array_equal(np.array([[101.0, 0.5]]), snapshot.asks_array)
+        self.assertEqual([2, 3], [recorded_timestamp for recorded_timestamp, _ in replayed])
+        diff = replayed[0][1]
+        self.assertEqual(OrderBookMessageType.DIFF, diff.type)
+        self.assertEqual(2, diff.first_update_id)
+        self.assertEqual([(99.0, 2.0, 2)], [tuple(row) for row in diff.bids])
+        self.assertEqual(0, len(diff.asks_array))
+        trade = replayed[1][1]
+        self.assertEqual(OrderBookMessageType.TRADE, trade.type)
+        self.assertEqual(messages[2].content, trade.content)
+        self.assertEqual(3, trade.timestamp)
+
+    def test_messages_of_the_selected_pairs_are_replayed_in_recording_order(self):
+        recorder = OrderBookRecorder(self.path)
+        self._record(recorder, [
+            self._snapshot("BTC-USDT", 1),
+            self._snapshot("ETH-USDT", 2),
+            self._snapshot("SOL-USDT", 3),
+            self._diff("ETH-USDT", 4),
+            self._diff("BTC-USDT", 5),
+            self._diff("SOL-USDT", 6),
+            self._diff("ETH-USDT", 7),
+        ])
+        recorder.close()
+
+        replayed = list(OrderBookRecording(self.path).iter_messages(["ETH-USDT", "BTC-USDT"]))
+
+        self.assertEqual([("ETH-USDT", 4), ("BTC-USDT", 5), ("ETH-USDT", 7)],
+                         [(message.trading_pair, message.update_id) for _, message in replayed])
+
+    def test_segments_start_with_the_current_snapshots(self):
+        recorder = OrderBookRecorder(self.path, max_segment_duration=10)
+        current_update_id = 0
+        recorder.set_snapshots_provider(lambda: [self._snapshot("BTC-USDT", current_update_id - 1)])
+        recorder.record(self._snapshot("BTC-USDT", 0), timestamp=0)
+        for current_update_id in range(1, 26):
+            recorder.record(self._diff("BTC-USDT", current_update_id), timestamp=current_update_id)
+        recorder.close()
+
+        recording = OrderBookRecording(self.path)
+
+        self.assertEqual(3, recorder.segments_count)
+        self.assertEqual(3, len(recording.segments))
+        self.assertTrue(all(os.path.exists(segment[:-len(SEGMENT_FILE_EXTENSION)] + INDEX_FILE_EXTENSION)
+                            for segment in recording.segments))
+        # The segments after the first one start at 10 and 20 with the snapshot of the book before the diff recorded
+        # at that time
+        self.assertEqual(0, recording.get_snapshot("BTC-USDT").update_id)
+        self.assertEqual(9, recording.get_snapshot("BTC-USDT", timestamp=15).update_id)
+        self.assertEqual(19, recording.get_snapshot("BTC-USDT", timestamp=100).update_id)
+        self.assertEqual(
+            [(OrderBookMessageType.DIFF, update_id) for update_id in range(10, 20)]
+            + [(OrderBookMessageType.SNAPSHOT, 19)]
+            + [(OrderBookMessageType.DIFF, update_id) for update_id in range(20, 26)],
+            [(message.type, message.update_id) for _, message in recording.iter_messages(["BTC-USDT"], 15)])
+        self.assertEqual(list(range(10, 18)),
+                         [message.update_id for _, message in recording.iter_messages(["BTC-USDT"], 15, 17)])
+
+    def test_index_is_rebuilt_for_segments_without_index(self):
+        recorder = OrderBookRecorder(self.path)
+        self._record(recorder, [self._snapshot("BTC-USDT", 1), self._diff("BTC-USDT", 2), self._trade("BTC-USDT", 3)])
+        recorder.flush()
+
+        replayed = list(OrderBookRecording(self.path).iter_messages(["BTC-USDT"]))
+
+        self.assertEqual([OrderBookMessageType.DIFF, OrderBookMessageType.TRADE],
+                         [message.type for _, message in replayed])
+        recorder.close()
+
+    def test_recording_is_smaller_than_json_lines(self):
+        messages_count = 5000
+        levels = 20
+        rng = np.random.default_rng(0)
+        messages = [self._snapshot("BTC-USDT", 0)]
+        for update_id in range(1, messages_count):
+            messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "BTC-USDT",
+                "first_update_id": update_id,
+                "update_id": update_id,
+                "bids": [[f"{price:.2f}", f"{amount:.4f}"]
+                         for price, amount in zip(rng.uniform(90, 100, levels), rng.uniform(0, 5, levels))],
+                "asks": [[f"{price:.2f}", f"{amount:.4f}"]
+                         for price, amount in zip(rng.uniform(100, 110, levels), rng.uniform(0, 5, levels))],
+            }, timestamp=update_id))
+
+        json_file_path = os.path.join(self.path, "messages.txt")
+        start = time.perf_counter()
+        with open(json_file_path, "w") as json_file:
+            for message in messages:
+                json_file.write(json.dumps({"ts": message.timestamp, **message.content}) + "\n")
+        json_time = time.perf_counter() - start
+
+        recorder = OrderBookRecorder(os.path.join(self.path, "recording"))
+        start = time.perf_counter()
+        for message in messages:
+            recorder.record(message, timestamp=message.timestamp)
+        recorder.close()
+        recording_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        replayed_count = sum(1 for _ in OrderBookRecording(recorder.path).iter_messages(["BTC-USDT"]))
+        replay_time = time.perf_counter() - start
+
+        json_size = os.path.getsize(json_file_path)
+        logging.getLogger(__name__).info(
+            f"{messages_count} diffs of {levels} levels per side: {json_size / 1e6:.2f}MB and {json_time * 1e3:.0f}ms "
+            f"as JSON lines, {recorder.bytes_recorded / 1e6:.2f}MB and {recording_time * 1e3:.0f}ms recorded, "
+            f"{replay_time * 1e3:.0f}ms to read back")
+        self.assertEqual(messages_count - 1, replayed_count)
+        self.assertLess(recorder.bytes_recorded, json_size)
@@ -0,0 +1,354 @@
+import asyncio
+import shutil
+import tempfile
+from collections import deque
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookRecording
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+        self.data_source = MagicMock()
+        self.tracker_tasks: List[asyncio.Task] = []
+
+    async def asyncTearDown(self):
+        for task in self.tracker_tasks:
+            task.cancel()
+        await super().asyncTearDown()
+
+    def _create_tracker(self, **kwargs) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs, **kwargs)
+        tracker._track_single_book = AsyncMock()
+        return tracker
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker._sleep", new_callable=AsyncMock)
+    async def test_sequential_initialization(self, sleep_mock):
+        self.data_source.get_new_order_book = AsyncMock(side_effect=lambda trading_pair: OrderBook())
+        tracker = self._create_tracker()
+
+        await tracker._init_order_books()
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(self.trading_pairs, tracker.ready_trading_pairs)
+        self.assertEqual(len(self.trading_pairs), sleep_mock.await_count)
+        for trading_pair in self.trading_pairs:
+            self.assertTrue(tracker.is_order_book_ready(trading_pair))
+            self.assertIn(trading_pair, tracker.order_books)
+
+    async def test_concurrent_initialization_flags_each_book_ready_as_it_arrives(self):
+        snapshots: Dict[str, asyncio.Future] = {
+            trading_pair: asyncio.get_event_loop().create_future() for trading_pair in self.trading_pairs
+        }
+        in_flight_requests = 0
+        max_in_flight_requests = 0
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            nonlocal in_flight_requests, max_in_flight_requests
+            in_flight_requests += 1
+            max_in_flight_requests = max(max_in_flight_requests, in_flight_requests)
+            try:
+                return await snapshots[trading_pair]
+            finally:
+                in_flight_requests -= 1
+
+        self.data_source.get_new_order_book = get_new_order_book
+        tracker = self._create_tracker(max_concurrent_initializations=2)
+        init_task = asyncio.ensure_future(tracker._init_order_books())
+        self.tracker_tasks.append(init_task)
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        self.assertEqual(2, max_in_flight_requests)
+        self.assertEqual([], tracker.ready_trading_pairs)
+
+        snapshots["COINBETA-HBOT"].set_result(OrderBook())
+        await tracker.wait_order_book_ready("COINBETA-HBOT")
+        await asyncio.sleep(0)
+
+        self.assertEqual(["COINBETA-HBOT"], tracker.ready_trading_pairs)
+        self.assertFalse(tracker.ready)
+
+        snapshots["COINALPHA-HBOT"].set_result(OrderBook())
+        snapshots["COINGAMMA-HBOT"].set_result(OrderBook())
+        await init_task
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(self.trading_pairs, tracker.ready_trading_pairs)
+        self.assertEqual(2, max_in_flight_requests)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker._sleep", new_callable=AsyncMock)
+    async def test_concurrent_initialization_retries_failed_snapshots(self, sleep_mock):
+        failures = {"COINGAMMA-HBOT": 1}
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            if failures.get(trading_pair, 0) > 0:
+                failures[trading_pair] -= 1
+                raise IOError("Test error")
+            return OrderBook()
+
+        self.data_source.get_new_order_book = get_new_order_book
+        tracker = self._create_tracker(max_concurrent_initializations=5)
+
+        await tracker._init_order_books()
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(self.trading_pairs, tracker.ready_trading_pairs)
+        sleep_mock.assert_awaited_once_with(delay=5)
+
+    async def test_stop_clears_readiness(self):
+        self.data_source.get_new_order_book = AsyncMock(side_effect=lambda trading_pair: OrderBook())
+        tracker = self._create_tracker(max_concurrent_initializations=3)
+        await tracker._init_order_books()
+
+        tracker.stop()
+
+        self.assertFalse(tracker.ready)
+        self.assertEqual([], tracker.ready_trading_pairs)
+        self.assertFalse(tracker.is_order_book_ready("UNKNOWN-PAIR"))
+
+    def _diff_message(self, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pairs[0], "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=update_id)
+
+    def _book_with_diffs(self, diff_messages: List[OrderBookMessage], coalesce_diffs: bool) -> OrderBook:
+        trading_pair = self.trading_pairs[0]
+        tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, coalesce_diffs=coalesce_diffs)
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 0)
+        tracker._order_books[trading_pair] = order_book
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        for diff_message in diff_messages:
+            tracker._tracking_message_queues[trading_pair].put_nowait(diff_message)
+        self.trackers.append(tracker)
+        return order_book
+
+    async def _process_queued_messages(self, tracker: OrderBookTracker):
+        trading_pair = self.trading_pairs[0]
+        task = asyncio.ensure_future(tracker._track_single_book(trading_pair))
+        self.tracker_tasks.append(task)
+        while not tracker._tracking_message_queues[trading_pair].empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    async def test_coalesced_diffs_produce_the_same_book_as_individual_diffs(self):
+        diff_messages = [
+            self._diff_message(1, bids=[[10.0, 1.0], [9.0, 2.0]], asks=[[11.0, 1.0], [12.0, 3.0]]),
+            self._diff_message(2, bids=[[10.0, 0.0], [8.0, 4.0]], asks=[[11.0, 5.0]]),
+            self._diff_message(3, bids=[[9.5, 1.0]], asks=[[12.0, 0.0], [13.0, 2.0]]),
+            self._diff_message(4, bids=[[8.0, 3.0]], asks=[]),
+        ]
+        self.trackers: List[OrderBookTracker] = []
+        individual_book = self._book_with_diffs(diff_messages, coalesce_diffs=False)
+        coalesced_book = self._book_with_diffs(diff_messages, coalesce_diffs=True)
+
+        for tracker in self.trackers:
+            await self._process_queued_messages(tracker)
+
+        self.assertEqual(individual_book.snapshot[0].values.tolist(), coalesced_book.snapshot[0].values.tolist())
+        self.assertEqual(individual_book.snapshot[1].values.tolist(), coalesced_book.snapshot[1].values.tolist())
+        self.assertEqual([[9.5, 1.0, 3], [9.0, 2.0, 1], [8.0, 3.0, 4]], coalesced_book.snapshot[0].values.tolist())
+        self.assertEqual([[11.0, 5.0, 2], [13.0, 2.0, 3]], coalesced_book.snapshot[1].values.tolist())
+        self.assertEqual(4, coalesced_book.last_diff_uid)
+        self.assertEqual({}, self.trackers[0].diff_messages_coalesced)
+        self.assertEqual({self.trading_pairs[0]: 3}, self.trackers[1].diff_messages_coalesced)
+        self.assertEqual(4, len(self.trackers[1]._past_diffs_windows[self.trading_pairs[0]]))
+
+    def test_coalesced_levels_keep_update_ids_above_float_precision(self):
+        first_update_id = 1_700_000_000_000_000_001
+        second_update_id = first_update_id + 2
+
+        levels, update_ids = OrderBookTracker._coalesce_levels([
+            (np.array([[10.0, 1.0], [9.0, 2.0]]), first_update_id),
+            (np.array([[10.0, 3.0]]), second_update_id),
+        ])
+
+        self.assertEqual([[9.0, 2.0], [10.0, 3.0]], levels.tolist())
+        self.assertEqual([first_update_id, second_update_id], update_ids.tolist())
+
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 0)
+        order_book.apply_diffs_arrays(levels, np.empty((0, 2)), second_update_id, update_ids)
+        self.assertEqual([(10.0, 3.0, second_update_id), (9.0, 2.0, first_update_id)],
+                         [tuple(row) for row in order_book.bid_entries()])
+
+    def test_pending_diff_messages_stop_at_snapshot(self):
+        snapshot_message = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pairs[0], "update_id": 3, "bids": [], "asks": []},
+            timestamp=3)
+        message_queue = asyncio.Queue()
+        for message in (self._diff_message(2, [], []), snapshot_message, self._diff_message(4, [], [])):
+            message_queue.put_nowait(message)
+        saved_messages = deque()
+
+        diff_messages = OrderBookTracker._pending_diff_messages(
+            self._diff_message(1, [], []), [deque(), saved_messages], message_queue)
+
+        self.assertEqual([1, 2], [diff_message.update_id for diff_message in diff_messages])
+        self.assertEqual([snapshot_message], list(saved_messages))
+        self.assertEqual(1, message_queue.qsize())
+
+    def _sequenced_diff_message(self, first_update_id: int, update_id: int, bids: List) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pairs[0], "first_update_id": first_update_id, "update_id": update_id,
+             "bids": bids, "asks": []},
+            timestamp=update_id)
+
+    def _gap_detecting_tracker(self, diff_messages: List[OrderBookMessage], **kwargs) -> OrderBookTracker:
+        trading_pair = self.trading_pairs[0]
+        tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, detect_sequence_gaps=True, **kwargs)
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 10)
+        tracker._order_books[trading_pair] = order_book
+        tracker._last_update_ids[trading_pair] = 10
+        tracker._order_book_ready_events[trading_pair].set()
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        for diff_message in diff_messages:
+            tracker._tracking_message_queues[trading_pair].put_nowait(diff_message)
+        return tracker
+
+    async def test_consecutive_diffs_are_applied_and_stale_diffs_dropped(self):
+        tracker = self._gap_detecting_tracker([
+            self._sequenced_diff_message(5, 9, bids=[[1.0, 1.0]]),
+            self._sequenced_diff_message(9, 12, bids=[[2.0, 1.0]]),
+            self._sequenced_diff_message(13, 15, bids=[[3.0, 1.0]]),
+        ])
+        self.data_source.get_order_book_snapshot_message = AsyncMock()
+
+        await self._process_queued_messages(tracker)
+
+        order_book = tracker.order_books[self.trading_pairs[0]]
+        self.assertEqual([3.0, 2.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(15, order_book.last_diff_uid)
+        self.assertEqual({}, tracker.sequence_gaps)
+        self.data_source.get_order_book_snapshot_message.assert_not_awaited()
+
+    async def test_sequence_gap_resyncs_book_and_replays_buffered_diffs(self):
+        trading_pair = self.trading_pairs[0]
+        snapshot_requested = asyncio.Event()
+        snapshot_response = asyncio.get_event_loop().create_future()
+
+        async def get_order_book_snapshot_message(requested_trading_pair: str) -> OrderBookMessage:
+            snapshot_requested.set()
+            return await snapshot_response
+
+        self.data_source.get_order_book_snapshot_message = get_order_book_snapshot_message
+        tracker = self._gap_detecting_tracker([
+            self._sequenced_diff_message(11, 12, bids=[[1.0, 1.0]]),
+            # Messages 13 and 14 are missing
+            self._sequenced_diff_message(15, 16, bids=[[2.0, 1.0]]),
+        ])
+        task = asyncio.ensure_future(tracker._track_single_book(trading_pair))
+        self.tracker_tasks.append(task)
+        await snapshot_requested.wait()
+
+        self.assertEqual([trading_pair], tracker.quarantined_trading_pairs)
+        self.assertFalse(tracker.is_order_book_ready(trading_pair))
+        self.assertEqual({trading_pair: 1}, tracker.sequence_gaps)
+
+        # Diffs received during the resync are buffered
+        tracker._tracking_message_queues[trading_pair].put_nowait(
+            self._sequenced_diff_message(17, 18, bids=[[4.0, 1.0]]))
+        snapshot_response.set_result(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": trading_pair, "update_id": 16, "bids": [[1.0, 1.0], [5.0, 2.0]], "asks": []},
+            timestamp=16))
+        await tracker.wait_order_book_ready(trading_pair)
+        await self._process_queued_messages(tracker)
+
+        order_book = tracker.order_books[trading_pair]
+        # The diff 15-16 is already included in the snapshot
+        self.assertEqual([5.0, 4.0, 1.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(18, order_book.last_diff_uid)
+        self.assertEqual([], tracker.quarantined_trading_pairs)
+        self.assertEqual({trading_pair: 1}, tracker.sequence_gaps)
+        self.assertEqual(1, tracker.resync_latencies[trading_pair].count)
+
+    async def test_sequence_gap_replays_every_coalesced_diff_after_the_gap(self):
+        trading_pair = self.trading_pairs[0]
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": trading_pair, "update_id": 16, "bids": [[1.0, 1.0]], "asks": []},
+            timestamp=16)
+        self.data_source.get_order_book_snapshot_message = AsyncMock(return_value=snapshot)
+        # More diffs after the gap than the saved messages queue can hold
+        diffs_after_gap = [self._sequenced_diff_message(update_id, update_id, bids=[[float(update_id), 1.0]])
+                           for update_id in range(17, 1517)]
+        tracker = self._gap_detecting_tracker([
+            self._sequenced_diff_message(11, 12, bids=[[1.0, 1.0]]),
+            # Messages 13 and 14 are missing
+            self._sequenced_diff_message(15, 16, bids=[[2.0, 1.0]]),
+        ] + diffs_after_gap, coalesce_diffs=True)
+
+        await self._process_queued_messages(tracker)
+        while len(tracker._resync_message_buffers[trading_pair]) > 0:
+            await asyncio.sleep(0)
+
+        order_book = tracker.order_books[trading_pair]
+        self.assertEqual(1516, order_book.last_diff_uid)
+        self.assertEqual(1501, len(list(order_book.bid_entries())))
+        self.assertEqual({trading_pair: 1}, tracker.sequence_gaps)
+        self.data_source.get_order_book_snapshot_message.assert_awaited_once_with(trading_pair)
+
+    async def test_sequence_gaps_ignored_when_detection_disabled(self):
+        self.trackers: List[OrderBookTracker] = []
+        order_book = self._book_with_diffs([
+            self._sequenced_diff_message(1, 2, bids=[[1.0, 1.0]]),
+            self._sequenced_diff_message(5, 6, bids=[[2.0, 1.0]]),
+        ], coalesce_diffs=False)
+
+        await self._process_queued_messages(self.trackers[0])
+
+        self.assertEqual([2.0, 1.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual({}, self.trackers[0].sequence_gaps)
+
+    async def test_recording_stores_the_initial_snapshots_and_the_received_messages(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+
+        def new_order_book(trading_pair: str) -> OrderBook:
+            order_book = OrderBook()
+            order_book.apply_snapshot([OrderBookRow(99, 1, 5)], [OrderBookRow(101, 2, 5)], 5)
+            return order_book
+
+        self.data_source.get_new_order_book = AsyncMock(side_effect=new_order_book)
+        tracker = self._create_tracker(max_concurrent_initializations=3)
+        await tracker._init_order_books_concurrently()
+        tracker.start_recording(OrderBookRecorder(path))
+        self.tracker_tasks.append(asyncio.ensure_future(tracker._order_book_diff_router()))
+        tracker._order_book_diff_stream.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT", "update_id": 6, "bids": [[100, 1]], "asks": [],
+        }, timestamp=1))
+        while not tracker._order_book_diff_stream.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        recorder = tracker.recorder
+        tracker.stop_recording()
+
+        recording = OrderBookRecording(path)
+        snapshot = recording.get_snapshot("COINALPHA-HBOT")
+
+        self.assertIsNone(tracker.recorder)
+        self.assertEqual(len(self.trading_pairs) + 1, recorder.messages_count)
+        self.assertEqual(sorted(self.trading_pairs), recording.trading_pairs)
+        self.assertEqual(5, snapshot.update_id)
+        self.assertEqual([[99, 1]], snapshot.bids_array.tolist())
+        self.assertEqual([[101, 2]], snapshot.asks_array.tolist())
+        self.assertEqual([6], [message.update_id for _, message in recording.iter_messages(["COINALPHA-HBOT"])])
@@ -0,0 +1,115 @@
+import asyncio
+import math
+import shutil
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import patch
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_data_source import ReplayOrderBookDataSource
+
+
+class ReplayOrderBookDataSourceTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "BTC-USDT"
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        recorder = OrderBookRecorder(self.path)
+        for recorded_timestamp, message in [
+            (1.0, OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": self.trading_pair,
+                "update_id": 1,
+                "bids": [["99", "1"], ["98", "2"]],
+                "asks": [["101", "1"], ["102", "2"]],
+            }, timestamp=1.0)),
+            (2.0, OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": self.trading_pair,
+                "update_id": 2,
+                "bids": [["99", "0"], ["100", "3"]],
+                "asks": [],
+            }, timestamp=2.0)),
+            (3.0, OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": self.trading_pair,
+                "trade_type": float(TradeType.BUY.value),
+                "trade_id": 1,
+                "update_id": 3,
+                "price": "101",
+                "amount": "0.5",
+            }, timestamp=3.0)),
+            (4.0, OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": self.trading_pair,
+                "update_id": 4,
+                "bids": [],
+                "asks": [["101", "0.5"]],
+            }, timestamp=4.0)),
+        ]:
+            recorder.record(message, timestamp=recorded_timestamp)
+        recorder.close()
+
+    async def test_tracker_replays_the_recorded_order_book(self):
+        data_source = ReplayOrderBookDataSource(trading_pairs=[self.trading_pair], recording=self.path, speed=0)
+        tracker = OrderBookTracker(
+            data_source=data_source, trading_pairs=[self.trading_pair], max_concurrent_initializations=2)
+        tracker.start()
+        self.addCleanup(tracker.stop)
+
+        await asyncio.wait_for(tracker.wait_ready(), timeout=5)
+        await asyncio.wait_for(data_source.replay_finished.wait(), timeout=5)
+        order_book = tracker.order_books[self.trading_pair]
+        for _ in range(100):
+            if order_book.last_diff_uid == 4 and order_book.last_trade_price == 101:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(3, data_source.messages_replayed)
+        self.assertEqual([(100.0, 3.0), (98.0, 2.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(101.0, 0.5), (102.0, 2.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
+        self.assertEqual(101, order_book.last_trade_price)
+
+    async def test_replay_keeps_the_recorded_time_between_messages(self):
+        data_source = ReplayOrderBookDataSource(trading_pairs=[self.trading_pair], recording=self.path, speed=20)
+        clock = [100.0]
+        sleeps = []
+
+        async def fake_sleep(delay: float):
+            sleeps.append(delay)
+            clock[0] += delay
+
+        with patch.object(data_source, "_time", lambda: clock[0]), patch.object(data_source, "_sleep", fake_sleep):
+            await data_source.listen_for_subscriptions()
+
+        # Two seconds of recording after the first replayed message, at 20x
+        self.assertEqual(3, len(sleeps))
+        for expected_delay, delay in zip([0, 0.05, 0.05], sleeps):
+            self.assertAlmostEqual(expected_delay, delay)
+        self.assertAlmostEqual(100.1, clock[0])
+        self.assertTrue(data_source.replay_finished.is_set())
+
+    async def test_replay_starts_from_the_snapshot_before_the_start_timestamp(self):
+        data_source = ReplayOrderBookDataSource(
+            trading_pairs=[self.trading_pair], recording=self.path, speed=0, start_timestamp=3.5)
+
+        order_book = await data_source.get_new_order_book(self.trading_pair)
+        await data_source.listen_for_subscriptions()
+
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(3, data_source.messages_replayed)
+
+    async def test_last_traded_prices(self):
+        data_source = ReplayOrderBookDataSource(trading_pairs=[self.trading_pair], recording=self.path, speed=0)
+
+        await data_source.get_new_order_book(self.trading_pair)
+        prices = await data_source.get_last_traded_prices([self.trading_pair, "ETH-USDT"])
+
+        self.assertEqual(100, prices[self.trading_pair])
+        self.assertTrue(math.isnan(prices["ETH-USDT"]))
+
+        await data_source.listen_for_subscriptions()
+        prices = await data_source.get_last_traded_prices([self.trading_pair])
+
+        self.assertEqual(101, prices[self.trading_pair])
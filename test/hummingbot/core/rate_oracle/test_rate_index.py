@@ -0,0 +1,135 @@
+import logging
+import random
+import time
+import unittest
+from decimal import Decimal
+from test.benchmark_utils import benchmark
+
+from hummingbot.core.rate_oracle.rate_index import RateIndex
+from hummingbot.core.rate_oracle.utils import find_rate
+
+
+class RateIndexTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+
+    @staticmethod
+    def _coin_gecko_prices(tokens_count: int) -> dict:
+        # Same shape as the CoinGecko rate source prices: every token quoted in the global token, plus a few cross pairs
+        generator = random.Random(42)
+        prices = {f"TOKEN{i}-USD": Decimal(str(round(generator.uniform(0.01, 1000), 6))) for i in range(tokens_count)}
+        prices.update({f"TOKEN{i}-BTC": Decimal(str(round(generator.uniform(0.0001, 1), 8))) for i in range(0, 100, 7)})
+        prices["BTC-USD"] = Decimal("30000")
+        return prices
+
+    def test_rates_match_find_rate(self):
+        index = RateIndex(self.prices)
+
+        for pair in ["HBOT-USDT", "ZBOT-USDT", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP", "HBOT-HBOT",
+                     "WETH-ETH"]:
+            self.assertEqual(find_rate(self.prices, pair), index.find_rate(pair), pair)
+
+    def test_routes_starting_with_an_inverted_price(self):
+        index = RateIndex(self.prices)
+
+        self.assertIsNone(find_rate(self.prices, "GBP-HBOT"))
+        self.assertEqual(Decimal("1") / Decimal("0.75") / Decimal("100"), index.find_rate("GBP-HBOT"))
+
+    def test_rates_match_find_rate_on_large_price_set(self):
+        prices = self._coin_gecko_prices(500)
+        index = RateIndex(prices)
+        generator = random.Random(1)
+        tokens = ["USD", "BTC"] + [f"TOKEN{i}" for i in range(500)]
+
+        for _ in range(500):
+            pair = f"{generator.choice(tokens)}-{generator.choice(tokens)}"
+            self.assertEqual(find_rate(prices, pair), index.find_rate(pair), pair)
+
+    def test_max_hops(self):
+        prices = {"A-B": Decimal("2"), "B-C": Decimal("3"), "C-D": Decimal("4")}
+
+        self.assertIsNone(RateIndex(prices).find_rate("A-D"))
+        self.assertEqual(Decimal("24"), RateIndex(prices, max_hops=3).find_rate("A-D"))
+        self.assertEqual(Decimal("1") / Decimal("4") / Decimal("3") / Decimal("2"),
+                         RateIndex(prices, max_hops=3).find_rate("D-A"))
+
+    def test_shortest_route_is_used(self):
+        index = RateIndex({"A-B": Decimal("2"), "B-C": Decimal("3"), "C-D": Decimal("4")}, max_hops=3)
+        self.assertEqual(Decimal("24"), index.find_rate("A-D"))
+
+        index["D-A"] = Decimal("0.05")
+
+        self.assertEqual(Decimal("20"), index.find_rate("A-D"))
+
+    def test_price_refresh_updates_rates_and_keeps_routes(self):
+        index = RateIndex(self.prices)
+        self.assertEqual(Decimal("75"), index.find_rate("HBOT-GBP"))
+        routes = dict(index._routes)
+
+        index.update({"HBOT-USDT": Decimal("200"), "USDT-GBP": Decimal("0.8")})
+
+        self.assertEqual(Decimal("160"), index.find_rate("HBOT-GBP"))
+        self.assertEqual(routes, index._routes)
+
+    def test_new_pair_invalidates_missing_routes(self):
+        index = RateIndex(self.prices)
+        self.assertIsNone(index.find_rate("ZBOT-GBP"))
+
+        index["ZBOT-USDT"] = Decimal("4")
+
+        self.assertEqual(Decimal("3"), index.find_rate("ZBOT-GBP"))
+
+    def test_removed_pair_is_not_used(self):
+        index = RateIndex(self.prices)
+        self.assertEqual(Decimal("2"), index.find_rate("HBOT-AAVE"))
+
+        del index["AAVE-USDT"]
+
+        self.assertIsNone(index.find_rate("HBOT-AAVE"))
+        self.assertNotIn("AAVE-USDT", index)
+        self.assertEqual(2, len(index))
+
+    def test_clear(self):
+        index = RateIndex(self.prices)
+        index.find_rate("HBOT-GBP")
+
+        index.clear()
+
+        self.assertEqual(0, len(index))
+        self.assertIsNone(index.find_rate("HBOT-GBP"))
+
+    def test_copy_returns_prices_dictionary(self):
+        index = RateIndex(self.prices)
+
+        prices = index.copy()
+
+        self.assertEqual(self.prices, prices)
+        self.assertIsInstance(prices, dict)
+
+    @benchmark
+    def test_lookup_benchmark_against_find_rate(self):
+        prices = self._coin_gecko_prices(3000)
+        index = RateIndex(prices)
+        generator = random.Random(2)
+        pairs = [f"TOKEN{generator.randrange(3000)}-TOKEN{generator.randrange(3000)}" for _ in range(200)]
+        rounds = 5
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            expected_rates = [find_rate(prices, pair) for pair in pairs]
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            # The rate oracle refreshes all the prices between lookups
+            index.update(prices)
+            rates = [index.find_rate(pair) for pair in pairs]
+        index_time = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(
+            f"{rounds} x {len(pairs)} lookups on {len(prices)} prices: find_rate {scan_time * 1e3:.1f} ms, "
+            f"rate index {index_time * 1e3:.1f} ms ({scan_time / max(index_time, 1e-9):.1f}x)")
+        self.assertEqual(expected_rates, rates)
+        self.assertLess(index_time, scan_time)
@@ -99,3 +99,28 @@ class RateOracleTest(IsolatedAsyncioWrapperTestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    def test_get_pair_rate_uses_updated_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(Decimal("75"), rate_oracle.get_pair_rate("HBOT-GBP"))
+
+        rate_oracle.set_price("USDT-GBP", Decimal("0.8"))
+        self.assertEqual(Decimal("80"), rate_oracle.get_pair_rate("HBOT-GBP"))
+
+        rate_oracle.set_price("COINALPHA-HBOT", Decimal("2"))
+        self.assertEqual(Decimal("200"), rate_oracle.get_pair_rate("COINALPHA-USDT"))
+
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}), max_conversion_hops=3)
+        rate_oracle._prices = {"COINALPHA-HBOT": Decimal("2"), "HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(Decimal("150"), rate_oracle.get_pair_rate("COINALPHA-GBP"))
+
+    def test_get_pair_rate_uses_routes_find_rate_does_not_try(self):
+        prices = {"USDT-HBOT": Decimal("0.01"), "USDT-GBP": Decimal("0.75")}
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = prices
+
+        # find_rate only starts routes from pairs with the base token as base
+        self.assertIsNone(find_rate(prices, "HBOT-GBP"))
+        self.assertEqual(Decimal("75"), rate_oracle.get_pair_rate("HBOT-GBP"))
+        self.assertEqual(find_rate(prices, "HBOT-USDT"), rate_oracle.get_pair_rate("HBOT-USDT"))
@@ -0,0 +1,56 @@
+import math
+from unittest import TestCase
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTests(TestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertTrue(math.isnan(histogram.mean))
+        self.assertTrue(math.isnan(histogram.min))
+        self.assertTrue(math.isnan(histogram.max))
+        self.assertTrue(math.isnan(histogram.percentile(50)))
+
+    def test_record_latencies(self):
+        histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1, 1))
+        for latency in (0.005, 0.01, 0.05, 0.2, 3):
+            histogram.record(latency)
+
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(3.265, histogram.total)
+        self.assertAlmostEqual(0.653, histogram.mean)
+        self.assertEqual(0.005, histogram.min)
+        self.assertEqual(3, histogram.max)
+        self.assertEqual([(0.01, 2), (0.1, 1), (1, 1), (math.inf, 1)], histogram.buckets)
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1, 1))
+        for _ in range(90):
+            histogram.record(0.005)
+        for _ in range(9):
+            histogram.record(0.05)
+        histogram.record(2)
+
+        self.assertEqual(0.01, histogram.percentile(50))
+        self.assertEqual(0.01, histogram.percentile(90))
+        self.assertEqual(0.1, histogram.percentile(99))
+        self.assertEqual(2, histogram.percentile(100))
+
+    def test_percentile_capped_to_max_latency(self):
+        histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1, 1))
+        histogram.record(0.02)
+
+        self.assertEqual(0.02, histogram.percentile(50))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.1)
+
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertTrue(all(count == 0 for _, count in histogram.buckets))
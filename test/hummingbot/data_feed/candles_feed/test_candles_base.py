@@ -90,6 +90,38 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_is_rebuilt_only_when_candles_change(self):
+        candles = self._candles_data_mock()
+        self.data_feed._candles.extend(list(candles)[:-1])
+
+        with patch.object(self.data_feed, "_build_candles_df", wraps=self.data_feed._build_candles_df) as build_mock:
+            first_df = self.data_feed.candles_df
+            first_df["extra_column"] = 1.0
+            second_df = self.data_feed.candles_df
+            self.assertEqual(1, build_mock.call_count)
+            self.assertNotIn("extra_column", second_df.columns)
+
+            self.data_feed._candles.append(candles[-1])
+            updated_df = self.data_feed.candles_df
+            self.assertEqual(2, build_mock.call_count)
+
+        self.assertEqual(3, len(second_df))
+        self.assertEqual(4, len(updated_df))
+        self.assertEqual(float(candles[-1][0]), updated_df["timestamp"].iloc[-1])
+
+    def test_candles_array_is_a_view_of_the_stored_candles(self):
+        candles = self._candles_data_mock()
+        self.data_feed._candles.extend(candles)
+
+        candles_array = self.data_feed.candles_array
+        np.testing.assert_array_equal(np.array(candles, dtype=float), candles_array)
+        self.assertFalse(candles_array.flags.writeable)
+
+        updated_candle = np.array(candles[-1], dtype=float)
+        updated_candle[4] += 1
+        self.data_feed._candles[-1] = updated_candle
+        np.testing.assert_array_equal(updated_candle, candles_array[-1])
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -360,6 +392,34 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
             self.assertEqual(len(result), 1)
             mock_fetch_candles.assert_called_once()
 
+    async def test_get_historical_candles_fetches_all_pages(self):
+        from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+        interval = self.data_feed.interval_in_seconds
+        page_size = self.data_feed.candles_max_result_per_rest_request
+        end_time = self.data_feed._round_timestamp_to_interval_multiple(1_700_000_000)
+        start_time = end_time - int(page_size * 2.5) * interval
+
+        async def fetch_candles(start_time, end_time, limit):
+            return np.array([[timestamp, 1, 2, 0.5, 1.5, 10, 0, 0, 0, 0]
+                             for timestamp in range(end_time - limit * interval, end_time + 1, interval)], dtype=float)
+
+        with patch.object(self.data_feed, 'initialize_exchange_data', new_callable=AsyncMock), \
+             patch.object(self.data_feed, 'fetch_candles', side_effect=fetch_candles) as mock_fetch_candles:
+            config = HistoricalCandlesConfig(
+                connector_name="test",
+                trading_pair="BTC-USDT",
+                interval=self.data_feed.interval,
+                start_time=start_time,
+                end_time=end_time
+            )
+
+            result = await self.data_feed.get_historical_candles(config)
+
+        self.assertEqual(3, mock_fetch_candles.call_count)
+        expected_timestamps = np.arange(start_time, end_time + 1, interval, dtype=float)
+        np.testing.assert_array_equal(expected_timestamps, result["timestamp"].to_numpy())
+
     async def test_get_historical_candles_with_time_filtering(self):
         """Test get_historical_candles time filtering (line 186)"""
         from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class CandlesRingBufferTests(unittest.TestCase):
+
+    @staticmethod
+    def _candle(timestamp: float):
+        return [timestamp, 1.0, 2.0]
+
+    def test_append_discards_oldest_candles_when_full(self):
+        candles = CandlesRingBuffer(maxlen=3, n_columns=3)
+
+        candles.extend(self._candle(timestamp) for timestamp in range(5))
+
+        self.assertEqual(3, len(candles))
+        self.assertEqual(3, candles.maxlen)
+        self.assertEqual([2.0, 3.0, 4.0], candles.array[:, 0].tolist())
+        self.assertEqual(2.0, candles[0][0])
+        self.assertEqual(4.0, candles[-1][0])
+
+    def test_appendleft_discards_newest_candles_when_full(self):
+        candles = CandlesRingBuffer(maxlen=3, n_columns=3)
+        candles.append(self._candle(10))
+
+        candles.extendleft(self._candle(timestamp) for timestamp in (9, 8, 7))
+
+        self.assertEqual([7.0, 8.0, 9.0], candles.array[:, 0].tolist())
+
+    def test_array_is_contiguous_view_after_wrapping(self):
+        candles = CandlesRingBuffer(maxlen=4, n_columns=3)
+        candles.extend(self._candle(timestamp) for timestamp in range(7))
+
+        array = candles.array
+
+        self.assertTrue(array.flags.c_contiguous)
+        self.assertIs(candles._buffer, array.base)
+        self.assertEqual([3.0, 4.0, 5.0, 6.0], array[:, 0].tolist())
+
+    def test_set_item_replaces_candle_and_indexing_returns_copies(self):
+        candles = CandlesRingBuffer(maxlen=3, n_columns=3)
+        candles.extend(self._candle(timestamp) for timestamp in range(4))
+        previous_last_candle = candles[-1]
+
+        candles[-1] = [3.0, 5.0, 6.0]
+
+        self.assertEqual([3.0, 1.0, 2.0], previous_last_candle.tolist())
+        self.assertEqual([3.0, 5.0, 6.0], candles[-1].tolist())
+        self.assertEqual([3.0, 5.0, 6.0], candles.array[-1].tolist())
+        with self.assertRaises(IndexError):
+            candles[3]
+
+    def test_version_changes_with_every_modification(self):
+        candles = CandlesRingBuffer(maxlen=3, n_columns=3)
+        versions = [candles.version]
+
+        candles.append(self._candle(1))
+        versions.append(candles.version)
+        candles[-1] = self._candle(2)
+        versions.append(candles.version)
+        candles.appendleft(self._candle(0))
+        versions.append(candles.version)
+        candles.clear()
+        versions.append(candles.version)
+
+        self.assertEqual(len(versions), len(set(versions)))
+        self.assertEqual(0, len(candles))
+        self.assertEqual((0, 3), candles.array.shape)
+
+    def test_iteration_returns_candles_in_chronological_order(self):
+        candles = CandlesRingBuffer(maxlen=2, n_columns=3)
+        candles.extend(self._candle(timestamp) for timestamp in range(3))
+
+        np.testing.assert_array_equal(np.array([self._candle(1), self._candle(2)]), np.array(list(candles)))
+        self.assertEqual([2.0, 1.0], [candle[0] for candle in reversed(candles)])
@@ -0,0 +1,108 @@
+import os
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.historical_candles_cache import HistoricalCandlesCache
+
+
+class HistoricalCandlesCacheTests(IsolatedAsyncioWrapperTestCase):
+    interval = 60
+    current_time = 1_700_010_000
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.cache = HistoricalCandlesCache(cache_dir=self.temporary_directory.name)
+        self.candles_feed = MagicMock()
+        self.candles_feed.columns = CandlesBase.columns
+        self.candles_feed.interval_in_seconds = self.interval
+        self.candles_feed.get_historical_candles = AsyncMock(side_effect=self._historical_candles)
+        self.missing_timestamps = set()
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    async def _historical_candles(self, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        timestamps = [timestamp for timestamp in range(config.start_time, config.end_time + 1, self.interval)
+                      if timestamp not in self.missing_timestamps]
+        candles = [[timestamp, 1, 2, 0.5, 1.5, 10, 15, 3, 4, 6] for timestamp in timestamps]
+        return pd.DataFrame(candles, columns=CandlesBase.columns, dtype=float)
+
+    def _config(self, start_time: int, end_time: int) -> HistoricalCandlesConfig:
+        return HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval="1m",
+                                       start_time=start_time, end_time=end_time)
+
+    def _fetched_ranges(self):
+        return [(call.kwargs["config"].start_time, call.kwargs["config"].end_time)
+                for call in self.candles_feed.get_historical_candles.call_args_list]
+
+    async def _get_candles(self, start_time: int, end_time: int) -> pd.DataFrame:
+        with patch.object(HistoricalCandlesCache, "_time", return_value=self.current_time):
+            return await self.cache.get_historical_candles(candles_feed=self.candles_feed,
+                                                           config=self._config(start_time, end_time))
+
+    async def test_candles_are_fetched_once_and_read_from_disk(self):
+        start_time, end_time = 1_700_000_000 - 1_700_000_000 % self.interval, 1_700_003_000
+
+        first_df = await self._get_candles(start_time, end_time)
+        self.cache = HistoricalCandlesCache(cache_dir=self.temporary_directory.name)
+        second_df = await self._get_candles(start_time, end_time)
+
+        self.assertEqual(1, self.candles_feed.get_historical_candles.call_count)
+        self.assertEqual(51, len(first_df))
+        pd.testing.assert_frame_equal(first_df, second_df)
+        self.assertTrue(os.path.exists(os.path.join(self.temporary_directory.name,
+                                                    "binance_BTC-USDT_1m.candles.npy")))
+
+    async def test_only_missing_ranges_are_fetched(self):
+        await self._get_candles(1_700_001_000, 1_700_002_000)
+        result = await self._get_candles(1_700_000_000, 1_700_003_000)
+
+        self.assertEqual([(1_699_999_980, 1_700_000_940), (1_700_002_020, 1_700_002_980)],
+                         self._fetched_ranges()[1:])
+        timestamps = result["timestamp"].to_numpy()
+        self.assertEqual(1_700_000_040, timestamps[0])
+        self.assertEqual(1_700_002_980, timestamps[-1])
+        self.assertTrue(np.all(np.diff(timestamps) == self.interval))
+
+    async def test_ranges_without_candles_are_not_fetched_again(self):
+        self.missing_timestamps = {1_700_000_040, 1_700_000_100}
+
+        await self._get_candles(1_700_000_040, 1_700_001_000)
+        result = await self._get_candles(1_700_000_040, 1_700_001_000)
+
+        self.assertEqual(1, self.candles_feed.get_historical_candles.call_count)
+        self.assertNotIn(1_700_000_100, result["timestamp"].tolist())
+
+    async def test_candles_not_closed_are_returned_but_not_stored(self):
+        last_closed_candle_time = self.current_time - self.current_time % self.interval - self.interval
+
+        first_result = await self._get_candles(last_closed_candle_time - 600, self.current_time)
+        await self._get_candles(last_closed_candle_time - 600, self.current_time)
+
+        self.assertEqual(self.current_time - self.current_time % self.interval, first_result["timestamp"].iloc[-1])
+        self.assertEqual((last_closed_candle_time + self.interval, last_closed_candle_time + self.interval),
+                         self._fetched_ranges()[-1])
+        stored_candles = np.load(os.path.join(self.temporary_directory.name, "binance_BTC-USDT_1m.candles.npy"))
+        self.assertEqual(last_closed_candle_time, stored_candles[-1, 0])
+
+    def test_missing_ranges(self):
+        ranges = [(100, 200), (400, 500)]
+
+        self.assertEqual([(0, 40), (260, 340), (560, 600)],
+                         HistoricalCandlesCache.missing_ranges(ranges, start_time=0, end_time=600, interval=60))
+        self.assertEqual([], HistoricalCandlesCache.missing_ranges(ranges, start_time=100, end_time=200, interval=60))
+        self.assertEqual([(1000, 1200)],
+                         HistoricalCandlesCache.missing_ranges(ranges, start_time=1000, end_time=1200, interval=60))
+
+    def test_merge_ranges(self):
+        self.assertEqual([(0, 260), (400, 500)],
+                         HistoricalCandlesCache.merge_ranges([(400, 500), (0, 200), (100, 200), (260, 260)],
+                                                             interval=60))
@@ -3,6 +3,7 @@ from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.connector.trading_rule import TradingRule
@@ -91,6 +92,14 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
 
+    def test_get_order_book_levels(self):
+        mock_order_book = MagicMock()
+        mock_order_book.levels_array.return_value = np.zeros((5, 4))
+        self.mock_connector.get_order_book.return_value = mock_order_book
+        levels = self.provider.get_order_book_levels("mock_connector", "BTC-USDT", is_buy=False, depth=5)
+        mock_order_book.levels_array.assert_called_once_with(False, 5)
+        self.assertEqual((5, 4), levels.shape)
+
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
             get_price_for_quote_volume=MagicMock(return_value=OrderBookQueryResult(100, 2, 100, 2)))
@@ -569,6 +578,29 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
             mock_feed.get_historical_candles.assert_called_once()
             mock_feed._candles.clear.assert_called()
 
+    async def test_get_historical_candles_df_uses_historical_candles_cache(self):
+        historical_candles_cache = MagicMock()
+        historical_data = pd.DataFrame([[1640995200, 50000, 50050, 49950, 50100, 100, 5000000, 10, 50, 2500000]],
+                                       columns=CandlesBase.columns)
+        historical_candles_cache.get_historical_candles = AsyncMock(return_value=historical_data)
+        provider = MarketDataProvider(self.connectors, historical_candles_cache=historical_candles_cache)
+
+        with patch.object(provider, 'get_candles_feed') as mock_get_feed:
+            mock_feed = MagicMock()
+            mock_feed.interval_in_seconds = 60
+            mock_feed.candles_df = pd.DataFrame()
+            mock_feed.get_historical_candles = AsyncMock(side_effect=AssertionError("Fetched without the cache"))
+            mock_get_feed.return_value = mock_feed
+
+            await provider.get_historical_candles_df(
+                "binance", "BTC-USDT", "1m",
+                start_time=1640995200, end_time=1640995320, max_records=3
+            )
+
+        historical_candles_cache.get_historical_candles.assert_awaited_once()
+        self.assertIs(mock_feed, historical_candles_cache.get_historical_candles.call_args.kwargs["candles_feed"])
+        mock_feed.get_historical_candles.assert_not_called()
+
     async def test_get_historical_candles_df_fallback(self):
         # Test fallback to regular method when no time range specified
         with patch.object(self.provider, 'get_candles_df') as mock_get_candles:
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+
+
+class SQLWriteBehindQueueTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(self.temp_dir.name, "test_write_behind.sqlite"))
+        self.write_queue = SQLWriteBehindQueue(self.manager, max_batch_size=10, batch_interval=0.01)
+
+    def tearDown(self) -> None:
+        self.write_queue.stop()
+        self.manager.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def _add_market_state(market: str, timestamp: int):
+        def write(session):
+            session.add(MarketState(config_file_path="test_config", market=market, timestamp=timestamp, saved_state={}))
+        return write
+
+    def _stored_market_states(self):
+        with self.manager.get_new_session() as session:
+            return [(state.market, state.timestamp) for state in session.query(MarketState).order_by(MarketState.id)]
+
+    def test_writes_synchronously_when_not_running(self):
+        self.write_queue.put(self._add_market_state("market_1", 1))
+
+        self.assertEqual([("market_1", 1)], self._stored_market_states())
+        self.assertEqual(1, self.write_queue.committed_writes)
+        self.assertEqual(1, self.write_queue.committed_batches)
+
+    def test_writes_on_worker_thread_in_order(self):
+        writing_threads = set()
+
+        def register_thread(session):
+            writing_threads.add(threading.current_thread())
+
+        self.write_queue.start()
+        for i in range(25):
+            self.write_queue.put(self._add_market_state(f"market_{i}", i))
+        self.write_queue.put(register_thread)
+        self.write_queue.flush()
+
+        self.assertEqual([(f"market_{i}", i) for i in range(25)], self._stored_market_states())
+        self.assertNotIn(threading.current_thread(), writing_threads)
+        self.assertEqual(0, self.write_queue.queue_depth)
+        self.assertEqual(26, self.write_queue.committed_writes)
+        self.assertGreaterEqual(self.write_queue.committed_batches, 3)
+        self.assertGreater(self.write_queue.max_commit_latency, 0)
+        self.assertGreater(self.write_queue.average_commit_latency, 0)
+
+    def test_stop_writes_pending_operations(self):
+        self.write_queue.start()
+        for i in range(5):
+            self.write_queue.put(self._add_market_state(f"market_{i}", i))
+
+        self.write_queue.stop()
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual(5, len(self._stored_market_states()))
+
+    def test_failed_operation_does_not_discard_the_rest_of_the_batch(self):
+        def failing_write(session):
+            raise ValueError("Test error")
+
+        self.write_queue.start()
+        self.write_queue.put(self._add_market_state("market_1", 1))
+        self.write_queue.put(failing_write)
+        self.write_queue.put(self._add_market_state("market_2", 2))
+        with self.assertLogs(logger=SQLWriteBehindQueue.logger(), level="ERROR"):
+            self.write_queue.flush()
+
+        self.assertEqual([("market_1", 1), ("market_2", 2)], self._stored_market_states())
+        self.assertEqual(2, self.write_queue.committed_writes)
+        self.assertEqual(1, self.write_queue.failed_writes)
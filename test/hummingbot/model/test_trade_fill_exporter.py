@@ -0,0 +1,136 @@
+import csv
+import datetime
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.model import trade_fill_exporter
+from hummingbot.model.trade_fill_exporter import TradeExportFormat, TradeFillExporter
+
+
+class TradeFillExporterTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "trades_test.csv")
+        self.field_names = ("exchange_trade_id", "price", "amount", "trade_fee")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _row(self, trade_id: int):
+        return f"T{trade_id}", Decimal("100.5"), Decimal("1"), {"percent": "0.01"}
+
+    def _read_csv(self, file_path: str):
+        with open(file_path, newline="") as file:
+            return list(csv.reader(file))
+
+    def _export_files(self):
+        return sorted(os.listdir(self.temp_dir.name))
+
+    def test_appends_rows_after_single_header(self):
+        exporter = TradeFillExporter(self.file_path, self.field_names)
+        exporter.append(self._row(1))
+        exporter.append(self._row(2))
+
+        rows = self._read_csv(self.file_path)
+        self.assertEqual([list(self.field_names), ["T1", "100.5", "1", "{'percent': '0.01'}"]], rows[:2])
+        self.assertEqual(3, len(rows))
+        exporter.close()
+
+    def test_reopening_file_with_same_header_keeps_appending(self):
+        exporter = TradeFillExporter(self.file_path, self.field_names)
+        exporter.append(self._row(1))
+        exporter.close()
+
+        exporter = TradeFillExporter(self.file_path, self.field_names)
+        exporter.append(self._row(2))
+        exporter.close()
+
+        rows = self._read_csv(self.file_path)
+        self.assertEqual([list(self.field_names), "T1", "T2"], [rows[0]] + [row[0] for row in rows[1:]])
+        self.assertEqual(["trades_test.csv"], self._export_files())
+
+    def test_file_with_different_header_is_moved_aside(self):
+        with open(self.file_path, "w") as file:
+            file.write("other,header\n1,2\n")
+
+        exporter = TradeFillExporter(self.file_path, self.field_names)
+        exporter.append(self._row(1))
+        exporter.close()
+
+        files = self._export_files()
+        self.assertEqual(2, len(files))
+        self.assertTrue(files[1].startswith("trades_test_old_"))
+        self.assertEqual(list(self.field_names), self._read_csv(self.file_path)[0])
+
+    def test_rows_are_buffered(self):
+        exporter = TradeFillExporter(self.file_path, self.field_names, buffer_size=3)
+        exporter.append(self._row(1))
+        exporter.append(self._row(2))
+
+        self.assertFalse(os.path.exists(self.file_path))
+
+        exporter.append(self._row(3))
+        self.assertEqual(4, len(self._read_csv(self.file_path)))
+
+        exporter.append(self._row(4))
+        exporter.close()
+        self.assertEqual(5, len(self._read_csv(self.file_path)))
+
+    def test_rotation_by_size(self):
+        # The header and two rows exceed the maximum size
+        exporter = TradeFillExporter(self.file_path, self.field_names, max_file_size=100)
+        for trade_id in range(5):
+            exporter.append(self._row(trade_id))
+        exporter.close()
+
+        files = self._export_files()
+        self.assertEqual(3, len(files))
+        self.assertIn("trades_test.csv", files)
+        exported_ids = []
+        for file_name in files:
+            rows = self._read_csv(os.path.join(self.temp_dir.name, file_name))
+            self.assertEqual(list(self.field_names), rows[0])
+            exported_ids.extend(row[0] for row in rows[1:])
+        self.assertEqual(["T0", "T1", "T2", "T3", "T4"], sorted(exported_ids))
+        self.assertEqual(["T4"], [row[0] for row in self._read_csv(self.file_path)[1:]])
+
+    def test_daily_rotation(self):
+        exporter = TradeFillExporter(self.file_path, self.field_names, rotate_daily=True)
+        with patch.object(TradeFillExporter, "_current_date", return_value=datetime.date(2024, 1, 1)):
+            exporter.append(self._row(1))
+            exporter.append(self._row(2))
+        self.assertEqual(["trades_test.csv"], self._export_files())
+
+        with patch.object(TradeFillExporter, "_current_date", return_value=datetime.date(2024, 1, 2)):
+            exporter.append(self._row(3))
+        exporter.close()
+
+        files = self._export_files()
+        self.assertEqual(2, len(files))
+        self.assertEqual(["T3"], [row[0] for row in self._read_csv(self.file_path)[1:]])
+
+    @unittest.skipIf(trade_fill_exporter.pa is None, "pyarrow is not installed")
+    def test_parquet_export(self):
+        exporter = TradeFillExporter(
+            self.file_path, self.field_names, export_format=TradeExportFormat.PARQUET, buffer_size=2)
+        for trade_id in range(5):
+            exporter.append(self._row(trade_id))
+        exporter.close()
+
+        self.assertTrue(exporter.current_path.endswith(".parquet"))
+        table = trade_fill_exporter.pq.read_table(exporter.current_path)
+        self.assertEqual(list(self.field_names), table.column_names)
+        self.assertEqual([f"T{trade_id}" for trade_id in range(5)], table.column("exchange_trade_id").to_pylist())
+        self.assertEqual('{"percent": "0.01"}', table.column("trade_fee")[0].as_py())
+        self.assertEqual(3, trade_fill_exporter.pq.ParquetFile(exporter.current_path).num_row_groups)
+
+    @patch.object(trade_fill_exporter, "pa", None)
+    def test_parquet_export_requires_pyarrow(self):
+        with self.assertRaises(ImportError):
+            TradeFillExporter(self.file_path, self.field_names, export_format=TradeExportFormat.PARQUET)
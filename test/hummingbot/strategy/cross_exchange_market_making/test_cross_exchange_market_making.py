@@ -42,6 +42,22 @@ from hummingbot.strategy.maker_taker_market_pair import MakerTakerMarketPair
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 
 
+class PartiallyReadyMockPaperExchange(MockPaperExchange):
+    """
+    Exchange whose markets are initialized one by one: only some trading pairs are ready
+    """
+    def __init__(self, ready_trading_pairs: List[str]):
+        super().__init__()
+        self.ready_trading_pairs = ready_trading_pairs
+
+    @property
+    def ready(self):
+        return False
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self.ready_trading_pairs
+
+
 class HedgedMarketMakingUnitTest(unittest.TestCase):
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
     end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
@@ -1042,3 +1058,109 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.006"), ask_order.price)
         self.assertAlmostEqual(Decimal("1"), round(bid_order.quantity, 4))
         self.assertAlmostEqual(Decimal("1"), round(ask_order.quantity, 4))
+
+    def _concurrent_strategy(self) -> CrossExchangeMarketMakingStrategy:
+        self.clock.remove_iterator(self.strategy)
+        strategy: CrossExchangeMarketMakingStrategy = CrossExchangeMarketMakingStrategy()
+        strategy.init_params(
+            config_map=self.config_map,
+            market_pairs=[self.market_pair],
+            logging_options=self.logging_options,
+            max_concurrent_market_pairs=2,
+        )
+        self.clock.add_iterator(strategy)
+        self.addCleanup(strategy.stop_market_pair_tasks)
+        return strategy
+
+    def test_concurrent_market_pairs_place_orders(self):
+        strategy = self._concurrent_strategy()
+        self.assertTrue(strategy.concurrent_market_pairs_enabled)
+        self.assertFalse(self.strategy.concurrent_market_pairs_enabled)
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertIsNone(strategy._main_task)
+        self.assertEqual(1, len(strategy.active_maker_bids))
+        self.assertEqual(1, len(strategy.active_maker_asks))
+        self.assertEqual(Decimal("0.99452"), strategy.active_maker_bids[0][1].price)
+        self.assertEqual(Decimal("1.0056"), strategy.active_maker_asks[0][1].price)
+
+    def test_taker_order_book_update_triggers_requote(self):
+        strategy = self._concurrent_strategy()
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+        self.assertEqual(0, strategy.requote_latencies[self.market_pair].count)
+
+        with patch.object(strategy, "process_market_pair", wraps=strategy.process_market_pair) as process_mock:
+            taker_order_book: OrderBook = self.taker_market.get_order_book(self.trading_pairs_taker[0])
+            self.simulate_order_book_widening(taker_order_book, 0.99, 1.01)
+            # Updates received before the market pair is processed are handled together
+            self.simulate_order_book_widening(taker_order_book, 0.98, 1.02)
+            self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        process_mock.assert_called_once()
+        self.assertEqual(1, strategy.requote_latencies[self.market_pair].count)
+        self.assertIn("Requote latency after taker order book updates", strategy.format_status())
+
+    def test_stop_cancels_market_pair_tasks(self):
+        strategy = self._concurrent_strategy()
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        tasks = list(strategy._market_pair_tasks.values())
+        self.assertEqual(1, len(tasks))
+
+        strategy.stop(self.clock)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertTrue(tasks[0].cancelled())
+        self.assertEqual(0, len(strategy._market_pair_tasks))
+        taker_order_book: OrderBook = self.taker_market.get_order_book(self.trading_pairs_taker[0])
+        self.simulate_order_book_widening(taker_order_book, 0.99, 1.01)
+        self.assertEqual(0, len(strategy._pending_taker_book_updates))
+
+    def _strategy_with_partially_ready_taker(self, ready_trading_pairs: List[str]) -> CrossExchangeMarketMakingStrategy:
+        self.clock.remove_iterator(self.strategy)
+        self.clock.remove_iterator(self.taker_market)
+        self.taker_market = PartiallyReadyMockPaperExchange(ready_trading_pairs)
+        self.taker_market.set_balanced_order_book(self.trading_pairs_taker[0], 1.0, 0.5, 1.5, 0.001, 4)
+        self.taker_market.set_balance("COINALPHA", 5)
+        self.taker_market.set_balance("ETH", 5)
+        self.taker_market.set_quantization_param(QuantizationParams(self.trading_pairs_taker[0], 5, 5, 5, 5))
+        market_pair = MakerTakerMarketPair(
+            MarketTradingPairTuple(self.maker_market, *self.trading_pairs_maker),
+            MarketTradingPairTuple(self.taker_market, *self.trading_pairs_taker),
+        )
+        strategy: CrossExchangeMarketMakingStrategy = CrossExchangeMarketMakingStrategy()
+        strategy.init_params(
+            config_map=self.config_map,
+            market_pairs=[market_pair],
+            logging_options=self.logging_options,
+        )
+        self.clock.add_iterator(self.taker_market)
+        self.clock.add_iterator(strategy)
+        return strategy
+
+    def test_market_pairs_with_ready_trading_pairs_are_traded_before_all_markets_are_ready(self):
+        strategy = self._strategy_with_partially_ready_taker(ready_trading_pairs=[self.trading_pairs_taker[0]])
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertFalse(strategy._all_markets_ready)
+        self.assertEqual(1, len(strategy.ready_market_pairs()))
+        self.assertEqual(1, len(strategy.active_maker_bids))
+        self.assertEqual(1, len(strategy.active_maker_asks))
+        self.assertEqual(Decimal("0.99452"), strategy.active_maker_bids[0][1].price)
+        self.assertEqual(Decimal("1.0056"), strategy.active_maker_asks[0][1].price)
+
+    def test_market_pairs_without_ready_trading_pairs_are_not_traded(self):
+        strategy = self._strategy_with_partially_ready_taker(ready_trading_pairs=[])
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertFalse(strategy._all_markets_ready)
+        self.assertEqual([], strategy.ready_market_pairs())
+        self.assertEqual(0, len(strategy.active_maker_bids))
+        self.assertEqual(0, len(strategy.active_maker_asks))
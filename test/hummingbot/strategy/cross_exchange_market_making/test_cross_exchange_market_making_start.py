@@ -58,3 +58,10 @@ class XEMMStartTest(IsolatedAsyncioWrapperTestCase):
         await strategy_start.start(self)
         self.assertEqual(self.strategy.order_amount, Decimal("1"))
         self.assertEqual(self.strategy.min_profitability, Decimal("0.02"))
+        self.assertFalse(self.strategy.concurrent_market_pairs_enabled)
+
+    async def test_strategy_creation_with_concurrent_market_pairs(self):
+        self.strategy_config_map.max_concurrent_market_pairs = 10
+        await strategy_start.start(self)
+        self.assertTrue(self.strategy.concurrent_market_pairs_enabled)
+        self.assertEqual(10, self.strategy._max_concurrent_market_pairs)
@@ -107,3 +107,57 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_get_value_and_size(self):
+        buffer = RingBuffer(3)
+        self.assertEqual(0, buffer.size)
+        with self.assertRaises(IndexError):
+            buffer.get_value(0)
+
+        for i in range(5):
+            buffer.add_value(i)
+
+        self.assertEqual(3, buffer.size)
+        self.assertEqual([2, 3, 4], [buffer.get_value(i) for i in range(3)])
+        with self.assertRaises(IndexError):
+            buffer.get_value(3)
+
+    def test_current_mean_value_before_buffer_is_full(self):
+        self.assertTrue(np.isnan(self.buffer.current_mean_value))
+        self.buffer.add_value(1)
+        self.buffer.add_value(2)
+
+        self.assertEqual(1.5, self.buffer.current_mean_value)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+
+    def test_running_statistics_match_buffer_values(self):
+        random = np.random.default_rng(7)
+        for value in random.normal(100, 10, self.BUFFER_LENGTH * 10):
+            self.buffer.add_value(value)
+            values = self.buffer.get_as_numpy_array()
+            self.assertAlmostEqual(np.mean(values), self.buffer.current_mean_value, 9)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.var(values), self.buffer.variance, 9)
+                self.assertAlmostEqual(np.std(values), self.buffer.std_dev, 9)
+
+    def test_running_statistics_with_nan_values(self):
+        self.fill_buffer_with_zeros()
+        self.buffer.add_value(np.nan)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+
+        for i in range(self.BUFFER_LENGTH - 1):
+            self.buffer.add_value(1)
+            self.assertTrue(np.isnan(self.buffer.mean_value))
+        self.buffer.add_value(1)
+
+        self.assertEqual(1, self.buffer.mean_value)
+        self.assertEqual(0, self.buffer.variance)
+
+    def test_running_statistics_after_length_change(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 10
+
+        self.assertEqual(np.mean(np.arange(20, 30)), self.buffer.mean_value)
+        self.assertEqual(np.var(np.arange(20, 30)), self.buffer.variance)
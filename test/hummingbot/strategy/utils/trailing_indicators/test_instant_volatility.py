@@ -1,5 +1,9 @@
+import logging
+import time
 import unittest
+from test.benchmark_utils import benchmark
 import numpy as np
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
 from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
 
 
@@ -20,3 +24,60 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    @staticmethod
+    def full_buffer_volatility(samples: np.ndarray) -> float:
+        return np.sqrt(np.sum(np.square(np.diff(samples))) / samples.size)
+
+    def test_volatility_matches_full_buffer_calculation(self):
+        samples = np.random.normal(100, 10, 500)
+        indicator = InstantVolatilityIndicator(50, 1)
+
+        for sample in samples:
+            indicator.add_sample(sample)
+            expected = self.full_buffer_volatility(indicator._sampling_buffer.get_as_numpy_array())
+            self.assertAlmostEqual(expected, indicator._indicator_calculation(), 9)
+
+    def test_volatility_after_sampling_length_change(self):
+        indicator = InstantVolatilityIndicator(50, 1)
+        for sample in np.random.normal(100, 10, 100):
+            indicator.add_sample(sample)
+
+        indicator.sampling_length = 20
+        indicator.add_sample(100)
+
+        expected = self.full_buffer_volatility(indicator._sampling_buffer.get_as_numpy_array())
+        self.assertEqual(20, indicator._sampling_buffer.size)
+        self.assertAlmostEqual(expected, indicator._indicator_calculation(), 9)
+
+    def test_volatility_with_nan_sample(self):
+        indicator = InstantVolatilityIndicator(5, 1)
+        for sample in [100, 101, np.nan, 102]:
+            indicator.add_sample(sample)
+        self.assertTrue(np.isnan(indicator.current_value))
+
+        for sample in [103, 104, 105, 106, 107]:
+            indicator.add_sample(sample)
+        self.assertAlmostEqual(np.sqrt(4 / 5), indicator._indicator_calculation(), 9)
+
+    @benchmark
+    def test_add_sample_benchmark(self):
+        samples = np.random.normal(100, 10, 3000)
+        indicator = InstantVolatilityIndicator(self.BUFFER_LENGTH, 1)
+        reference_buffer = RingBuffer(self.BUFFER_LENGTH)
+
+        start = time.perf_counter()
+        for sample in samples:
+            reference_buffer.add_value(sample)
+            self.full_buffer_volatility(reference_buffer.get_as_numpy_array())
+        full_buffer_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for sample in samples:
+            indicator.add_sample(sample)
+        incremental_time = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(
+            f"{samples.size} samples with a {self.BUFFER_LENGTH} samples buffer: full buffer "
+            f"{full_buffer_time * 1e3:.1f} ms, incremental {incremental_time * 1e3:.1f} ms")
+        self.assertLess(incremental_time, full_buffer_time)
@@ -1,6 +1,7 @@
 import math
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -11,6 +12,7 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators import trading_intensity
 from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
@@ -256,3 +258,60 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def _trade(self, timestamp: float, price: float, amount: float) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair="COINALPHAHBOT", timestamp=timestamp, price=price, amount=amount, type=TradeType.SELL)
+
+    def test_fitted_trades_follow_sampled_ticks(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 3)
+        timestamp = self.start_timestamp
+        indicator.last_quotes = [{"timestamp": timestamp, "price": self.initial_mid_price}]
+        sampled_trades = []
+
+        with patch.object(trading_intensity, "curve_fit", wraps=trading_intensity.curve_fit) as curve_fit_mock:
+            for tick in range(8):
+                timestamp += 1
+                price_level = 1 + tick % 3
+                indicator.register_trade(self._trade(timestamp, self.initial_mid_price + price_level, 1 + tick))
+                indicator.calculate(timestamp)
+                sampled_trades = (sampled_trades + [(price_level, 1 + tick)])[-3:]
+
+                if tick >= 2:
+                    expected = {}
+                    for level, amount in sampled_trades:
+                        expected[level] = expected.get(level, 0) + amount
+                    price_levels, lambdas = curve_fit_mock.call_args.args[1:3]
+                    self.assertEqual(sorted(expected, reverse=True), price_levels)
+                    self.assertEqual([expected[level] for level in price_levels], lambdas)
+
+        self.assertEqual(6, curve_fit_mock.call_count)
+
+    def test_intensity_is_only_fitted_when_samples_change(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        timestamp = self.start_timestamp
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+        timestamp += 1
+        for price in [2, 3, 4, 5]:
+            indicator.register_trade(self._trade(timestamp, price, 2 * np.exp(-0.1 * (price - 1))))
+
+        with patch.object(trading_intensity, "curve_fit", wraps=trading_intensity.curve_fit) as curve_fit_mock:
+            indicator.calculate(timestamp)
+            indicator.calculate(timestamp + 1)
+            indicator.calculate(timestamp + 2)
+
+        self.assertEqual(1, curve_fit_mock.call_count)
+        self.assertAlmostEqual(2, indicator.current_value[0], 10)
+
+    def test_refit_interval(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2, refit_interval=3)
+        timestamp = self.start_timestamp
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 100}]
+
+        with patch.object(trading_intensity, "curve_fit", wraps=trading_intensity.curve_fit) as curve_fit_mock:
+            for tick in range(7):
+                timestamp += 1
+                indicator.register_trade(self._trade(timestamp, 101 + tick % 3, 1))
+                indicator.calculate(timestamp)
+
+        self.assertEqual(2, curve_fit_mock.call_count)
@@ -0,0 +1,120 @@
+import logging
+import time
+from decimal import Decimal
+from test.benchmark_utils import benchmark
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from types import SimpleNamespace
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction
+
+
+class CandlesProvider:
+    def __init__(self, candles: pd.DataFrame):
+        self.candles = candles
+        self.prices = {}
+        self._time = None
+
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str):
+        return self.candles.copy()
+
+
+class SignalController:
+    """
+    Minimal controller opening a position executor every time the signal changes and there is no active executor
+    """
+
+    def __init__(self, candles: pd.DataFrame, features: pd.DataFrame, create_executors: bool = True):
+        self.config = SimpleNamespace(connector_name="binance", trading_pair="COINALPHA-HBOT")
+        self.market_data_provider = CandlesProvider(candles)
+        self.processed_data = {"features": features}
+        self.executors_info = []
+        self.create_executors = create_executors
+        self.observed_states = []
+        self.executors_created = 0
+
+    def determine_executor_actions(self) -> List[ExecutorAction]:
+        key = f"{self.config.connector_name}_{self.config.trading_pair}"
+        price = self.market_data_provider.prices[key]
+        self.observed_states.append((self.market_data_provider._time, price, self.processed_data["signal"]))
+        if (not self.create_executors or self.processed_data["signal"] == 0
+                or any(executor.is_active for executor in self.executors_info)):
+            return []
+        self.executors_created += 1
+        return [CreateExecutorAction(executor_config=PositionExecutorConfig(
+            id=f"executor_{self.executors_created}",
+            timestamp=self.market_data_provider._time,
+            trading_pair=self.config.trading_pair,
+            connector_name=self.config.connector_name,
+            side=TradeType.BUY if self.processed_data["signal"] > 0 else TradeType.SELL,
+            entry_price=price,
+            amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(
+                stop_loss=Decimal("0.01"), take_profit=Decimal("0.01"), time_limit=60 * 30,
+                open_order_type=OrderType.MARKET)))]
+
+
+class BacktestingEngineBaseTests(IsolatedAsyncioWrapperTestCase):
+    ROWS = 3000
+
+    def setUp(self) -> None:
+        super().setUp()
+        random = np.random.default_rng(42)
+        timestamps = 1700000000 + np.arange(self.ROWS) * 60.0
+        close = 100 * np.exp(np.cumsum(random.normal(0, 0.002, self.ROWS)))
+        self.candles = pd.DataFrame({
+            "timestamp": timestamps,
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": random.uniform(1, 10, self.ROWS),
+        })
+        signal = np.where(np.arange(self.ROWS) % 120 < 60, 1, -1)
+        self.features = pd.DataFrame({"timestamp": timestamps, "signal": signal})
+
+    def _engine(self, create_executors: bool = True) -> BacktestingEngineBase:
+        engine = BacktestingEngineBase()
+        engine.backtesting_resolution = "1m"
+        engine.controller = SignalController(self.candles, self.features.copy(), create_executors)
+        return engine
+
+    async def test_vectorized_simulation_matches_row_simulation(self):
+        row_engine = self._engine()
+        vectorized_engine = self._engine()
+
+        row_executors = await row_engine.simulate_execution(trade_cost=0.0006)
+        vectorized_executors = await vectorized_engine.simulate_execution_vectorized(trade_cost=0.0006)
+
+        self.assertGreater(len(row_executors), 10)
+        self.assertEqual(row_engine.controller.observed_states, vectorized_engine.controller.observed_states)
+        self.assertEqual(
+            [(executor.id, executor.close_type, executor.net_pnl_quote, executor.close_timestamp)
+             for executor in row_executors],
+            [(executor.id, executor.close_type, executor.net_pnl_quote, executor.close_timestamp)
+             for executor in vectorized_executors])
+        self.assertEqual(BacktestingEngineBase.summarize_results(row_executors),
+                         BacktestingEngineBase.summarize_results(vectorized_executors))
+
+    @benchmark
+    async def test_vectorized_simulation_benchmark(self):
+        row_engine = self._engine(create_executors=False)
+        start = time.perf_counter()
+        await row_engine.simulate_execution(trade_cost=0.0006)
+        row_time = time.perf_counter() - start
+
+        vectorized_engine = self._engine(create_executors=False)
+        start = time.perf_counter()
+        await vectorized_engine.simulate_execution_vectorized(trade_cost=0.0006)
+        vectorized_time = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(
+            f"Backtesting loop over {self.ROWS} rows: iterrows {self.ROWS / row_time:.0f} rows/s, "
+            f"vectorized {self.ROWS / vectorized_time:.0f} rows/s ({row_time / max(vectorized_time, 1e-9):.1f}x)")
+        self.assertLess(vectorized_time, row_time)
@@ -0,0 +1,130 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.backtesting_sweep import BacktestingSweep
+from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction
+
+
+class MomentumControllerConfig(ControllerConfigBase):
+    controller_name: str = "momentum_test"
+    connector_name: str = "binance"
+    trading_pair: str = "COINALPHA-HBOT"
+    lookback: int = 10
+    threshold: float = 0.002
+    take_profit: Decimal = Decimal("0.01")
+
+
+class MomentumController(ControllerBase):
+    async def update_processed_data(self):
+        if self.config.lookback <= 0:
+            raise ValueError("The lookback must be positive.")
+        candles = self.market_data_provider.get_candles_df(
+            self.config.connector_name, self.config.trading_pair, "1m").copy()
+        momentum = candles["close"].pct_change(self.config.lookback)
+        candles["signal"] = np.where(momentum > self.config.threshold, 1,
+                                     np.where(momentum < -self.config.threshold, -1, 0))
+        self.processed_data = {"features": candles[["timestamp", "signal"]]}
+
+    def determine_executor_actions(self) -> List[ExecutorAction]:
+        signal = self.processed_data["signal"]
+        if signal == 0 or any(executor.is_active for executor in self.executors_info):
+            return []
+        price = self.market_data_provider.get_price_by_type(self.config.connector_name, self.config.trading_pair, None)
+        return [CreateExecutorAction(controller_id=self.config.id, executor_config=PositionExecutorConfig(
+            timestamp=self.market_data_provider.time(),
+            trading_pair=self.config.trading_pair,
+            connector_name=self.config.connector_name,
+            side=TradeType.BUY if signal > 0 else TradeType.SELL,
+            entry_price=price,
+            amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(
+                stop_loss=Decimal("0.01"), take_profit=self.config.take_profit, time_limit=60 * 30,
+                open_order_type=OrderType.MARKET)))]
+
+
+class BacktestingSweepTests(IsolatedAsyncioWrapperTestCase):
+    ROWS = 1500
+
+    def setUp(self) -> None:
+        super().setUp()
+        generator = np.random.default_rng(7)
+        self.start = 1700000000
+        timestamps = self.start + np.arange(self.ROWS) * 60.0
+        close = 100 * np.exp(np.cumsum(generator.normal(0, 0.002, self.ROWS)))
+        self.candles = pd.DataFrame({
+            "timestamp": timestamps,
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": generator.uniform(1, 10, self.ROWS),
+        })
+        self.end = int(timestamps[-1])
+        self.trading_rules = {"binance": {"COINALPHA-HBOT": TradingRule(trading_pair="COINALPHA-HBOT")}}
+        self.base_config = MomentumControllerConfig(id="momentum")
+
+    def _preload(self, data_provider):
+        data_provider.candles_feeds["binance_COINALPHA-HBOT_1m"] = self.candles
+        data_provider.trading_rules = dict(self.trading_rules)
+
+    def test_grid_configs(self):
+        configs = BacktestingSweep.grid_configs(
+            self.base_config, {"lookback": [5, 10], "threshold": [0.001, 0.002, 0.003]})
+
+        self.assertEqual(6, len(configs))
+        self.assertEqual(
+            [(5, 0.001), (5, 0.002), (5, 0.003), (10, 0.001), (10, 0.002), (10, 0.003)],
+            [(config.lookback, config.threshold) for config in configs])
+        self.assertEqual(6, len({config.id for config in configs}))
+        self.assertTrue(all(isinstance(config, MomentumControllerConfig) for config in configs))
+        self.assertTrue(all(config.take_profit == Decimal("0.01") for config in configs))
+
+    def test_random_configs(self):
+        space = {"lookback": (5, 20), "threshold": (0.001, 0.004), "take_profit": (Decimal("0.005"), Decimal("0.02"))}
+        configs = BacktestingSweep.random_configs(self.base_config, space, samples=20, seed=1)
+
+        self.assertEqual(20, len(configs))
+        self.assertTrue(all(5 <= config.lookback <= 20 for config in configs))
+        self.assertTrue(all(0.001 <= config.threshold <= 0.004 for config in configs))
+        self.assertTrue(all(Decimal("0.005") <= config.take_profit <= Decimal("0.02") for config in configs))
+        self.assertEqual(
+            [config.lookback for config in configs],
+            [config.lookback for config in BacktestingSweep.random_configs(self.base_config, space, 20, seed=1)])
+
+    async def test_run_sweep_matches_individual_backtests(self):
+        configs = BacktestingSweep.grid_configs(self.base_config, {"lookback": [5, 15], "threshold": [0.001, 0.003]})
+        sweep = BacktestingSweep(max_workers=2)
+        self._preload(sweep.backtesting_data_provider)
+
+        results_df = await sweep.run_sweep(configs, start=self.start, end=self.end)
+
+        self.assertEqual([config.id for config in configs], results_df["id"].tolist())
+        self.assertEqual(["id", "lookback", "threshold"], results_df.columns[:3].tolist())
+        self.assertTrue(results_df["error"].isna().all())
+        for config, (_, row) in zip(configs, results_df.iterrows()):
+            engine = BacktestingEngineBase()
+            self._preload(engine.backtesting_data_provider)
+            expected = await engine.run_backtesting(config, self.start, self.end, "1m")
+            self.assertEqual(expected["results"]["net_pnl_quote"], row["net_pnl_quote"])
+            self.assertEqual(expected["results"]["total_executors"], row["total_executors"])
+
+    async def test_run_sweep_reports_failed_configurations(self):
+        configs = BacktestingSweep.grid_configs(self.base_config, {"lookback": [5, 0]})
+        sweep = BacktestingSweep(max_workers=1)
+        self._preload(sweep.backtesting_data_provider)
+
+        with self.assertLogs(logger=BacktestingSweep.logger(), level="ERROR"):
+            results_df = await sweep.run_sweep(configs, start=self.start, end=self.end)
+
+        self.assertIsNone(results_df["error"].iloc[0])
+        self.assertEqual("The lookback must be positive.", results_df["error"].iloc[1])
+        self.assertTrue(pd.isna(results_df["net_pnl_quote"].iloc[1]))
@@ -0,0 +1,164 @@
+import logging
+import shutil
+import tempfile
+import time
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+import numpy as np
+
+from controllers.market_making.pmm_simple import PMMSimpleConfig
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.strategy_v2.backtesting.order_book_backtesting_engine import OrderBookBacktestingEngine
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class OrderBookBacktestingEngineTests(IsolatedAsyncioWrapperTestCase):
+    connector_name = "binance"
+    trading_pair = "ETH-USDT"
+    start = 1000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+    def _engine(self) -> OrderBookBacktestingEngine:
+        engine = OrderBookBacktestingEngine(self.path)
+        engine.backtesting_data_provider.trading_rules = {self.connector_name: {self.trading_pair: TradingRule(
+            trading_pair=self.trading_pair,
+            min_order_size=Decimal("0.001"),
+            min_price_increment=Decimal("0.01"),
+            min_base_amount_increment=Decimal("0.001"))}}
+        return engine
+
+    def _controller_config(self, **kwargs) -> PMMSimpleConfig:
+        config = {
+            "id": "pmm",
+            "connector_name": self.connector_name,
+            "trading_pair": self.trading_pair,
+            "total_amount_quote": Decimal("100"),
+            "buy_spreads": [0.0003],
+            "sell_spreads": [0.003],
+            "buy_amounts_pct": [Decimal("1")],
+            "sell_amounts_pct": [Decimal("1")],
+            "executor_refresh_time": 5,
+            "take_profit": Decimal("0.002"),
+            "stop_loss": Decimal("0.05"),
+            "time_limit": 3600,
+            "take_profit_order_type": OrderType.LIMIT,
+            "skip_rebalance": True,
+        }
+        config.update(kwargs)
+        return PMMSimpleConfig(**config)
+
+    def _record(self, messages):
+        recorder = OrderBookRecorder(self.path)
+        for recorded_timestamp, message_type, content in messages:
+            recorder.record(OrderBookMessage(message_type, {"trading_pair": self.trading_pair, **content},
+                                             timestamp=recorded_timestamp),
+                            timestamp=recorded_timestamp)
+        recorder.close()
+
+    @staticmethod
+    def _trade(trade_type: TradeType, price: float, amount: float, trade_id: int):
+        return OrderBookMessageType.TRADE, {
+            "trade_type": float(trade_type.value), "trade_id": trade_id, "update_id": trade_id,
+            "price": price, "amount": amount}
+
+    async def test_maker_orders_are_filled_after_the_queue_ahead_of_them(self):
+        self._record([
+            (self.start, OrderBookMessageType.SNAPSHOT, {
+                "update_id": 1, "bids": [[99.97, 5], [99.9, 10]], "asks": [[100.03, 5], [100.3, 5]]}),
+            # The buy order at 99.97 is queued behind 5, so the first trades don't fill it
+            (self.start + 1.5, *self._trade(TradeType.SELL, 99.97, 3, 2)),
+            (self.start + 2.5, OrderBookMessageType.DIFF, {"update_id": 3, "bids": [[99.97, 1]], "asks": []}),
+            (self.start + 3.5, *self._trade(TradeType.SELL, 99.97, 1.2, 4)),
+            (self.start + 3.6, OrderBookMessageType.DIFF, {"update_id": 5, "bids": [[99.97, 0]], "asks": []}),
+            # A trade through the order price fills the rest of the order
+            (self.start + 4.5, *self._trade(TradeType.SELL, 99.9, 1, 6)),
+            # The take profit placed at 99.97 * 1.002 is filled by a trade through its price
+            (self.start + 5.5, *self._trade(TradeType.BUY, 100.2, 1, 7)),
+        ])
+        engine = self._engine()
+
+        result = await engine.run_backtesting(
+            self._controller_config(), self.start, self.start + 8, trade_cost=0.001, maker_trade_cost=0)
+
+        executors = {executor.id: executor for executor in result["executors"]}
+        self.assertEqual(3, engine.exchange_simulator.fills_count)
+        first_buy, first_sell = [executor for executor in result["executors"] if executor.timestamp == self.start]
+        if first_buy.side == TradeType.SELL:
+            first_buy, first_sell = first_sell, first_buy
+        self.assertEqual(CloseType.TAKE_PROFIT, first_buy.close_type)
+        self.assertEqual(self.start + 5.5, first_buy.close_timestamp)
+        self.assertAlmostEqual(0.5 * 99.97 + 0.5 * 100.16, float(first_buy.filled_amount_quote), places=6)
+        self.assertAlmostEqual(0.5 * (100.16 - 99.97), float(first_buy.net_pnl_quote), places=6)
+        self.assertEqual(CloseType.EARLY_STOP, first_sell.close_type)
+        self.assertEqual(self.start + 6, first_sell.close_timestamp)
+        self.assertEqual(0, first_sell.filled_amount_quote)
+        # The executors created after the first ones are still active at the end of the backtest
+        self.assertTrue(any(executor.is_active for executor in executors.values()))
+        self.assertAlmostEqual(0.095, result["results"]["net_pnl_quote"], places=6)
+        self.assertEqual(Decimal((99.9 + 100.03) / 2), result["processed_data"]["reference_price"])
+
+    async def test_stop_loss_closes_the_position_taking_the_book(self):
+        self._record([
+            (self.start, OrderBookMessageType.SNAPSHOT, {
+                "update_id": 1, "bids": [[99.97, 0.2], [99.9, 10]], "asks": [[100.03, 5], [100.3, 5]]}),
+            (self.start + 1.5, *self._trade(TradeType.SELL, 99.9, 1, 2)),
+            (self.start + 1.6, OrderBookMessageType.DIFF, {
+                "update_id": 3, "bids": [[99.97, 0], [99.9, 0], [95, 0.3], [94, 10]], "asks": []}),
+        ])
+        engine = self._engine()
+
+        result = await engine.run_backtesting(
+            self._controller_config(executor_refresh_time=60, stop_loss=Decimal("0.03")), self.start, self.start + 3,
+            trade_cost=0.001, maker_trade_cost=0)
+
+        buy_executor = next(executor for executor in result["executors"]
+                            if executor.side == TradeType.BUY and executor.timestamp == self.start)
+        self.assertEqual(CloseType.STOP_LOSS, buy_executor.close_type)
+        self.assertEqual(self.start + 2, buy_executor.close_timestamp)
+        # The market order closing the position takes 0.3 at 95 and 0.2 at 94
+        close_price = (0.3 * 95 + 0.2 * 94) / 0.5
+        expected_pnl = 0.5 * (close_price - 99.97) - 0.5 * close_price * 0.001
+        self.assertAlmostEqual(expected_pnl, float(buy_executor.net_pnl_quote), places=6)
+
+    async def test_replay_benchmark(self):
+        random = np.random.default_rng(0)
+        messages_count = 50000
+        mid_prices = 100 + np.cumsum(random.normal(0, 0.01, messages_count))
+        messages = [(self.start - 1, OrderBookMessageType.SNAPSHOT, {
+            "update_id": 0,
+            "bids": [[round(mid_prices[0] - 0.01 * (i + 1), 2), 10] for i in range(20)],
+            "asks": [[round(mid_prices[0] + 0.01 * (i + 1), 2), 10] for i in range(20)]})]
+        for i, mid_price in enumerate(mid_prices):
+            timestamp = self.start + i * 0.05
+            if i % 10 == 0:
+                messages.append((timestamp, *self._trade(
+                    TradeType.BUY if random.random() < 0.5 else TradeType.SELL, round(mid_price, 2), 1, i + 1)))
+            else:
+                messages.append((timestamp, OrderBookMessageType.DIFF, {
+                    "update_id": i + 1,
+                    "bids": [[round(mid_price - 0.01 * (level + 1), 2), random.uniform(0, 20)] for level in range(5)],
+                    "asks": [[round(mid_price + 0.01 * (level + 1), 2), random.uniform(0, 20)] for level in range(5)]}))
+        self._record(messages)
+        engine = self._engine()
+        end = self.start + int(messages_count * 0.05)
+
+        start = time.perf_counter()
+        result = await engine.run_backtesting(
+            self._controller_config(buy_spreads=[0.0005], sell_spreads=[0.0005], executor_refresh_time=30),
+            self.start, end, trade_cost=0.001, maker_trade_cost=0)
+        elapsed = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(
+            f"Order book backtest of {messages_count} messages and {end - self.start} controller updates: "
+            f"{elapsed:.2f}s, {messages_count / elapsed:.0f} messages/s, {len(result['executors'])} executors, "
+            f"{engine.exchange_simulator.fills_count} fills")
+        self.assertEqual(messages_count, engine.exchange_simulator.messages_count)
+        self.assertGreater(len(result["executors"]), 0)
@@ -0,0 +1,98 @@
+import math
+import unittest
+
+import numpy as np
+
+from hummingbot.strategy_v2.backtesting.order_queue_simulator import OrderQueueSimulator
+
+
+class OrderQueueSimulatorTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.simulator = OrderQueueSimulator()
+
+    def test_trades_consume_the_queue_ahead_before_filling_the_order(self):
+        self.simulator.add_order(1, True, 99.0, 2.0, 5.0)
+
+        self.assertEqual([], self.simulator.match_trade(False, 99.0, 3.0))
+        self.assertEqual(2.0, self.simulator.get_queue_ahead(1))
+        self.assertEqual([(1, 99.0, 1.5)], self.simulator.match_trade(False, 99.0, 3.5))
+        self.assertEqual(0, self.simulator.get_queue_ahead(1))
+        self.assertEqual(1.5, self.simulator.get_filled_amount(1))
+        self.assertEqual([(1, 99.0, 0.5)], self.simulator.match_trade(False, 99.0, 10.0))
+        self.assertFalse(self.simulator.has_order(1))
+        self.assertEqual(0, self.simulator.orders_count)
+
+    def test_trades_on_the_same_side_or_at_other_prices_do_not_fill_the_order(self):
+        self.simulator.add_order(1, True, 99.0, 2.0, 0.0)
+        self.simulator.add_order(2, False, 101.0, 2.0, 0.0)
+
+        self.assertEqual([], self.simulator.match_trade(True, 99.0, 10.0))
+        self.assertEqual([], self.simulator.match_trade(False, 99.5, 10.0))
+        self.assertEqual([], self.simulator.match_trade(True, 100.5, 10.0))
+        self.assertEqual(2, self.simulator.orders_count)
+
+    def test_trades_through_the_order_price_fill_the_whole_order(self):
+        self.simulator.add_order(1, True, 99.0, 2.0, 5.0)
+        self.simulator.add_order(2, True, 98.0, 1.0, 5.0)
+        self.simulator.add_order(3, False, 101.0, 1.0, 5.0)
+
+        self.assertEqual([(1, 99.0, 2.0)], self.simulator.match_trade(False, 98.5, 0.1))
+        self.assertEqual([(3, 101.0, 1.0)], self.simulator.match_trade(True, 102.0, 0.1))
+        self.assertEqual(1, self.simulator.orders_count)
+
+    def test_orders_at_the_same_price_are_filled_in_placement_order(self):
+        self.simulator.add_order(1, False, 101.0, 1.0, 2.0)
+        self.simulator.add_order(2, False, 101.0, 1.0, 2.0)
+
+        self.assertEqual([(1, 101.0, 1.0), (2, 101.0, 0.5)], self.simulator.match_trade(True, 101.0, 3.5))
+        self.assertEqual([(2, 101.0, 0.5)], self.simulator.match_trade(True, 101.0, 0.5))
+
+    def test_level_decreases_move_the_order_forward_in_the_queue(self):
+        self.simulator.add_order(1, True, 99.0, 2.0, 5.0)
+
+        self.simulator.apply_levels(True, np.array([[99.0, 7.0], [98.0, 1.0]]))
+        self.assertEqual(5.0, self.simulator.get_queue_ahead(1))
+        self.simulator.apply_levels(False, np.array([[99.0, 1.0]]))
+        self.assertEqual(5.0, self.simulator.get_queue_ahead(1))
+        self.simulator.apply_levels(True, np.array([[99.0, 3.0]]))
+        self.assertEqual(3.0, self.simulator.get_queue_ahead(1))
+        self.simulator.apply_levels(True, np.array([[99.0, 0.0]]))
+        self.assertEqual(0.0, self.simulator.get_queue_ahead(1))
+
+    def test_snapshots_reset_the_queue_of_orders_at_missing_levels(self):
+        self.simulator.add_order(1, True, 99.0, 2.0, 5.0)
+        self.simulator.add_order(2, True, 98.0, 2.0, 5.0)
+        self.simulator.add_order(3, False, 101.0, 2.0, 5.0)
+
+        self.simulator.apply_snapshot_levels(True, np.array([[99.0, 3.0], [97.0, 1.0]]))
+        self.assertEqual(3.0, self.simulator.get_queue_ahead(1))
+        # The level of the order is not in the snapshot, so it is empty
+        self.assertEqual(0.0, self.simulator.get_queue_ahead(2))
+        self.assertEqual(5.0, self.simulator.get_queue_ahead(3))
+        self.simulator.apply_snapshot_levels(True, np.array([[99.0, 8.0]]))
+        self.assertEqual(3.0, self.simulator.get_queue_ahead(1))
+        self.simulator.apply_snapshot_levels(False, np.empty((0, 2)))
+        self.assertEqual(0.0, self.simulator.get_queue_ahead(3))
+
+    def test_orders_crossed_by_the_book_are_filled(self):
+        self.simulator.add_order(1, True, 99.0, 2.0, 5.0)
+        self.simulator.add_order(2, False, 101.0, 1.0, 5.0)
+
+        self.assertEqual([], self.simulator.match_crossed(98.0, 100.0))
+        self.assertEqual([(1, 99.0, 2.0)], self.simulator.match_crossed(98.0, 99.0))
+        self.assertEqual([], self.simulator.match_crossed(math.nan, math.nan))
+        self.assertEqual([(2, 101.0, 1.0)], self.simulator.match_crossed(101.5, math.nan))
+
+    def test_cancel_order(self):
+        self.simulator.add_order(1, True, 99.0, 2.0, 0.0)
+
+        self.assertTrue(self.simulator.cancel_order(1))
+        self.assertFalse(self.simulator.cancel_order(1))
+        self.assertEqual([], self.simulator.match_trade(False, 99.0, 10.0))
+        with self.assertRaises(KeyError):
+            self.simulator.get_queue_ahead(1)
+        self.simulator.add_order(2, True, 99.0, 2.0, 0.0)
+        with self.assertRaises(ValueError):
+            self.simulator.add_order(2, True, 99.0, 2.0, 0.0)
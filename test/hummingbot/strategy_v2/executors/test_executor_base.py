@@ -11,6 +11,7 @@ from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
+    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -145,6 +146,63 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         )
         self.assertEqual(sell_order_id, "OID-SELL-1")
 
+    def test_own_order_events_wake_up_the_executor(self):
+        self.component.scheduler = MagicMock()
+        buy_order_id = self.component.place_order(
+            connector_name="connector1",
+            trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT,
+            side=TradeType.BUY,
+            price=Decimal("1000.0"),
+            amount=Decimal("1.0"),
+        )
+        process_cancel_event = self.component._waking_up_on_own_orders(self.component.process_order_canceled_event)
+
+        process_cancel_event(1, MagicMock(), OrderCancelledEvent(timestamp=1234567890, order_id="OID-OTHER"))
+        self.component.scheduler.wake_up.assert_not_called()
+
+        process_cancel_event(1, MagicMock(), OrderCancelledEvent(timestamp=1234567890, order_id=buy_order_id))
+        self.component.scheduler.wake_up.assert_called_once_with(self.component)
+
+    async def test_state_version_changes_with_the_executor_state(self):
+        state_version = self.component.state_version
+        self.component.start()
+        self.assertGreater(self.component.state_version, state_version)
+
+        state_version = self.component.state_version
+        await self.component.run_control_task()
+        self.assertGreater(self.component.state_version, state_version)
+
+        buy_order_id = self.component.place_order(
+            connector_name="connector1",
+            trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT,
+            side=TradeType.BUY,
+            price=Decimal("1000.0"),
+            amount=Decimal("1.0"),
+        )
+        state_version = self.component.state_version
+        self.component.process_market_event(
+            MarketEvent.OrderCancelled.value, MagicMock(), OrderCancelledEvent(timestamp=1234567890, order_id="OID-OTHER"))
+        self.assertEqual(state_version, self.component.state_version)
+        self.component.process_market_event(
+            MarketEvent.OrderCancelled.value, MagicMock(), OrderCancelledEvent(timestamp=1234567890, order_id=buy_order_id))
+        self.assertGreater(self.component.state_version, state_version)
+
+        state_version = self.component.state_version
+        self.component.stop()
+        self.assertGreater(self.component.state_version, state_version)
+
+    async def test_executor_starts_with_scheduler(self):
+        scheduler = MagicMock()
+        self.component.scheduler = scheduler
+
+        self.component.start()
+
+        scheduler.register.assert_called_once_with(self.component)
+        self.assertEqual(RunnableStatus.RUNNING, self.component.status)
+        self.component.stop()
+
     async def test_executor_starts_and_stops(self):
         self.assertEqual(RunnableStatus.NOT_STARTED, self.component.status)
         self.component.start()
@@ -0,0 +1,149 @@
+import logging
+import time
+import unittest
+from test.benchmark_utils import benchmark
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import List
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_event_dispatcher import ExecutorEventDispatcher
+
+
+class RecordingExecutor(ExecutorBase):
+    def __init__(self, strategy: ScriptStrategyBase, config: ExecutorConfigBase):
+        super().__init__(strategy=strategy, connectors=["connector1"], config=config)
+        self.canceled_order_ids: List[str] = []
+
+    def process_order_canceled_event(self, event_tag: int, market: PubSub, event: OrderCancelledEvent):
+        if event.order_id in self._order_ids:
+            self.canceled_order_ids.append(event.order_id)
+
+
+class ExecutorEventDispatcherTests(unittest.TestCase, LoggerMixinForTest):
+
+    def setUp(self):
+        super().setUp()
+        self.connector = PubSub()
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.connectors = {"connector1": self.connector}
+        self.strategy.buy.side_effect = (f"OID-BUY-{i}" for i in range(10000))
+        self.dispatcher = ExecutorEventDispatcher()
+        self.set_loggers(loggers=[self.dispatcher.logger()])
+
+    def _start_executors(self, count: int, dispatcher: ExecutorEventDispatcher = None) -> List[RecordingExecutor]:
+        executors = []
+        for i in range(count):
+            executor = RecordingExecutor(
+                strategy=self.strategy,
+                config=ExecutorConfigBase(id=f"executor-{i}", type="position_executor", timestamp=1234567890))
+            executor.event_dispatcher = dispatcher
+            executor.register_events()
+            executors.append(executor)
+        return executors
+
+    @staticmethod
+    def _place_order(executor: ExecutorBase) -> str:
+        return executor.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                    side=TradeType.BUY, amount=1)
+
+    def _cancel(self, order_id: str):
+        self.connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(timestamp=1, order_id=order_id))
+
+    def test_events_of_known_orders_are_routed_to_the_owner(self):
+        executors = self._start_executors(3, self.dispatcher)
+        order_id = self._place_order(executors[1])
+        for executor in executors:
+            executor.process_market_event = MagicMock()
+
+        self._cancel(order_id)
+
+        executors[0].process_market_event.assert_not_called()
+        executors[1].process_market_event.assert_called_once()
+        executors[2].process_market_event.assert_not_called()
+        self.assertEqual(1, self.dispatcher.routed_events_count)
+        self.assertEqual(0, self.dispatcher.broadcast_events_count)
+
+    def test_owner_processes_its_order_events(self):
+        first_executor, second_executor = self._start_executors(2, self.dispatcher)
+        first_order_id = self._place_order(first_executor)
+        second_order_id = self._place_order(second_executor)
+
+        self._cancel(second_order_id)
+        self._cancel(first_order_id)
+
+        self.assertEqual([first_order_id], first_executor.canceled_order_ids)
+        self.assertEqual([second_order_id], second_executor.canceled_order_ids)
+        self.assertEqual(2, self.dispatcher.routed_events_count)
+
+    def test_events_of_unknown_orders_are_broadcast(self):
+        executors = self._start_executors(3, self.dispatcher)
+        for executor in executors:
+            executor.process_market_event = MagicMock()
+
+        self._cancel("OID-UNKNOWN")
+
+        for executor in executors:
+            executor.process_market_event.assert_called_once()
+        self.assertEqual(0, self.dispatcher.routed_events_count)
+        self.assertEqual(1, self.dispatcher.broadcast_events_count)
+
+    def test_unregistered_executors_stop_receiving_events(self):
+        first_executor, second_executor = self._start_executors(2, self.dispatcher)
+        order_id = self._place_order(first_executor)
+
+        first_executor.unregister_events()
+        self._cancel(order_id)
+
+        self.assertEqual([], first_executor.canceled_order_ids)
+        self.assertEqual(1, self.dispatcher.broadcast_events_count)
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderCancelled)))
+
+        second_executor.unregister_events()
+
+        self.assertEqual(0, self.dispatcher.executors_count)
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderCancelled)))
+
+    def test_error_in_an_executor_does_not_affect_the_others(self):
+        first_executor, second_executor = self._start_executors(2, self.dispatcher)
+        first_executor.process_market_event = MagicMock(side_effect=Exception("Test"))
+        second_executor.process_market_event = MagicMock()
+
+        self._cancel("OID-UNKNOWN")
+
+        second_executor.process_market_event.assert_called_once()
+        self.assertTrue(self.is_partially_logged("ERROR", "Error processing the event"))
+
+    @benchmark
+    def test_dispatch_cost_does_not_grow_with_the_executors(self):
+        executors_count = 500
+        events_count = 1000
+
+        listening_executors = self._start_executors(executors_count)
+        order_ids = [self._place_order(executor) for executor in listening_executors]
+        start = time.perf_counter()
+        for i in range(events_count):
+            self._cancel(order_ids[i % executors_count])
+        listening_time = time.perf_counter() - start
+        for executor in listening_executors:
+            executor.unregister_events()
+
+        dispatched_executors = self._start_executors(executors_count, self.dispatcher)
+        order_ids = [self._place_order(executor) for executor in dispatched_executors]
+        start = time.perf_counter()
+        for i in range(events_count):
+            self._cancel(order_ids[i % executors_count])
+        dispatching_time = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(
+            f"{events_count} order events with {executors_count} executors: {listening_time * 1e3:.1f}ms with a "
+            f"listener per executor, {dispatching_time * 1e3:.1f}ms with the dispatcher")
+        self.assertEqual(events_count, sum(len(executor.canceled_order_ids) for executor in listening_executors))
+        self.assertEqual(events_count, sum(len(executor.canceled_order_ids) for executor in dispatched_executors))
+        self.assertEqual(events_count, self.dispatcher.routed_events_count)
+        self.assertLess(dispatching_time, listening_time)
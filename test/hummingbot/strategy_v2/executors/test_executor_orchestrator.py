@@ -7,6 +7,7 @@ from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.model.position import Position
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
@@ -105,6 +106,9 @@ class TestExecutorOrchestrator(unittest.TestCase):
         ]
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 5)
+        for executor in self.orchestrator.active_executors["test"]:
+            self.assertIs(self.orchestrator.executors_scheduler, executor.scheduler)
+            self.assertIs(self.orchestrator.executors_event_dispatcher, executor.event_dispatcher)
 
     def test_execute_actions_store_executor_active(self):
         position_executor = MagicMock(spec=PositionExecutor)
@@ -181,6 +185,56 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(report.realized_pnl_quote, Decimal(10))
         self.assertEqual(report.unrealized_pnl_quote, Decimal(10))
 
+    @patch("hummingbot.strategy_v2.executors.executor_orchestrator.MarketsRecorder.get_instance")
+    def test_reports_reuse_the_info_of_unchanged_executors(self, mock_get_instance: MagicMock):
+        mock_get_instance.return_value = MagicMock(spec=MarketsRecorder)
+        config_mock = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        running_info = ExecutorInfo(
+            id="123", timestamp=1234, type="position_executor",
+            status=RunnableStatus.RUNNING, config=config_mock,
+            filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(10), net_pnl_pct=Decimal(10),
+            cum_fees_quote=Decimal(1), is_trading=True, is_active=True, custom_info={"side": TradeType.BUY}
+        )
+        take_profit_info = ExecutorInfo(
+            id="123", timestamp=1234, type="position_executor",
+            status=RunnableStatus.TERMINATED, config=config_mock, close_type=CloseType.TAKE_PROFIT,
+            filled_amount_quote=Decimal(200), net_pnl_quote=Decimal(20), net_pnl_pct=Decimal(10),
+            cum_fees_quote=Decimal(1), is_trading=False, is_active=False, custom_info={"side": TradeType.BUY}
+        )
+        position_executor = MagicMock(spec=PositionExecutor)
+        position_executor.state_version = 1
+        executor_info_mock = PropertyMock(return_value=running_info)
+        type(position_executor).executor_info = executor_info_mock
+        self.orchestrator.active_executors["test"] = [position_executor]
+
+        self.orchestrator.get_all_reports()
+        reports = self.orchestrator.get_all_reports()
+
+        self.assertEqual(1, executor_info_mock.call_count)
+        self.assertEqual([running_info], reports["test"]["executors"])
+        self.assertEqual(Decimal(10), reports["test"]["performance"].unrealized_pnl_quote)
+        self.assertEqual(Decimal(100), reports["test"]["performance"].volume_traded)
+
+        position_executor.state_version = 2
+        executor_info_mock.return_value = take_profit_info
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+
+        self.assertEqual(2, executor_info_mock.call_count)
+        self.assertEqual(Decimal(0), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(20), report.realized_pnl_quote)
+        self.assertEqual(Decimal(200), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, report.close_type_counts)
+
+        self.orchestrator.active_executors["test"] = []
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+
+        self.assertEqual(Decimal(0), report.realized_pnl_quote)
+        self.assertEqual(Decimal(0), report.volume_traded)
+        self.assertEqual({}, report.close_type_counts)
+
     @patch("hummingbot.strategy_v2.executors.executor_orchestrator.MarketsRecorder.get_instance")
     def test_initialize_cached_performance(self, mock_get_instance: MagicMock):
         # Create mock markets recorder
@@ -358,6 +412,25 @@ class TestExecutorOrchestrator(unittest.TestCase):
 
         asyncio.run(test_async())
 
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_executors_step_times(self, markets_recorder: MagicMock):
+        markets_recorder.return_value = MagicMock(spec=MarketsRecorder)
+        position_executor = MagicMock(spec=PositionExecutor)
+        position_executor.config = MagicMock(PositionExecutorConfig)
+        position_executor.config.id = "123"
+        step_times = LatencyHistogram()
+        self.orchestrator.active_executors["test"] = [position_executor]
+
+        with patch.object(self.orchestrator.executors_scheduler, "get_step_times", return_value=step_times):
+            self.assertEqual({"123": step_times}, self.orchestrator.get_executors_step_times())
+
+        orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy, use_executors_scheduler=False,
+                                            use_executors_event_dispatcher=False)
+        orchestrator.active_executors["test"] = [position_executor]
+        self.assertIsNone(orchestrator.executors_scheduler)
+        self.assertIsNone(orchestrator.executors_event_dispatcher)
+        self.assertEqual({}, orchestrator.get_executors_step_times())
+
     def test_stop_executor(self):
         position_executor = MagicMock(spec=PositionExecutor)
         position_executor.is_closed = False
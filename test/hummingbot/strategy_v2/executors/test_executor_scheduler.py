@@ -0,0 +1,200 @@
+import asyncio
+import logging
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import Callable, List
+from unittest.mock import patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class CountingRunnable(RunnableBase):
+    def __init__(self, update_interval: float, step_duration: float = 0):
+        super().__init__(update_interval=update_interval)
+        self.step_duration = step_duration
+        self.on_start_calls = 0
+        self.on_stop_calls = 0
+        self.steps = 0
+
+    async def on_start(self):
+        self.on_start_calls += 1
+
+    def on_stop(self):
+        self.on_stop_calls += 1
+
+    async def control_task(self):
+        self.steps += 1
+        if self.step_duration > 0:
+            await asyncio.sleep(self.step_duration)
+
+
+class FakeTimerHandle:
+    def __init__(self, when: float, callback: Callable):
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeClock:
+    """
+    Replaces the event loop time and timers of a scheduler, so tests do not depend on real sleeps
+    """
+    def __init__(self):
+        self.now = 0.0
+        self.timers: List[FakeTimerHandle] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def call_at(self, when: float, callback: Callable) -> FakeTimerHandle:
+        handle = FakeTimerHandle(when, callback)
+        self.timers.append(handle)
+        return handle
+
+    async def advance(self, seconds: float):
+        """
+        Moves the time forward, firing the timers due in between in order
+        """
+        end = self.now + seconds
+        await self._run_ready_tasks()
+        while True:
+            self.timers = [timer for timer in self.timers if not timer.cancelled]
+            due_timers = [timer for timer in self.timers if timer.when <= end]
+            if len(due_timers) == 0:
+                break
+            timer = min(due_timers, key=lambda t: t.when)
+            self.timers.remove(timer)
+            self.now = max(self.now, timer.when)
+            timer.callback()
+            await self._run_ready_tasks()
+        self.now = end
+
+    @staticmethod
+    async def _run_ready_tasks():
+        # Lets the scheduler loop and the step tasks it starts run
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+
+class ExecutorSchedulerTests(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.scheduler = ExecutorScheduler(batch_window=0.01, min_wake_up_interval=0.02)
+        self.set_loggers(loggers=[RunnableBase.logger()])
+
+    async def asyncTearDown(self):
+        self.scheduler.stop()
+        await super().asyncTearDown()
+
+    def _start_runnables(self, count: int, update_interval: float, step_duration: float = 0) -> List[CountingRunnable]:
+        runnables = []
+        for _ in range(count):
+            runnable = CountingRunnable(update_interval=update_interval, step_duration=step_duration)
+            runnable.scheduler = self.scheduler
+            runnable.start()
+            runnables.append(runnable)
+        return runnables
+
+    async def test_runnables_are_stepped_every_update_interval(self):
+        runnable = self._start_runnables(1, update_interval=0.05)[0]
+
+        await asyncio.sleep(0.22)
+
+        self.assertEqual(RunnableStatus.RUNNING, runnable.status)
+        self.assertEqual(1, runnable.on_start_calls)
+        self.assertIn(runnable.steps, range(4, 6))
+        self.assertEqual(runnable.steps, self.scheduler.get_step_times(runnable).count)
+
+    async def test_stopped_runnable_is_unregistered(self):
+        runnable = self._start_runnables(1, update_interval=0.1)[0]
+        await asyncio.sleep(0.02)
+
+        runnable.stop()
+        await asyncio.sleep(0.15)
+
+        self.assertEqual(1, runnable.steps)
+        self.assertEqual(1, runnable.on_stop_calls)
+        self.assertEqual(0, self.scheduler.runnables_count)
+        self.assertIsNone(self.scheduler.get_step_times(runnable))
+
+    async def test_wake_up_runs_the_next_step_early(self):
+        self.scheduler = ExecutorScheduler(batch_window=0.01, min_wake_up_interval=0.1)
+        runnable = self._start_runnables(1, update_interval=10)[0]
+        await asyncio.sleep(0.01)
+        self.assertEqual(1, runnable.steps)
+
+        runnable.wake_up()
+        await asyncio.sleep(0.02)
+        # The minimum wake up interval has not elapsed since the first step
+        self.assertEqual(1, runnable.steps)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(2, runnable.steps)
+
+    async def test_wake_up_during_a_step_runs_another_step_after_it(self):
+        runnable = self._start_runnables(1, update_interval=10, step_duration=0.03)[0]
+        await asyncio.sleep(0.01)
+
+        runnable.wake_up()
+        await asyncio.sleep(0.06)
+
+        self.assertEqual(2, runnable.steps)
+
+    async def test_slow_step_does_not_delay_other_runnables(self):
+        slow_runnable = self._start_runnables(1, update_interval=0.02, step_duration=1)[0]
+        fast_runnable = self._start_runnables(1, update_interval=0.02)[0]
+
+        await asyncio.sleep(0.15)
+
+        self.assertEqual(1, slow_runnable.steps)
+        self.assertGreater(fast_runnable.steps, 3)
+
+    async def test_control_task_errors_are_logged(self):
+        runnable = self._start_runnables(1, update_interval=0.02)[0]
+
+        async def raise_exception():
+            raise Exception("Test")
+
+        runnable.control_task = raise_exception
+        await asyncio.sleep(0.05)
+
+        self.assertTrue(self.is_logged("ERROR", "Test"))
+        self.assertGreater(self.scheduler.get_step_times(runnable).count, 1)
+
+    async def test_order_book_updates_wake_up_watching_runnables(self):
+        runnable = self._start_runnables(1, update_interval=10)[0]
+        order_book = OrderBook()
+        self.scheduler.watch_order_book(runnable, order_book)
+        await asyncio.sleep(0.03)
+        self.assertEqual(1, runnable.steps)
+
+        order_book.apply_diffs([OrderBookRow(1.0, 1.0, 1)], [], 1)
+        await asyncio.sleep(0.01)
+        self.assertEqual(2, runnable.steps)
+
+        self.scheduler.unwatch_order_book(runnable, order_book)
+        await asyncio.sleep(0.03)
+        order_book.apply_diffs([OrderBookRow(1.0, 2.0, 2)], [], 2)
+        await asyncio.sleep(0.01)
+        self.assertEqual(2, runnable.steps)
+
+    async def test_due_steps_are_batched_in_one_wake_up(self):
+        clock = FakeClock()
+        with patch.object(self.scheduler, "_time", clock.time), patch.object(self.scheduler, "_call_at", clock.call_at):
+            runnables = self._start_runnables(500, update_interval=0.05)
+            await clock.advance(0.48)
+
+        steps = sum(runnable.steps for runnable in runnables)
+        logging.getLogger(__name__).info(
+            f"{steps} control steps of {len(runnables)} runnables in {self.scheduler.loop_iterations} scheduler "
+            f"wake ups (a control loop per runnable wakes up once per step)")
+        self.assertTrue(all(runnable.steps == 10 for runnable in runnables))
+        self.assertEqual(10, self.scheduler.loop_iterations)